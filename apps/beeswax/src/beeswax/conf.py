@@ -249,6 +249,14 @@ MAX_NUMBER_OF_SESSIONS = Config(
   default=-1
 )
 
+MAX_CACHED_CLIENTS = Config(
+  key="max_cached_clients",
+  help=_t("Maximum number of HiveServer2, Impala and Metastore clients cached per Hue process, one per user and server. "
+          "The least recently used ones are evicted above it."),
+  type=int,
+  default=1000
+)
+
 THRIFT_VERSION = Config(
   key="thrift_version",
   help=_t("Thrift version to use when communicating with HiveServer2."),
@@ -318,7 +326,8 @@ AUTH_PASSWORD = Config(
   key="auth_password",
   help=_t("LDAP/PAM/.. password of the hue user used for authentications."),
   private=True,
-  dynamic_default=get_auth_password)
+  dynamic_default=get_auth_password,
+  memoize=False)
 
 AUTH_PASSWORD_SCRIPT = Config(
   key="auth_password_script",
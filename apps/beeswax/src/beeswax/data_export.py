@@ -82,9 +82,9 @@ def upload(path, handle, user, db, fs, max_rows=-1, max_bytes=-1):
     fs.do_as_user(user.username, fs.create, path)
 
   content_generator = DataAdapter(db, handle=handle, max_rows=max_rows, start_over=True, max_bytes=max_bytes)
+  encoder = export_csvxls.CSVEncoder()
   for header, data in content_generator:
-    dataset = export_csvxls.dataset(None, data)
-    fs.do_as_user(user.username, fs.append, path, dataset.csv)
+    fs.do_as_user(user.username, fs.append, path, encoder.encode(None, data, column_types=content_generator.column_types))
 
 
 class DataAdapter(object):
@@ -102,6 +102,7 @@ class DataAdapter(object):
     self.first_fetched = True
     self.headers = None
     self.num_cols = None
+    self.column_types = None
     self.row_counter = 0
     self.bytes_counter = 0
     self.is_truncated = False
@@ -146,6 +147,7 @@ class DataAdapter(object):
       self.start_over = False
       results_headers = results.full_cols()
       self.num_cols = len(results_headers)
+      self.column_types = [column['type'] for column in results_headers]
       if self.store_data_type_in_header:
         self.headers = [column['name'] + '|' + column['type'] for column in results_headers]
       else:
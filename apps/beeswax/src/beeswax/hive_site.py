@@ -28,6 +28,7 @@ import socket
 import sys
 
 from desktop.lib import security_util
+from desktop.lib.conf import invalidate_cache
 from hadoop import confparse
 from hadoop.ssl_client_site import get_trustore_location, get_trustore_password
 
@@ -85,6 +86,7 @@ def reset():
   global _METASTORE_LOC_CACHE
   _HIVE_SITE_DICT = None
   _METASTORE_LOC_CACHE = None
+  invalidate_cache()  # The dynamic defaults of the configs read it
 
 
 def get_conf():
@@ -23,6 +23,7 @@ import threading
 import time
 import json
 
+from collections import OrderedDict
 from django.core.cache import caches
 from django.urls import reverse
 from kazoo.client import KazooClient
@@ -31,6 +32,7 @@ from beeswax.models import Compute
 from desktop.conf import CLUSTER_ID, has_connectors
 from desktop.lib.django_util import format_preserving_redirect
 from desktop.lib.exceptions_renderable import PopupException
+from desktop.lib.metrics import global_registry
 from desktop.lib.parameterization import substitute_variables
 from desktop.lib.view_util import location_to_url
 from desktop.models import Cluster
@@ -44,7 +46,7 @@ from beeswax.conf import HIVE_SERVER_HOST, HIVE_SERVER_PORT, HIVE_SERVER_HOST, H
     AUTH_USERNAME, AUTH_PASSWORD, APPLY_NATURAL_SORT_MAX, QUERY_PARTITIONS_LIMIT, HIVE_DISCOVERY_HIVESERVER2_ZNODE, \
     HIVE_DISCOVERY_HS2, HIVE_DISCOVERY_LLAP, HIVE_DISCOVERY_LLAP_HA, HIVE_DISCOVERY_LLAP_ZNODE, CACHE_TIMEOUT, \
     LLAP_SERVER_HOST, LLAP_SERVER_PORT, LLAP_SERVER_THRIFT_PORT, USE_SASL as HIVE_USE_SASL, CLOSE_SESSIONS, has_session_pool, \
-    MAX_NUMBER_OF_SESSIONS
+    MAX_NUMBER_OF_SESSIONS, MAX_CACHED_CLIENTS
 from beeswax.common import apply_natural_sort, is_compute
 from beeswax.design import hql_query
 from beeswax.hive_site import hiveserver2_use_ssl, hiveserver2_impersonation_enabled, get_hiveserver2_kerberos_principal, \
@@ -65,17 +67,115 @@ else:
 LOG = logging.getLogger()
 
 
-RESET_HS2_QUERY_SERVER = False
-DBMS_CACHE = {}
-DBMS_CACHE_LOCK = threading.Lock()
+HIVESERVER2_CLIENT = 'hiveserver2'
+IMPALA_CLIENT = 'impala'
+METASTORE_CLIENT = 'hms'
+
+
+class _Construction(object):
+
+  def __init__(self):
+    self.event = threading.Event()
+    self.client = None
+    self.error = None
+
+
+class DbmsCache(object):
+  """
+  Caches the Dbms clients per user and server name.
+
+  The lock is never held while a client is built, as it can open Thrift connections: only the concurrent requests
+  for the same user and server wait for the first one to build it. The least recently used clients are evicted
+  above MAX_CACHED_CLIENTS and invalidate() drops the clients of one kind or server only.
+  """
+
+  def __init__(self):
+    self._clients = OrderedDict()  # (user id, server name) -> (client kind, client)
+    self._constructions = {}
+    self._lock = threading.Lock()
+    self._generation = 0
+
+    self.construction_time = global_registry().histogram(
+        name='dbms.cache.construction-time',
+        label='Dbms Client Construction Time',
+        description='Time spent building the HiveServer2, Impala or Metastore clients of the users',
+        numerator='seconds',
+        counter_numerator='clients',
+    )
+    self.contention = global_registry().counter(
+        name='dbms.cache.contention',
+        label='Dbms Client Construction Contention',
+        description='Number of requests that waited for the client of the same user and server to be built by another request',
+        numerator='requests',
+    )
+    self.evictions = global_registry().counter(
+        name='dbms.cache.evictions',
+        label='Dbms Client Evictions',
+        description='Number of cached clients evicted because of the cache size',
+        numerator='clients',
+    )
+
+  def __len__(self):
+    return len(self._clients)
+
+  def get(self, key, kind, create):
+    with self._lock:
+      if key in self._clients:
+        self._clients.move_to_end(key)
+        return self._clients[key][1]
+
+      construction = self._constructions.get(key)
+      is_builder = construction is None
+      if is_builder:
+        construction = self._constructions[key] = _Construction()
+        generation = self._generation
+      else:
+        self.contention.inc()
+
+    if not is_builder:
+      construction.event.wait()
+      if construction.error is not None:
+        raise construction.error
+      return construction.client
+
+    start = time.time()
+    try:
+      construction.client = create()
+      return construction.client
+    except Exception as e:
+      construction.error = e
+      raise
+    finally:
+      self.construction_time.add(time.time() - start)
+      with self._lock:
+        del self._constructions[key]
+        if construction.error is None and generation == self._generation:  # Not invalidated while being built
+          self._clients[key] = (kind, construction.client)
+          while len(self._clients) > MAX_CACHED_CLIENTS.get():
+            self._clients.popitem(last=False)
+            self.evictions.inc()
+      construction.event.set()
+
+  def invalidate(self, kind=None, server_name=None):
+    with self._lock:
+      self._generation += 1
+      for key, (client_kind, client) in list(self._clients.items()):
+        if (kind is None or client_kind == kind) and (server_name is None or key[1] == server_name):
+          del self._clients[key]
+
+  def clear(self):
+    self.invalidate()
+
+
+DBMS_CACHE = DbmsCache()
 cache = caches[CACHES_HIVE_DISCOVERY_KEY]
 
 # Using file cache to make sure eventlet threads are uniform, this cache is persistent on startup
 # So we clear it to make sure the server resets hiveserver2 host.
-def reset_ha():
-  global RESET_HS2_QUERY_SERVER
+def reset_ha(server_name=None):
   cache.clear()
-  RESET_HS2_QUERY_SERVER = True
+  LOG.debug('Resetting the DBMS cache for the new hs2')
+  DBMS_CACHE.invalidate(kind=HIVESERVER2_CLIENT, server_name=server_name)
 
 
 reset_ha()
@@ -94,10 +194,6 @@ def get_zk_hs2():
 
 
 def get(user, query_server=None, cluster=None):
-  global DBMS_CACHE
-  global DBMS_CACHE_LOCK
-  global RESET_HS2_QUERY_SERVER
-
   if query_server is None:
     query_server = get_query_server_config(connector=cluster)
 
@@ -106,45 +202,39 @@ def get(user, query_server=None, cluster=None):
   if not query_server.get('auth_username') and user and user.username:
     query_server['auth_username'] = user.username
 
-  DBMS_CACHE_LOCK.acquire()
-  try:
-    DBMS_CACHE.setdefault(user.id, {})
+  if query_server.get('dialect') == 'impala':
+    kind = IMPALA_CLIENT
+  elif query_server['server_name'] == 'hms':
+    kind = METASTORE_CLIENT
+  else:
+    kind = HIVESERVER2_CLIENT
 
-    if query_server['server_name'] not in DBMS_CACHE[user.id]:
-      # Avoid circular dependency
-      from beeswax.server.hive_server2_lib import HiveServerClientCompatible
+  return DBMS_CACHE.get((user.id, query_server['server_name']), kind, lambda: _create_dbms(user, query_server, kind))
 
-      if query_server.get('dialect') == 'impala':
-        from impala.dbms import ImpalaDbms
-        from impala.server import ImpalaServerClient
-        DBMS_CACHE[user.id][query_server['server_name']] = ImpalaDbms(
-            HiveServerClientCompatible(ImpalaServerClient(query_server, user)),
-            QueryHistory.SERVER_TYPE[1][0]
-        )
-      elif query_server['server_name'] == 'hms':
-        from beeswax.server.hive_metastore_server import HiveMetastoreClient
-        DBMS_CACHE[user.id][query_server['server_name']] = HiveServer2Dbms(
-            HiveMetastoreClient(query_server, user),
-            QueryHistory.SERVER_TYPE[1][0]
-        )
-      else:
-        from beeswax.server.hive_server2_lib import HiveServerClient
-        DBMS_CACHE[user.id][query_server['server_name']] = HiveServer2Dbms(
-            HiveServerClientCompatible(HiveServerClient(query_server, user)),
-            QueryHistory.SERVER_TYPE[1][0]
-        )
-    elif RESET_HS2_QUERY_SERVER:
-      from beeswax.server.hive_server2_lib import HiveServerClient, HiveServerClientCompatible
-      RESET_HS2_QUERY_SERVER = False
-      LOG.debug('Setting DBMS cache for the new hs2')
-      DBMS_CACHE[user.id].clear()
-      DBMS_CACHE[user.id][query_server['server_name']] = HiveServer2Dbms(
+
+def _create_dbms(user, query_server, kind):
+  # Avoid circular dependency
+  from beeswax.server.hive_server2_lib import HiveServerClientCompatible
+
+  if kind == IMPALA_CLIENT:
+    from impala.dbms import ImpalaDbms
+    from impala.server import ImpalaServerClient
+    return ImpalaDbms(
+        HiveServerClientCompatible(ImpalaServerClient(query_server, user)),
+        QueryHistory.SERVER_TYPE[1][0]
+    )
+  elif kind == METASTORE_CLIENT:
+    from beeswax.server.hive_metastore_server import HiveMetastoreClient
+    return HiveServer2Dbms(
+        HiveMetastoreClient(query_server, user),
+        QueryHistory.SERVER_TYPE[1][0]
+    )
+  else:
+    from beeswax.server.hive_server2_lib import HiveServerClient
+    return HiveServer2Dbms(
         HiveServerClientCompatible(HiveServerClient(query_server, user)),
         QueryHistory.SERVER_TYPE[1][0]
-      )
-    return DBMS_CACHE[user.id][query_server['server_name']]
-  finally:
-    DBMS_CACHE_LOCK.release()
+    )
 
 
 def get_query_server_config(name='beeswax', connector=None):
@@ -237,7 +327,7 @@ def get_query_server_config(name='beeswax', connector=None):
             if not hs2_in_active_endpoint:
               LOG.error(
                 'Current HiveServer is down, working to connect with the next available HiveServer from Zookeeper')
-              reset_ha()
+              reset_ha('beeswax' if name != 'hplsql' else 'hplsql')
               server_to_use = 0
               LOG.debug("Selected HiveServer {0}: {1}".format(server_to_use, hiveservers[server_to_use]))
               cache.set(
@@ -487,8 +577,10 @@ class HiveServer2Dbms(object):
       return []
 
 
-  def get_table(self, database, table_name):
+  def get_table(self, database, table_name, session=None):
     try:
+      if session is not None:  # Only supported by HiveServer2
+        return self.client.get_table(database, table_name, session=session)
       return self.client.get_table(database, table_name)
     except QueryServerException as e:
       LOG.debug("Seems like %s.%s could be a Kudu table" % (database, table_name))
@@ -764,14 +856,14 @@ class HiveServer2Dbms(object):
     return stats
 
 
-  def get_table_columns_stats(self, database, table, column):
+  def get_table_columns_stats(self, database, table, column, session=None):
     if self.server_name.startswith('impala'):
       hql = 'SHOW COLUMN STATS `%(database)s`.`%(table)s`' % {'database': database, 'table': table}
     else:
       hql = 'DESCRIBE FORMATTED `%(database)s`.`%(table)s` `%(column)s`' % {'database': database, 'table': table, 'column': column}
 
     query = hql_query(hql)
-    handle = self.execute_and_wait(query, timeout_sec=5.0)
+    handle = self.execute_and_wait(query, timeout_sec=5.0, session=session)
 
     if handle:
       result = self.fetch(handle, rows=100)
@@ -1034,13 +1126,13 @@ class HiveServer2Dbms(object):
     return self.client.get_operation_status(handle)
 
 
-  def execute_and_wait(self, query, timeout_sec=30.0, sleep_interval=0.5):
+  def execute_and_wait(self, query, timeout_sec=30.0, sleep_interval=0.5, session=None):
     """
     Run query and check status until it finishes or timeouts.
 
     Check status until it finishes or timeouts.
     """
-    handle = self.client.query(query)
+    handle = self.client.query(query, session=session) if session is not None else self.client.query(query)
     curr = time.time()
     end = curr + timeout_sec
 
@@ -19,8 +19,10 @@
 import logging
 import pytest
 import sys
+import threading
 from django.test import TestCase
-from beeswax.server.dbms import get_query_server_config
+from beeswax.conf import MAX_CACHED_CLIENTS
+from beeswax.server.dbms import get_query_server_config, DbmsCache, HIVESERVER2_CLIENT, IMPALA_CLIENT
 from desktop.lib.exceptions_renderable import PopupException
 from desktop.settings import CACHES_HIVE_DISCOVERY_KEY
 from django.core.cache import caches
@@ -173,3 +175,57 @@ class TestGetQueryServerConfig():
 # TODO: all the combinations in new test methods, e.g.:
 # HIVE_DISCOVERY_LLAP_HA.get() --> True
 # ...
+
+
+class TestDbmsCache():
+
+  def test_lru_eviction(self):
+    dbms_cache = DbmsCache()
+
+    reset = MAX_CACHED_CLIENTS.set_for_testing(2)
+    try:
+      client1 = dbms_cache.get((1, 'beeswax'), HIVESERVER2_CLIENT, Mock)
+      dbms_cache.get((2, 'beeswax'), HIVESERVER2_CLIENT, Mock)
+      assert dbms_cache.get((1, 'beeswax'), HIVESERVER2_CLIENT, Mock) is client1
+
+      dbms_cache.get((3, 'beeswax'), HIVESERVER2_CLIENT, Mock)
+
+      assert len(dbms_cache) == 2
+      assert dbms_cache.get((1, 'beeswax'), HIVESERVER2_CLIENT, Mock) is client1
+    finally:
+      reset()
+
+  def test_invalidate(self):
+    dbms_cache = DbmsCache()
+
+    hive = dbms_cache.get((1, 'beeswax'), HIVESERVER2_CLIENT, Mock)
+    impala = dbms_cache.get((1, 'impala'), IMPALA_CLIENT, Mock)
+
+    dbms_cache.invalidate(kind=HIVESERVER2_CLIENT)
+
+    assert dbms_cache.get((1, 'beeswax'), HIVESERVER2_CLIENT, Mock) is not hive
+    assert dbms_cache.get((1, 'impala'), IMPALA_CLIENT, Mock) is impala
+
+  def test_single_flight(self):
+    dbms_cache = DbmsCache()
+    building = threading.Event()
+    release = threading.Event()
+    create = Mock(side_effect=lambda: building.set() or release.wait() and Mock())
+    other_user = Mock(return_value='client2')
+    clients = []
+
+    builder = threading.Thread(target=lambda: clients.append(dbms_cache.get((1, 'beeswax'), HIVESERVER2_CLIENT, create)))
+    waiter = threading.Thread(target=lambda: clients.append(dbms_cache.get((1, 'beeswax'), HIVESERVER2_CLIENT, create)))
+    builder.start()
+    building.wait()
+    waiter.start()
+
+    # Other users are not blocked by a slow construction
+    assert dbms_cache.get((2, 'beeswax'), HIVESERVER2_CLIENT, other_user) == 'client2'
+
+    release.set()
+    builder.join()
+    waiter.join()
+
+    assert create.call_count == 1
+    assert clients[0] is clients[1]
@@ -282,6 +282,16 @@ class HiveServerTRowSet2(object):
     else:
       raise StopIteration
 
+  def iter_rows(self):
+    """
+    Transposes the columns into rows by index, decoding each column and its nulls only once.
+    The column values are not consumed, contrary to HiveServerTRow2.fields().
+    """
+    if not self.row_set.columns:
+      return iter([])
+
+    return map(list, zip(*[HiveServerTColumnValue2(column).val for column in self.row_set.columns]))
+
 
 class HiveServerTRow2(object):
   def __init__(self, cols, schema):
@@ -361,22 +371,39 @@ class HiveServerTColumnValue2(object):
 
   @classmethod
   def set_nulls(cls, values, nulls):
-    can_decode = True
-    bytestring = nulls
-    if sys.version_info[0] == 3 and isinstance(bytestring, bytes):
-      try:
-        bytestring = bytestring.decode('utf-8')
-      except Exception:
-        can_decode = False
+    mask = cls._get_mask(nulls)
 
-    if bytestring == '' or (can_decode and re.match('^(\x00)+$', bytestring)):  # HS2 has just \x00 or '', Impala can have \x00\x00...
+    if not mask.strip(b'\x00'):  # HS2 has just \x00 or '', Impala can have \x00\x00...
       return values
     else:
-      _values = [None if is_null else value for value, is_null in zip(values, cls.mark_nulls(values, nulls))]
-      if len(values) != len(_values):  # HS2 can have just \x00\x01 instead of \x00\x01\x00...
-        _values.extend(values[len(_values):])
+      # HS2 can have just \x00\x01 instead of \x00\x01\x00..., the values past the mask are not null
+      _values = list(values)
+      for position in cls.null_positions(mask, len(values)):
+        _values[position] = None
       return _values
 
+  @classmethod
+  def null_positions(cls, mask, size):
+    """
+    Returns the positions of the bits set in the mask, least significant bit of the first byte first.
+
+    The whole mask is expanded in one go into a string of bits instead of bit by bit.
+    """
+    bits = format(int.from_bytes(mask, 'little'), 'b')[::-1]
+    position = bits.find('1')
+    while 0 <= position < size:
+      yield position
+      position = bits.find('1', position + 1)
+
+  @classmethod
+  def _get_mask(cls, nulls):
+    if isinstance(nulls, (bytes, bytearray)):
+      return bytes(nulls)
+    try:
+      return nulls.encode('latin-1')
+    except UnicodeEncodeError:
+      return bytes(python_util.get_bytes_from_bits(python_util.from_string_to_bits(nulls)))
+
 
 class HiveServerDataTable(DataTable):
   def __init__(self, results, schema, operation_handle, query_server, session=None):
@@ -401,6 +428,11 @@ class HiveServerDataTable(DataTable):
       return []
 
   def rows(self):
+    if hasattr(self.row_set, 'iter_rows'):
+      for row in self.row_set.iter_rows():
+        yield row
+      return
+
     for row in self.row_set:
       try:
         yield row.fields()
@@ -710,7 +742,7 @@ class HiveServerClient(object):
       req = TOpenSessionReq(**kwargs)
     except Exception as e:
       if 'Connection refused' in str(e):
-        reset_ha()
+        reset_ha(self.query_server['server_name'])
     res = self._client.OpenSession(req)
     self.coordinator_host = self._client.get_coordinator_host()
     if self.coordinator_host:
@@ -895,9 +927,10 @@ class HiveServerClient(object):
 
     return HiveServerTRowSet(results.results, schema.schema).cols(('TABLE_NAME',))
 
-  def get_table(self, database, table_name, partition_spec=None):
+  def get_table(self, database, table_name, partition_spec=None, session=None):
+    owned_session = session is None
     req = TGetTablesReq(schemaName=database.lower(), tableName=table_name.lower())  # Impala returns empty if not lower case
-    (res, session) = self.call(self._client.GetTables, req)
+    (res, session) = self.call(self._client.GetTables, req, session=session)
 
     table_results, table_schema = self.fetch_result(res.operationHandle, orientation=TFetchOrientation.FETCH_NEXT)
     self.close_operation(res.operationHandle)
@@ -966,7 +999,7 @@ class HiveServerClient(object):
       else:
         raise e
     finally:
-      if self.has_close_sessions:
+      if self.has_close_sessions and owned_session:
         self.close_session(session)
 
     return HiveServerTable(table_results.results, table_schema.schema, desc_results.results, desc_schema.schema)
@@ -1512,8 +1545,8 @@ class HiveServerClientCompatible(object):
     tables.sort()
     return tables
 
-  def get_table(self, database, table_name, partition_spec=None):
-    table = self._client.get_table(database, table_name, partition_spec)
+  def get_table(self, database, table_name, partition_spec=None, session=None):
+    table = self._client.get_table(database, table_name, partition_spec, session=session)
     return HiveServerTableCompatible(table)
 
   def get_columns(self, database, table):
@@ -75,7 +75,7 @@ from beeswax.models import SavedQuery, QueryHistory, HQL, HIVE_SERVER2
 from beeswax.server import dbms
 from beeswax.server.dbms import QueryServerException
 from beeswax.server.hive_server2_lib import HiveServerClient, PartitionKeyCompatible, PartitionValueCompatible, HiveServerTable, \
-    HiveServerTColumnValue2
+    HiveServerTColumnValue2, HiveServerTRowSet2
 from beeswax.test_base import BeeswaxSampleProvider, is_hive_on_spark, get_available_execution_engines
 from beeswax.hive_site import get_metastore, hiveserver2_jdbc_url
 
@@ -2658,6 +2658,27 @@ class TestHiveServer2API(object):
     nulls = '\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00'
     assert data is not HiveServerTColumnValue2.set_nulls(data, nulls)
 
+  def test_row_set_iter_rows(self):
+    from TCLIService.ttypes import TColumn, TI32Column, TRowSet, TStringColumn
+
+    row_set = TRowSet(startRowOffset=0, rows=[], columns=[
+        TColumn(i32Val=TI32Column(values=[1, 2, 3, 0], nulls=b'\x08')),
+        TColumn(stringVal=TStringColumn(values=['a', '', 'c', 'd'], nulls=b'\x02')),
+    ])
+    result_set = HiveServerTRowSet2(row_set, schema=None)
+
+    expected = [[1, 'a'], [2, None], [3, 'c'], [None, 'd']]
+    assert expected == list(result_set.iter_rows())
+    assert expected == list(result_set.iter_rows())  # Columns are not consumed
+
+    assert [] == list(HiveServerTRowSet2(TRowSet(startRowOffset=0, rows=[], columns=[]), schema=None).iter_rows())
+
+  def test_null_positions(self):
+    assert [] == list(HiveServerTColumnValue2.null_positions(b'\x00\x00', 16))
+    assert [0, 1] == list(HiveServerTColumnValue2.null_positions(b'\x03', 8))
+    assert [0, 8, 15] == list(HiveServerTColumnValue2.null_positions(b'\x01\x81', 16))
+    assert [0] == list(HiveServerTColumnValue2.null_positions(b'\x01\x81', 8))  # Bits past the values are ignored
+
   def test_bits_to_bytes_conversion(self):
     if sys.version_info[0] < 3:
       pytest.skip("Skipping Test")
@@ -2715,7 +2736,7 @@ class TestWithMockedServer(object):
     # Beware: Monkey patch Beeswax/Hive server with Mock API
     if not hasattr(dbms, 'OriginalBeeswaxApi'):
       dbms.OriginalBeeswaxApi = dbms.HiveServer2Dbms
-    dbms.DBMS_CACHE = {}
+    dbms.DBMS_CACHE.clear()
     dbms.HiveServer2Dbms = MockDbms
 
     self.client = make_logged_in_client(is_superuser=False)
@@ -2725,7 +2746,7 @@ class TestWithMockedServer(object):
     grant_access("test", "test", "beeswax")
 
   def teardown_method(self):
-    dbms.DBMS_CACHE = {}
+    dbms.DBMS_CACHE.clear()
     dbms.HiveServer2Dbms = dbms.OriginalBeeswaxApi
 
   def test_bulk_query_trash(self):
@@ -101,3 +101,30 @@ FILE_DOWNLOAD_CACHE_CONTROL = Config(
   type=str,
   default=None,
   help="Optionally set this to control the caching strategy for files download")
+
+LISTING_CACHE_TTL = Config(
+  key="listing_cache_ttl",
+  default=60,
+  type=int,
+  help=_('Number of seconds a directory listing is cached for paging, sorting and filtering it. '
+         'Changes done through Hue invalidate it right away. Only used with the task server, which provides a cache shared '
+         'by the Hue processes. Set to 0 to disable.'))
+
+LISTING_CACHE_SIZE = Config(
+  key="listing_cache_size",
+  default=50,
+  type=int,
+  help=_('Maximum number of directory listings cached per Hue process.'))
+
+TRANSFER_CHUNK_SIZE = Config(
+  key="transfer_chunk_size",
+  default=8388608,
+  type=int,
+  help=_('Size in bytes of the chunks read and written when copying or moving files between two filesystems, '
+         'e.g. from HDFS to S3. Default is 8MB.'))
+
+TRANSFER_WORKERS = Config(
+  key="transfer_workers",
+  default=4,
+  type=int,
+  help=_('Number of files copied in parallel when copying or moving a directory between two filesystems.'))
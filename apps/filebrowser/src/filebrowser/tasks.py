@@ -24,6 +24,7 @@ from datetime import datetime, timedelta
 
 from celery.utils.log import get_task_logger
 from celery import states
+from django.core.cache import caches
 from django.db import transaction
 from django.http import HttpRequest
 from django.utils import timezone
@@ -32,6 +33,7 @@ from desktop.auth.backend import rewrite_user
 from desktop.celery import app
 from desktop.conf import TASK_SERVER
 from desktop.lib import fsmanager
+from desktop.settings import CACHES_CELERY_KEY
 from useradmin.models import User
 from filebrowser.views import UPLOAD_CLASSES
 
@@ -87,6 +89,52 @@ def upload_file_task(**kwargs):
   upload_file_task.update_state(task_id=task_id, state='SUCCESS', meta=kwargs)
   return None
 
+def _transfer_checkpoint_key(task_id):
+  return 'filebrowser:transfer:checkpoint:%s' % task_id
+
+@app.task(autoretry_for=(IOError,), retry_backoff=True, max_retries=3)
+def transfer_task(**kwargs):
+  """
+  Copies or moves a file or a directory between two filesystems, e.g. from HDFS to S3.
+  The progress is reported in the task state and the files already copied are checkpointed, so that a retry resumes it.
+  """
+  task_id = kwargs["task_id"]
+  request = _get_request(user_id=kwargs["user_id"])
+  request.fs.setuser(request.user)
+  now = timezone.now()
+  kwargs["username"] = request.user.username
+  kwargs["task_name"] = "move" if kwargs.get("move") else "copy"
+  kwargs["state"] = "RUNNING"
+  kwargs["progress"] = "0%"
+  kwargs["task_start"] = now.strftime("%Y-%m-%dT%H:%M:%S")
+  transfer_task.update_state(task_id=task_id, state='RUNNING', meta=kwargs)
+
+  checkpoint_key = _transfer_checkpoint_key(task_id)
+  checkpoint = caches[CACHES_CELERY_KEY].get(checkpoint_key) or {}
+
+  def on_progress(transfer):
+    caches[CACHES_CELERY_KEY].set(checkpoint_key, dict(transfer.checkpoint), timeout=None)
+    kwargs.update(transfer.progress)
+    kwargs["progress"] = "%(percent)s%%" % transfer.progress
+    transfer_task.update_state(task_id=task_id, state='PROGRESS', meta=kwargs)
+
+  try:
+    request.fs.transfer(
+      kwargs["src_path"], kwargs["dest_path"], move=kwargs.get("move", False), checkpoint=checkpoint, on_progress=on_progress
+    )
+  except Exception as err:
+    kwargs["state"] = "FAILURE"
+    transfer_task.update_state(task_id=task_id, state='FAILURE', meta=kwargs)
+    LOG.exception("Transfer of %s to %s failed" % (kwargs["src_path"], kwargs["dest_path"]))
+    raise
+
+  caches[CACHES_CELERY_KEY].delete(checkpoint_key)
+  kwargs["state"] = "SUCCESS"
+  kwargs["progress"] = "100%"
+  kwargs["task_end"] = timezone.now().strftime("%Y-%m-%dT%H:%M:%S")
+  transfer_task.update_state(task_id=task_id, state='SUCCESS', meta=kwargs)
+  return None
+
 def _get_request(postdict=None, user_id=None, scheme=None):
   request = HttpRequest()
   request.POST = postdict
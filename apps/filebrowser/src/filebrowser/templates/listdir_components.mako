@@ -79,7 +79,7 @@ else:
           <span>${_('Page')}</span>
           <input type="text" data-bind="value: page().number, valueUpdate: 'afterkeydown', event: { change: skipTo }" class="pagination-input" />
           <input type="hidden" id="current_page" data-bind="value: page().number" />
-          ${_('of')} <span data-bind="text: page().num_pages"></span>
+          ${_('of')} <span data-bind="text: page().num_pages + (page().total_count_exact === false ? '+' : '')"></span>
         </div>
 
         <ul class="inline">
@@ -100,7 +100,7 @@ else:
 
     <p>${_('Show')}
       <select class="input-mini" data-bind="options: recordsPerPageChoices, value: recordsPerPage"></select>
-      ${_('of')} <span data-bind="text: page().total_count"></span> ${_('items')}
+      ${_('of')} <span data-bind="text: page().total_count + (page().total_count_exact === false ? '+' : '')"></span> ${_('items')}
     </p>
   </div>
 
@@ -847,7 +847,8 @@ else:
           next_page_number: page.next_page_number,
           start_index: page.start_index,
           end_index: page.end_index,
-          total_count: page.total_count
+          total_count: page.total_count,
+          total_count_exact: page.total_count_exact
         }
       }
       return {
@@ -27,15 +27,16 @@ from builtins import object
 import errno
 import logging
 import mimetypes
-import operator
 import os
 import posixpath
 import re
 import stat as stat_module
 import sys
 import urllib.request, urllib.error
+import uuid
 
 from bz2 import decompress
+from copy import copy as shallow_copy
 from datetime import datetime
 
 from django.core.paginator import EmptyPage, Paginator, Page, InvalidPage
@@ -62,6 +63,7 @@ from desktop.lib.django_util import JsonResponse
 from desktop.lib.export_csvxls import file_reader
 from desktop.lib.exceptions_renderable import PopupException
 from desktop.lib.fs import splitpath
+from desktop.lib.fs.listing_cache import LISTING_CACHE, Listing
 from desktop.lib.fs.ozone.ofs import get_ofs_home_directory
 from desktop.lib.fs.gc.gs import get_gs_home_directory
 from desktop.lib.i18n import smart_str
@@ -76,6 +78,7 @@ from hadoop.fs.exceptions import WebHdfsException
 from hadoop.fs.fsutils import do_overwrite_save
 from useradmin.models import User, Group
 
+from filebrowser.conf import LISTING_CACHE_SIZE, LISTING_CACHE_TTL
 from filebrowser.conf import ENABLE_EXTRACT_UPLOADED_ARCHIVE, MAX_SNAPPY_DECOMPRESSION_SIZE,\
     SHOW_DOWNLOAD_BUTTON, SHOW_UPLOAD_BUTTON, REDIRECT_DOWNLOAD, FILE_DOWNLOAD_CACHE_CONTROL
 from filebrowser.lib.archives import archive_factory
@@ -546,7 +549,9 @@ def _massage_page(page, paginator):
       'next_page_number': next_num,
       'start_index': page.start_index(),
       'end_index': page.end_index(),
-      'total_count': paginator.count
+      'total_count': paginator.count,
+      # Without sort nor filter, the directory is only listed up to the requested page and the count is a lower bound
+      'total_count_exact': getattr(paginator.object_list, 'complete', True)
   }
 
 def listdir_paged(request, path):
@@ -566,17 +571,24 @@ def listdir_paged(request, path):
   """
   path = _normalize_path(path)
 
-  if not request.fs.isdir(path):
-    raise PopupException("Not a directory: %s" % (path,))
-
-  pagenum = int(request.GET.get('pagenum', 1))
-  pagesize = int(request.GET.get('pagesize', 30))
   do_as = None
   if is_admin(request.user) or request.user.has_hue_permission(action="impersonate", app="security"):
     do_as = request.GET.get('doas', request.user.username)
   if hasattr(request, 'doas'):
     do_as = request.doas
 
+  def cached(path, kind, create):
+    return LISTING_CACHE.get(
+        (request.user.username + (':' + do_as if do_as else ''), request.fs._name, path, kind), create,
+        ttl=LISTING_CACHE_TTL.get(), max_size=LISTING_CACHE_SIZE.get()
+    )
+
+  if not cached(path, 'isdir', lambda: request.fs.isdir(path)):
+    raise PopupException("Not a directory: %s" % (path,))
+
+  pagenum = int(request.GET.get('pagenum', 1))
+  pagesize = int(request.GET.get('pagesize', 30))
+
   if request.fs._get_scheme(path) == 'hdfs':
     home_dir_path = request.user.get_home_directory()
   else:
@@ -584,30 +596,26 @@ def listdir_paged(request, path):
   breadcrumbs = parse_breadcrumbs(path)
   s3_listing_not_allowed = ''
 
+  filter_str = request.GET.get('filter', None)
+  sortby = request.GET.get('sortby', None)
+  descending_param = request.GET.get('descending', None)
+  if sortby is not None and sortby not in ('type', 'name', 'atime', 'mtime', 'user', 'group', 'size'):
+    logger.info("Invalid sort attribute '%s' for listdir." % sortby)
+    sortby = None
+
+  # Filter and sort the cached listing. Without them, only the requested page and one more entry need to be listed.
+  min_count = pagenum * pagesize + 1
   try:
     if do_as:
-      all_stats = request.fs.do_as_user(do_as, request.fs.listdir_stats, path)
+      listing = cached(path, 'listing', lambda: Listing(request.fs.do_as_user(do_as, request.fs.listdir_stats_iter, path)))
+      all_stats = request.fs.do_as_user(do_as, listing.view, sortby, coerce_bool(descending_param), filter_str, min_count)
     else:
-      all_stats = request.fs.listdir_stats(path)
+      listing = cached(path, 'listing', lambda: Listing(request.fs.listdir_stats_iter(path)))
+      all_stats = listing.view(sortby, coerce_bool(descending_param), filter_str, min_count)
   except S3ListAllBucketsException as e:
     s3_listing_not_allowed = str(e)
     all_stats = []
 
-  # Filter first
-  filter_str = request.GET.get('filter', None)
-  if filter_str:
-    filtered_stats = [sb for sb in all_stats if filter_str in sb['name']]
-    all_stats = filtered_stats
-
-  # Sort next
-  sortby = request.GET.get('sortby', None)
-  descending_param = request.GET.get('descending', None)
-  if sortby is not None:
-    if sortby not in ('type', 'name', 'atime', 'mtime', 'user', 'group', 'size'):
-      logger.info("Invalid sort attribute '%s' for listdir." % sortby)
-    else:
-      all_stats = sorted(all_stats, key=operator.attrgetter(sortby), reverse=coerce_bool(descending_param))
-
   # Do pagination
   try:
     paginator = Paginator(all_stats, pagesize, allow_empty_first_page=True)
@@ -620,7 +628,7 @@ def listdir_paged(request, path):
     shown_stats = []
 
   # Include same dir always as first option to see stats of the current folder.
-  current_stat = request.fs.stats(path)
+  current_stat = shallow_copy(cached(path, 'stats', lambda: request.fs.stats(path)))
   # The 'path' field would be absolute, but we want its basename to be
   # actually '.' for display purposes. Encode it since _massage_stats expects byte strings.
   current_stat.path = path
@@ -630,7 +638,7 @@ def listdir_paged(request, path):
   # Include parent dir always as second option, unless at filesystem root or when RAZ is enabled.
   if not (request.fs.isroot(path) or RAZ.IS_ENABLED.get()):
     parent_path = request.fs.parent_path(path)
-    parent_stat = request.fs.stats(parent_path)
+    parent_stat = shallow_copy(cached(parent_path, 'stats', lambda: request.fs.stats(parent_path)))
     # The 'path' field would be absolute, but we want its basename to be
     # actually '..' for display purposes. Encode it since _massage_stats expects byte strings.
     parent_stat['path'] = parent_path
@@ -644,6 +652,8 @@ def listdir_paged(request, path):
   is_trash_enabled = is_hdfs and int(get_trash_interval()) > 0
   is_fs_superuser = is_hdfs and _is_hdfs_superuser(request)
 
+  is_home_dir = home_dir_path and cached(home_dir_path, 'isdir', lambda: request.fs.isdir(home_dir_path))
+
   data = {
       'path': path,
       'breadcrumbs': breadcrumbs,
@@ -652,7 +662,7 @@ def listdir_paged(request, path):
       'files': page.object_list if page else [],
       'page': _massage_page(page, paginator) if page else {},
       'pagesize': pagesize,
-      'home_directory': home_dir_path if home_dir_path and request.fs.isdir(home_dir_path) else None,
+      'home_directory': home_dir_path if is_home_dir else None,
       'descending': descending_param,
       # The following should probably be deprecated
       'cwd_set': True,
@@ -1353,6 +1363,9 @@ def move(request):
     for arg in args:
       if arg['src_path'] == arg['dest_path']:
         raise PopupException(_('Source path and destination path cannot be same'))
+      if TASK_SERVER.ENABLED.get() and request.fs.is_cross_filesystem(arg['src_path'], arg['dest_path']):
+        _submit_transfer_task(request, arg['src_path'], arg['dest_path'], move=True)
+        continue
       request.fs.rename(
           arg['src_path'].encode('utf-8') if not isinstance(arg['src_path'], str) else arg['src_path'],
           arg['dest_path'].encode('utf-8') if not isinstance(arg['dest_path'], str) else arg['dest_path']
@@ -1373,9 +1386,11 @@ def copy(request):
       if arg['src_path'] == arg['dest_path']:
         raise PopupException(_('Source path and destination path cannot be same'))
 
+      if TASK_SERVER.ENABLED.get() and request.fs.is_cross_filesystem(arg['src_path'], arg['dest_path']):
+        _submit_transfer_task(request, arg['src_path'], arg['dest_path'])
       # Copy method for OFS returns a string of skipped files if their size is greater than chunk size.
-      if arg['src_path'].startswith('ofs://'):
-        ofs_skip_files += request.fs.copy(arg['src_path'], arg['dest_path'], recursive=True, owner=request.user)
+      elif arg['src_path'].startswith('ofs://'):
+        ofs_skip_files += request.fs.copy(arg['src_path'], arg['dest_path'], recursive=True, owner=request.user) or ''
       else:
         request.fs.copy(arg['src_path'], arg['dest_path'], recursive=True, owner=request.user)
 
@@ -1389,6 +1404,17 @@ def copy(request):
                     initial_value_extractor=formset_initial_value_extractor)
 
 
+def _submit_transfer_task(request, src_path, dest_path, move=False):
+  """Copies or moves between two filesystems in the task server, so that large transfers do not hold the request open."""
+  from filebrowser.tasks import transfer_task, error_handler
+
+  task_id = str(uuid.uuid4())
+  kwargs = {'task_id': task_id, 'user_id': request.user.id, 'src_path': src_path, 'dest_path': dest_path, 'move': move}
+  transfer_task.apply_async(task_id=task_id, args=(), kwargs=kwargs, link_error=error_handler.s(), queue="default")
+  logger.info("Transfer task started %s" % task_id)
+  return task_id
+
+
 @require_http_methods(["POST"])
 def chmod(request):
   recurring = ["sticky", "user_read", "user_write", "user_execute",
@@ -1498,6 +1524,7 @@ def perform_upload_task(request, *args, **kwargs):
   else:
     _fs = upload_class(request, **kwargs)
     _fs.upload()
+    LISTING_CACHE.invalidate(kwargs['dest'])
     if scheme == 'hdfs':
       result = _massage_stats(request, stat_absolute_path(_fs.filepath, request.fs.stats(_fs.filepath)))
     else:
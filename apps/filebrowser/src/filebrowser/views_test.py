@@ -57,7 +57,7 @@ from hadoop.conf import UPLOAD_CHUNK_SIZE
 from hadoop.fs.webhdfs import WebHdfs
 from useradmin.models import User, Group
 
-from filebrowser.conf import ENABLE_EXTRACT_UPLOADED_ARCHIVE, MAX_SNAPPY_DECOMPRESSION_SIZE,\
+from filebrowser.conf import ENABLE_EXTRACT_UPLOADED_ARCHIVE, LISTING_CACHE_TTL, MAX_SNAPPY_DECOMPRESSION_SIZE,\
   REMOTE_STORAGE_HOME
 from filebrowser.lib.rwx import expand_mode
 from filebrowser.views import snappy_installed, _normalize_path
@@ -118,8 +118,8 @@ class TestFileBrowser():
             ),
           ),
           normpath=Mock(return_value='/'),
-          listdir_stats=Mock(
-            return_value=[]  # Add "Mock files here"
+          listdir_stats_iter=Mock(
+            return_value=iter([[]])  # Add "Mock files here"
           ),
           superuser='hdfs',
           supergroup='hdfs'
@@ -220,8 +220,8 @@ class TestFileBrowser():
           ),
           normpath=WebHdfs.norm_path,
           is_sentry_managed=Mock(return_value=False),
-          listdir_stats=Mock(
-            return_value=[parent_dir, file_1, file_2, file_3]
+          listdir_stats_iter=Mock(
+            return_value=iter([[parent_dir, file_1, file_2, file_3]])
           ),
           superuser='hdfs',
           supergroup='hdfs'
@@ -234,6 +234,7 @@ class TestFileBrowser():
         assert 200 == response.status_code
         dir_listing = json.loads(response.content)['files']
         assert 5 == len(dir_listing)
+        assert json.loads(response.content)['page']['total_count_exact']
         assert b'"url": "/filebrowser/view=%2Fuser%2Fsystest%2Ftest5",' in response.content, response.content
         assert (b'"url": "/filebrowser/view=%2Fuser%2Fsystest%2Ft'
           b'est5%2FT%D0%B6%D0%B5%D0%B9%D0%BA%D0%BE%D0%B1",' in response.content), response.content
@@ -259,8 +260,11 @@ class TestFileBrowserWithHadoop(object):
     self.cluster.fs.setuser('test')
     self.prefix = self.cluster.fs_prefix + '/filebrowser'
     self.cluster.fs.do_as_user('test', self.cluster.fs.create_home_dir, '/user/test')
+    # The tests mutate the cluster directly and not through the ProxyFS, which would invalidate the cached listings
+    self.reset = LISTING_CACHE_TTL.set_for_testing(0)
 
   def teardown_method(self):
+    self.reset()
     cleanup_tree(self.cluster, self.prefix)
     assert not self.cluster.fs.exists(self.prefix)
     self.cluster.fs.setuser('test')
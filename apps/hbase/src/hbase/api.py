@@ -17,15 +17,21 @@
 
 from builtins import range
 from builtins import object
+import codecs
+import hashlib
+import itertools
 import json
 import logging
 import re
 import csv
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
+
 from django.utils.encoding import smart_str
 
 from desktop.lib import thrift_util
+from desktop.lib.cache_util import get_shared_cache, has_shared_cache
 from desktop.lib.exceptions_renderable import PopupException
 
 from hbase import conf
@@ -39,6 +45,11 @@ else:
 
 LOG = logging.getLogger()
 
+TABLE_STATES_CACHE_TIMEOUT = 30  # Seconds, tables enabled or disabled outside of Hue are seen after at most this delay
+TABLE_STATE_ACTIONS = ('enableTable', 'disableTable', 'deleteTable')
+SNIFF_LINES = 20
+MUTATION_OVERHEAD = 32  # Approximate size in bytes of the Thrift framing of a Mutation
+
 
 # Format methods similar to Thrift API, for similarity with catch-all
 class HbaseApi(object):
@@ -62,7 +73,11 @@ class HbaseApi(object):
   def queryCluster(self, action, cluster, *args):
     client = self.connectCluster(cluster)
     method = getattr(client, action)
-    return method(*args, doas=self.user.username)
+    try:
+      return method(*args, doas=self.user.username)
+    finally:
+      if action in TABLE_STATE_ACTIONS and has_shared_cache():
+        get_shared_cache().delete(_table_states_cache_key(cluster))
 
   def getClusters(self):
     clusters = []
@@ -145,7 +160,20 @@ class HbaseApi(object):
 
   def getTableList(self, cluster):
     client = self.connectCluster(cluster)
-    return [{'name': name, 'enabled': client.isTableEnabled(name, doas=self.user.username)} for name in client.getTableNames(doas=self.user.username)]
+    names = client.getTableNames(doas=self.user.username)
+
+    # Thrift 1 has no batch call for the states, they are fetched in parallel. They are only cached for the cluster in the
+    # cache shared by the Hue processes, as a table enabled or disabled through another one would not drop them.
+    cache_key = _table_states_cache_key(cluster)
+    states = (get_shared_cache().get(cache_key) or {}) if has_shared_cache() else {}
+    missing = [name for name in names if name not in states]
+    if missing:
+      with ThreadPoolExecutor(max_workers=min(conf.SCAN_CONCURRENCY.get(), len(missing))) as executor:
+        states.update(zip(missing, executor.map(lambda name: client.isTableEnabled(name, doas=self.user.username), missing)))
+      if has_shared_cache():
+        get_shared_cache().set(cache_key, states, TABLE_STATES_CACHE_TIMEOUT)
+
+    return [{'name': name, 'enabled': states[name]} for name in names]
 
   def getRows(self, cluster, tableName, columns, startRowKey, numRows, prefix=False):
     client = self.connectCluster(cluster)
@@ -153,8 +181,22 @@ class HbaseApi(object):
       scanner = client.scannerOpen(tableName, smart_str(startRowKey), columns, None, doas=self.user.username)
     else:
       scanner = client.scannerOpenWithPrefix(tableName, smart_str(startRowKey), columns, None, doas=self.user.username)
-    data = client.scannerGetList(scanner, numRows, doas=self.user.username)
-    client.scannerClose(scanner, doas=self.user.username)
+    return self._scan(client, scanner, numRows)
+
+  def _scan(self, client, scanner, numRows):
+    """Fetches the rows of an opened scanner page by page, then closes it."""
+    caching = max(1, conf.SCAN_CACHING.get())
+    numRows = int(numRows)
+    data = []
+    try:
+      while len(data) < numRows:
+        page_size = min(caching, numRows - len(data))
+        page = client.scannerGetList(scanner, page_size, doas=self.user.username)
+        data += page
+        if len(page) < page_size:
+          break
+    finally:
+      client.scannerClose(scanner, doas=self.user.username)
     return data
 
   def getAutocompleteRows(self, cluster, tableName, numRows, query):
@@ -163,7 +205,7 @@ class HbaseApi(object):
       client = self.connectCluster(cluster)
       scan = get_thrift_type('TScan')(startRow=query, stopRow=None, timestamp=None, columns=[], caching=None, filterString="PrefixFilter('" + query + "') AND ColumnPaginationFilter(1,0)", batchSize=None)
       scanner = client.scannerOpenWithScan(tableName, scan, None, doas=self.user.username)
-      return [result.row for result in client.scannerGetList(scanner, numRows, doas=self.user.username)]
+      return [result.row for result in self._scan(client, scanner, numRows)]
     except Exception as e:
       LOG.error('Autocomplete error: %s' % smart_str(e))
       return []
@@ -188,7 +230,7 @@ class HbaseApi(object):
     client = self.connectCluster(cluster)
     scan = get_thrift_type('TScan')(startRow=rowKey, stopRow=None, timestamp=None, columns=[], caching=None, filterString="ColumnPaginationFilter(%i, %i)" % (number, offset), batchSize=None)
     scanner = client.scannerOpenWithScan(tableName, scan, None, doas=self.user.username)
-    return client.scannerGetList(scanner, 1, doas=self.user.username)
+    return self._scan(client, scanner, 1)
 
   def deleteColumns(self, cluster, tableName, row, columns):
     client = self.connectCluster(cluster)
@@ -222,12 +264,13 @@ class HbaseApi(object):
 
   def getRowQuerySet(self, cluster, tableName, columns, queries):
     client = self.connectCluster(cluster)
-    aggregate_data = []
     limit = conf.TRUNCATE_LIMIT.get()
+    caching = max(1, conf.SCAN_CACHING.get())
     if not isinstance(queries, list):
       queries=json.loads(queries)
     queries = sorted(queries, key=lambda query: query['scan_length']) #sort by scan length
-    for query in queries:
+
+    def scan_query(query):
       scan_length = int(query['scan_length'])
       if query['row_key'] == "null":
         query['row_key'] = ""
@@ -236,28 +279,67 @@ class HbaseApi(object):
         fs = " AND (" + fs.strip() + ")"
       filterstring = "(ColumnPaginationFilter(%i,0) AND PageFilter(%i))" % (limit, limit) + (fs or "")
       scan_columns = [smart_str(column.strip(':')) for column in query['columns']] or [smart_str(column.strip(':')) for column in columns]
-      scan = get_thrift_type('TScan')(startRow=smart_str(query['row_key']), stopRow=None, timestamp=None, columns=scan_columns, caching=None, filterString=filterstring, batchSize=None)
+      scan = get_thrift_type('TScan')(startRow=smart_str(query['row_key']), stopRow=None, timestamp=None, columns=scan_columns,
+                                      caching=min(caching, scan_length) or None, filterString=filterstring, batchSize=None)
       scanner = client.scannerOpenWithScan(tableName, scan, None, doas=self.user.username)
-      aggregate_data += client.scannerGetList(scanner, query['scan_length'], doas=self.user.username)
+      return self._scan(client, scanner, scan_length)
+
+    # The queries are independent, each one is scanned over its own pooled connection
+    aggregate_data = []
+    if queries:
+      with ThreadPoolExecutor(max_workers=max(1, min(conf.SCAN_CONCURRENCY.get(), len(queries)))) as executor:
+        for data in executor.map(scan_query, queries):
+          aggregate_data += data
     return aggregate_data
 
   def bulkUpload(self, cluster, tableName, data):
+    """
+    Reads the CSV rows of the uploaded file one by one and sends them in batches of at most upload_batch_size bytes.
+    Returns the number of rows and batches sent.
+    """
     client = self.connectCluster(cluster)
     BatchMutation = get_thrift_type('BatchMutation')
     Mutation = get_thrift_type('Mutation')
-    columns = []
-    data = data.read()
-    dialect = csv.Sniffer().sniff(data)
-    reader = csv.reader(data.splitlines(), delimiter=dialect.delimiter)
-    columns = next(reader)
-    batches = []
+    max_batch_size = conf.UPLOAD_BATCH_SIZE.get()
+
+    if isinstance(data.read(0), bytes):
+      data = codecs.getreader('utf-8')(data)
+    sample = list(itertools.islice(data, SNIFF_LINES))
+    dialect = csv.Sniffer().sniff(''.join(sample))
+    reader = csv.reader(itertools.chain(sample, data), delimiter=dialect.delimiter)
+    columns = [smart_str(column) for column in next(reader)]
+
+    progress = {'rows': 0, 'batches': 0}
+    batch = []
+    batch_size = 0
+
+    def send(batch):
+      client.mutateRows(tableName, batch, None, doas=self.user.username)
+      progress['rows'] += len(batch)
+      progress['batches'] += 1
+      LOG.info('Bulk upload into %s: %d rows sent in %d batches' % (tableName, progress['rows'], progress['batches']))
+
     for row in reader:
-      row_key = row[0]
-      row_data = {}
+      row_key = smart_str(row[0])
       mutations = []
+      row_size = len(row_key)
       for column_index in range(1, len(row)):
         if str(row[column_index]) != "":
-          mutations.append(Mutation(column=smart_str(columns[column_index]), value=smart_str(row[column_index])))
-      batches += [BatchMutation(row=row_key, mutations=mutations)]
-    client.mutateRows(tableName, batches, None, doas=self.user.username)
-    return True
+          value = smart_str(row[column_index])
+          mutations.append(Mutation(column=columns[column_index], value=value))
+          row_size += len(columns[column_index]) + len(value) + MUTATION_OVERHEAD
+
+      if batch and batch_size + row_size > max_batch_size:
+        send(batch)
+        batch = []
+        batch_size = 0
+      batch.append(BatchMutation(row=row_key, mutations=mutations))
+      batch_size += row_size
+
+    if batch:
+      send(batch)
+    return progress
+
+
+def _table_states_cache_key(cluster):
+  return 'hbase-table-states-%s' % hashlib.md5(smart_str(cluster).encode('utf-8')).hexdigest()
@@ -47,6 +47,28 @@ TRUNCATE_LIMIT = Config(
   type=int
 )
 
+SCAN_CACHING = Config(
+  key="scan_caching",
+  default=100,
+  help=_t("Number of rows fetched per call to the HBase Thrift Server when scanning a table."),
+  type=int
+)
+
+SCAN_CONCURRENCY = Config(
+  key="scan_concurrency",
+  default=4,
+  help=_t("Maximum number of row key queries of a table browsing request scanned in parallel."),
+  type=int
+)
+
+UPLOAD_BATCH_SIZE = Config(
+  key="upload_batch_size",
+  default=1024 * 1024,
+  help=_t("Maximum size in bytes of the rows sent together to the HBase Thrift Server by a bulk upload. "
+          "Must stay below the maximum frame size of the Thrift Server."),
+  type=int
+)
+
 THRIFT_TRANSPORT = Config(
   key="thrift_transport",
   default="buffered",
@@ -21,6 +21,7 @@ import os.path
 import sys
 
 from hadoop import confparse
+from desktop.lib.conf import invalidate_cache
 from desktop.lib.security_util import get_components
 
 if sys.version_info[0] > 2:
@@ -48,6 +49,7 @@ _CNF_HBASE_USE_THRIFT_SSL = 'hbase.thrift.ssl.enabled'
 def reset():
   global SITE_DICT
   SITE_DICT = None
+  invalidate_cache()  # The dynamic defaults of the configs read it
 
 
 def get_conf():
@@ -32,12 +32,16 @@ from hadoop.pseudo_hdfs4 import is_live_cluster
 from useradmin.models import User
 
 from hbase.api import HbaseApi
-from hbase.conf import HBASE_CONF_DIR
+from hbase.conf import HBASE_CONF_DIR, SCAN_CACHING, UPLOAD_BATCH_SIZE
 from hbase.hbase_site import get_server_authentication, get_server_principal, get_conf, reset, _CNF_HBASE_IMPERSONATION_ENABLED, is_impersonation_enabled
 
 if sys.version_info[0] > 2:
+  from io import BytesIO as string_io
+  from unittest.mock import patch, Mock
   open_file = open
 else:
+  from cStringIO import StringIO as string_io
+  from mock import patch, Mock
   open_file = file
 
 
@@ -150,6 +154,89 @@ def test_impersonation():
 
 
 
+class TestHbaseApi(object):
+
+  def setup_method(self):
+    self.client = Mock()
+    self.api = HbaseApi(Mock(username='test'))
+    self.connect = patch.object(HbaseApi, 'connectCluster', return_value=self.client)
+    self.connect.start()
+
+  def teardown_method(self):
+    self.connect.stop()
+
+  def test_get_row_query_set(self):
+    rows = {'a': ['a%d' % i for i in range(5)], 'b': ['b%d' % i for i in range(3)]}
+    scanners = {}
+
+    def scannerOpenWithScan(table, scan, attributes, doas):
+      scanners[scan.startRow] = list(rows[scan.startRow])
+      return scan.startRow
+
+    def scannerGetList(scanner, size, doas):
+      page, scanners[scanner] = scanners[scanner][:size], scanners[scanner][size:]
+      return page
+
+    self.client.scannerOpenWithScan.side_effect = scannerOpenWithScan
+    self.client.scannerGetList.side_effect = scannerGetList
+
+    reset = SCAN_CACHING.set_for_testing(2)
+    try:
+      data = self.api.getRowQuerySet('Cluster', 'table', ['cf:'], [
+        {'row_key': 'a', 'scan_length': 10, 'columns': []},
+        {'row_key': 'b', 'scan_length': 2, 'columns': []},
+      ])
+    finally:
+      reset()
+
+    assert ['b0', 'b1', 'a0', 'a1', 'a2', 'a3', 'a4'] == data  # Sorted by scan length
+    assert [2] * 4 == [call[0][1] for call in self.client.scannerGetList.call_args_list]  # Pages of scan_caching rows
+    assert 2 == self.client.scannerClose.call_count
+
+  @patch('hbase.api.has_shared_cache', Mock(return_value=True))
+  def test_get_table_list(self):
+    from desktop.lib.cache_util import get_shared_cache
+    get_shared_cache().clear()
+
+    self.client.getTableNames.return_value = ['t1', 't2']
+    self.client.isTableEnabled.side_effect = lambda name, doas: name == 't1'
+
+    assert [{'name': 't1', 'enabled': True}, {'name': 't2', 'enabled': False}] == self.api.getTableList('Cluster')
+    assert [{'name': 't1', 'enabled': True}, {'name': 't2', 'enabled': False}] == self.api.getTableList('Cluster')
+    assert 2 == self.client.isTableEnabled.call_count  # Cached
+
+    self.api.queryCluster('disableTable', 'Cluster', 't1')
+    self.client.isTableEnabled.side_effect = lambda name, doas: False
+
+    assert [{'name': 't1', 'enabled': False}, {'name': 't2', 'enabled': False}] == self.api.getTableList('Cluster')
+    assert 4 == self.client.isTableEnabled.call_count
+
+  @patch('hbase.api.has_shared_cache', Mock(return_value=False))
+  def test_get_table_list_not_cached_without_shared_cache(self):
+    self.client.getTableNames.return_value = ['t1', 't2']
+    self.client.isTableEnabled.side_effect = lambda name, doas: name == 't1'
+
+    self.api.getTableList('Cluster')
+    self.api.getTableList('Cluster')
+    assert 4 == self.client.isTableEnabled.call_count
+
+  def test_bulk_upload(self):
+    data = string_io(b'row_key,cf:a,cf:b\n' + b''.join(b'row%d,a%d,b%d\n' % (i, i, i) for i in range(100)))
+
+    reset = UPLOAD_BATCH_SIZE.set_for_testing(1000)
+    try:
+      progress = self.api.bulkUpload('Cluster', 'table', data)
+    finally:
+      reset()
+
+    batches = [call[0][1] for call in self.client.mutateRows.call_args_list]
+    assert {'rows': 100, 'batches': len(batches)} == progress
+    assert len(batches) > 1
+    assert ['row%d' % i for i in range(100)] == [batch.row for rows in batches for batch in rows]
+    assert ['cf:a', 'cf:b'] == [mutation.column for mutation in batches[0][0].mutations]
+    assert 'b99' == batches[-1][-1].mutations[1].value
+
+
 class MockHttpClient(object):
   def __init__(self):
     self.headers = {}
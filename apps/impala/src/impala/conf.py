@@ -199,7 +199,8 @@ AUTH_PASSWORD = Config(
   key="auth_password",
   help=_t("LDAP/PAM/.. password of the hue user used for authentications."),
   private=True,
-  dynamic_default=get_auth_password
+  dynamic_default=get_auth_password,
+  memoize=False
 )
 
 AUTH_PASSWORD_SCRIPT = Config(
@@ -19,6 +19,8 @@ import errno
 import logging
 import os.path
 
+from desktop.lib.conf import invalidate_cache
+
 LOG = logging.getLogger()
 
 _IMPALA_FLAGS = None
@@ -37,6 +39,7 @@ _DEFAULT_HS2_HTTP_PORT = '-hs2_http_port'
 def reset():
   global _IMPALA_FLAGS
   _IMPALA_FLAGS = None
+  invalidate_cache()  # The dynamic defaults of the configs read it
 
 
 def get_conf():
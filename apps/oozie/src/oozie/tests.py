@@ -46,7 +46,7 @@ from hadoop import cluster as originalCluster
 from hadoop.pseudo_hdfs4 import is_live_cluster
 from jobsub.models import OozieDesign, OozieMapreduceAction
 from liboozie import oozie_api
-from liboozie.conf import OOZIE_URL
+from liboozie.conf import JOB_CACHE_TTL, OOZIE_URL
 from liboozie.oozie_api_tests import OozieServerProvider
 from liboozie.submission2 import Submission
 from liboozie.types import WorkflowList, Workflow as OozieWorkflow, Coordinator as OozieCoordinator,\
@@ -124,6 +124,12 @@ class MockOozieApi(object):
 
   def __init__(self, *args, **kwargs):
     self.api_version = 'v2'
+    self.user = 'test'
+
+  get_any_job = oozie_api.OozieApi.get_any_job
+  get_jobs_by_id = oozie_api.OozieApi.get_jobs_by_id
+  jobs_control = oozie_api.OozieApi.jobs_control
+  _fan_out = oozie_api.OozieApi._fan_out
 
   def setuser(self, user):
     pass
@@ -3510,6 +3516,54 @@ class TestDashboard(OozieMockBase):
       assert wf_id in response.content, response.content
 
 
+  def test_list_workflows_progress(self):
+    response = self.c.get(reverse('oozie:list_oozie_workflows') + "?format=json&type=progress&status=RUNNING&status=KILLED")
+    jobs = json.loads(response.content)['jobs']
+    job_ids = [job['id'] for job in jobs]
+
+    assert job_ids
+    assert job_ids == sorted(job_ids, key=MockOozieApi.WORKFLOW_IDS.index) # Order of the listing
+
+
+  def test_bulk_manage_oozie_jobs(self):
+    response = self.c.post(reverse('oozie:bulk_manage_oozie_jobs'), {'job_ids': ' '.join(MockOozieApi.WORKFLOW_IDS[:3]), 'action': 'kill'})
+    data = json.loads(response.content)
+    assert 3 == data['totalRequests']
+    assert 0 == data['totalErrors'], data['messages']
+
+    # Errors are reported per job
+    jobs_control = MockOozieApi.job_control
+    try:
+      MockOozieApi.job_control = lambda api, job_id, action: 'Done' if job_id != MockOozieApi.WORKFLOW_IDS[1] else 1 / 0
+      response = self.c.post(reverse('oozie:bulk_manage_oozie_jobs'), {'job_ids': ' '.join(MockOozieApi.WORKFLOW_IDS[:3]), 'action': 'kill'})
+    finally:
+      MockOozieApi.job_control = jobs_control
+    data = json.loads(response.content)
+    assert 3 == data['totalRequests']
+    assert 1 == data['totalErrors']
+    assert 'division by zero' in data['messages']
+
+
+  def test_bulk_manage_oozie_jobs_reuses_the_progress_jobs(self):
+    reset = JOB_CACHE_TTL.set_for_testing(60)
+    oozie_api._job_cache.clear()
+    get_job = MockOozieApi.get_job
+    try:
+      response = self.c.get(reverse('oozie:list_oozie_workflows') + "?format=json&type=progress&status=RUNNING&status=KILLED")
+      job_ids = [job['id'] for job in json.loads(response.content)['jobs']]
+      assert job_ids
+
+      MockOozieApi.get_job = lambda api, job_id: 1 / 0  # The bulk action must not fetch the jobs again
+      response = self.c.post(reverse('oozie:bulk_manage_oozie_jobs'), {'job_ids': ' '.join(job_ids), 'action': 'kill'})
+    finally:
+      MockOozieApi.get_job = get_job
+      oozie_api._job_cache.clear()
+      reset()
+    data = json.loads(response.content)
+    assert len(job_ids) == data['totalRequests']
+    assert 0 == data['totalErrors'], data['messages']
+
+
   def test_list_coordinators(self):
     response = self.c.get(reverse('oozie:list_oozie_coordinators'))
     assert b'Running' in response.content, response.content
@@ -166,16 +166,21 @@ def bulk_manage_oozie_jobs(request):
 
     oozie_api = get_oozie(request.user)
 
+    # All the permissions are checked before acting on any job
+    oozie_jobs, errors = oozie_api.get_jobs_by_id(jobs)
     for job_id in jobs:
-      job = check_job_access_permission(request, job_id)
-      check_job_edition_permission(job, request.user)
-      try:
-        oozie_api.job_control(job_id, request.POST.get('action'))
-      except RestException as ex:
-        LOG.exception("Error performing bulk operation for job_id=%s", job_id)
+      if job_id in oozie_jobs:
+        check_job_edition_permission(_check_job_access_permission(request, oozie_jobs[job_id]), request.user)
+
+    results, control_errors = oozie_api.jobs_control([job_id for job_id in jobs if job_id in oozie_jobs], request.POST.get('action'))
+    errors.update(control_errors)
+
+    for job_id in jobs:
+      if job_id in errors:
+        LOG.error("Error performing bulk operation for job_id=%s: %s", job_id, errors[job_id])
 
         response['totalErrors'] = response['totalErrors'] + 1
-        response['messages'] += str(ex)
+        response['messages'] += str(errors[job_id])
 
   return JsonResponse(response)
 
@@ -194,6 +199,12 @@ def show_oozie_error(view_func):
   return wraps(view_func)(decorate)
 
 
+def _get_jobs_progress(oozie_api, jobs, get_job):
+  """Fetches the details of the listed jobs in parallel. A job failing to be fetched keeps its summary of the listing."""
+  oozie_jobs, _ = oozie_api.get_jobs_by_id([job.id for job in jobs], get_job=get_job)
+  return [oozie_jobs.get(job.id, job) for job in jobs]
+
+
 @show_oozie_error
 def list_oozie_workflows(request):
   kwargs = {'cnt': OOZIE_JOBS_COUNT.get(), 'filters': []}
@@ -222,7 +233,7 @@ def list_oozie_workflows(request):
       total_jobs = wf_list.total
 
     if request.GET.get('type') == 'progress':
-      json_jobs = [oozie_api.get_job(job.id) for job in json_jobs]
+      json_jobs = _get_jobs_progress(oozie_api, json_jobs, oozie_api.get_job)
 
     response = massaged_oozie_jobs_for_json(json_jobs, request.user, just_sla)
     response['total_jobs'] = total_jobs
@@ -260,7 +271,7 @@ def list_oozie_coordinators(request):
       total_jobs = co_list.total
 
     if request.GET.get('type') == 'progress':
-      json_jobs = [oozie_api.get_coordinator(job.id) for job in json_jobs]
+      json_jobs = _get_jobs_progress(oozie_api, json_jobs, oozie_api.get_coordinator)
 
     response = massaged_oozie_jobs_for_json(json_jobs, request.user)
     response['total_jobs'] = total_jobs
@@ -296,7 +307,7 @@ def list_oozie_bundles(request):
       total_jobs = bundle_list.total
 
     if request.GET.get('type') == 'progress':
-      json_jobs = [oozie_api.get_coordinator(job.id) for job in json_jobs]
+      json_jobs = _get_jobs_progress(oozie_api, json_jobs, oozie_api.get_coordinator)
 
     response = massaged_oozie_jobs_for_json(json_jobs, request.user)
     response['total_jobs'] = total_jobs
@@ -1263,6 +1274,10 @@ def check_job_access_permission(request, job_id, **kwargs):
       LOG.exception(msg)
       raise PopupException(msg, detail=ex._headers.get('oozie-error-message'))
 
+  return _check_job_access_permission(request, oozie_job)
+
+
+def _check_job_access_permission(request, oozie_job):
   if is_admin(request.user) \
       or oozie_job.user == request.user.username \
       or has_dashboard_jobs_access(request.user):
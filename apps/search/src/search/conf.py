@@ -43,7 +43,8 @@ SECURITY_ENABLED = Config(
 
 DOWNLOAD_LIMIT = Config(
   key="download_limit",
-  help=_("Default 1000 rows, max is 15K rows."),
+  help=_("Maximum number of rows of a download, default 1000 rows. The result grid of a dashboard is streamed from Solr "
+          "page by page, the downloads of the widgets are limited to 15K rows."),
   default=1000,
   type=int)
 
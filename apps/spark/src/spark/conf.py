@@ -74,6 +74,30 @@ LIVY_SERVER_SESSION_KIND = Config( # Note: this one is ignored by Livy, this sho
    default="yarn"
 )
 
+LIVY_SESSION_POOL_SIZE = Config(
+  key="livy_session_pool_size",
+  help=_t("Number of idle Livy sessions kept started by the task server for each user, kind and session properties recently "
+          "used, so that the first snippet does not wait for Spark to start. Requires the task server. Set to 0 to disable."),
+  default=0,
+  type=int
+)
+
+LIVY_SESSION_POOL_TTL = Config(
+  key="livy_session_pool_ttl",
+  help=_t("Number of seconds after their last use the pooled Livy sessions of a user, kind and session properties are kept."),
+  default=3600,
+  type=int
+)
+
+LIVY_METADATA_CACHE_TTL = Config(
+  key="livy_metadata_cache_ttl",
+  help=_t("Number of seconds the databases, tables and columns listed by the assist through a Livy session are cached. "
+          "The cache of a user is dropped when they run a DDL statement or refresh the assist. "
+          "Only used with the task server, which provides a cache shared by the Hue processes. Set to 0 to disable."),
+  default=300,
+  type=int
+)
+
 # Spark SQL
 SQL_SERVER_HOST = Config(
   key="sql_server_host",
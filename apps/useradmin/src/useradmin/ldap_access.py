@@ -29,6 +29,7 @@ try:
   import ldap
   import ldap.filter
   from ldap import SCOPE_SUBTREE
+  from ldap.controls import SimplePagedResultsControl
 except ImportError:
   LOG.warning('ldap module not found')
   SCOPE_SUBTREE = None
@@ -269,6 +270,8 @@ class LdapConnection(object):
             ldap_info['groups'] = [smart_str(member) for member in data['memberOf']]
           if 'isMemberOf' in data:
             ldap_info['groups'] = [smart_str(member) for member in data['isMemberOf']]
+          if 'modifyTimestamp' in data:
+            ldap_info['modified'] = smart_str(data['modifyTimestamp'][0])
 
           user_info.append(ldap_info)
     return user_info
@@ -313,6 +316,9 @@ class LdapConnection(object):
                      'not an objectClass or no memberUids found' % group_name)
             ldap_info['posix_members'] = []
 
+          if 'modifyTimestamp' in data:
+            ldap_info['modified'] = smart_str(data['modifyTimestamp'][0])
+
           group_info.append(ldap_info)
 
     return group_info
@@ -473,6 +479,72 @@ class LdapConnection(object):
     result_data = self.find_members_of_group(dn, name_attr, ldap_filter)
     return self._transform_find_group_results(result_data, name_attr, member_attr)
 
+  def find_all_users(self, modified_since=None, page_size=1000, names_only=False):
+    """
+    Pages through the users matching the user filter, only the ones modified since ``modified_since`` when given.
+
+    :param modified_since: A generalized time, e.g. the ``modified`` of a previous result, compared to the ``modifyTimestamp``.
+    :param names_only: Only fetch the DN and name of the users.
+
+    :returns: Generator of lists of dictionaries of ``find_users``, one list per page, with the extra key ``modified``.
+    """
+    user_name_attr = self.ldap_config.USERS.USER_NAME_ATTR.get()
+    ldap_filter = self._get_modified_filter(self.ldap_config.USERS.USER_FILTER.get(), modified_since)
+    if names_only:
+      attrlist = ['dn', 'modifyTimestamp', user_name_attr]
+    else:
+      attrlist = ['objectClass', 'isMemberOf', 'memberOf', 'givenName', 'sn', 'mail', 'dn', 'modifyTimestamp', user_name_attr]
+
+    for result_data in self._paged_search(self._get_root_dn(), ldap_filter, attrlist, page_size):
+      yield self._transform_find_user_results(result_data, user_name_attr)
+
+  def find_all_groups(self, modified_since=None, page_size=1000):
+    """
+    Pages through the groups matching the group filter, only the ones modified since ``modified_since`` when given.
+
+    :returns: Generator of lists of dictionaries of ``find_groups``, one list per page, with the extra key ``modified``.
+    """
+    group_name_attr = self.ldap_config.GROUPS.GROUP_NAME_ATTR.get()
+    group_member_attr = self.ldap_config.GROUPS.GROUP_MEMBER_ATTR.get()
+    ldap_filter = self._get_modified_filter(self.ldap_config.GROUPS.GROUP_FILTER.get(), modified_since)
+    attrlist = ['objectClass', 'dn', 'memberUid', 'modifyTimestamp', group_member_attr, group_name_attr]
+
+    for result_data in self._paged_search(self._get_root_dn(), ldap_filter, attrlist, page_size):
+      yield self._transform_find_group_results(result_data, group_name_attr, group_member_attr)
+
+  def _get_modified_filter(self, ldap_filter, modified_since=None):
+    if not ldap_filter.startswith('('):
+      ldap_filter = '(' + ldap_filter + ')'
+    if modified_since:
+      ldap_filter = '(&%s(modifyTimestamp>=%s))' % (ldap_filter, ldap.filter.escape_filter_chars(modified_since))
+    return ldap_filter
+
+  def _paged_search(self, search_dn, ldap_filter, attrlist, page_size, scope=SCOPE_SUBTREE):
+    """
+    Searches with the RFC 2696 simple paged results control and yields the entries page by page. The control is not
+    critical: servers not supporting it return all the entries in a single page.
+    """
+    self._search_dn = search_dn
+    self._ldap_filter = ldap_filter
+    self._attrlist = attrlist
+
+    control = SimplePagedResultsControl(criticality=False, size=page_size, cookie='')
+
+    while True:
+      ldap_result_id = self.ldap_handle.search_ext(search_dn, scope, ldap_filter, attrlist, serverctrls=[control])
+      result_type, result_data, ldap_result_id, server_controls = self.ldap_handle.result3(ldap_result_id)
+
+      if result_type == ldap.RES_SEARCH_RESULT:
+        yield result_data
+
+      cookies = [
+        server_control.cookie for server_control in server_controls
+        if server_control.controlType == SimplePagedResultsControl.controlType
+      ]
+      if not cookies or not cookies[0]:
+        break
+      control.cookie = cookies[0]
+
   def _get_root_dn(self):
     return self.ldap_config.BASE_DN.get()
 
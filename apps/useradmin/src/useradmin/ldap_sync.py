@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Synchronization of the Hue users and groups imported from LDAP with the current state of the LDAP server.
+
+The users and groups are read with paged searches then compared in memory with the Hue tables. Only the differences
+are written, with bulk statements in transactions of bounded size.
+"""
+from builtins import object
+
+import logging
+import time
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.encoding import smart_str
+
+import desktop.conf
+
+from useradmin.forms import validate_first_name, validate_last_name
+from useradmin.models import LdapGroup, UserProfile, User, Group
+
+LOG = logging.getLogger()
+
+try:
+  import ldap
+  import ldap.dn
+except ImportError:
+  ldap = None
+
+
+def get_watermark_key(server):
+  """Cache key of the watermark of the last sync of a server, to start the next incremental sync from."""
+  return 'useradmin:ldap_sync:watermark:%s' % (server or 'default')
+
+
+def normalize_dn(dn):
+  """
+  Returns the DN in lower case with its values escaped the same way and without the spaces around the separators, so that
+  the member DNs of the groups match the DNs of the users as written by the server.
+  """
+  dn = smart_str(dn)
+  if ldap is not None:
+    try:
+      dn = ldap.dn.dn2str(ldap.dn.str2dn(dn))
+    except ldap.DECODING_ERROR:
+      LOG.warning('Could not parse the DN %s' % dn)
+  return dn.lower()
+
+
+class LdapSync(object):
+  """
+  Syncs the information of the users and the memberships of the groups that already exist in Hue. No user or group is
+  imported or deleted.
+
+  With ``modified_since``, only the users and groups modified since then in LDAP are synced. The report of run() returns
+  the ``watermark`` to pass to the next incremental sync, None when the server does not expose modifyTimestamp.
+
+  ``checkpoint`` is a dictionary updated after each transaction and passed to ``on_progress``. Running again with the same
+  checkpoint skips the work already committed.
+  """
+
+  def __init__(self, connection, modified_since=None, page_size=None, batch_size=None, checkpoint=None, on_progress=None):
+    self.connection = connection
+    self.modified_since = modified_since
+    self.page_size = page_size or desktop.conf.LDAP.SYNC_PAGE_SIZE.get()
+    self.batch_size = batch_size or desktop.conf.LDAP.SYNC_BATCH_SIZE.get()
+    self.checkpoint = checkpoint if checkpoint is not None else {}
+    self.on_progress = on_progress
+
+    self.checkpoint.setdefault('users_done', False)
+    self.checkpoint.setdefault('groups_done', [])
+    self.checkpoint.setdefault('watermark', modified_since)
+
+    self.report = {
+      'users': {'synced': 0, 'updated': 0, 'not_found': 0},
+      'groups': {'synced': 0, 'not_found': 0},
+      'memberships': {'added': 0, 'removed': 0},
+      'failed_users': [],
+      'timings': {},
+      'watermark': None,
+    }
+    self._member_names = None  # Normalized LDAP DN of the users to their name
+
+  def run(self):
+    start = time.time()
+
+    if not self.checkpoint['users_done']:
+      self._sync_users()
+      self.checkpoint['users_done'] = True
+      self._progress()
+    self.report['timings']['users'] = round(time.time() - start, 3)
+
+    groups_start = time.time()
+    self._sync_groups()
+    self.report['timings']['groups'] = round(time.time() - groups_start, 3)
+    self.report['timings']['total'] = round(time.time() - start, 3)
+
+    self.report['watermark'] = self.checkpoint['watermark']
+    LOG.info('LDAP sync done: %s' % self.report)
+    return self.report
+
+  def _sync_users(self):
+    users = dict(
+      (self._get_key(user.username), user) for user in User.objects.filter(
+        userprofile__creation_method=UserProfile.CreationMethod.EXTERNAL.name
+      ).only('id', 'username', 'first_name', 'last_name', 'email')
+    )
+    found = set()
+    member_names = {}
+    updated = []
+
+    for page in self.connection.find_all_users(modified_since=self.modified_since, page_size=self.page_size):
+      for ldap_info in page:
+        self._update_watermark(ldap_info)
+        member_names[normalize_dn(ldap_info['dn'])] = ldap_info['username']
+
+        key = self._get_key(ldap_info['username'])
+        user = users.get(key)
+        if user is None:
+          continue
+        found.add(key)
+
+        try:
+          if self._update_user(user, ldap_info):
+            updated.append(user)
+        except ValidationError as e:
+          self.report['failed_users'].append(ldap_info['username'])
+          LOG.warning('Could not sync %s: %s' % (ldap_info['username'], e))
+
+        if len(updated) >= self.batch_size:
+          self._save_users(updated)
+          updated = []
+
+    self._save_users(updated)
+
+    self.report['users']['synced'] = len(found)
+    if not self.modified_since:
+      self._member_names = member_names  # All the users were listed
+      not_found = [user.username for key, user in users.items() if key not in found]
+      self.report['users']['not_found'] = len(not_found)
+      if not_found:
+        LOG.warning('Could not get LDAP details of %d users: %s' % (len(not_found), ', '.join(not_found[:100])))
+
+  def _update_user(self, user, ldap_info):
+    changed = False
+
+    fields = (('first_name', 'first', validate_first_name), ('last_name', 'last', validate_last_name), ('email', 'email', None))
+
+    for attr, key, validate in fields:
+      if key in ldap_info and getattr(user, attr) != ldap_info[key]:
+        if validate is not None:
+          validate(ldap_info[key])
+        setattr(user, attr, ldap_info[key])
+        changed = True
+
+    return changed
+
+  def _save_users(self, users):
+    if users:
+      with transaction.atomic():
+        User.objects.bulk_update(users, ['first_name', 'last_name', 'email'])
+      self.report['users']['updated'] += len(users)
+
+  def _sync_groups(self):
+    groups = dict((group.name, group) for group in Group.objects.filter(group__in=LdapGroup.objects.all()))
+    user_ids = dict((self._get_key(username), user_id) for user_id, username in User.objects.values_list('id', 'username'))
+    member_names = self._get_member_names()
+    done = set(self.checkpoint['groups_done'])
+    found = set()
+
+    for page in self.connection.find_all_groups(modified_since=self.modified_since, page_size=self.page_size):
+      members = {}
+
+      for ldap_info in page:
+        self._update_watermark(ldap_info)
+
+        group = groups.get(ldap_info['name'])
+        if group is None:
+          continue
+        found.add(group.name)
+        if group.name in done:
+          continue
+
+        usernames = [member_names.get(normalize_dn(member)) for member in ldap_info['members']]
+        usernames += [smart_str(member) for member in ldap_info['posix_members']]
+        members[group.id] = set(user_ids[self._get_key(name)] for name in usernames if name and self._get_key(name) in user_ids)
+
+      self._save_memberships(members)
+      self.checkpoint['groups_done'].extend(group.name for group in groups.values() if group.id in members)
+      self._progress()
+
+    self.report['groups']['synced'] = len(found)
+    if not self.modified_since:
+      self.report['groups']['not_found'] = len(set(groups) - found)
+
+  def _save_memberships(self, members):
+    """Adds and removes the users of the groups to match ``members``, a dictionary of group id to the set of its user ids."""
+    Membership = User.groups.through
+
+    current = dict((group_id, set()) for group_id in members)
+    for group_id, user_id in Membership.objects.filter(group_id__in=list(members)).values_list('group_id', 'user_id'):
+      current[group_id].add(user_id)
+
+    added = [(group_id, user_id) for group_id, user_ids in members.items() for user_id in user_ids - current[group_id]]
+    removed = [(group_id, user_id) for group_id, user_ids in current.items() for user_id in user_ids - members[group_id]]
+
+    for start in range(0, len(added), self.batch_size):
+      with transaction.atomic():
+        Membership.objects.bulk_create(
+          [Membership(group_id=group_id, user_id=user_id) for group_id, user_id in added[start:start + self.batch_size]],
+          ignore_conflicts=True
+        )
+
+    for start in range(0, len(removed), self.batch_size):
+      batch = {}
+      for group_id, user_id in removed[start:start + self.batch_size]:
+        batch.setdefault(group_id, []).append(user_id)
+      with transaction.atomic():
+        for group_id, batch_user_ids in batch.items():
+          Membership.objects.filter(group_id=group_id, user_id__in=batch_user_ids).delete()
+
+    self.report['memberships']['added'] += len(added)
+    self.report['memberships']['removed'] += len(removed)
+
+  def _get_member_names(self):
+    if self._member_names is None:
+      # Only the modified users were listed, or none when resuming
+      self._member_names = dict(
+        (normalize_dn(ldap_info['dn']), ldap_info['username'])
+        for page in self.connection.find_all_users(page_size=self.page_size, names_only=True) for ldap_info in page
+      )
+    return self._member_names
+
+  def _get_key(self, username):
+    return username.lower() if desktop.conf.LDAP.IGNORE_USERNAME_CASE.get() else username
+
+  def _update_watermark(self, ldap_info):
+    modified = ldap_info.get('modified')
+    if modified and (self.checkpoint['watermark'] is None or modified > self.checkpoint['watermark']):
+      self.checkpoint['watermark'] = modified
+
+  def _progress(self):
+    if self.on_progress is not None:
+      self.on_progress(self.checkpoint, self.report)
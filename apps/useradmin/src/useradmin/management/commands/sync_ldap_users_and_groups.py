@@ -15,13 +15,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import sys
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 from desktop.conf import LDAP
+from desktop.lib.cache_util import get_shared_cache, has_shared_cache
 
 from useradmin import ldap_access
+from useradmin.ldap_sync import get_watermark_key
 from useradmin.views import sync_ldap_users_and_groups
 
 if sys.version_info[0] > 2:
@@ -41,10 +44,30 @@ class Command(BaseCommand):
     parser.add_argument("--server", help=_t("Server to connect to."),
                               action="store",
                               default=None)
+    parser.add_argument("--incremental", help=_t("Only sync the users and groups modified in LDAP since the previous sync. "
+                              "Requires the task server."),
+                              action="store_true",
+                              default=False)
+    parser.add_argument("--modified-since", help=_t("Only sync the users and groups modified in LDAP since this generalized time, "
+                              "e.g. 20240101000000Z."),
+                              action="store",
+                              default=None)
 
   def handle(self, **options):
     server = options['server']
+    cache = get_shared_cache()
+    watermark_key = get_watermark_key(server)
+
+    modified_since = options['modified_since']
+    if options['incremental'] and not modified_since:
+      if not has_shared_cache():  # The cache of this process is gone with it, there would be no previous sync
+        raise CommandError(_t('--incremental requires the task server, use --modified-since instead.'))
+      modified_since = cache.get(watermark_key)
 
     connection = ldap_access.get_connection_from_server(server)
 
-    sync_ldap_users_and_groups(connection)
+    report = sync_ldap_users_and_groups(connection, modified_since=modified_since)
+
+    if report['watermark'] and has_shared_cache():
+      cache.set(watermark_key, report['watermark'], timeout=None)
+    self.stdout.write(json.dumps(report, indent=2))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+
+import ldap
+
+from django.core.cache import caches
+from django.utils import timezone
+
+from desktop.celery import app
+from desktop.lib import fsmanager
+from desktop.settings import CACHES_CELERY_KEY
+from useradmin import ldap_access
+from useradmin.ldap_sync import LdapSync, get_watermark_key
+from useradmin.models import User, UserProfile
+from useradmin.views import ensure_home_directory
+
+LOG = logging.getLogger()
+
+
+@app.task
+def error_handler(request, exc, traceback):
+  LOG.error('Task %s raised exception: %r\n%r' % (request.id, exc, traceback))
+
+
+def ldap_sync_checkpoint_key(task_id):
+  return 'useradmin:ldap_sync:checkpoint:%s' % task_id
+
+
+@app.task(autoretry_for=(ldap.LDAPError,), retry_backoff=True, max_retries=3)
+def sync_ldap_users_and_groups_task(**kwargs):
+  """
+  Syncs the existing LDAP users and groups. The progress is reported in the task state and the groups already synced
+  are checkpointed, so that a retry resumes it.
+  With incremental, only the entries modified in LDAP since the previous successful sync are read.
+  """
+  task_id = kwargs["task_id"]
+  server = kwargs.get("server")
+  cache = caches[CACHES_CELERY_KEY]
+  kwargs["username"] = User.objects.get(id=kwargs["user_id"]).username
+  kwargs["task_name"] = "ldap_sync"
+  kwargs["state"] = "RUNNING"
+  kwargs["progress"] = "0%"
+  kwargs["task_start"] = timezone.now().strftime("%Y-%m-%dT%H:%M:%S")
+  sync_ldap_users_and_groups_task.update_state(task_id=task_id, state='RUNNING', meta=kwargs)
+
+  checkpoint_key = ldap_sync_checkpoint_key(task_id)
+  checkpoint = cache.get(checkpoint_key) or {}
+  modified_since = cache.get(get_watermark_key(server)) if kwargs.get("incremental") else None
+
+  def on_progress(checkpoint, report):
+    cache.set(checkpoint_key, dict(checkpoint), timeout=None)
+    kwargs["progress"] = "50%" if not checkpoint['groups_done'] else "75%"
+    kwargs["report"] = report
+    sync_ldap_users_and_groups_task.update_state(task_id=task_id, state='PROGRESS', meta=kwargs)
+
+  try:
+    connection = ldap_access.get_connection_from_server(server)
+    report = LdapSync(connection, modified_since=modified_since, checkpoint=checkpoint, on_progress=on_progress).run()
+
+    if kwargs.get("ensure_home_directory"):
+      fs = fsmanager.get_filesystem('default')
+      for user in User.objects.filter(userprofile__creation_method=UserProfile.CreationMethod.EXTERNAL.name):
+        ensure_home_directory(fs, user)
+  except Exception:
+    kwargs["state"] = "FAILURE"
+    sync_ldap_users_and_groups_task.update_state(task_id=task_id, state='FAILURE', meta=kwargs)
+    LOG.exception("LDAP sync of the server %s failed" % (server or 'default'))
+    raise
+
+  cache.delete(checkpoint_key)
+  if report['watermark']:
+    cache.set(get_watermark_key(server), report['watermark'], timeout=None)
+  kwargs["state"] = "SUCCESS"
+  kwargs["progress"] = "100%"
+  kwargs["report"] = report
+  kwargs["task_end"] = timezone.now().strftime("%Y-%m-%dT%H:%M:%S")
+  sync_ldap_users_and_groups_task.update_state(task_id=task_id, state='SUCCESS', meta=kwargs)
+  return None
@@ -22,6 +22,8 @@ import pytest
 import sys
 
 from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.db.utils import DatabaseError
 from django.urls import reverse
 
@@ -32,6 +34,7 @@ from hadoop import pseudo_hdfs4
 from hadoop.pseudo_hdfs4 import is_live_cluster
 
 from useradmin import ldap_access
+from useradmin.ldap_sync import LdapSync
 from useradmin.models import LdapGroup, UserProfile
 from useradmin.models import get_profile, User, Group
 from useradmin.views import sync_ldap_users, sync_ldap_groups, import_ldap_users, import_ldap_groups, \
@@ -796,6 +799,86 @@ class TestUserAdminLdap(BaseUserAdminTests):
       for finish in reset:
         finish()
 
+  def _import_for_sync(self):
+    ldap_access.CACHED_LDAP_CONN = LdapTestConnection()
+    for username in ('moe', 'lårry', 'curly'):
+      import_ldap_users(ldap_access.CACHED_LDAP_CONN, username, sync_groups=False, import_by_dn=False)
+    for groupname in ('TestUsers', 'Test Administrators'):
+      import_ldap_groups(ldap_access.CACHED_LDAP_CONN, groupname, import_members=False,
+        import_members_recursive=False, sync_users=False, import_by_dn=False)
+    return ldap_access.CACHED_LDAP_CONN
+
+  def test_ldap_sync(self):
+    connection = self._import_for_sync()
+    connection._instance.users['curly']['first'] = 'Curly Howard'
+
+    report = LdapSync(connection, page_size=2, batch_size=2).run()
+
+    assert 'Curly Howard' == User.objects.get(username='curly').first_name
+    assert ['curly', 'lårry', 'moe'] == sorted(User.objects.get(username='moe').groups.get().user_set.values_list('username', flat=True))
+    assert ['curly', 'lårry'] == sorted(Group.objects.get(name='Test Administrators').user_set.values_list('username', flat=True))
+    assert {'synced': 3, 'updated': 1, 'not_found': 0} == report['users']
+    assert {'synced': 2, 'not_found': 0} == report['groups']
+    assert {'added': 5, 'removed': 0} == report['memberships']
+    assert ['users', 'groups', 'total'] == list(report['timings'])
+
+    # Only the differences are written
+    connection.remove_user_group_for_test('uid=curly,ou=People,dc=example,dc=com', 'TestUsers')
+    report = LdapSync(connection).run()
+
+    assert ['Test Administrators'] == list(User.objects.get(username='curly').groups.values_list('name', flat=True))
+    assert {'synced': 3, 'updated': 0, 'not_found': 0} == report['users']
+    assert {'added': 0, 'removed': 1} == report['memberships']
+
+  def test_ldap_sync_matches_member_dns_written_differently(self):
+    connection = self._import_for_sync()
+    LdapSync(connection).run()
+
+    members = connection._instance.groups['Test Administrators']['members']
+    members[members.index('uid=curly,ou=People,dc=example,dc=com')] = 'UID=curly, ou=People, DC=example, DC=com'
+    report = LdapSync(connection).run()
+
+    assert ['curly', 'lårry'] == sorted(Group.objects.get(name='Test Administrators').user_set.values_list('username', flat=True))
+    assert {'added': 0, 'removed': 0} == report['memberships']
+
+  def test_ldap_sync_resume(self):
+    connection = self._import_for_sync()
+    connection._instance.users['curly']['first'] = 'Curly Howard'
+    checkpoints = []
+
+    report = LdapSync(
+      connection, checkpoint={'users_done': True, 'groups_done': ['TestUsers']}, on_progress=lambda checkpoint, report: checkpoints.append(
+        dict(checkpoint, groups_done=list(checkpoint['groups_done']))
+      )
+    ).run()
+
+    assert 'Curly' == User.objects.get(username='curly').first_name
+    assert not Group.objects.get(name='TestUsers').user_set.exists()
+    assert 2 == Group.objects.get(name='Test Administrators').user_set.count()
+    assert {'added': 2, 'removed': 0} == report['memberships']
+    assert ['TestUsers', 'Test Administrators'] == checkpoints[-1]['groups_done']
+
+  def test_ldap_sync_incremental(self):
+    connection = self._import_for_sync()
+    for entry in list(connection._instance.users.values()) + list(connection._instance.groups.values()):
+      entry['modified'] = '20240101000000Z'
+    connection._instance.users['moe']['first'] = 'Moses'
+    connection._instance.users['curly'].update(first='Curly Howard', modified='20240201000000Z')
+
+    report = LdapSync(connection, modified_since='20240115000000Z').run()
+
+    assert 'Curly Howard' == User.objects.get(username='curly').first_name
+    assert 'Moe' == User.objects.get(username='moe').first_name
+    assert not Group.objects.get(name='TestUsers').user_set.exists()
+    assert {'synced': 1, 'updated': 1, 'not_found': 0} == report['users']
+    assert 0 == report['groups']['synced']
+    assert '20240201000000Z' == report['watermark']
+
+  def test_ldap_sync_incremental_requires_shared_cache(self):
+    with patch('useradmin.management.commands.sync_ldap_users_and_groups.has_shared_cache', Mock(return_value=False)):
+      with pytest.raises(CommandError):
+        call_command('sync_ldap_users_and_groups', incremental=True)
+
   def test_ldap_exception_handling(self):
     # Set up LDAP tests to use a LdapTestConnection instead of an actual LDAP connection
     ldap_access.CACHED_LDAP_CONN = LdapTestConnection()
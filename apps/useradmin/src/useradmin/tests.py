@@ -185,6 +185,19 @@ class LdapTestConnection(object):
 
     return groups
 
+  def find_all_users(self, modified_since=None, page_size=1000, names_only=False):
+    return self._find_all(list(self._instance.users.values()), modified_since, page_size)
+
+  def find_all_groups(self, modified_since=None, page_size=1000):
+    return self._find_all(list(self._instance.groups.values()), modified_since, page_size)
+
+  def _find_all(self, entries, modified_since, page_size):
+    """ Yields the entries by pages, the ones without 'modified' are considered as modified """
+    if modified_since:
+      entries = [entry for entry in entries if entry.get('modified', modified_since) >= modified_since]
+    for start in range(0, len(entries), page_size):
+      yield entries[start:start + page_size]
+
   class Data(object):
     def __init__(self):
       long_username = create_long_username()
@@ -23,6 +23,7 @@ import logging
 import subprocess
 import sys
 import json
+import uuid
 
 LOG = logging.getLogger()
 
@@ -43,7 +44,7 @@ from django.utils.encoding import smart_str
 
 import desktop.conf
 from desktop.auth.backend import is_admin
-from desktop.conf import LDAP, ENABLE_ORGANIZATIONS, ENABLE_CONNECTORS, ENABLE_SHARING
+from desktop.conf import LDAP, ENABLE_ORGANIZATIONS, ENABLE_CONNECTORS, ENABLE_SHARING, TASK_SERVER
 from desktop.lib.django_util import JsonResponse, render
 from desktop.lib.exceptions_renderable import PopupException
 from desktop.models import _get_apps
@@ -55,6 +56,7 @@ from useradmin.forms import SyncLdapUsersGroupsForm, AddLdapGroupsForm, AddLdapU
   PermissionsEditForm, GroupEditForm, SuperUserChangeForm, validate_username, validate_first_name, \
   validate_last_name, PasswordChangeForm
 from useradmin.ldap_access import LdapBindException, LdapSearchException
+from useradmin.ldap_sync import LdapSync
 from useradmin.models import HuePermission, UserProfile, LdapGroup, get_profile, get_default_user_group, User, Group, Organization
 
 if sys.version_info[0] > 2:
@@ -749,6 +751,20 @@ def sync_ldap_users_groups(request):
     if form.is_valid():
       is_ensuring_home_directory = form.cleaned_data['ensure_home_directory']
       server = form.cleaned_data.get('server')
+
+      if TASK_SERVER.ENABLED.get():
+        task_id = _submit_ldap_sync_task(request, server, is_ensuring_home_directory)
+        request.audit = {
+          'operation': 'SYNC_LDAP_USERS_GROUPS',
+          'operationText': 'Submitted the sync of the LDAP users/groups in task %s' % task_id
+        }
+        request.info(_('The LDAP users and groups are being synced in the background.'))
+
+        if is_embeddable:
+          return JsonResponse({'url': '/hue' + reverse('useradmin:useradmin.views.list_users'), 'task_id': task_id})
+        else:
+          return redirect(reverse('useradmin:useradmin.views.list_users'))
+
       try:
         connection = ldap_access.get_connection_from_server(server)
       except (ldap.LDAPError, LdapBindException) as e:
@@ -783,22 +799,40 @@ def sync_ldap_users_groups(request):
     return render("sync_ldap_users_groups.mako", request, dict(path=request.path, form=form, is_embeddable=is_embeddable))
 
 
-def sync_ldap_users_and_groups(connection, is_ensuring_home_directory=False, fs=None, failed_users=None):
+def sync_ldap_users_and_groups(connection, is_ensuring_home_directory=False, fs=None, failed_users=None, modified_since=None):
+  """
+  Syncs the existing LDAP users and groups with paged searches and bulk writes, see LdapSync. Returns the report of the sync.
+  """
   try:
-    users = sync_ldap_users(connection, failed_users=failed_users)
-    groups = sync_ldap_groups(connection, failed_users=failed_users)
+    report = LdapSync(connection, modified_since=modified_since).run()
   except (ldap.LDAPError, LdapBindException) as e:
     LOG.error("LDAP Exception: %s" % smart_str(e))
     raise PopupException(smart_str(_('There was an error when communicating with LDAP: %s')) % str(e))
 
+  if failed_users is not None:
+    failed_users.extend(report['failed_users'])
+
   # Create home dirs for every user sync'd
   if is_ensuring_home_directory:
-    for user in users:
+    for user in User.objects.filter(userprofile__creation_method=UserProfile.CreationMethod.EXTERNAL.name):
       try:
         ensure_home_directory(fs, user)
       except (IOError, WebHdfsException) as e:
         raise PopupException(_("The import may not be complete, sync again."), detail=e)
 
+  return report
+
+
+def _submit_ldap_sync_task(request, server, is_ensuring_home_directory):
+  """Syncs in the task server, so that large directories do not hold the request open."""
+  from useradmin.tasks import sync_ldap_users_and_groups_task, error_handler
+
+  task_id = str(uuid.uuid4())
+  kwargs = {'task_id': task_id, 'user_id': request.user.id, 'server': server, 'ensure_home_directory': is_ensuring_home_directory}
+  sync_ldap_users_and_groups_task.apply_async(task_id=task_id, args=(), kwargs=kwargs, link_error=error_handler.s(), queue="default")
+  LOG.info("LDAP sync task started %s" % task_id)
+  return task_id
+
 
 def import_ldap_users(connection, user_pattern, sync_groups, import_by_dn, server=None, failed_users=None):
   return _import_ldap_users(
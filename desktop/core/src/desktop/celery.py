@@ -50,6 +50,11 @@ class HueCelery(Celery):
       'args': (),
       'kwargs': {'cleanup_threshold': 90},  # Provide task arguments if needed
       },
+      'top_up_livy_session_pool': {
+      'task': 'notebook.top_up_livy_session_pool',
+      'schedule': 60.0,  # Run every 60 seconds
+      'args': (),
+      },
     }
 
 if hasattr(TASK_SERVER, 'get') and TASK_SERVER.ENABLED.get():
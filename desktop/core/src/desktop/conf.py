@@ -461,7 +461,8 @@ AUTH_PASSWORD = Config(
   help=_("LDAP/PAM/.. password of the hue user used for authentications. Inactive if empty. "
   "For example for LDAP Authentication with HiveServer2/Impala."),
   private=True,
-  dynamic_default=get_auth_password)
+  dynamic_default=get_auth_password,
+  memoize=False)
 
 AUTH_PASSWORD_SCRIPT = Config(
   key="auth_password_script",
@@ -773,7 +774,7 @@ METRICS = ConfigSection(
   members=dict(
     ENABLE_WEB_METRICS=Config(
       key='enable_web_metrics',
-      help=_('Enable metrics URL "desktop/metrics"'),
+      help=_('Enable metrics URL "desktop/metrics" and its Prometheus format "desktop/metrics/prometheus"'),
       default=True,
       type=coerce_bool),
     LOCATION=Config(
@@ -789,12 +790,6 @@ METRICS = ConfigSection(
 )
 
 
-def is_gunicorn_report_enabled():
-  return 'rungunicornserver' in sys.argv \
-    and METRICS.LOCATION.get() is not None \
-    and METRICS.COLLECTION_INTERVAL.get() is not None
-
-
 SLACK = ConfigSection(
   key='slack',
   help=_("""Configuration options for slack """),
@@ -1073,6 +1068,28 @@ ENABLE_SMART_THRIFT_POOL = Config(
   default=False
 )
 
+THRIFT_POOL_MIN_SIZE = Config(
+  key="thrift_pool_min_size",
+  help=_("Minimum number of idle Thrift connections kept open per service endpoint. "
+         "Connections are opened on demand up to cherrypy_server_threads."),
+  type=int,
+  default=0
+)
+
+THRIFT_POOL_IDLE_TIMEOUT = Config(
+  key="thrift_pool_idle_timeout",
+  help=_("Number of seconds a pooled Thrift connection can stay idle before being closed. 0 disables the eviction."),
+  type=int,
+  default=600
+)
+
+THRIFT_POOL_VALIDATION_INTERVAL = Config(
+  key="thrift_pool_validation_interval",
+  help=_("Number of seconds between two background checks of the idle pooled Thrift connections."),
+  type=int,
+  default=60
+)
+
 
 # See python's documentation for time.tzset for valid values.
 TIME_ZONE = Config(
@@ -1338,6 +1355,14 @@ LDAP = ConfigSection(
       help=_("Define the number of levels to search for nested members."),
       type=int,
       default=10),
+    SYNC_PAGE_SIZE=Config("sync_page_size",
+      help=_("Number of entries per page of the paged LDAP searches of the users and groups sync."),
+      type=int,
+      default=1000),
+    SYNC_BATCH_SIZE=Config("sync_batch_size",
+      help=_("Maximum number of rows written per transaction by the users and groups sync."),
+      type=int,
+      default=1000),
     FOLLOW_REFERRALS=Config("follow_referrals",
       help=_("Whether or not to follow referrals."),
       type=coerce_bool,
@@ -2087,6 +2112,19 @@ WEBSOCKETS = ConfigSection(
       default=6379,
       help=_('Layer backend port.')
     ),
+    PUSH_QUERY_STATUS=Config(
+      key='push_query_status',
+      default=False,
+      type=coerce_bool,
+      help=_('If the status, progress and first page of results of the queries are pushed to the editors connected to the '
+             'websocket, instead of being polled by them.')
+    ),
+    QUERY_STATUS_INTERVAL=Config(
+      key='query_status_interval',
+      type=int,
+      default=1,
+      help=_('Interval in seconds between two checks of the status of the pushed queries.')
+    ),
   )
 )
 
@@ -138,6 +138,7 @@ export interface ExecutionHistory {
 export interface ExecuteApiResponse {
   handle: ExecutionHandle;
   history?: ExecutionHistory;
+  statusPushed?: boolean;
 }
 
 export interface ExecuteStatusApiResponse {
@@ -229,6 +230,7 @@ export const executeStatement = async (options: ExecuteApiOptions): Promise<Exec
       history_uuid?: string;
       history_parent_uuid?: string;
       result?: ResultApiResponse;
+      status_pushed?: boolean;
     },
     ExecuteData
   >(url, data, {
@@ -265,7 +267,8 @@ export const executeStatement = async (options: ExecuteApiOptions): Promise<Exec
   response.handle.result = response.result;
 
   const cleanedResponse: ExecuteApiResponse = {
-    handle: response.handle
+    handle: response.handle,
+    statusPushed: !!response.status_pushed
   };
 
   if (typeof response.history_id !== 'undefined') {
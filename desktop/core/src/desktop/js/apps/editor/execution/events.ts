@@ -14,7 +14,7 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
-import { Session } from 'apps/editor/execution/api';
+import { ExecuteStatusApiResponse, Session } from 'apps/editor/execution/api';
 import ExecutionResult from './executionResult';
 import SqlExecutable, { ExecutionStatus } from './sqlExecutable';
 import ExecutionLogs from './executionLogs';
@@ -35,6 +35,12 @@ export type ExecutableLogsUpdatedEvent = ExecutionLogs;
 export const EXECUTABLE_RESULT_UPDATED_TOPIC = 'hue.executable.result.updated';
 export type ExecutableResultUpdatedEvent = ExecutionResult;
 
+export const QUERY_STATUS_PUSHED_TOPIC = 'editor.ws.query.status';
+export interface QueryStatusPushedEvent extends ExecuteStatusApiResponse {
+  query_id: string;
+  progress?: number;
+}
+
 export const SHOW_SESSION_AUTH_MODAL_TOPIC = 'show.session.auth.modal';
 export interface ShowSessionAuthModalEvent {
   message?: string;
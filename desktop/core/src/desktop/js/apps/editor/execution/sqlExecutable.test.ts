@@ -19,9 +19,11 @@ import { CancellablePromise } from 'api/cancellablePromise';
 import Executor from 'apps/editor/execution/executor';
 import SqlExecutable from './sqlExecutable';
 import { ExecutionStatus } from './sqlExecutable';
+import { QUERY_STATUS_PUSHED_TOPIC, QueryStatusPushedEvent } from './events';
 import sessionManager from './sessionManager';
 import * as ApiUtils from 'api/utils';
 import { ParsedSqlStatement } from 'parse/sqlStatementsParser';
+import huePubSub from 'utils/huePubSub';
 
 describe('sqlExecutable.js', () => {
   afterEach(() => {
@@ -144,6 +146,97 @@ describe('sqlExecutable.js', () => {
     expect(subject.status).toEqual(ExecutionStatus.available);
   });
 
+  it('should follow the pushed status instead of polling it', async () => {
+    const subject = createSubject(SELECT_STATEMENT, undefined, 'impala');
+
+    let checkStatusApiHits = 0;
+
+    jest.spyOn(ApiUtils, 'post').mockImplementation((url: string): CancellablePromise<unknown> => {
+      if (url.indexOf('/create_session') !== -1) {
+        return CancellablePromise.resolve({ session: { type: 'foo' } });
+      } else if (url.indexOf('/execute') !== -1) {
+        return CancellablePromise.resolve({
+          handle: {},
+          history_id: 1,
+          history_uuid: 'some-history_uuid',
+          status_pushed: true
+        });
+      } else if (url.indexOf('/check_status') !== -1) {
+        checkStatusApiHits++;
+        return CancellablePromise.resolve({ query_status: { status: ExecutionStatus.running } });
+      } else if (url.indexOf('/get_logs') !== -1) {
+        return CancellablePromise.resolve({ status: 0, logs: '' });
+      }
+      fail('fail for URL: ' + url);
+      throw new Error('Did not find URL: ' + url);
+    });
+
+    const flush = () => new Promise(resolve => setTimeout(resolve, 0));
+
+    await subject.execute();
+    await flush();
+
+    huePubSub.publish<QueryStatusPushedEvent>(QUERY_STATUS_PUSHED_TOPIC, {
+      query_id: 'other-history_uuid',
+      status: ExecutionStatus.failed
+    });
+    huePubSub.publish<QueryStatusPushedEvent>(QUERY_STATUS_PUSHED_TOPIC, {
+      query_id: 'some-history_uuid',
+      status: ExecutionStatus.running,
+      progress: 40
+    });
+    await flush();
+
+    expect(subject.status).toEqual(ExecutionStatus.running);
+    expect(subject.progress).toEqual(40);
+
+    huePubSub.publish<QueryStatusPushedEvent>(QUERY_STATUS_PUSHED_TOPIC, {
+      query_id: 'some-history_uuid',
+      status: ExecutionStatus.success
+    });
+    await flush();
+
+    expect(subject.status).toEqual(ExecutionStatus.success);
+    expect(checkStatusApiHits).toEqual(1); // Checked once in case it finished before the subscription
+  });
+
+  it('should check the status of a pushed query once in case it already finished', async () => {
+    const subject = createSubject(SELECT_STATEMENT, undefined, 'impala');
+
+    jest.spyOn(ApiUtils, 'post').mockImplementation((url: string): CancellablePromise<unknown> => {
+      if (url.indexOf('/create_session') !== -1) {
+        return CancellablePromise.resolve({ session: { type: 'foo' } });
+      } else if (url.indexOf('/execute') !== -1) {
+        return CancellablePromise.resolve({
+          handle: {},
+          history_id: 1,
+          history_uuid: 'some-history_uuid',
+          status_pushed: true
+        });
+      } else if (url.indexOf('/check_status') !== -1) {
+        return CancellablePromise.resolve({ query_status: { status: ExecutionStatus.success } });
+      } else if (url.indexOf('/get_logs') !== -1) {
+        return CancellablePromise.resolve({ status: 0, logs: '' });
+      }
+      fail('fail for URL: ' + url);
+      throw new Error('Did not find URL: ' + url);
+    });
+
+    await subject.execute();
+    await new Promise(resolve => setTimeout(resolve, 0));
+
+    expect(subject.status).toEqual(ExecutionStatus.success);
+
+    // Late messages are ignored
+    huePubSub.publish<QueryStatusPushedEvent>(QUERY_STATUS_PUSHED_TOPIC, {
+      query_id: 'some-history_uuid',
+      status: ExecutionStatus.running
+    });
+    await new Promise(resolve => setTimeout(resolve, 0));
+
+    expect(subject.status).toEqual(ExecutionStatus.success);
+  });
+
   it('should update the handle on check status after execute', async () => {
     const subject = createSubject(SELECT_STATEMENT, undefined, 'impala');
 
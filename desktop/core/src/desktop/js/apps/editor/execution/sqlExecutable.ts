@@ -21,6 +21,7 @@ import {
   closeStatement,
   ExecuteApiResponse,
   executeStatement,
+  ExecuteStatusApiResponse,
   ExecutionHandle,
   ExecutionHistory
 } from 'apps/editor/execution/api';
@@ -28,7 +29,9 @@ import {
   EXECUTABLE_TRANSITIONED_TOPIC,
   EXECUTABLE_UPDATED_TOPIC,
   ExecutableTransitionedEvent,
-  ExecutableUpdatedEvent
+  ExecutableUpdatedEvent,
+  QUERY_STATUS_PUSHED_TOPIC,
+  QueryStatusPushedEvent
 } from 'apps/editor/execution/events';
 import ExecutionResult from 'apps/editor/execution/executionResult';
 import ExecutionLogs, {
@@ -43,7 +46,7 @@ import { HueAlert } from 'reactComponents/AlertComponent/types';
 import { GLOBAL_ERROR_TOPIC } from 'reactComponents/AlertComponent/events';
 import { hueWindow } from 'types/types';
 import hueAnalytics from 'utils/hueAnalytics';
-import huePubSub from 'utils/huePubSub';
+import huePubSub, { HueSubscription } from 'utils/huePubSub';
 import UUID from 'utils/string/UUID';
 
 export enum ExecutionStatus {
@@ -82,6 +85,7 @@ export interface SqlExecutableRaw extends ExecutableRaw {
 
 const BATCHABLE_STATEMENT_TYPES =
   /ALTER|ANALYZE|WITH|REFRESH|CREATE|DELETE|DROP|GRANT|INSERT|INVALIDATE|LOAD|SET|TRUNCATE|UPDATE|FROM|UPSERT|USE/i;
+const PUSHED_STATUS_TIMEOUT = 10000; // Polls when no status is pushed for this long, in ms
 const SELECT_END_REGEX = /([^;]*)([;]?[^;]*)/;
 const ERROR_REGEX = /line ([0-9]+)(:([0-9]+))?/i;
 const TABLE_DDL_REGEX =
@@ -260,8 +264,10 @@ export default class SqlExecutable {
         'notebook',
         'execute/' + (this.executor.connector() ? this.executor.connector().dialect : '')
       );
+      let statusPushed = false;
       try {
         const response = await this.internalExecute();
+        statusPushed = !!response.statusPushed;
         this.handle = response.handle;
         this.history = response.history;
         if (response.history) {
@@ -300,7 +306,11 @@ export default class SqlExecutable {
         huePubSub.publish('editor.upload.query', this.history.id);
       }
 
-      this.checkStatus();
+      if (statusPushed) {
+        this.watchPushedStatus();
+      } else {
+        this.checkStatus();
+      }
       this.logs.fetchLogs();
     } catch (err) {
       console.warn(err);
@@ -327,6 +337,81 @@ export default class SqlExecutable {
 
     const queryStatus = await checkExecutionStatus({ executable: this });
 
+    if (await this.handleStatus(queryStatus)) {
+      checkStatusTimeout = window.setTimeout(
+        () => {
+          this.checkStatus(statusCheckCount);
+        },
+        actualCheckCount > 45 ? 5000 : 1000
+      );
+    }
+  }
+
+  /**
+   * Follows the status pushed by the server through the websocket. The status is also checked once
+   * as the query can finish before the subscription, and polled when nothing is pushed for a while,
+   * e.g. when the websocket is closed.
+   */
+  watchPushedStatus(): void {
+    const queryId = (this.history && this.history.uuid) || (this.handle && this.handle.guid);
+    let done = false;
+    let fallbackTimeout = -1;
+    let subscription: HueSubscription | undefined;
+
+    const stop = (): void => {
+      done = true;
+      window.clearTimeout(fallbackTimeout);
+      subscription?.remove();
+    };
+
+    const waitForPush = (): void => {
+      window.clearTimeout(fallbackTimeout);
+      fallbackTimeout = window.setTimeout(() => {
+        if (!done) {
+          stop();
+          this.checkStatus();
+        }
+      }, PUSHED_STATUS_TIMEOUT);
+    };
+
+    const onStatus = async (queryStatus: ExecuteStatusApiResponse & { progress?: number }) => {
+      if (done) {
+        return;
+      }
+      const running = await this.handleStatus(queryStatus);
+      if (!running) {
+        stop();
+      } else if (typeof queryStatus.progress === 'number') {
+        this.setProgress(queryStatus.progress);
+      }
+    };
+
+    subscription = huePubSub.subscribe<QueryStatusPushedEvent>(
+      QUERY_STATUS_PUSHED_TOPIC,
+      queryStatus => {
+        if (queryStatus.query_id === queryId) {
+          waitForPush();
+          onStatus(queryStatus);
+        }
+      }
+    );
+    this.addCancellable({
+      cancel: stop
+    });
+
+    waitForPush();
+    checkExecutionStatus({ executable: this })
+      .then(onStatus)
+      .catch(err => {
+        console.warn(err);
+      });
+  }
+
+  /**
+   * Applies the status of the query, either polled or pushed by the server. Returns true while the
+   * query is running.
+   */
+  async handleStatus(queryStatus: ExecuteStatusApiResponse): Promise<boolean> {
     if (this.handle && typeof queryStatus.has_result_set !== 'undefined') {
       this.handle.has_result_set = queryStatus.has_result_set;
     }
@@ -336,7 +421,7 @@ export default class SqlExecutable {
         this.executeEnded = Date.now();
         this.setStatus(queryStatus.status);
         this.setProgress(99); // TODO: why 99 here (from old code)?
-        break;
+        return false;
       case ExecutionStatus.available:
         this.executeEnded = Date.now();
         this.setStatus(queryStatus.status);
@@ -351,15 +436,15 @@ export default class SqlExecutable {
           }
           this.nextExecutable.execute();
         }
-        break;
+        return false;
       case ExecutionStatus.canceled:
       case ExecutionStatus.expired:
         this.executeEnded = Date.now();
         this.setStatus(queryStatus.status);
-        break;
+        return false;
       case ExecutionStatus.streaming:
         if (!queryStatus.result) {
-          return;
+          return false;
         }
         if ((<hueWindow>window).WEB_SOCKETS_ENABLED) {
           huePubSub.publish('editor.ws.query.fetch_result', queryStatus.result);
@@ -373,13 +458,7 @@ export default class SqlExecutable {
       case ExecutionStatus.starting:
       case ExecutionStatus.waiting:
         this.setStatus(queryStatus.status);
-        checkStatusTimeout = window.setTimeout(
-          () => {
-            this.checkStatus(statusCheckCount);
-          },
-          actualCheckCount > 45 ? 5000 : 1000
-        );
-        break;
+        return true;
       case ExecutionStatus.failed:
         this.executeEnded = Date.now();
         this.setStatus(queryStatus.status);
@@ -388,11 +467,12 @@ export default class SqlExecutable {
             message: queryStatus.message
           });
         }
-        break;
+        return false;
       default:
         this.executeEnded = Date.now();
         this.setStatus(ExecutionStatus.failed);
         console.warn('Got unknown status ' + queryStatus.status);
+        return false;
     }
   }
 
@@ -283,6 +283,26 @@ describe('DataCatalogEntry.ts', () => {
       expect(sourceMetaSpy).toHaveBeenCalledTimes(1);
     });
 
+    it('should ask the server to refresh the source metadata after clearing the cache', async () => {
+      const sourceMetaSpy = jest
+        .spyOn(CatalogApi, 'fetchSourceMetadata')
+        .mockImplementation(() =>
+          CancellablePromise.resolve<TableSourceMeta>({ columns: [], extended_columns: [] })
+        );
+      const tableEntry = await getEntry('someDb.someRefreshedTable');
+      await tableEntry.getSourceMeta();
+      await tableEntry.clearCache();
+      await tableEntry.getSourceMeta();
+      await tableEntry.getSourceMeta({ refreshCache: true });
+
+      expect(sourceMetaSpy).toHaveBeenCalledTimes(3);
+      expect(sourceMetaSpy.mock.calls.map(call => call[0].refreshCache)).toEqual([
+        false,
+        true,
+        true
+      ]);
+    });
+
     it('should fetch column source metadata for the comment when there is no table metadata', async () => {
       const sourceMetaSpy = jest
         .spyOn(CatalogApi, 'fetchSourceMetadata')
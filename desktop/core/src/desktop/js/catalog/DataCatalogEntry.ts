@@ -275,6 +275,7 @@ export default class DataCatalogEntry {
   samplePromise?: CancellablePromise<Sample>;
   sourceMeta?: SourceMeta;
   sourceMetaPromise?: CancellablePromise<SourceMeta>;
+  refreshSourceMeta = false;
 
   constructor(options: {
     compute: Compute;
@@ -367,6 +368,8 @@ export default class DataCatalogEntry {
     }
 
     this.reset();
+    // The next fetch also skips the metadata cached by the server
+    this.refreshSourceMeta = true;
 
     try {
       if (options.cascade) {
@@ -501,10 +504,14 @@ export default class DataCatalogEntry {
         } catch (err) {}
       }
 
+      const refreshCache = this.refreshSourceMeta;
+      this.refreshSourceMeta = false;
+
       try {
         this.sourceMeta = await fetchSourceMetadata({
           ...options,
-          entry: this
+          entry: this,
+          refreshCache
         });
         resolve(this.sourceMeta);
       } catch (err) {
@@ -1572,6 +1579,9 @@ export default class DataCatalogEntry {
       return CancellablePromise.reject();
     }
     if (!this.sourceMetaPromise || shouldReload(options)) {
+      if (options && options.refreshCache) {
+        this.refreshSourceMeta = true;
+      }
       return this.reloadSourceMeta(options);
     }
     return applyCancellable(this.sourceMetaPromise, options);
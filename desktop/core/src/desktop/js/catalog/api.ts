@@ -57,6 +57,10 @@ interface DescribeFetchOptions extends SharedFetchOptions {
   refreshAnalysis?: boolean;
 }
 
+interface SourceMetaFetchOptions extends SharedFetchOptions {
+  refreshCache?: boolean;
+}
+
 interface SampleFetchOptions extends SharedFetchOptions {
   operation?: string;
   sampleCount?: number;
@@ -561,8 +565,9 @@ export const fetchSample = ({
 
 export const fetchSourceMetadata = ({
   entry,
+  refreshCache,
   silenceErrors
-}: SharedFetchOptions): CancellablePromise<SourceMeta> =>
+}: SourceMetaFetchOptions): CancellablePromise<SourceMeta> =>
   post<SourceMeta>(
     `${AUTOCOMPLETE_URL_PREFIX}${getEntryUrlPath(entry)}`,
     {
@@ -572,7 +577,8 @@ export const fetchSourceMetadata = ({
         source: 'data'
       }),
       operation: entry.isModel() ? 'model' : 'default',
-      cluster: (entry.compute && JSON.stringify(entry.compute)) || '""'
+      cluster: (entry.compute && JSON.stringify(entry.compute)) || '""',
+      refreshCache: !!refreshCache
     },
     {
       silenceErrors,
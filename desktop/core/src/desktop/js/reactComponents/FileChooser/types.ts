@@ -65,6 +65,7 @@ export interface PageStats {
   start_index: number;
   end_index: number;
   total_count: number;
+  total_count_exact?: boolean; // false when the directory is not listed entirely yet
 }
 
 export interface BreadcrumbData {
@@ -86,6 +86,7 @@ const Pagination: React.FC<PaginationProps> = ({
       </div>
       <div className="hue-pagination__rows-stats-display">
         {pageStats.start_index} - {pageStats.end_index} of {pageStats.total_count}
+        {pageStats.total_count_exact === false ? '+' : ''}
       </div>
       <div className="hue-pagination__control-buttons-panel">
         <Button onClick={() => onPageNumberChange(1)} className="hue-pagination__control-button">
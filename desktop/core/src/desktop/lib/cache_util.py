@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+
+from django.core.cache import caches
+
+from desktop.conf import TASK_SERVER
+from desktop.settings import CACHES_CELERY_KEY
+
+
+POLL_MIN_INTERVAL = 0.05
+POLL_MAX_INTERVAL = 1.0
+
+
+def has_shared_cache():
+  '''The default cache is local to each Hue process, the task server one is shared by all of them.'''
+  return TASK_SERVER.ENABLED.get()
+
+
+def get_shared_cache():
+  '''Returns the cache shared by all the Hue processes when there is one, the cache of the current process otherwise.'''
+  return caches[CACHES_CELERY_KEY] if has_shared_cache() else caches['default']
+
+
+def poll(timeout):
+  '''
+  Sleeps between two polls until the timeout. The interval starts small, as most of the polled operations take a few
+  milliseconds, and doubles up to POLL_MAX_INTERVAL. The jitter spreads the polls of the concurrent requests.
+  '''
+  deadline = time.time() + timeout
+  interval = POLL_MIN_INTERVAL
+  while time.time() < deadline:
+    yield
+    time.sleep(min(random.uniform(interval / 2, interval), max(deadline - time.time(), 0)))
+    interval = min(interval * 2, POLL_MAX_INTERVAL)
@@ -103,9 +103,26 @@ SUPPORTED_THRIFT_TRANSPORTS = ('buffered', 'framed')
 # a BoundContainer(BoundConfig) object which has all of the application's configs as members
 GLOBAL_CONFIG = None
 
+# Memoized values of BoundConfig.get(), keyed by config and bound data, until the configuration data changes
+_RESOLVED_VALUES = {}
+_resolved_generation = 0
+_MEMOIZABLE_TYPES = string_types + (numbers.Number, bool, type(None), tuple, frozenset)
+
 LOG = logging.getLogger()
 
-__all__ = ["UnspecifiedConfigSection", "ConfigSection", "Config", "load_confs", "coerce_bool", "coerce_csv", "coerce_json_dict"]
+__all__ = ["UnspecifiedConfigSection", "ConfigSection", "Config", "load_confs", "coerce_bool", "coerce_csv", "coerce_json_dict",
+           "invalidate_cache"]
+
+
+def invalidate_cache():
+  """
+  Forgets the memoized values of the configs. To call whenever the data a config or a dynamic default
+  reads is changed, e.g. when a configuration file is reloaded.
+  """
+  global _resolved_generation
+  _resolved_generation += 1
+  _RESOLVED_VALUES.clear()
+
 
 class BoundConfig(object):
   def __init__(self, config, bind_to, grab_key=_ANONYMOUS, prefix=''):
@@ -158,7 +175,26 @@ class BoundConfig(object):
     return data, present
 
   def get(self):
-    """Get the data, or its default value."""
+    """Get the data, or its default value. Immutable values are memoized until the configuration changes."""
+    if not self.config.memoize:
+      return self._resolve()
+
+    # BoundConfigs are created at each access, the values are hence memoized per config and bound data
+    key = (id(self.config), id(self.bind_to))
+    generation = _resolved_generation
+    entry = _RESOLVED_VALUES.get(key)
+    if entry is not None and entry[0] == generation and entry[1] is self.config and entry[2] is self.bind_to:
+      return list(entry[3]) if entry[4] else entry[3]
+
+    value = self._resolve()
+    if isinstance(value, _MEMOIZABLE_TYPES):
+      _RESOLVED_VALUES[key] = (generation, self.config, self.bind_to, value, False)
+    elif isinstance(value, list) and all(isinstance(item, _MEMOIZABLE_TYPES) for item in value):
+      # e.g. coerce_csv, each caller gets its own copy
+      _RESOLVED_VALUES[key] = (generation, self.config, self.bind_to, tuple(value), True)
+    return value
+
+  def _resolve(self):
     data, present = self._get_data_and_presence()
     return self.config.get_value(data, present=present, prefix=self.prefix, coerce_type=True)
 
@@ -181,6 +217,7 @@ class BoundConfig(object):
       self.bind_to[self.grab_key] = data
       if not presence:
         del self.bind_to[self.grab_key]
+      invalidate_cache()  # Other configs can depend on this one through their dynamic default
     assert self.grab_key is not _ANONYMOUS # TODO(todd) really?
     old_data = self.bind_to.get(self.grab_key)
     old_presence = self.grab_key in self.bind_to
@@ -200,7 +237,7 @@ class BoundConfig(object):
 
 class Config(object):
   def __init__(self, key=_ANONYMOUS, default=None, dynamic_default=None,
-               required=False, help=None, type=str, private=False):
+               required=False, help=None, type=str, private=False, memoize=True):
     """
     Initialize a new Configurable variable.
 
@@ -213,6 +250,10 @@ class Config(object):
                     str is the default. Should raise an exception in the case
                     that it cannot be coerced.
     @param private  if True, does not emit help text
+    @param memoize  if False, the value is resolved again at each get(). For the
+                    dynamic defaults returning something else at each call, e.g.
+                    secrets rotated by a script. Values coerced from a password
+                    script are never memoized.
     """
     if not callable(type):
       raise ValueError("%s: The type argument '%s()' is not callable" % (key, type))
@@ -240,6 +281,7 @@ class Config(object):
     self.help = help
     self.type = type
     self.private = private
+    self.memoize = memoize and type is not coerce_password_from_script
 
     # It makes no sense to be required if you have a default,
     # since you'll never throw the "not set" error.
@@ -363,6 +405,19 @@ class BoundContainer(BoundConfig):
   def keys(self):
     return list(self.get_data_dict().keys())
 
+  def _get_member(self, attr):
+    """The bound members are memoized like the values, as they are looked up at each access, e.g. AUTH.BACKEND.get()"""
+    key = (id(self.config), id(self.bind_to), self.prefix, attr)
+    generation = _resolved_generation
+    entry = _RESOLVED_VALUES.get(key)
+    if entry is not None and entry[0] == generation and entry[1] is self.config and entry[2] is self.bind_to:
+      return entry[3]
+
+    member = self.config.get_member(self.get_data_dict(), attr, self.prefix)
+    if self.config.memoize:
+      _RESOLVED_VALUES[key] = (generation, self.config, self.bind_to, member)
+    return member
+
 class BoundContainerWithGetAttr(BoundContainer):
   """
   A configuration bound to a data container where we expect
@@ -372,7 +427,7 @@ class BoundContainerWithGetAttr(BoundContainer):
   This is used by ConfigSection
   """
   def __getattr__(self, attr):
-    return self.config.get_member(self.get_data_dict(), attr, self.prefix)
+    return self._get_member(attr)
 
 class BoundContainerWithGetItem(BoundContainer):
   """
@@ -384,7 +439,7 @@ class BoundContainerWithGetItem(BoundContainer):
   def __getitem__(self, attr):
     if attr in self.__dict__:
       return self.__dict__[attr]
-    return self.config.get_member(self.get_data_dict(), attr, self.prefix)
+    return self._get_member(attr)
 
 
 class ConfigSection(Config):
@@ -616,6 +671,7 @@ def initialize(modules, config_dir):
     new_config.update_members(GLOBAL_CONFIG.config.members, overwrite=False)
     conf_data.merge(GLOBAL_CONFIG.bind_to)
     GLOBAL_CONFIG = new_config.bind(conf_data, prefix='')
+  invalidate_cache()
   return
 
 def is_anonymous(key):
@@ -25,6 +25,7 @@ import re
 import sys
 
 from desktop.lib.conf import *
+from desktop.lib.conf import coerce_password_from_script
 
 if sys.version_info[0] > 2:
   from io import StringIO as string_io
@@ -179,6 +180,59 @@ class TestConfig(object):
       close()
     assert "baz_default" == self.conf.SOME_SECTION.BAZ.get()
 
+  def test_memoize(self):
+    calls = []
+    def bar_plus_one():
+      """BAR + 1"""
+      calls.append(1)
+      return self.conf.BAR.get() + 1
+
+    section = ConfigSection(
+      members=dict(
+        MEMOIZED=Config("memoized", dynamic_default=bar_plus_one, type=int),
+        DYNAMIC=Config("dynamic", dynamic_default=bar_plus_one, type=int, memoize=False),
+        LIST=Config("list", default="a,b", type=coerce_csv),
+      )
+    ).bind({}, prefix='')
+
+    assert 457 == section.MEMOIZED.get()
+    assert 457 == section.MEMOIZED.get()
+    assert 1 == len(calls)
+
+    # Changing any configuration invalidates the values, as the dynamic defaults can read it
+    close = self.conf.BAR.set_for_testing(10)
+    try:
+      assert 11 == section.MEMOIZED.get()
+    finally:
+      close()
+    assert 457 == section.MEMOIZED.get()
+    assert 3 == len(calls)
+
+    invalidate_cache()
+    assert 457 == section.MEMOIZED.get()
+    assert 4 == len(calls)
+
+    assert 457 == section.DYNAMIC.get()
+    assert 457 == section.DYNAMIC.get()
+    assert 6 == len(calls)
+
+    # Mutable values are never shared between the callers
+    values = section.LIST.get()
+    values.append('c')
+    assert ['a', 'b'] == section.LIST.get()
+
+    assert not Config("password", type=coerce_password_from_script).memoize
+
+    # The members of the sections are memoized too
+    assert self.conf.CLUSTERS['clustera'] is self.conf.CLUSTERS['clustera']
+    close = self.conf.CLUSTERS.set_for_testing({'clusterc': {'host': 'otherhost'}})
+    try:
+      assert ['clusterc'] == self.conf.CLUSTERS.keys()
+      assert 'otherhost' == self.conf.CLUSTERS['clusterc'].HOST.get()
+    finally:
+      close()
+    assert 'localhost' == self.conf.CLUSTERS['clustera'].HOST.get()
+
 
   def test_coerce_bool(self):
     assert False == coerce_bool(False)
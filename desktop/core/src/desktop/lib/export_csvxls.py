@@ -21,21 +21,25 @@ Common library to export either CSV or XLS.
 from future import standard_library
 standard_library.install_aliases()
 from builtins import next, object
-import gc
+import csv
 import logging
+import math
 import numbers
-import openpyxl
 import re
 import six
 import sys
 import tablib
+import zipfile
+
+from openpyxl.utils import get_column_letter
+from xml.sax.saxutils import escape
 
 from django.http import StreamingHttpResponse, HttpResponse
 from django.utils.encoding import smart_str
 from desktop.lib import i18n
 
 if sys.version_info[0] > 2:
-  from io import BytesIO as string_io
+  from io import StringIO as string_io
   from urllib.parse import quote
 else:
   from StringIO import StringIO as string_io
@@ -46,6 +50,10 @@ LOG = logging.getLogger()
 
 DOWNLOAD_CHUNK_SIZE = 1 * 1024 * 1024 # 1MB
 ILLEGAL_CHARS = r'[\000-\010]|[\013-\014]|[\016-\037]'
+ILLEGAL_CHARS_RE = re.compile(ILLEGAL_CHARS)
+ILLEGAL_CHARS_TABLE = dict((char, u'?') for char in list(range(0o0, 0o11)) + list(range(0o13, 0o15)) + list(range(0o16, 0o40)))
+EXCEL_LINK_RE = re.compile('^(https?://.+)', re.IGNORECASE)
+NUMERIC_TYPES = ('TINYINT', 'SMALLINT', 'INT', 'INTEGER', 'BIGINT', 'FLOAT', 'DOUBLE', 'REAL')
 FORMAT_TO_CONTENT_TYPE = {
     'csv': 'application/csv',
     'xls': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
@@ -71,9 +79,9 @@ def encode_row(row, encoding=None, make_excel_links=False):
 
   for cell in row:
     if isinstance(cell, six.string_types):
-      cell = re.sub(ILLEGAL_CHARS, '?', cell)
+      cell = ILLEGAL_CHARS_RE.sub('?', cell)
       if make_excel_links:
-        cell = re.compile('^(https?://.+)', re.IGNORECASE).sub(r'=HYPERLINK("\1")', cell)
+        cell = EXCEL_LINK_RE.sub(r'=HYPERLINK("\1")', cell)
     cell = nullify(cell)
     if not isinstance(cell, numbers.Number):
       cell = smart_str(cell, encoding, strings_only=True, errors='replace')
@@ -98,42 +106,187 @@ def dataset(headers, data, encoding=None):
   return dataset
 
 
-class XlsWrapper(object):
-  def __init__(self, xls):
-    self.xls = xls
+class CSVEncoder(object):
+  """
+  Encodes batches of rows into CSV text with a single csv.writer over a reusable buffer.
+
+  The encoding function of each column is picked once from the column types, either given
+  or stored in the headers as 'name|TYPE', so that most cells skip the generic type checks
+  of encode_row(). The output is the same as dataset().csv.
+  """
+
+  def __init__(self, encoding=None):
+    self.encoding = encoding or i18n.get_site_encoding()
+    self.buffer = string_io()
+    self.writer = csv.writer(self.buffer)
+    self.cell_encoders = None
+
+  def encode(self, headers, data, column_types=None):
+    if self.cell_encoders is None:
+      self.cell_encoders = self._get_cell_encoders(headers, column_types)
+    cell_encoders = self.cell_encoders
+    writerow = self.writer.writerow
+
+    if headers:
+      writerow(encode_row(headers, self.encoding))
+
+    for row in data:
+      if len(row) == len(cell_encoders):
+        writerow([encode_cell(cell) for encode_cell, cell in zip(cell_encoders, row)])
+      else:
+        writerow(encode_row(row, self.encoding))
+
+    content = self.buffer.getvalue()
+    self.buffer.seek(0)
+    self.buffer.truncate()
+    return content
+
+  def _get_cell_encoders(self, headers, column_types):
+    if column_types is None and headers:
+      column_types = [header.split('|')[1] if '|' in header else '' for header in headers]
+
+    return [
+      self._encode_number if column_type and column_type.upper().replace('_TYPE', '') in NUMERIC_TYPES else self._encode_string
+      for column_type in (column_types or [])
+    ]
+
+  def _encode_number(self, cell):
+    if type(cell) in (int, float):
+      return cell
+    return self._encode_cell(cell)
+
+  def _encode_string(self, cell):
+    if type(cell) is str:
+      return cell.translate(ILLEGAL_CHARS_TABLE)
+    return self._encode_cell(cell)
+
+  def _encode_cell(self, cell):
+    if cell is None:
+      return 'NULL'
+    elif isinstance(cell, six.string_types):
+      return ILLEGAL_CHARS_RE.sub('?', cell)
+    elif isinstance(cell, numbers.Number):
+      return cell
+    else:
+      return smart_str(cell, self.encoding, strings_only=True, errors='replace')
+
+
+class StreamBuffer(object):
+  """
+  Write-only file object collecting what is written until drained. Not being seekable,
+  ZipFile writes data descriptors after each entry instead of rewriting the local headers.
+  """
+
+  def __init__(self):
+    self.chunks = []
+
+  def write(self, data):
+    self.chunks.append(bytes(data))
+    return len(data)
+
+  def flush(self):
+    pass
 
+  def drain(self):
+    data = b''.join(self.chunks)
+    self.chunks = []
+    return data
 
-def xls_dataset(workbook):
-  output = string_io()
-  workbook.save(output)
-  output.seek(0)
-  return XlsWrapper(output.read())
+
+XLSX_CONTENT_TYPES = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+</Types>'''
+XLSX_RELS = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>'''
+XLSX_WORKBOOK = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" \
+xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets><sheet name="Sheet" sheetId="1" r:id="rId1"/></sheets>
+</workbook>'''
+XLSX_WORKBOOK_RELS = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" \
+Target="worksheets/sheet1.xml"/>
+</Relationships>'''
+XLSX_SHEET_HEADER = b'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'''
+XLSX_SHEET_FOOTER = b'</sheetData></worksheet>'
+
+
+def xlsx_cell(reference, value):
+  if isinstance(value, bool):
+    return '<c r="%s" t="b"><v>%d</v></c>' % (reference, value)
+  elif isinstance(value, numbers.Number) and not (isinstance(value, float) and (math.isnan(value) or math.isinf(value))):
+    return '<c r="%s"><v>%s</v></c>' % (reference, value)
+
+  value = '%s' % (value,)
+  if value.startswith('=') and len(value) > 1:  # Formulas like the HYPERLINK() of encode_row()
+    return '<c r="%s"><f>%s</f></c>' % (reference, escape(value[1:]))
+  else:
+    return '<c r="%s" t="inlineStr"><is><t xml:space="preserve">%s</t></is></c>' % (reference, escape(value))
+
+
+def xlsx_row(index, row, columns):
+  while len(columns) < len(row):
+    columns.append(get_column_letter(len(columns) + 1))
+
+  return '<row r="%d">%s</row>' % (index, ''.join(xlsx_cell('%s%d' % (columns[i], index), cell) for i, cell in enumerate(row)))
+
+
+def xlsx_generator(content_generator, encoding=None):
+  """
+  Streams an XLSX document: the zip container is emitted as the rows arrive, with inline strings
+  instead of a shared strings table so that memory stays bounded by the size of a batch.
+  """
+  output = StreamBuffer()
+  columns = []
+  row_ctr = 0
+
+  with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as archive:
+    archive.writestr('[Content_Types].xml', XLSX_CONTENT_TYPES)
+    archive.writestr('_rels/.rels', XLSX_RELS)
+    archive.writestr('xl/workbook.xml', XLSX_WORKBOOK)
+    archive.writestr('xl/_rels/workbook.xml.rels', XLSX_WORKBOOK_RELS)
+
+    with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+      sheet.write(XLSX_SHEET_HEADER)
+
+      for _headers, _data in content_generator:
+        # Write headers to workbook once
+        if _headers and row_ctr == 0:
+          row_ctr += 1
+          sheet.write(xlsx_row(row_ctr, encode_row(_headers, encoding), columns).encode('utf-8'))
+
+        # Write row data to workbook
+        for row in _data:
+          row_ctr += 1
+          sheet.write(xlsx_row(row_ctr, encode_row(row, encoding, make_excel_links=True), columns).encode('utf-8'))
+
+        chunk = output.drain()
+        if chunk:
+          yield chunk
+
+      sheet.write(XLSX_SHEET_FOOTER)
+
+  yield output.drain()
 
 
 def create_generator(content_generator, format, encoding=None):
   if format == 'csv':
+    encoder = CSVEncoder(encoding)
     show_headers = True
     for headers, data in content_generator:
-      yield dataset(show_headers and headers or None, data, encoding).csv
+      yield encoder.encode(show_headers and headers or None, data, column_types=getattr(content_generator, 'column_types', None))
       show_headers = False
   elif format == 'xls':
-    workbook = openpyxl.Workbook(write_only=True)
-    worksheet = workbook.create_sheet()
-    row_ctr = 0
-
-    for _headers, _data in content_generator:
-      # Write headers to workbook once
-      if _headers and row_ctr == 0:
-        worksheet.append(encode_row(_headers, encoding))
-        row_ctr += 1
-
-      # Write row data to workbook
-      for row in _data:
-        worksheet.append(encode_row(row, encoding, make_excel_links=True))
-        row_ctr += 1
-
-    yield xls_dataset(workbook).xls
-    gc.collect()
+    for chunk in xlsx_generator(content_generator, encoding):
+      yield chunk
   else:
     raise Exception("Unknown format: %s" % format)
 
@@ -146,15 +299,14 @@ def make_response(generator, format, name, encoding=None, user_agent=None): #TOD
   @param encoding Unicode encoding for data
   """
   content_type = FORMAT_TO_CONTENT_TYPE.get(format, 'application/octet-stream')
-  if format == 'csv':
+  if format in ('csv', 'xls'):
     resp = StreamingHttpResponse(generator, content_type=content_type)
     try:
       del resp['Content-Length']
     except KeyError:
       pass
-  elif format == 'xls':
-    format = 'xlsx'
-    resp = HttpResponse(next(generator), content_type=content_type)
+    if format == 'xls':
+      format = 'xlsx'
   elif format == 'json' or format == 'txt':
     resp = HttpResponse(generator, content_type=content_type)
   else:
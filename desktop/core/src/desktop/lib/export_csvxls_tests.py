@@ -22,7 +22,7 @@ import sys
 
 from openpyxl import load_workbook
 
-from desktop.lib.export_csvxls import create_generator, make_response
+from desktop.lib.export_csvxls import create_generator, make_response, dataset, CSVEncoder
 
 if sys.version_info[0] > 2:
   from io import BytesIO as string_io
@@ -68,6 +68,27 @@ def test_export_csv():
 
 
 
+def test_csv_encoder():
+  headers = ["x|INT_TYPE", "y|STRING_TYPE", "z"]
+  data = [
+    [1, "a\x01b", 1.5],
+    [None, None, None],
+    ["2", b"bytes", True],
+    [3.5, 4, "5,6"],
+    [1, 2],
+  ]
+
+  encoder = CSVEncoder()
+
+  assert dataset(headers, data[:4]).csv == encoder.encode(headers, data[:4])
+  assert dataset(None, data[:4]).csv == encoder.encode(None, data[:4])  # Buffer is reset after each batch
+  assert '1,2\r\n' == encoder.encode(None, data[4:])
+
+  encoder = CSVEncoder()
+  assert dataset(["x", "y"], [[1, "a"]]).csv == encoder.encode(["x", "y"], [[1, "a"]], column_types=['INT', 'STRING'])
+  assert encoder.cell_encoders[0] == encoder._encode_number
+
+
 def test_export_xls():
   headers = ["x", "y"]
   data = [["1", "2"], ["3", "4"], ["5,6", "7"], [None, None], ["http://gethue.com", "http://gethue.com"]]
@@ -85,8 +106,26 @@ def test_export_xls():
   assert 'attachment; filename="foo.xlsx"' == response["content-disposition"]
 
 
+def test_export_xls_streaming():
+  headers = ["x", "y", "z"]
+
+  def batches():
+    for i in range(3):
+      yield headers, [[i * 10 + j, 'row %d <&>' % (i * 10 + j), True] for j in range(10)]
+
+  generator = create_generator(batches(), "xls")
+  response = make_response(generator, "xls", "foo")
+
+  sheet_data = _read_xls_sheet_data(response)
+
+  assert 31 == len(sheet_data)
+  assert headers == sheet_data[0]
+  assert [0, 'row 0 <&>', True] == sheet_data[1]
+  assert [29, 'row 29 <&>', True] == sheet_data[-1]
+
+
 def _read_xls_sheet_data(response):
-  content = bytes(response.content)
+  content = b''.join(response.streaming_content)
 
   data = string_io()
   data.write(content)
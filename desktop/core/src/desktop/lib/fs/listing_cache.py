@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+Process wide cache of directory listings, so that paging, sorting and filtering a large directory in the
+File Browser does not list it again for every page.
+
+The listings are keyed by (user, filesystem, path, kind), expire after a TTL to pick up the external changes and are
+invalidated right away by the mutations done through the ProxyFS of Hue. As the Hue workers each have their own cache,
+the cache is only used with a shared cache: every mutation bumps a shared generation which makes the entries of all the
+workers stale.
+'''
+
+from builtins import object
+import logging
+import operator
+import posixpath
+import threading
+import time
+
+from array import array
+from collections import OrderedDict
+from urllib.parse import urlparse as lib_urlparse
+
+from desktop.lib.cache_util import get_shared_cache, has_shared_cache
+
+
+LOG = logging.getLogger()
+
+GENERATION_KEY = 'filebrowser-listing-generation'
+
+
+def normalize_path(path):
+  '''Returns the path without trailing slash and without the scheme and authority for HDFS paths.'''
+  split = lib_urlparse(path or '')
+  if split.scheme in ('', 'hdfs'):
+    return posixpath.normpath(split.path or '/')
+  return '%s://%s%s' % (split.scheme, split.netloc, split.path.rstrip('/'))
+
+
+def _parent_path(path):
+  if '://' in path:
+    scheme, rest = path.split('://', 1)
+    return '%s://%s' % (scheme, rest.rsplit('/', 1)[0]) if '/' in rest else '%s://' % scheme
+  return posixpath.dirname(path)
+
+
+class Listing(object):
+  '''
+  Stats of the entries of a directory, pulled lazily batch by batch from the filesystem.
+
+  The entries are kept in their listing order. Sort orders are computed once per attribute and direction and
+  cached as arrays of indexes into the entries.
+  '''
+
+  def __init__(self, batches):
+    self.stats = []
+    self.names = []
+    self.failed = False
+    self._batches = batches
+    self._orders = {}
+    self._lock = threading.Lock()
+
+  @property
+  def complete(self):
+    return self._batches is None
+
+  def load(self, count=None):
+    '''Pulls batches until at least count entries are loaded or the whole directory when count is None.'''
+    with self._lock:
+      while self._batches is not None and (count is None or len(self.stats) < count):
+        try:
+          batch = next(self._batches)
+        except StopIteration:
+          self._batches = None
+        except Exception:
+          self.failed = True
+          self._batches = None
+          raise
+        else:
+          self.stats.extend(batch)
+          self.names.extend(stat.name for stat in batch)
+          self._orders.clear()
+
+  def view(self, sortby=None, descending=False, filter_str=None, min_count=None):
+    '''
+    Returns a ListingView of the entries filtered by a substring of their name and sorted by one of their attributes.
+
+    Without sort nor filter the entries are served in their listing order and only min_count entries are loaded.
+    '''
+    if sortby is None and not filter_str:
+      self.load(min_count)
+      return ListingView(self)
+
+    self.load()
+
+    order = self._get_order(sortby, descending)
+    if filter_str:
+      names = self.names
+      order = [index for index in (order if order is not None else range(len(names))) if filter_str in names[index]]
+
+    return ListingView(self, order)
+
+  def _get_order(self, sortby, descending):
+    if sortby is None:
+      return None
+
+    key = (sortby, bool(descending))
+    if key not in self._orders:
+      stats = self.stats
+      get_attribute = operator.attrgetter(sortby)
+      self._orders[key] = array('l', sorted(range(len(stats)), key=lambda index: get_attribute(stats[index]), reverse=bool(descending)))
+
+    return self._orders[key]
+
+
+class ListingView(object):
+  '''Sequence of the stats of a Listing in a given order, sliced by the Paginator.'''
+
+  def __init__(self, listing, order=None):
+    self.listing = listing
+    self._order = order
+
+  @property
+  def complete(self):
+    return self.listing.complete
+
+  def __len__(self):
+    return len(self.listing.stats) if self._order is None else len(self._order)
+
+  def __getitem__(self, index):
+    stats = self.listing.stats
+    if self._order is None:
+      return stats[index]
+    if isinstance(index, slice):
+      return [stats[i] for i in self._order[index]]
+    return stats[self._order[index]]
+
+  def __iter__(self):
+    return iter(self[:])
+
+
+class ListingCache(object):
+  '''LRU of listings and stats with a TTL.'''
+
+  def __init__(self):
+    self._entries = OrderedDict()  # (user, fs name, path, kind) -> (creation time, generation, value)
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+
+  def __len__(self):
+    return len(self._entries)
+
+  def get(self, key, create, ttl, max_size):
+    '''
+    Returns the value cached for key = (user, fs name, path, kind) or caches the result of create().
+    Failed listings and entries created before the last mutation of any worker are never served from the cache.
+    '''
+    if not ttl or not has_shared_cache():
+      return create()
+
+    user, fs_name, path, kind = key
+    key = (user, fs_name, normalize_path(path), kind)
+    now = time.time()
+    generation = get_shared_cache().get(GENERATION_KEY, 0)
+
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None and now - entry[0] < ttl and entry[1] == generation and not getattr(entry[2], 'failed', False):
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+      self.misses += 1
+
+    value = create()
+
+    with self._lock:
+      self._entries[key] = (now, generation, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > max_size:
+        self._entries.popitem(last=False)
+
+    return value
+
+  def invalidate(self, *paths):
+    '''
+    Drops the entries of the paths, of their parent directories and of all their sub-directories, for all the users.
+    The entries of the other workers are all made stale.
+    '''
+    paths = [path for path in paths if path]
+    if paths:
+      self._bump_generation()
+
+    for path in paths:
+      path = normalize_path(path)
+      parent = _parent_path(path)
+      prefix = path.rstrip('/') + '/'
+
+      with self._lock:
+        for key in list(self._entries):
+          cached_path = key[2]
+          if cached_path == path or cached_path == parent or cached_path.startswith(prefix):
+            del self._entries[key]
+
+  def clear(self):
+    self._bump_generation()
+    with self._lock:
+      self._entries.clear()
+
+  def _bump_generation(self):
+    if not has_shared_cache():
+      return
+    try:
+      shared_cache = get_shared_cache()
+      if not shared_cache.add(GENERATION_KEY, 1, None):
+        shared_cache.incr(GENERATION_KEY)
+    except Exception:
+      LOG.exception('Failed to invalidate the directory listings of the other workers')
+
+
+LISTING_CACHE = ListingCache()
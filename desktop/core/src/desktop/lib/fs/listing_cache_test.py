@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from builtins import object
+from unittest.mock import Mock, patch
+
+import pytest
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.paginator import Paginator
+
+from desktop.lib.fs.listing_cache import GENERATION_KEY, Listing, ListingCache, normalize_path
+
+
+class Stat(object):
+
+  def __init__(self, name, size):
+    self.name = name
+    self.size = size
+
+
+def batches(*sizes):
+  index = 0
+  for size in sizes:
+    yield [Stat('file_%02d' % i, 100 - i) for i in range(index, index + size)]
+    index += size
+
+
+class TestListing(object):
+
+  def test_native_order_is_loaded_lazily(self):
+    listing = Listing(batches(10, 10, 10))
+
+    page = Paginator(listing.view(min_count=11), 10).page(1)
+
+    assert ['file_%02d' % i for i in range(10)] == [stat.name for stat in page.object_list]
+    assert page.has_next()
+    assert 20 == len(listing.stats)
+    assert not listing.complete
+
+    listing.view(min_count=100)
+    assert 30 == len(listing.stats)
+    assert listing.complete
+
+  def test_sort_and_filter(self):
+    listing = Listing(batches(5, 7))
+
+    view = listing.view(sortby='size')
+    assert listing.complete
+    assert 12 == len(view)
+    assert 'file_11' == view[0].name
+    assert ['file_11', 'file_10'] == [stat.name for stat in view[:2]]
+
+    view = listing.view(sortby='size', descending=True)
+    assert 'file_00' == view[0].name
+
+    view = listing.view(filter_str='1')
+    assert ['file_01', 'file_10', 'file_11'] == [stat.name for stat in view]
+
+    view = listing.view(sortby='name', descending=True, filter_str='1')
+    assert ['file_11', 'file_10', 'file_01'] == [stat.name for stat in view]
+
+  def test_failed_listing(self):
+    def failing_batches():
+      yield [Stat('a', 1)]
+      raise IOError('Connection reset')
+
+    listing = Listing(failing_batches())
+
+    with pytest.raises(IOError):
+      listing.view(sortby='name')
+    assert listing.failed
+
+
+class TestListingCache(object):
+
+  @pytest.fixture(autouse=True)
+  def shared_cache(self):
+    shared_cache = LocMemCache('listing-cache-test', {})
+    shared_cache.clear()
+    with patch('desktop.lib.fs.listing_cache.has_shared_cache', Mock(return_value=True)):
+      with patch('desktop.lib.fs.listing_cache.get_shared_cache', Mock(return_value=shared_cache)):
+        yield shared_cache
+
+  def test_get(self):
+    cache = ListingCache()
+    calls = []
+
+    def create():
+      calls.append(1)
+      return Listing(batches(1))
+
+    listing = cache.get(('test', 'default', '/user/test/', 'listing'), create, ttl=60, max_size=10)
+    assert listing is cache.get(('test', 'default', '/user/test', 'listing'), create, ttl=60, max_size=10)
+    assert 1 == len(calls)
+    assert 1 == cache.hits
+
+    # Not shared across users
+    cache.get(('other', 'default', '/user/test', 'listing'), create, ttl=60, max_size=10)
+    assert 2 == len(calls)
+
+    # Expired
+    cache.get(('test', 'default', '/user/test', 'listing'), create, ttl=-1, max_size=10)
+    assert 3 == len(calls)
+
+    # Disabled
+    cache.get(('test', 'default', '/user/test', 'listing'), create, ttl=0, max_size=10)
+    assert 4 == len(calls)
+
+    # Not used without shared cache
+    with patch('desktop.lib.fs.listing_cache.has_shared_cache', Mock(return_value=False)):
+      cache.get(('test', 'default', '/user/test', 'listing'), create, ttl=60, max_size=10)
+      cache.get(('test', 'default', '/user/test', 'listing'), create, ttl=60, max_size=10)
+    assert 6 == len(calls)
+
+  def test_lru(self):
+    cache = ListingCache()
+
+    for i in range(5):
+      cache.get(('test', 'default', '/tmp/%s' % i, 'isdir'), lambda: True, ttl=60, max_size=3)
+
+    assert 3 == len(cache)
+    assert 0 == cache.hits
+    cache.get(('test', 'default', '/tmp/4', 'isdir'), lambda: True, ttl=60, max_size=3)
+    assert 1 == cache.hits
+
+  def test_failed_listings_are_not_served(self):
+    cache = ListingCache()
+    failed = Listing(batches(1))
+    failed.failed = True
+
+    cache.get(('test', 'default', '/tmp', 'listing'), lambda: failed, ttl=60, max_size=10)
+    listing = cache.get(('test', 'default', '/tmp', 'listing'), lambda: Listing(batches(1)), ttl=60, max_size=10)
+
+    assert listing is not failed
+
+  def test_invalidate(self):
+    cache = ListingCache()
+    paths = ['/user', '/user/test', '/user/test/dir', '/user/test/dir/sub', '/user/test2', 's3a://bucket/dir', 's3a://bucket/dir/key']
+    for path in paths:
+      cache.get(('test', 'default', path, 'listing'), lambda: Listing(batches(1)), ttl=60, max_size=100)
+
+    cache.invalidate('/user/test/dir/')
+    assert ['/user', '/user/test2', 's3a://bucket/dir', 's3a://bucket/dir/key'] == [key[2] for key in cache._entries]
+
+    cache.invalidate('s3a://bucket/dir/key')
+    assert ['/user', '/user/test2'] == [key[2] for key in cache._entries]
+
+  def test_invalidate_from_other_worker(self, shared_cache):
+    cache = ListingCache()
+    other_worker_cache = ListingCache()
+
+    listing = cache.get(('test', 'default', '/user/test', 'listing'), lambda: Listing(batches(1)), ttl=60, max_size=10)
+    assert listing is cache.get(('test', 'default', '/user/test', 'listing'), lambda: Listing(batches(1)), ttl=60, max_size=10)
+
+    other_worker_cache.invalidate('/tmp/file')
+    assert 1 == shared_cache.get(GENERATION_KEY)
+    assert listing is not cache.get(('test', 'default', '/user/test', 'listing'), lambda: Listing(batches(1)), ttl=60, max_size=10)
+
+    other_worker_cache.clear()
+    assert 2 == shared_cache.get(GENERATION_KEY)
+
+
+def test_normalize_path():
+  assert '/user/test' == normalize_path('/user/test/')
+  assert '/user/test' == normalize_path('hdfs://namenode:8020/user/test')
+  assert '/' == normalize_path('/')
+  assert 's3a://bucket/dir' == normalize_path('s3a://bucket/dir/')
+  assert 'abfs://container@account.dfs.core.windows.net/dir' == normalize_path('abfs://container@account.dfs.core.windows.net/dir')
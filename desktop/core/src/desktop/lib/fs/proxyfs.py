@@ -14,8 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from builtins import object
+import inspect
 import logging
 
+from functools import wraps
 from urllib.parse import urlparse as lib_urlparse
 
 from crequest.middleware import CrequestMiddleware
@@ -23,7 +25,9 @@ from useradmin.models import User
 
 from desktop.auth.backend import is_admin
 from desktop.conf import DEFAULT_USER, ENABLE_ORGANIZATIONS, is_ofs_enabled, is_raz_gs
+from desktop.lib.fs.listing_cache import LISTING_CACHE
 from desktop.lib.fs.ozone import OFS_ROOT
+from desktop.lib.fs.transfer import Transfer
 
 from desktop.lib.fs.gc.gs import get_gs_home_directory
 
@@ -33,11 +37,32 @@ from aws.s3.s3fs import get_s3_home_directory
 from azure.conf import is_raz_abfs
 from azure.abfs.__init__ import get_home_dir_for_abfs
 
+from filebrowser.conf import TRANSFER_CHUNK_SIZE, TRANSFER_WORKERS
+
 
 LOG = logging.getLogger()
 DEFAULT_USER = DEFAULT_USER.get()
 
 
+def invalidate_listing(*path_names):
+  """Drops the cached directory listings of the path arguments once the decorated operation ran, even partially."""
+  def decorator(func):
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+      try:
+        return func(*args, **kwargs)
+      finally:
+        try:
+          arguments = signature.bind(*args, **kwargs).arguments
+        except TypeError:
+          arguments = {}
+        LISTING_CACHE.invalidate(*[arguments.get(name) for name in path_names])
+    return wrapper
+  return decorator
+
+
 class ProxyFS(object):
 
   def __init__(self, filesystems_dict, default_scheme, name='default'):
@@ -114,6 +139,10 @@ class ProxyFS(object):
       return src_fs, src_fs
     return src_fs, self._get_fs(dst)
 
+  def is_cross_filesystem(self, src, dst):
+    """Whether copying or moving src to dst streams the data from one filesystem to another one."""
+    return bool(lib_urlparse(dst).scheme) and self._get_scheme(src) != self._get_scheme(dst)
+
   def setuser(self, user):
     """Set a new user. Return the past current user."""
     curr = self.getuser()
@@ -154,6 +183,13 @@ class ProxyFS(object):
   def listdir_stats(self, path, **kwargs):
     return self._get_fs(path).listdir_stats(path, **kwargs)
 
+  def listdir_stats_iter(self, path):
+    """Returns an iterator of batches of stats, listed lazily when the filesystem supports it."""
+    fs = self._get_fs(path)
+    if hasattr(fs, 'listdir_stats_iter'):
+      return fs.listdir_stats_iter(path)
+    return iter([fs.listdir_stats(path)])
+
   def listdir(self, path, glob=None):
     return self._get_fs(path).listdir(path, glob)
 
@@ -178,30 +214,39 @@ class ProxyFS(object):
   def join(self, first, *comp_list):
     return self._get_fs(first).join(first, *comp_list)
 
+  @invalidate_listing('path')
   def mkdir(self, path, *args, **kwargs):
     return self._get_fs(path).mkdir(path, *args, **kwargs)
 
   def read(self, path, *args, **kwargs):
     return self._get_fs(path).read(path, *args, **kwargs)
 
+  @invalidate_listing('path')
   def append(self, path, *args, **kwargs):
     return self._get_fs(path).append(path, *args, **kwargs)
 
+  @invalidate_listing('path')
   def rmtree(self, path, *args, **kwargs):
     self._get_fs(path).rmtree(path, *args, **kwargs)
 
+  @invalidate_listing('path')
   def remove(self, path, skip_trash=False):
     self._get_fs(path).remove(path, skip_trash)
 
   def restore(self, path):
-    self._get_fs(path).restore(path)
+    try:
+      self._get_fs(path).restore(path)
+    finally:
+      LISTING_CACHE.clear()  # The original location is unknown here
 
+  @invalidate_listing('path')
   def create(self, path, *args, **kwargs):
     self._get_fs(path).create(path, *args, **kwargs)
 
   def get_content_summary(self, path):
     return self._get_fs(path).get_content_summary(path)
 
+  @invalidate_listing('home_path')
   def create_home_dir(self, home_path=None):
     """
     Initially home_path will have path value for HDFS, try creating the user home dir for it first.
@@ -236,12 +281,15 @@ class ProxyFS(object):
       fs = self.do_as_user(username, self._get_fs, home_path)
       fs.create_home_dir(home_path)
 
+  @invalidate_listing('path')
   def chown(self, path, *args, **kwargs):
     self._get_fs(path).chown(path, *args, **kwargs)
 
+  @invalidate_listing('path')
   def chmod(self, path, *args, **kwargs):
     self._get_fs(path).chmod(path, *args, **kwargs)
 
+  @invalidate_listing('remote_dst')
   def copyFromLocal(self, local_src, remote_dst, *args, **kwargs):
     self._get_fs(remote_dst).copyFromLocal(local_src, remote_dst, *args, **kwargs)
 
@@ -252,50 +300,80 @@ class ProxyFS(object):
   def purge_trash(self):
     fs = self._get_fs(None)  # Only webhdfs supports trash.
     if fs and hasattr(fs, 'purge_trash'):
-      fs.purge_trash()
+      try:
+        fs.purge_trash()
+      finally:
+        LISTING_CACHE.clear()
 
   # Handle file systems interactions
   # --------------------------------
+  @invalidate_listing('dst')
   def copy(self, src, dst, *args, **kwargs):
     src_fs, dst_fs = self._get_fs_pair(src, dst)
     op = src_fs.copy if src_fs is dst_fs else self._copy_between_filesystems
     return op(src, dst, *args, **kwargs)
 
   def _copy_between_filesystems(self, src, dst, recursive=False, *args, **kwargs):
-    raise NotImplementedError("Will be addressed in HUE-2934")
+    self._get_transfer(src, dst).copy(src, dst, recursive=recursive)
 
+  @invalidate_listing('dst')
   def copyfile(self, src, dst, *args, **kwargs):
     src_fs, dst_fs = self._get_fs_pair(src, dst)
     op = src_fs.copyfile if src_fs is dst_fs else self._copyfile_between_filesystems
     return op(src, dst, *args, **kwargs)
 
   def _copyfile_between_filesystems(self, src, dst, *args, **kwargs):
-    raise NotImplementedError("Will be addressed in HUE-2934")
+    self._get_transfer(src, dst).copyfile(src, dst)
 
+  @invalidate_listing('dst')
   def copy_remote_dir(self, src, dst, *args, **kwargs):
     src_fs, dst_fs = self._get_fs_pair(src, dst)
     op = src_fs.copy_remote_dir if src_fs is dst_fs else self._copy_remote_dir_between_filesystems
     return op(src, dst, *args, **kwargs)
 
   def _copy_remote_dir_between_filesystems(self, src, dst, *args, **kwargs):
-    raise NotImplementedError("Will be addressed in HUE-2934")
+    self._get_transfer(src, dst).copy_dir(src, dst)
 
+  @invalidate_listing('old', 'new')
   def rename(self, old, new):
     old_fs, new_fs = self._get_fs_pair(old, new)
     op = old_fs.rename if old_fs is new_fs else self._rename_between_filesystems
     return op(old, new)
 
   def _rename_between_filesystems(self, old, new):
-    raise NotImplementedError("Will be addressed in HUE-2934")
+    self._get_transfer(old, new).move(old, new)
 
+  @invalidate_listing('old_dir', 'new_dir')
   def rename_star(self, old_dir, new_dir):
     old_fs, new_fs = self._get_fs_pair(old_dir, new_dir)
     op = old_fs.rename_star if old_fs is new_fs else self._rename_star_between_filesystems
     return op(old_dir, new_dir)
 
   def _rename_star_between_filesystems(self, old, new):
-    raise NotImplementedError("Will be addressed in HUE-2934")
+    self._get_transfer(old, new).move_contents(old, new)
+
+  def _get_transfer(self, src, dst, **kwargs):
+    src_fs, dst_fs = self._get_fs_pair(src, dst)
+    kwargs.setdefault('chunk_size', TRANSFER_CHUNK_SIZE.get())
+    kwargs.setdefault('workers', TRANSFER_WORKERS.get())
+    return Transfer(src_fs, dst_fs, user=self.getuser(), **kwargs)
+
+  def transfer(self, src, dst, move=False, **kwargs):
+    """
+    Copies or moves src to dst between two filesystems, e.g. from a task of the task server.
+    The keyword arguments are the checkpoint and on_progress callback of the Transfer.
+    """
+    transfer = self._get_transfer(src, dst, **kwargs)
+    try:
+      if move:
+        transfer.move(src, dst)
+      else:
+        transfer.copy(src, dst, recursive=True)
+    finally:
+      LISTING_CACHE.invalidate(src if move else None, dst)
+    return transfer
 
+  @invalidate_listing('path')
   def upload(self, file, path, *args, **kwargs):
     self._get_fs(path).upload(file, path, *args, **kwargs)
 
@@ -27,6 +27,7 @@ from desktop.auth.backend import rewrite_user
 from desktop.lib.fs import ProxyFS
 from desktop.lib.django_test_util import make_logged_in_client
 from desktop.lib.test_utils import add_permission, remove_from_group
+from filebrowser.conf import TRANSFER_CHUNK_SIZE, TRANSFER_WORKERS
 
 if sys.version_info[0] > 2:
   from unittest.mock import patch, MagicMock
@@ -122,9 +123,20 @@ def test_multi_fs_selection():
     ofs.copyfile.assert_called_once_with('ofs://volume/bucket/key', 'key2')
     assert not hdfs.copyfile.called
 
-    # Exception can only be thrown if scheme is specified, else default to 1st scheme
-    with pytest.raises(NotImplementedError):
+    # Different filesystems can only be selected if scheme is specified, else default to 1st scheme
+    with patch('desktop.lib.fs.proxyfs.Transfer') as Transfer:
       proxy_fs.copy_remote_dir('s3a://bucket/key', 'adl://tmp/dir')
+      Transfer.assert_called_once_with(s3fs, adls, user='test', chunk_size=TRANSFER_CHUNK_SIZE.get(), workers=TRANSFER_WORKERS.get())
+      Transfer.return_value.copy_dir.assert_called_once_with('s3a://bucket/key', 'adl://tmp/dir')
+      assert not s3fs.copy_remote_dir.called
+
+      proxy_fs.rename('abfs://container/dir', 's3a://bucket/dir')
+      Transfer.return_value.move.assert_called_once_with('abfs://container/dir', 's3a://bucket/dir')
+      assert not abfs.rename.called
+
+    assert proxy_fs.is_cross_filesystem('/tmp/file', 's3a://bucket/key')
+    assert not proxy_fs.is_cross_filesystem('s3a://bucket/key', 'key2')
+    assert not proxy_fs.is_cross_filesystem('/tmp/file', 'hdfs://localhost:42/tmp/file2')
 
 
 def test_constructor_given_invalid_arguments():
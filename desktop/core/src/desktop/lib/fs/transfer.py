@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+Copy and move of files and directory trees between two different filesystems, e.g. from HDFS to S3.
+
+The files are streamed chunk by chunk with the read / create / append primitives of the filesystems, so that the
+memory used is bounded by the chunk size and the number of workers whatever the size of the files.
+'''
+
+from builtins import object
+import errno
+import logging
+import posixpath
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+from io import BytesIO
+from urllib.parse import urlparse as lib_urlparse
+
+
+LOG = logging.getLogger()
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_WORKERS = 4
+PROGRESS_INTERVAL = 2  # Seconds between two progress reports
+
+
+class _AppendWriter(object):
+  '''Writes a file with create() then append(). A partial copy can be resumed from the end of the file.'''
+
+  resumable = True
+
+  def __init__(self, fs, path, offset=0):
+    self.fs = fs
+    self.path = path
+    self.offset = offset
+
+  def write(self, data):
+    if self.offset == 0:
+      self.fs.create(self.path, overwrite=True, data=data)
+    else:
+      self._append(data)
+    self.offset += len(data)
+
+  def _append(self, data):
+    self.fs.append(self.path, data)
+
+  def close(self):
+    if self.offset == 0:
+      self.fs.create(self.path, overwrite=True, data='')
+
+  def abort(self):
+    pass
+
+
+class _AbfsWriter(_AppendWriter):
+  '''ABFS needs the position of the appended data, which is flushed after each chunk so that the copy can be resumed.'''
+
+  def write(self, data):
+    if self.offset == 0:
+      self.fs.create(self.path, overwrite=True)
+    self.fs._append(self.path, data, size=len(data), params={'position': self.offset})
+    self.offset += len(data)
+    self.fs.flush(self.path, {'position': self.offset})
+
+
+class _MultipartWriter(object):
+  '''
+  Object stores can not append to an object: the chunks are sent as the parts of a multipart upload, which are required
+  to be of at least 5MB except for the last one. Small files are written in a single request.
+  '''
+
+  resumable = False
+  MIN_PART_SIZE = 5 * 1024 * 1024
+
+  def __init__(self, fs, path, offset=0):
+    self.fs = fs
+    self.path = path
+    self.offset = 0
+    self._buffer = []
+    self._buffered = 0
+    self._upload = None
+    self._part_num = 0
+
+  def write(self, data):
+    self._buffer.append(data)
+    self._buffered += len(data)
+    self.offset += len(data)
+    if self._buffered >= self.MIN_PART_SIZE:
+      self._upload_part()
+
+  def _upload_part(self):
+    if self._upload is None:
+      key = self.fs._get_key(self.path, validate=False)
+      self._upload = key.bucket.initiate_multipart_upload(key.name)
+    self._part_num += 1
+    self._upload.upload_part_from_file(fp=BytesIO(b''.join(self._buffer)), part_num=self._part_num)
+    self._buffer = []
+    self._buffered = 0
+
+  def close(self):
+    if self._upload is None:
+      self.fs.create(self.path, overwrite=True, data=b''.join(self._buffer))
+    else:
+      if self._buffer:
+        self._upload_part()
+      self._upload.complete_upload()
+
+  def abort(self):
+    if self._upload is not None:
+      self._upload.cancel_upload()
+
+
+WRITERS = {
+  's3a': _MultipartWriter,
+  'gs': _MultipartWriter,
+  'abfs': _AbfsWriter,
+}
+
+
+def open_writer(fs, path):
+  '''Returns a writer streaming the chunks given to write() into the new file `path`, to close() once done.'''
+  return WRITERS.get(lib_urlparse(path).scheme, _AppendWriter)(fs, path)
+
+
+def _basename(path):
+  return posixpath.basename(path.rstrip('/'))
+
+
+class Transfer(object):
+  '''
+  Copies or moves a file or a directory tree from the filesystem of the source to the one of the destination.
+
+  The files of a directory are copied in parallel by a pool of workers. The bytes already copied of each file are
+  recorded in `checkpoint`, a dictionary from destination path to offset. Giving back the checkpoint of an interrupted
+  transfer skips the files already copied and resumes the partial ones when the destination filesystem can append.
+
+  `on_progress(transfer)` is called at most every PROGRESS_INTERVAL seconds and once the transfer is done.
+  '''
+
+  def __init__(self, src_fs, dst_fs, user=None, chunk_size=None, workers=None, checkpoint=None, on_progress=None):
+    self.src_fs = src_fs
+    self.dst_fs = dst_fs
+    self.user = user
+    self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    self.workers = workers or DEFAULT_WORKERS
+    self.checkpoint = checkpoint if checkpoint is not None else {}
+    self.on_progress = on_progress
+
+    self.total_files = 0
+    self.total_bytes = 0
+    self.copied_files = 0
+    self.copied_bytes = 0
+
+    self._lock = threading.Lock()
+    self._progress_lock = threading.Lock()
+    self._last_progress = 0
+
+  @property
+  def progress(self):
+    return {
+      'total_files': self.total_files,
+      'total_bytes': self.total_bytes,
+      'copied_files': self.copied_files,
+      'copied_bytes': self.copied_bytes,
+      'percent': int(100 * self.copied_bytes / self.total_bytes) if self.total_bytes else (100 if self.copied_files else 0),
+    }
+
+  def copy(self, src, dst, recursive=False):
+    '''Same semantic as WebHdfs.copy(): a file or a directory is copied into dst when dst is an existing directory.'''
+    src_stats = self._stats(src)
+
+    if src_stats.isDir:
+      if not recursive:
+        LOG.debug('Skipping contents of %s' % src)
+        return
+      if self.dst_fs.exists(dst):
+        if not self.dst_fs.isdir(dst):
+          raise IOError(errno.EEXIST, 'Destination file %s exists and is not a directory.' % dst)
+        dst = self.dst_fs.join(dst, _basename(src))
+      self._run(self._plan_dir(src, dst))
+    else:
+      if self.dst_fs.isdir(dst):
+        dst = self.dst_fs.join(dst, _basename(src))
+      self._run([(src, dst, src_stats.size)])
+
+  def copyfile(self, src, dst):
+    src_stats = self._stats(src)
+    if src_stats.isDir:
+      raise IOError(errno.EINVAL, "Copy src '%s' is a directory" % src)
+    if self.dst_fs.isdir(dst):
+      raise IOError(errno.EINVAL, "Copy dst '%s' is a directory" % dst)
+    self._run([(src, dst, src_stats.size)])
+
+  def copy_dir(self, src, dst):
+    '''Copies the content of the directory src into the directory dst.'''
+    self._run(self._plan_dir(src, dst))
+
+  def move(self, src, dst):
+    '''Copies then removes src. The source is only removed once all its files are copied.'''
+    self.copy(src, dst, recursive=True)
+    if self.src_fs.isdir(src):
+      self.src_fs.rmtree(src)
+    else:
+      self.src_fs.remove(src)
+
+  def move_contents(self, src_dir, dst_dir):
+    '''Equivalent to `mv src_dir/* dst_dir`.'''
+    if not self.src_fs.isdir(src_dir):
+      raise IOError(errno.ENOTDIR, "'%s' is not a directory" % src_dir)
+    if not self.dst_fs.exists(dst_dir):
+      self.dst_fs.mkdir(dst_dir)
+    elif not self.dst_fs.isdir(dst_dir):
+      raise IOError(errno.ENOTDIR, "'%s' is not a directory" % dst_dir)
+
+    entries = self.src_fs.listdir_stats(src_dir)
+    files = []
+    for stats in entries:
+      src = self.src_fs.join(src_dir, stats.name)
+      dst = self.dst_fs.join(dst_dir, stats.name)
+      files.extend(self._plan_dir(src, dst) if stats.isDir else [(src, dst, stats.size)])
+    self._run(files)
+
+    for stats in entries:
+      src = self.src_fs.join(src_dir, stats.name)
+      if stats.isDir:
+        self.src_fs.rmtree(src)
+      else:
+        self.src_fs.remove(src)
+
+  def _stats(self, path):
+    stats = self.src_fs.stats(path)
+    if stats is None:
+      raise IOError(errno.ENOENT, 'File not found: %s' % path)
+    return stats
+
+  def _plan_dir(self, src, dst):
+    '''Creates the directory tree on the destination and returns the list of (source, destination, size) of its files.'''
+    files = []
+    directories = [(src, dst)]
+
+    while directories:
+      src_dir, dst_dir = directories.pop()
+      if not self.dst_fs.exists(dst_dir):
+        self.dst_fs.mkdir(dst_dir)
+      for stats in self.src_fs.listdir_stats(src_dir):
+        src_path = self.src_fs.join(src_dir, stats.name)
+        dst_path = self.dst_fs.join(dst_dir, stats.name)
+        if stats.isDir:
+          directories.append((src_path, dst_path))
+        else:
+          files.append((src_path, dst_path, stats.size))
+
+    return files
+
+  def _run(self, files):
+    self.total_files += len(files)
+    self.total_bytes += sum(size for _, _, size in files)
+
+    if len(files) == 1 or self.workers == 1:
+      for src, dst, size in files:
+        self._copy_file(src, dst, size)
+    elif files:
+      with ThreadPoolExecutor(max_workers=self.workers) as executor:
+        futures = [executor.submit(self._copy_file, src, dst, size) for src, dst, size in files]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+          future.cancel()
+        for future in done:
+          future.result()
+
+    self._report_progress(force=True)
+
+  def _copy_file(self, src, dst, size):
+    if self.user is not None:  # The filesystems keep the user per thread
+      self.src_fs.setuser(self.user)
+      self.dst_fs.setuser(self.user)
+
+    offset = self.checkpoint.get(dst, 0)
+    if offset and offset == size:
+      LOG.debug('Skipping %s, already copied to %s' % (src, dst))
+      self._add_progress(files=1)
+      return
+
+    writer_class = WRITERS.get(lib_urlparse(dst).scheme, _AppendWriter)
+    if offset and not (writer_class.resumable and self.dst_fs.stats(dst).size == offset):
+      offset = 0
+    writer = writer_class(self.dst_fs, dst, offset=offset)
+    self._add_progress(size=offset)
+
+    try:
+      while offset < size:
+        data = self.src_fs.read(src, offset, min(self.chunk_size, size - offset))
+        if not data:
+          raise IOError(errno.EIO, 'Unexpected end of %s at offset %d of %d' % (src, offset, size))
+        writer.write(data)
+        offset += len(data)
+        with self._lock:
+          self.checkpoint[dst] = offset if writer.resumable else 0
+        self._add_progress(size=len(data))
+      writer.close()
+    except Exception:
+      LOG.exception('Failed to copy %s to %s' % (src, dst))
+      writer.abort()
+      raise
+
+    with self._lock:
+      self.checkpoint[dst] = size
+    self._add_progress(files=1)
+
+  def _add_progress(self, files=0, size=0):
+    with self._lock:
+      self.copied_files += files
+      self.copied_bytes += size
+    self._report_progress()
+
+  def _report_progress(self, force=False):
+    if self.on_progress is None:
+      return
+    with self._progress_lock:
+      now = time.time()
+      if force or now - self._last_progress >= PROGRESS_INTERVAL:
+        self._last_progress = now
+        self.on_progress(self)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from builtins import object
+import posixpath
+import threading
+
+import pytest
+
+from desktop.lib.fs.transfer import Transfer, _MultipartWriter
+
+
+class Stat(object):
+
+  def __init__(self, path, size=0, isDir=False):
+    self.path = path
+    self.name = posixpath.basename(path)
+    self.size = size
+    self.isDir = isDir
+
+
+class MemoryFs(object):
+  '''Filesystem keeping its files in a dictionary, which counts the bytes read in one call.'''
+
+  def __init__(self, files=None, dirs=None):
+    self.files = dict(files or {})
+    self.dirs = set(dirs or [])
+    self.max_read = 0
+    self.fail_after = None
+    self.user = None
+    self._lock = threading.Lock()
+
+  def setuser(self, user):
+    self.user = user
+
+  def join(self, first, *comp_list):
+    return posixpath.join(first, *comp_list)
+
+  def exists(self, path):
+    return path in self.files or path in self.dirs
+
+  def isdir(self, path):
+    return path in self.dirs
+
+  def stats(self, path):
+    if path in self.dirs:
+      return Stat(path, isDir=True)
+    return Stat(path, len(self.files[path])) if path in self.files else None
+
+  def listdir_stats(self, path):
+    return [self.stats(child) for child in sorted(self.files) + sorted(self.dirs) if posixpath.dirname(child) == path]
+
+  def mkdir(self, path):
+    self.dirs.add(path)
+
+  def read(self, path, offset, length):
+    with self._lock:
+      if self.fail_after is not None:
+        if self.fail_after == 0:
+          raise IOError('Connection reset')
+        self.fail_after -= 1
+      self.max_read = max(self.max_read, length)
+    return self.files[path][offset:offset + length]
+
+  def create(self, path, overwrite=False, data=None):
+    self.files[path] = data or b''
+
+  def append(self, path, data):
+    self.files[path] += data
+
+  def remove(self, path):
+    del self.files[path]
+
+  def rmtree(self, path):
+    self.dirs = set(d for d in self.dirs if d != path and not d.startswith(path + '/'))
+    self.files = dict((f, data) for f, data in self.files.items() if not f.startswith(path + '/'))
+
+
+def make_tree():
+  return MemoryFs(
+    files={
+      '/src/a.csv': b'a' * 25,
+      '/src/empty': b'',
+      '/src/sub/b.csv': b'b' * 7,
+      '/src/sub/deeper/c.csv': b'c' * 40,
+    },
+    dirs=['/src', '/src/sub', '/src/sub/deeper']
+  )
+
+
+class TestTransfer(object):
+
+  def test_copy_directory(self):
+    src_fs, dst_fs = make_tree(), MemoryFs(dirs=['/dst'])
+    progress = []
+
+    transfer = Transfer(src_fs, dst_fs, user='test', chunk_size=10, workers=3, on_progress=lambda t: progress.append(t.progress))
+    transfer.copy('/src', '/dst', recursive=True)
+
+    assert {
+      '/dst/src/a.csv': b'a' * 25,
+      '/dst/src/empty': b'',
+      '/dst/src/sub/b.csv': b'b' * 7,
+      '/dst/src/sub/deeper/c.csv': b'c' * 40,
+    } == dst_fs.files
+    assert set(['/dst', '/dst/src', '/dst/src/sub', '/dst/src/sub/deeper']) == dst_fs.dirs
+    assert 10 == src_fs.max_read
+    assert 'test' == src_fs.user == dst_fs.user
+    assert {'total_files': 4, 'total_bytes': 72, 'copied_files': 4, 'copied_bytes': 72, 'percent': 100} == progress[-1]
+
+  def test_copy_file(self):
+    src_fs, dst_fs = make_tree(), MemoryFs(dirs=['/dst'])
+
+    Transfer(src_fs, dst_fs, chunk_size=10).copy('/src/a.csv', '/dst')
+    Transfer(src_fs, dst_fs, chunk_size=10).copyfile('/src/sub/b.csv', '/dst/b.txt')
+
+    assert {'/dst/a.csv': b'a' * 25, '/dst/b.txt': b'b' * 7} == dst_fs.files
+
+    with pytest.raises(IOError):
+      Transfer(src_fs, dst_fs).copyfile('/src/sub', '/dst/sub')
+
+  def test_move(self):
+    src_fs, dst_fs = make_tree(), MemoryFs(dirs=['/dst'])
+
+    Transfer(src_fs, dst_fs, chunk_size=10).move('/src/sub', '/dst/moved')
+
+    assert {'/dst/moved/b.csv': b'b' * 7, '/dst/moved/deeper/c.csv': b'c' * 40} == dst_fs.files
+    assert set(['/src/a.csv', '/src/empty']) == set(src_fs.files)
+
+  def test_failed_move_keeps_source(self):
+    src_fs, dst_fs = make_tree(), MemoryFs(dirs=['/dst'])
+    src_fs.fail_after = 2
+
+    with pytest.raises(IOError):
+      Transfer(src_fs, dst_fs, chunk_size=10, workers=1).move('/src', '/dst')
+
+    assert 4 == len(src_fs.files)
+
+  def test_resume_from_checkpoint(self):
+    src_fs, dst_fs = make_tree(), MemoryFs(dirs=['/dst'])
+    src_fs.fail_after = 4
+    checkpoint = {}
+
+    with pytest.raises(IOError):
+      Transfer(src_fs, dst_fs, chunk_size=10, workers=1, checkpoint=checkpoint).copy_dir('/src', '/dst')
+
+    assert checkpoint
+    copied = dict(checkpoint)
+
+    src_fs.fail_after = None
+    src_fs.max_read = 0
+    reads = []
+    read = src_fs.read
+    src_fs.read = lambda path, offset, length: reads.append((path, offset)) or read(path, offset, length)
+
+    Transfer(src_fs, dst_fs, chunk_size=10, workers=1, checkpoint=checkpoint).copy_dir('/src', '/dst')
+
+    assert {
+      '/dst/a.csv': b'a' * 25,
+      '/dst/empty': b'',
+      '/dst/sub/b.csv': b'b' * 7,
+      '/dst/sub/deeper/c.csv': b'c' * 40,
+    } == dst_fs.files
+    # The bytes already copied are not read again
+    for path, offset in reads:
+      assert offset >= copied.get(path.replace('/src', '/dst', 1), 0)
+
+
+class TestMultipartWriter(object):
+
+  def test_write(self):
+    fs = MemoryFs()
+    writer = _MultipartWriter(fs, 's3a://bucket/small')
+    writer.write(b'abc')
+    writer.close()
+    assert b'abc' == fs.files['s3a://bucket/small']
+
+    parts = []
+
+    class Upload(object):
+      def upload_part_from_file(self, fp, part_num):
+        parts.append((part_num, len(fp.read())))
+
+      def complete_upload(self):
+        parts.append('complete')
+
+    class Key(object):
+      name = 'big'
+
+      class bucket(object):
+        @staticmethod
+        def initiate_multipart_upload(name):
+          return Upload()
+
+    fs._get_key = lambda path, validate: Key()
+    writer = _MultipartWriter(fs, 's3a://bucket/big')
+    for i in range(7):
+      writer.write(b'x' * 1024 * 1024)
+    writer.close()
+
+    assert [(1, 5 * 1024 * 1024), (2, 2 * 1024 * 1024), 'complete'] == parts
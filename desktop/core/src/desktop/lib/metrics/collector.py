@@ -0,0 +1,58 @@
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from builtins import object
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+
+from desktop.lib.metrics.shared import COUNTER, GAUGE, TIMER, Sketch, current_epoch
+
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+def prometheus_name(name):
+  return 'hue_' + name.replace('.', '_').replace('-', '_')
+
+
+class SharedMetricsCollector(object):
+  """
+  Prometheus collector of the counters and timers shared by all the processes of the server. The timers are exposed
+  as histograms, which can be aggregated across the Hue servers.
+  """
+
+  def __init__(self, registry):
+    self.registry = registry
+
+  def describe(self):
+    return []  # The metrics are only known once the processes recorded them
+
+  def collect(self):
+    descriptions = dict((schema.name, schema.description) for schema in self.registry.schemas)
+    epoch = current_epoch()
+
+    for (name, kind), values in sorted(self.registry.shared.read().items()):
+      description = descriptions.get(name, name)
+
+      if kind == COUNTER:
+        yield CounterMetricFamily(prometheus_name(name), description, value=values[0])
+      elif kind == GAUGE:
+        yield GaugeMetricFamily(prometheus_name(name), description, value=values[0])
+      elif kind == TIMER:
+        sketch = Sketch(values, epoch)
+        buckets = [(str(upper_bound), sketch.cumulative_count(upper_bound)) for upper_bound in BUCKETS]
+        buckets.append(('+Inf', sketch.count))
+        yield HistogramMetricFamily(prometheus_name(name) + '_seconds', description, buckets=buckets, sum_value=sketch.sum)
@@ -22,9 +22,8 @@ from builtins import object
 import functools
 import pyformance
 import logging
-import os
 
-from multiprocessing import Manager
+from desktop.lib.metrics.shared import COUNTER, GAUGE, RATES, RATE_KEYS, TIMER, SharedMetrics, Sketch, current_epoch
 
 LOG = logging.getLogger()
 
@@ -70,25 +69,13 @@ PERCENTILE_99_DESCRIPTION_SUFFIX = ': 99th Percentile. This is computed over the
 PERCENTILE_999_LABEL_SUFFIX = ': 999th Percentile'
 PERCENTILE_999_DESCRIPTION_SUFFIX = ': 999th Percentile. This is computed over the past hour.'
 
-REQUESTS_ACTIVE_KEY = 'requests.active'
-REQUESTS_EXCEPTIONS_KEY = 'requests.exceptions'
-REQUESTS_RESPONSE_TIME_KEY = 'requests.response-time'
-AUTH_OAUTH_AUTH_TIME_KEY = 'auth.oauth.auth-time'
-AUTH_SAML2_AUTH_TIME_KEY = 'auth.saml2.auth-time'
-AUTH_LDAP_AUTH_TIME_KEY = 'auth.ldap.auth-time'
-AUTH_PAM_AUTH_TIME_KEY = 'auth.pam.auth-time'
-AUTH_SPNEGO_AUTH_TIME_KEY = 'auth.spnego.auth-time'
-
 class MetricsRegistry(object):
-  def __init__(self, registry=None):
-    import sys
+  def __init__(self, registry=None, shared=None):
     if registry is None:
       registry = pyformance.global_registry()
     self._registry = registry
     self._schemas = []
-    global metrics_dict
-    metrics_dict = Manager().dict() if 'rungunicornserver' in sys.argv else None
-    self._metrics_dict = metrics_dict
+    self.shared = shared if shared is not None else SharedMetrics()
 
   def _register_schema(self, schema):
     self._schemas.append(schema)
@@ -98,8 +85,9 @@ class MetricsRegistry(object):
     return list(self._schemas)
 
   def counter(self, name, **kwargs):
-    self._schemas.append(CounterDefinition(name, **kwargs))
-    return self._registry.counter(name)
+    definition = CounterDefinition(name, **kwargs)
+    self._schemas.append(definition)
+    return Counter(self._registry.counter(name), self.shared, name, GAUGE if definition.treat_counter_as_gauge else COUNTER)
 
   def histogram(self, name, **kwargs):
     self._schemas.append(HistogramDefinition(name, **kwargs))
@@ -119,108 +107,31 @@ class MetricsRegistry(object):
 
   def timer(self, name, **kwargs):
     self._schemas.append(TimerDefinition(name, **kwargs))
-    return Timer(self._registry.timer(name))
+    return Timer(self._registry.timer(name), self.shared, name)
 
-  def update_metrics_shared_data(self):
-    # Update from middleware in Gunicorn worker process
+  def get_metrics_shared_data(self):
+    """
+    Metrics of this process, with the counters and timers merged from the shared values of all the Gunicorn processes.
+    The rates of the timers of this process are published first so that the rates of all the processes can be summed.
+    """
     metrics = self.dump_metrics()
-    if self._metrics_dict is not None:
-      self._metrics_dict[os.getpid()] = metrics
 
-  def get_metrics_shared_data(self):
-    # Getting from reporter in Gunicorn main process
-    metrics_data = self._metrics_dict.values() if self._metrics_dict is not None else []
-    size = len(metrics_data)
-
-    if size > 0:
-      active_requests_list = []
-      active_exceptions_list = []
-      requests_response_time_list = []
-      auth_oauth_auth_time_list = []
-      auth_saml2_auth_time_list = []
-      auth_ldap_auth_time_list = []
-      auth_pam_auth_time_list = []
-      auth_spnego_auth_time_list = []
-
-      for value in metrics_data:
-        active_requests_list.append(value['requests.active'])
-        active_exceptions_list.append(value['requests.exceptions'])
-        requests_response_time_list.append(value[REQUESTS_RESPONSE_TIME_KEY])
-        auth_oauth_auth_time_list.append(value[AUTH_OAUTH_AUTH_TIME_KEY])
-        auth_saml2_auth_time_list.append(value[AUTH_SAML2_AUTH_TIME_KEY])
-        auth_ldap_auth_time_list.append(value[AUTH_LDAP_AUTH_TIME_KEY])
-        auth_pam_auth_time_list.append(value[AUTH_PAM_AUTH_TIME_KEY])
-        auth_spnego_auth_time_list.append(value[AUTH_SPNEGO_AUTH_TIME_KEY])
-
-      metrics_master = self.dump_metrics()
-      self.calculate_count(metrics_master[REQUESTS_ACTIVE_KEY], active_requests_list)
-      self.calculate_count(metrics_master[REQUESTS_EXCEPTIONS_KEY], active_exceptions_list)
-      self.calculate_time_series(metrics_master[REQUESTS_RESPONSE_TIME_KEY], requests_response_time_list, size)
-      self.calculate_time_series(metrics_master[AUTH_OAUTH_AUTH_TIME_KEY], auth_oauth_auth_time_list, size)
-      self.calculate_time_series(metrics_master[AUTH_SAML2_AUTH_TIME_KEY], auth_saml2_auth_time_list, size)
-      self.calculate_time_series(metrics_master[AUTH_LDAP_AUTH_TIME_KEY], auth_ldap_auth_time_list, size)
-      self.calculate_time_series(metrics_master[AUTH_PAM_AUTH_TIME_KEY], auth_pam_auth_time_list, size)
-      self.calculate_time_series(metrics_master[AUTH_SPNEGO_AUTH_TIME_KEY], auth_spnego_auth_time_list, size)
-
-      return metrics_master
-    else:
-      return self.dump_metrics()
-
-  def calculate_count(self, count_obj, count_list):
-    value = 0
-    for count in count_list:
-      value += count['count']
-    count_obj['count'] = value
-
-  def calculate_time_series(self, time_obj, time_list, size):
-    avg_list = []
-    sum_list = []
-    count_list = []
-    max_lit = []
-    min_list = []
-    std_dev_list = []
-    rate_15m_list = []
-    rate_5m_list = []
-    rate_1m_list = []
-    mean_rate_list = []
-    # percentile_50_list = []
-    percentile_75_list = []
-    percentile_95_list = []
-    percentile_99_list = []
-    percentile_999_list = []
-
-    for time in time_list:
-      avg_list.append(time['avg'])
-      sum_list.append(time['sum'])
-      count_list.append(time['count'])
-      max_lit.append(time['max'])
-      min_list.append(time['min'])
-      std_dev_list.append(time['std_dev'])
-      rate_15m_list.append(time['15m_rate'])
-      rate_5m_list.append(time['5m_rate'])
-      rate_1m_list.append(time['1m_rate'])
-      mean_rate_list.append(time['mean_rate'])
-      # percentile_50_list.append(time['50_percentile'])
-      percentile_75_list.append(time['75_percentile'])
-      percentile_95_list.append(time['95_percentile'])
-      percentile_99_list.append(time['99_percentile'])
-      percentile_999_list.append(time['999_percentile'])
-
-    time_obj['avg'] = sum(avg_list) / size
-    time_obj['sum'] = sum(sum_list) / size
-    time_obj['count'] = sum(count_list)
-    time_obj['max'] = sum(max_lit) / size
-    time_obj['min'] = sum(min_list) / size
-    time_obj['std_dev'] = sum(std_dev_list) / size
-    time_obj['15m_rate'] = sum(rate_15m_list) / size
-    time_obj['5m_rate'] = sum(rate_5m_list) / size
-    time_obj['1m_rate'] = sum(rate_1m_list) / size
-    time_obj['mean_rate'] = sum(mean_rate_list) / size
-    # time_obj['50_percentile'] = sum(percentile_50_list) / size
-    time_obj['75_percentile'] = sum(percentile_75_list) / size
-    time_obj['95_percentile'] = sum(percentile_95_list) / size
-    time_obj['99_percentile'] = sum(percentile_99_list) / size
-    time_obj['999_percentile'] = sum(percentile_999_list) / size
+    for schema in self._schemas:
+      if isinstance(schema, TimerDefinition) and schema.name in metrics:
+        self.shared.set_rates(schema.name, [metrics[schema.name][key] for key in RATE_KEYS])
+
+    epoch = current_epoch()
+    for (name, kind), values in self.shared.read().items():
+      if name not in metrics:
+        continue
+      if kind == TIMER:
+        metrics[name].update(Sketch(values, epoch).to_dict())
+      elif kind == RATES:
+        metrics[name].update(zip(RATE_KEYS, values))
+      else:
+        metrics[name]['count'] = int(values[0])
+
+    return metrics
 
   def get_hue_metrics(self, key):
     return self._registry.get_metrics(key)
@@ -494,27 +405,76 @@ class TimerDefinition(MetricDefinition):
     ]
 
 
+class Counter(object):
+  """
+  Wrapper around the pyformance Counter object to also record the value in the
+  metrics shared by the processes.
+  """
+
+  def __init__(self, counter, shared, name, kind=COUNTER):
+    self._counter = counter
+    self._shared = shared
+    self._name = name
+    self._kind = kind
+
+  def inc(self, val=1):
+    self._counter.inc(val)
+    self._shared.add(self._name, val, self._kind)
+
+  def dec(self, val=1):
+    self._counter.dec(val)
+    self._shared.add(self._name, -val, self._kind)
+
+  def __getattr__(self, *args, **kwargs):
+    return getattr(self._counter, *args, **kwargs)
+
+
 class Timer(object):
   """
   Wrapper around the pyformance Timer object to allow it to be used in an
-  annotation.
+  annotation and to also record the durations in the metrics shared by the processes.
   """
 
-  def __init__(self, timer):
+  def __init__(self, timer, shared=None, name=None):
     self._timer = timer
+    self._shared = shared
+    self._name = name
 
   def __call__(self, fn, *args, **kwargs):
     @functools.wraps(fn)
     def wrapper(*args, **kwargs):
-      with self._timer.time():
+      with self.time():
         return fn(*args, **kwargs)
 
     return wrapper
 
+  def time(self, *args, **kwargs):
+    return TimerContext(self._timer.time(*args, **kwargs), self._shared, self._name)
+
   def __getattr__(self, *args, **kwargs):
     return getattr(self._timer, *args, **kwargs)
 
 
+class TimerContext(object):
+
+  def __init__(self, context, shared, name):
+    self._context = context
+    self._shared = shared
+    self._name = name
+
+  def stop(self):
+    elapsed = self._context.stop()
+    if self._shared is not None:
+      self._shared.observe(self._name, elapsed)
+    return elapsed
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.stop()
+
+
 _global_registry = MetricsRegistry()
 
 
@@ -0,0 +1,369 @@
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Counters and timers shared by the processes of the Gunicorn server.
+
+Each process writes its values into its own file of a common directory, mapped in memory, so that recording a value is a
+local memory write. The files are only read and merged when the metrics are reported. The values of a timer are counted
+in logarithmic buckets (as in DDSketch): the quantiles have a bounded relative error and the buckets of several processes
+can be merged by adding them, unlike their percentiles.
+
+The master process folds the cumulative values of its workers which exit into a 'retired' file.
+"""
+
+from builtins import object
+import fcntl
+import logging
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+
+LOG = logging.getLogger()
+
+SHARED_DIRECTORY_ENV = 'HUE_METRICS_SHARED_DIR'
+SEGMENT_SIZE = 1024 * 1024
+
+COUNTER = 1
+GAUGE = 2  # Counter only meaningful for the live processes, e.g. the active requests
+TIMER = 3
+RATES = 4  # Rates of the timer of the same name, published by the reporter of each process
+
+RATE_KEYS = ('1m_rate', '5m_rate', '15m_rate', 'mean_rate')
+
+RELATIVE_ACCURACY = 0.02
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+LOG_GAMMA = math.log(GAMMA)
+MIN_VALUE = 1e-6  # 1 microsecond, the last bucket starts at about 35 hours
+NUM_BUCKETS = 640
+WINDOW_SECONDS = 3600
+
+# Values of a timer: count, sum, sum of squares, min, max, the buckets since the start then two windows of an epoch and
+# buckets, one per hour in turn.
+STATS_SIZE = 5
+WINDOW_SIZE = 1 + NUM_BUCKETS
+WINDOWS = (STATS_SIZE + NUM_BUCKETS, STATS_SIZE + NUM_BUCKETS + WINDOW_SIZE)
+TIMER_SIZE = STATS_SIZE + NUM_BUCKETS + 2 * WINDOW_SIZE
+
+HEADER = struct.Struct('<HHI')  # Name size, kind, number of values, followed by the name padded to 8 bytes and the values
+DOUBLE = struct.Struct('<d')
+STATS = struct.Struct('<%dd' % STATS_SIZE)
+ZERO_WINDOW = bytes(8 * WINDOW_SIZE)
+
+RETIRED_FILE = 'retired.metrics'
+LOCK_FILE = 'lock'
+
+
+def bucket_index(value):
+  if value <= MIN_VALUE:
+    return 0
+  return min(NUM_BUCKETS - 1, int(math.ceil(math.log(value / MIN_VALUE) / LOG_GAMMA)))
+
+
+def bucket_value(index):
+  return MIN_VALUE * GAMMA ** index * 2 / (GAMMA + 1)
+
+
+def current_epoch():
+  return int(time.time() // WINDOW_SECONDS)
+
+
+def _padded(size):
+  return (size + 7) // 8 * 8
+
+
+class Sketch(object):
+  """Merged values of a timer: its statistics since the start and its quantiles over the last one or two hours."""
+
+  def __init__(self, values, epoch=None):
+    if epoch is None:
+      epoch = current_epoch()
+
+    self.count, self.sum, self.sum_sq, self.min, self.max = values[:STATS_SIZE]
+    self.buckets = list(values[STATS_SIZE:STATS_SIZE + NUM_BUCKETS])
+
+    self.recent_buckets = [0] * NUM_BUCKETS
+    for window in WINDOWS:
+      if values[window] in (epoch, epoch - 1):
+        self.recent_buckets = [total + count for total, count in zip(self.recent_buckets, values[window + 1:window + WINDOW_SIZE])]
+
+  def quantile(self, q):
+    total = sum(self.recent_buckets)
+    if not total:
+      return 0.0
+
+    rank = q * (total - 1)
+    seen = 0
+    for index, count in enumerate(self.recent_buckets):
+      seen += count
+      if seen > rank:
+        return min(max(bucket_value(index), self.min), self.max)
+    return self.max
+
+  def cumulative_count(self, upper_bound):
+    """Number of values lower than upper_bound since the start, within the relative accuracy."""
+    return sum(self.buckets[:bucket_index(upper_bound) + 1])
+
+  def to_dict(self):
+    count = int(self.count)
+    return {
+      'count': count,
+      'sum': self.sum,
+      'avg': self.sum / count if count else 0.0,
+      'min': self.min,
+      'max': self.max,
+      'std_dev': math.sqrt(max(0.0, (self.sum_sq - self.sum * self.sum / count) / (count - 1))) if count > 1 else 0.0,
+      '50_percentile': self.quantile(0.5),
+      '75_percentile': self.quantile(0.75),
+      '95_percentile': self.quantile(0.95),
+      '99_percentile': self.quantile(0.99),
+      '999_percentile': self.quantile(0.999),
+    }
+
+
+def _merge(records, name, kind, values):
+  key = (name, kind)
+  if key not in records:
+    records[key] = list(values)
+    return
+
+  merged = records[key]
+
+  if kind != TIMER:
+    for index, value in enumerate(values):
+      merged[index] += value
+    return
+
+  if not values[0]:
+    return
+  if merged[0]:
+    merged[3] = min(merged[3], values[3])
+    merged[4] = max(merged[4], values[4])
+  else:
+    merged[3], merged[4] = values[3], values[4]
+  for index in range(3):
+    merged[index] += values[index]
+
+  end = STATS_SIZE + NUM_BUCKETS
+  merged[STATS_SIZE:end] = [total + count for total, count in zip(merged[STATS_SIZE:end], values[STATS_SIZE:end])]
+
+  for window in WINDOWS:
+    end = window + WINDOW_SIZE
+    if values[window] == merged[window]:
+      merged[window + 1:end] = [total + count for total, count in zip(merged[window + 1:end], values[window + 1:end])]
+    elif values[window] > merged[window]:  # The older one is at least two hours old
+      merged[window:end] = values[window:end]
+
+
+def _read_segment(segment, records, cumulative_only=False):
+  offset = 0
+  while offset + HEADER.size <= len(segment):
+    name_size, kind, size = HEADER.unpack_from(segment, offset)
+    if not name_size:
+      break
+    start = offset + HEADER.size
+    name = bytes(segment[start:start + name_size]).decode('utf-8')
+    values_offset = start + _padded(name_size)
+    if not (cumulative_only and kind in (GAUGE, RATES)):
+      _merge(records, name, kind, struct.unpack_from('<%dd' % size, segment, values_offset))
+    offset = values_offset + 8 * size
+
+
+class SharedMetrics(object):
+  """
+  Values of the counters and timers of all the processes using the same directory, which is read from the
+  HUE_METRICS_SHARED_DIR environment variable when not given. Without directory, the values stay in the memory of
+  the process.
+  """
+
+  def __init__(self, directory=None, size=SEGMENT_SIZE):
+    self._directory = directory
+    self.size = size
+    self._lock = threading.Lock()
+    self._pid = None
+    self._segment = None
+    self._offsets = {}
+    self._end = 0
+    self._full = False
+
+  @property
+  def directory(self):
+    return self._directory or os.environ.get(SHARED_DIRECTORY_ENV)
+
+  def add(self, name, value, kind=COUNTER):
+    with self._lock:
+      offset = self._allocate(name, kind, 1)
+      if offset is not None:
+        DOUBLE.pack_into(self._segment, offset, DOUBLE.unpack_from(self._segment, offset)[0] + value)
+
+  def observe(self, name, value):
+    epoch = current_epoch()
+
+    with self._lock:
+      offset = self._allocate(name, TIMER, TIMER_SIZE)
+      if offset is None:
+        return
+      segment = self._segment
+
+      count, total, total_sq, low, high = STATS.unpack_from(segment, offset)
+      if not count:
+        low = high = value
+      STATS.pack_into(segment, offset, count + 1, total + value, total_sq + value * value, min(low, value), max(high, value))
+
+      index = bucket_index(value)
+      bucket = offset + 8 * (STATS_SIZE + index)
+      DOUBLE.pack_into(segment, bucket, DOUBLE.unpack_from(segment, bucket)[0] + 1)
+
+      window = offset + 8 * WINDOWS[epoch % 2]
+      if DOUBLE.unpack_from(segment, window)[0] != epoch:
+        segment[window:window + 8 * WINDOW_SIZE] = ZERO_WINDOW
+        DOUBLE.pack_into(segment, window, epoch)
+      bucket = window + 8 * (1 + index)
+      DOUBLE.pack_into(segment, bucket, DOUBLE.unpack_from(segment, bucket)[0] + 1)
+
+  def set_rates(self, name, rates):
+    with self._lock:
+      offset = self._allocate(name, RATES, len(RATE_KEYS))
+      if offset is not None:
+        struct.pack_into('<%dd' % len(RATE_KEYS), self._segment, offset, *rates)
+
+  def read(self):
+    """Returns the values of all the processes merged, as a dictionary from (name, kind) to the list of values."""
+    records = {}
+    directory = self.directory
+
+    if directory is None:
+      with self._lock:
+        if self._segment is not None:
+          _read_segment(self._segment, records)
+      return records
+
+    with self._directory_lock(fcntl.LOCK_SH):
+      for file_name in os.listdir(directory):
+        if file_name.endswith('.metrics'):
+          self._read_file(os.path.join(directory, file_name), records)
+    return records
+
+  def retire(self, pid):
+    """Folds the counters and timers of the process which exited into the file of the retired processes."""
+    directory = self.directory
+    if directory is None:
+      return
+
+    path = os.path.join(directory, '%d.metrics' % pid)
+    retired_path = os.path.join(directory, RETIRED_FILE)
+
+    with self._directory_lock(fcntl.LOCK_EX):
+      if not os.path.exists(path):
+        return
+
+      records = {}
+      for file_path in (retired_path, path):
+        if os.path.exists(file_path):
+          self._read_file(file_path, records, cumulative_only=True)
+
+      data = bytearray()
+      for (name, kind), values in records.items():
+        encoded = name.encode('utf-8')
+        data += HEADER.pack(len(encoded), kind, len(values))
+        data += encoded.ljust(_padded(len(encoded)), b'\0')
+        data += struct.pack('<%dd' % len(values), *values)
+      data += bytes(HEADER.size)
+
+      with tempfile.NamedTemporaryFile(dir=directory, suffix='.tmp', delete=False) as f:
+        f.write(data)
+      os.chmod(f.name, 0o644)
+      os.rename(f.name, retired_path)
+      os.remove(path)
+
+  def _read_file(self, path, records, cumulative_only=False):
+    try:
+      with open(path, 'rb') as f:
+        segment = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError):  # Removed meanwhile or still empty
+      return
+    try:
+      _read_segment(segment, records, cumulative_only=cumulative_only)
+    finally:
+      segment.close()
+
+  def _directory_lock(self, operation):
+    return _FileLock(os.path.join(self.directory, LOCK_FILE), operation)
+
+  def _allocate(self, name, kind, size):
+    """Returns the offset of the values of the metric in the segment of this process, None when it is full."""
+    if self._pid != os.getpid():  # Each process has its own segment, e.g. after a fork
+      self._open_segment()
+
+    key = (name, kind)
+    offset = self._offsets.get(key)
+
+    if offset is None:
+      encoded = name.encode('utf-8')
+      start = self._end
+      offset = start + HEADER.size + _padded(len(encoded))
+      end = offset + 8 * size
+
+      if end + HEADER.size > self.size:
+        if not self._full:
+          LOG.warning('Shared metrics segment full, %s is only recorded in this process' % name)
+          self._full = True
+        return None
+
+      self._segment[start + HEADER.size:start + HEADER.size + len(encoded)] = encoded
+      HEADER.pack_into(self._segment, start, len(encoded), kind, size)  # Last, readers stop at the first empty header
+      self._offsets[key] = offset
+      self._end = end
+
+    return offset
+
+  def _open_segment(self):
+    directory = self.directory
+
+    if directory is None:
+      self._segment = mmap.mmap(-1, self.size)
+    else:
+      fd = os.open(os.path.join(directory, '%d.metrics' % os.getpid()), os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+      try:
+        os.ftruncate(fd, self.size)
+        self._segment = mmap.mmap(fd, self.size)
+      finally:
+        os.close(fd)
+
+    self._pid = os.getpid()
+    self._offsets = {}
+    self._end = 0
+    self._full = False
+
+
+class _FileLock(object):
+
+  def __init__(self, path, operation):
+    self.path = path
+    self.operation = operation
+
+  def __enter__(self):
+    self._fd = os.open(self.path, os.O_RDONLY | os.O_CREAT, 0o644)
+    fcntl.flock(self._fd, self.operation)
+    return self
+
+  def __exit__(self, *args):
+    fcntl.flock(self._fd, fcntl.LOCK_UN)
+    os.close(self._fd)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from builtins import object
+import os
+import shutil
+import tempfile
+
+import pyformance
+
+from prometheus_client import CollectorRegistry, generate_latest
+from unittest.mock import patch
+
+from desktop.lib.metrics.collector import SharedMetricsCollector
+from desktop.lib.metrics.registry import MetricsRegistry
+from desktop.lib.metrics.shared import COUNTER, GAUGE, RELATIVE_ACCURACY, TIMER, SharedMetrics, Sketch
+
+
+def in_process(pid, fn, *args):
+  with patch('desktop.lib.metrics.shared.os.getpid', return_value=pid):
+    return fn(*args)
+
+
+class TestSharedMetrics(object):
+
+  def setup_method(self):
+    self.directory = tempfile.mkdtemp()
+
+  def teardown_method(self):
+    shutil.rmtree(self.directory)
+
+  def test_merge_processes(self):
+    workers = [SharedMetrics(self.directory), SharedMetrics(self.directory)]
+
+    for pid, shared in enumerate(workers, 1000):
+      in_process(pid, shared.add, 'requests.exceptions', 2)
+      in_process(pid, shared.add, 'requests.active', 1, GAUGE)
+      for value in range(1, 501):
+        in_process(pid, shared.observe, 'requests.response-time', value / 1000.0 + (pid - 1000) * 0.5)
+
+    records = SharedMetrics(self.directory).read()
+
+    assert [4] == records[('requests.exceptions', COUNTER)]
+    assert [2] == records[('requests.active', GAUGE)]
+
+    sketch = Sketch(records[('requests.response-time', TIMER)])
+    assert 1000 == sketch.count
+    assert 0.001 == sketch.min
+    assert 1.0 == sketch.max
+    # The quantiles of the values of all the processes, not the average of the quantiles of each one
+    for q in (0.5, 0.75, 0.99):
+      assert abs(sketch.quantile(q) - q) <= q * RELATIVE_ACCURACY + 0.001
+    assert 1000 == sketch.cumulative_count(1.0)
+    assert abs(sketch.cumulative_count(0.5) - 500) <= 500 * 2 * RELATIVE_ACCURACY
+
+  def test_retire(self):
+    workers = [SharedMetrics(self.directory), SharedMetrics(self.directory)]
+    for pid, shared in enumerate(workers, 1000):
+      in_process(pid, shared.add, 'requests.exceptions', 1)
+      in_process(pid, shared.add, 'requests.active', 1, GAUGE)
+      in_process(pid, shared.observe, 'requests.response-time', 0.2)
+
+    SharedMetrics(self.directory).retire(1000)
+    SharedMetrics(self.directory).retire(1000)
+
+    assert ['1001.metrics', 'lock', 'retired.metrics'] == sorted(os.listdir(self.directory))
+    records = SharedMetrics(self.directory).read()
+    assert [2] == records[('requests.exceptions', COUNTER)]
+    assert [1] == records[('requests.active', GAUGE)]  # Only the live process
+    assert 2 == Sketch(records[('requests.response-time', TIMER)]).count
+
+    SharedMetrics(self.directory).retire(1001)
+    records = SharedMetrics(self.directory).read()
+    assert [2] == records[('requests.exceptions', COUNTER)]
+    assert ('requests.active', GAUGE) not in records
+
+  def test_registry(self):
+    registry = MetricsRegistry(registry=pyformance.MetricsRegistry(), shared=SharedMetrics(self.directory))
+    counter = registry.counter(name='test.counter', label='Test', description='Test counter', numerator='requests')
+    timer = registry.timer(
+        name='test.timer', label='Test', description='Test timer', numerator='seconds', counter_numerator='requests',
+        rate_denominator='seconds'
+    )
+
+    counter.inc()
+    counter.inc(3)
+    counter.dec()
+    timer(lambda: None)()
+    with timer.time():
+      pass
+    in_process(1000, SharedMetrics(self.directory).add, 'test.counter', 5)
+
+    metrics = registry.get_metrics_shared_data()
+    assert 8 == metrics['test.counter']['count']
+    assert 2 == metrics['test.timer']['count']
+    assert 3 == registry.get_hue_metrics('test.counter')['count']  # This process only
+
+    content = generate_latest(_collector_registry(registry)).decode('utf-8')
+    assert 'hue_test_counter_total 8.0' in content
+    assert 'hue_test_timer_seconds_bucket{le="+Inf"} 2.0' in content
+    assert 'hue_test_timer_seconds_count 2.0' in content
+
+
+def _collector_registry(registry):
+  collector_registry = CollectorRegistry()
+  collector_registry.register(SharedMetricsCollector(registry))
+  return collector_registry
@@ -26,4 +26,5 @@ else:
 
 urlpatterns = [
   re_path(r'^$', views.index, name='desktop.lib.metrics.views.index'),
+  re_path(r'^prometheus/?$', views.prometheus, name='desktop.lib.metrics.views.prometheus'),
 ]
@@ -19,15 +19,21 @@ import datetime
 import logging
 import json
 
+from django.http import HttpResponse
 from django.views.decorators.http import require_GET
+from prometheus_client import CollectorRegistry, CONTENT_TYPE_LATEST, generate_latest
 
 from desktop.lib.django_util import JsonResponse, login_notrequired, render
+from desktop.lib.metrics.collector import SharedMetricsCollector
 from desktop.lib.metrics.registry import global_registry
 from desktop.lib.view_util import is_ajax
 
 
 LOG = logging.getLogger()
 
+_collector_registry = CollectorRegistry()
+_collector_registry.register(SharedMetricsCollector(global_registry()))
+
 
 @login_notrequired
 @require_GET
@@ -52,3 +58,9 @@ def index(request):
           'is_embeddable': request.GET.get('is_embeddable', False)
         }
     )
+
+
+@login_notrequired
+@require_GET
+def prometheus(request):
+  return HttpResponse(generate_latest(_collector_registry), content_type=CONTENT_TYPE_LATEST)
@@ -40,9 +40,11 @@ from thrift.protocol.TBinaryProtocol import TBinaryProtocol
 from thrift.protocol.TMultiplexedProtocol import TMultiplexedProtocol
 
 from django.conf import settings
-from desktop.conf import SASL_MAX_BUFFER, CHERRYPY_SERVER_THREADS, ENABLE_SMART_THRIFT_POOL, USE_THRIFT_HTTP_JWT, ENABLE_ORGANIZATIONS
+from desktop.conf import SASL_MAX_BUFFER, CHERRYPY_SERVER_THREADS, ENABLE_SMART_THRIFT_POOL, USE_THRIFT_HTTP_JWT, ENABLE_ORGANIZATIONS, \
+    THRIFT_POOL_MIN_SIZE, THRIFT_POOL_IDLE_TIMEOUT, THRIFT_POOL_VALIDATION_INTERVAL
 
 from desktop.lib.apputil import WARN_LEVEL_CALL_DURATION_MS, INFO_LEVEL_CALL_DURATION_MS
+from desktop.lib.metrics import global_registry
 from desktop.lib.python_util import create_synchronous_io_multiplexer
 from desktop.lib.thrift_.http_client import THttpClient
 from desktop.lib.thrift_.TSSLSocketWithWildcardSAN import TSSLSocketWithWildcardSAN
@@ -72,28 +74,6 @@ except Exception as e:
 MAX_RECURSION_DEPTH = 50
 
 
-class LifoQueue(queue.Queue):
-  '''
-  Variant of Queue that retrieves most recently added entries first.
-
-  This LIFO Queue is included in python2.7 (or 2.6) and later,
-  but it's a simple subclass, so we "backport" it here.
-  '''
-
-  def _init(self, maxsize):
-    self.queue = []
-    self.maxsize = maxsize
-
-  def _qsize(self, len=len):
-    return len(self.queue)
-
-  def _put(self, item):
-    self.queue.append(item)
-
-  def _get(self):
-    return self.queue.pop()
-
-
 class ConnectionConfig(object):
   """ Struct-like class encapsulating the configuration of a Thrift client. """
   def __init__(self, klass, host, port, service_name,
@@ -170,72 +150,207 @@ class ConnectionConfig(object):
   def get_coordinator_host(self):
     return self.coordinator_host
 
+class ElasticPool(object):
+  """
+  Pool of SuperClients for a single endpoint which grows on demand.
+
+  A new connection is only constructed when no idle one is available and the pool has
+  not reached max_size yet, otherwise callers block until a client is returned.
+  Idle clients are handed out most recently returned first, so the least used ones age
+  at the bottom of the stack and get evicted after idle_timeout seconds, down to min_size.
+
+  Pools with can_connect=False never construct clients themselves and only hold the
+  clients adopted from another pool (e.g. Impala coordinator specific pools).
+  """
+
+  def __init__(self, conf, min_size=0, max_size=10, idle_timeout=0, validation_interval=0, can_connect=True):
+    self.conf = conf
+    self.min_size = min(min_size, max_size)
+    self.max_size = max_size
+    self.idle_timeout = idle_timeout
+    self.validation_interval = validation_interval
+    self.can_connect = can_connect
+
+    self._cond = threading.Condition(threading.Lock())
+    self._idle = []  # (client, last returned time), oldest first
+    self._size = 0  # Clients owned by the pool, idle or in use
+    self._next_cid = 0
+
+    self.in_use = 0
+    self.creations = 0
+    self.evictions = 0
+    self.wait_time = None  # Optional histogram recording how long callers waited for a client
+
+  @property
+  def idle(self):
+    return len(self._idle)
+
+  @property
+  def size(self):
+    return self._size
+
+  def get(self, timeout=None):
+    """
+    Returns an idle client, or a new one if the pool still has room.
+
+    Blocks until a client is returned otherwise and raises queue.Empty after `timeout` seconds.
+    """
+    deadline = time.time() + timeout if timeout is not None else None
+    cid = None
+
+    with self._cond:
+      while True:
+        if self._idle:
+          client, last_used = self._idle.pop()
+          break
+        elif self.can_connect and self._size < self.max_size:
+          client, last_used = None, None
+          cid = self._next_cid
+          self._next_cid += 1
+          self._size += 1
+          break
+
+        remaining = None
+        if deadline is not None:
+          remaining = deadline - time.time()
+          if remaining <= 0:
+            raise queue.Empty()
+        self._cond.wait(remaining)
+
+      self.in_use += 1
+
+    if client is None:
+      # Constructing outside of the lock so that a slow endpoint does not block the other callers
+      try:
+        client = construct_superclient(self.conf)
+      except Exception:
+        with self._cond:
+          self._size -= 1
+          self.in_use -= 1
+          self._cond.notify()
+        raise
+      client.CID = cid
+      client._pool = self
+      with self._cond:
+        self.creations += 1
+    elif self.validation_interval and time.time() - last_used > self.validation_interval:
+      _validate_client(self.conf, client)
+
+    return client
+
+  def put(self, client):
+    with self._cond:
+      self.in_use -= 1
+      self._idle.append((client, time.time()))
+      self._cond.notify()
+
+  def release(self, client):
+    """
+    Forgets a checked out client, e.g. when it was handed over to another pool.
+    """
+    with self._cond:
+      self.in_use -= 1
+      self._size -= 1
+      self._cond.notify()
+
+  def adopt(self, client):
+    """
+    Adds a client checked out from another pool to the idle clients. Returns False if the pool is full.
+    """
+    with self._cond:
+      if self._size >= self.max_size:
+        return False
+      client._pool = self
+      self._size += 1
+      self._idle.append((client, time.time()))
+      self._cond.notify()
+      return True
+
+  def evict_idle(self, now=None):
+    """
+    Closes the clients idle for more than idle_timeout seconds, keeping at least min_size clients.
+    """
+    if not self.idle_timeout:
+      return 0
+
+    now = now if now is not None else time.time()
+    evicted = []
+
+    with self._cond:
+      while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+        evicted.append(self._idle.pop(0)[0])
+        self._size -= 1
+      self.evictions += len(evicted)
+
+    for client in evicted:
+      _close_client(client)
+
+    return len(evicted)
+
+  def validate_idle(self):
+    """
+    Closes the transport of the idle clients shut down on the remote side. They get reopened on next use.
+    """
+    with self._cond:
+      for client, last_used in self._idle:
+        _validate_client(self.conf, client)
+
+
 class ConnectionPooler(object):
   """
   Thread-safe connection pooling for thrift. (With about 3 changes,
   this could be made general).
 
-  Each host,port pair has a connection pool set associated with it.
-  Clients can get connections from this pool and then block when
-  none are available.
+  Each (klass, host, port, coordinator) endpoint has an ElasticPool associated with it.
+  Pools start empty and open connections lazily up to poolsize. Clients can get
+  connections from this pool and then block when none are available.
 
   A connection is a 'SuperClient', which deals with timeout errors
   automatically so we don't have to worry about refreshing a stale pool.
 
-  We could be fancier here - we could reclaim clients ourselves without
-  relying on them to be returned but that would increase complexity. The
-  benefit would be not having to hit the connection pool on every client call.
+  A background thread evicts the connections idle for more than idle_timeout seconds
+  and checks every validation_interval seconds that the idle ones were not closed
+  on the remote side.
   """
 
-  def __init__(self, poolsize=10):
+  def __init__(self, poolsize=10, min_size=0, idle_timeout=0, validation_interval=0):
     self.pooldict = {}
     self.poolsize = poolsize
+    self.min_size = min_size
+    self.idle_timeout = idle_timeout
+    self.validation_interval = validation_interval
     self.dictlock = threading.Lock()
+    self._reaper = None
 
   def create_pool_impala(self, conf):
-    self.dictlock.acquire()
-    try:
-      if _get_pool_key(conf) not in self.pooldict:
-        q = LifoQueue(self.poolsize)
-        self.pooldict[_get_pool_key(conf)] = q
-    finally:
-      self.dictlock.release()
+    return self._get_or_create_pool(conf, can_connect=False)
 
   def create_pool(self, conf):
-    # First up, check to see if we have a pool for this endpoint
-    if _get_pool_key(conf) not in self.pooldict:
-      # Uh-oh, we need to initialise the queue. Take the dict lock.
-      # Note that this is 'double-checked locking'.
-
-      # The reason this pattern doesn't work in Java is that the write to the dict
-      # may get issued before the construction of the Queue due to new Queue(..) not
-      # being atomic. However in Python this becomes CALL_FUNCTION and STORE_FAST,
-      # therefore as long as a) the function doesn't get inlined b) Python's bytecode
-      # generator doesn't move the write to q before the function completes there's no
-      # way for another thread to observe a partially constructed queue.
-
-      # I haven't found a reference for the Python memory model, so I'm leaving this comment
-      # here in case unladen-swallow or something breaks this assumption of correctness.
-
-      self.dictlock.acquire()
-      try:
-        if _get_pool_key(conf) not in self.pooldict:
-          q = LifoQueue(self.poolsize)
-          for i in range(self.poolsize):
-            client = construct_superclient(conf)
-            client.CID = i
-            q.put(client, False)
-
-          # Wait until the queue has been filled with connections before adding
-          # it to the pool. This is done last because any exceptions thrown
-          # by the client construction could result in there being no
-          # connections available in this pool. When `get_client` is called next,
-          # it would skip this block because the key has a value, but then it
-          # would deadlock later because there are no connections for it to
-          # fetch from the pool.
-          self.pooldict[_get_pool_key(conf)] = q
-      finally:
-        self.dictlock.release()
+    return self._get_or_create_pool(conf)
+
+  def _get_or_create_pool(self, conf, can_connect=True):
+    key = _get_pool_key(conf)
+    pool = self.pooldict.get(key)
+
+    if pool is None:
+      # Only registering the pool under the lock, connections are opened on demand
+      with self.dictlock:
+        pool = self.pooldict.get(key)
+        if pool is None:
+          pool = ElasticPool(
+              conf,
+              min_size=self.min_size,
+              max_size=self.poolsize,
+              # Clients of coordinator pools can't be reopened, they should not be evicted
+              idle_timeout=self.idle_timeout if can_connect else 0,
+              validation_interval=self.validation_interval,
+              can_connect=can_connect
+          )
+          _register_pool_metrics(key, pool)
+          self.pooldict[key] = pool
+          self._start_reaper()
+
+    return pool
 
   def get_client(self, conf, get_client_timeout=None):
     """
@@ -249,7 +364,7 @@ class ConnectionPooler(object):
     start_pool_get_time = time.time()
     has_waited_for = 0
 
-    self.create_pool(conf)
+    pool = self.create_pool(conf)
 
     while connection is None:
       if get_client_timeout is not None:
@@ -258,9 +373,11 @@ class ConnectionPooler(object):
         this_round_timeout = None
 
       try:
-        connection = self.pooldict[_get_pool_key(conf)].get(block=True, timeout=this_round_timeout)
+        connection = pool.get(timeout=this_round_timeout)
         if connection is not None:
           duration = time.time() - start_pool_get_time
+          if pool.wait_time is not None:
+            pool.wait_time.add(duration)
           message = "Thrift client %s got connection %s after %.2f seconds" % (self, connection.CID, duration)
           log_if_slow_call(duration=duration, message=message)
       except queue.Empty:
@@ -281,13 +398,109 @@ class ConnectionPooler(object):
     pass back a client that was not retrieved from a pool, and
     you might well get an exception for doing so.
     """
+    source_pool = getattr(client, '_pool', None) or self.pooldict[_get_pool_key(conf)]
+
     if client.get_coordinator_host() is not None:
       conf.update_coordinator_host(client.get_coordinator_host())
-      self.create_pool_impala(conf)
-    if client.get_coordinator_host() is not None and client.get_coordinator_host() != conf.get_coordinator_host():
-      conf.update_coordinator_host(client.get_coordinator_host())
+      pool = self.create_pool_impala(conf)
+    else:
+      pool = source_pool
+
+    if pool is source_pool:
+      pool.put(client)
+    else:
+      source_pool.release(client)
+      if not pool.adopt(client):
+        _close_client(client)
+
+  def reap(self):
+    for pool in list(self.pooldict.values()):
+      try:
+        pool.evict_idle()
+        pool.validate_idle()
+      except Exception:
+        LOG.exception('Failed to clean up the Thrift connection pool of %s' % pool.conf.service_name)
+
+  def _start_reaper(self):
+    intervals = [interval for interval in (self.idle_timeout, self.validation_interval) if interval > 0]
+
+    if intervals and self._reaper is None:
+      self._reaper = threading.Thread(target=self._reap_forever, args=(min(intervals),), name='ThriftPoolReaper')
+      self._reaper.daemon = True
+      self._reaper.start()
+
+  def _reap_forever(self, interval):
+    while True:
+      time.sleep(interval)
+      self.reap()
+
+
+def _register_pool_metrics(key, pool):
+  klass, host, port, coordinator_host = key
+  name = 'thrift.pool.%s' % re.sub(r'[^\w-]+', '_', '%s_%s_%s_%s' % (pool.conf.service_name, host, port, coordinator_host or ''))
+  label = 'Thrift Pool %s %s:%s %s' % (pool.conf.service_name, host, port, coordinator_host or '')
+
+  global_registry().gauge_callback(
+      name=name + '.in-use',
+      callback=lambda: pool.in_use,
+      label=label + ' In Use',
+      description='Number of Thrift connections checked out from the pool',
+      numerator='connections',
+  )
+  global_registry().gauge_callback(
+      name=name + '.idle',
+      callback=lambda: pool.idle,
+      label=label + ' Idle',
+      description='Number of idle Thrift connections in the pool',
+      numerator='connections',
+  )
+  global_registry().gauge_callback(
+      name=name + '.creations',
+      callback=lambda: pool.creations,
+      label=label + ' Creations',
+      description='Number of Thrift connections created by the pool',
+      numerator='connections',
+      treat_gauge_as_counter=True,
+  )
+  global_registry().gauge_callback(
+      name=name + '.evictions',
+      callback=lambda: pool.evictions,
+      label=label + ' Evictions',
+      description='Number of idle Thrift connections closed by the pool',
+      numerator='connections',
+      treat_gauge_as_counter=True,
+  )
+  pool.wait_time = global_registry().histogram(
+      name=name + '.wait-time',
+      label=label + ' Wait Time',
+      description='Time spent waiting to get a Thrift connection from the pool',
+      numerator='seconds',
+      counter_numerator='connections',
+  )
+
+
+def _close_client(client):
+  try:
+    client.transport.close()
+  except Exception as e:
+    LOG.warning('Failed to close Thrift connection %s: %s' % (getattr(client, 'CID', None), e))
+
+
+def _validate_client(conf, client):
+  """
+  Poke an idle client to see if it's closed on the other end. This can happen if a connection
+  sits in the connection pool longer than the read timeout of the server.
+  """
+  sock = conf.transport_mode != 'http' and _grab_transport_from_wrapper(client.transport).handle
+  if sock and create_synchronous_io_multiplexer().read([sock]):
+    # the socket is readable, meaning there is either data from a previous call
+    # (i.e our protocol is out of sync), or the connection was shut down on the
+    # remote side. Either way, we need to reopen the connection, which the
+    # SuperClient does on next call when the transport is closed.
+    client.transport.close()
+    return False
+  return True
 
-    self.pooldict[_get_pool_key(conf)].put(client)
 
 def _get_pool_key(conf):
   """
@@ -382,7 +595,12 @@ def connect_to_thrift(conf):
   return service, protocol, transport
 
 
-_connection_pool = ConnectionPooler(poolsize=CHERRYPY_SERVER_THREADS.get())
+_connection_pool = ConnectionPooler(
+    poolsize=CHERRYPY_SERVER_THREADS.get(),
+    min_size=THRIFT_POOL_MIN_SIZE.get(),
+    idle_timeout=THRIFT_POOL_IDLE_TIMEOUT.get(),
+    validation_interval=THRIFT_POOL_VALIDATION_INTERVAL.get()
+)
 
 
 def get_client(klass, host, port, service_name, **kwargs):
@@ -436,19 +654,7 @@ class PooledClient(object):
         attr = getattr(superclient, attr_name)
 
         try:
-          # Poke it to see if it's closed on the other end. This can happen if a connection
-          # sits in the connection pool longer than the read timeout of the server.
-          sock = self.conf.transport_mode != 'http' and _grab_transport_from_wrapper(superclient.transport).handle
-          if sock and create_synchronous_io_multiplexer().read([sock]):
-            # the socket is readable, meaning there is either data from a previous call
-            # (i.e our protocol is out of sync), or the connection was shut down on the
-            # remote side. Either way, we need to reopen the connection.
-            # If the socket was closed remotely, btw, socket.read() will return
-            # an empty string.  This is a fairly normal condition, btw, since
-            # there are timeouts on both the server and client sides.
-            superclient.transport.close()
-            superclient.transport.open()
-
+          # Idle connections are validated by the pool, see _validate_client()
           superclient.set_timeout(self.conf.timeout_seconds)
           return attr(*args, **kwargs)
         except TApplicationException as e:
@@ -20,6 +20,7 @@ from builtins import object
 import logging
 import os
 import pytest
+import queue
 import socket
 import sys
 import threading
@@ -367,6 +368,85 @@ class TestSuperClient(TestCase):
       # Could check output for several "Thrift exception; retrying: some error"
 
 
+class TestElasticPool(object):
+
+  def test_lazy_growth(self):
+    with patch('desktop.lib.thrift_util.construct_superclient') as construct_superclient:
+      construct_superclient.side_effect = lambda conf: Mock()
+      pool = thrift_util.ElasticPool(Mock(), max_size=2)
+
+      assert 0 == pool.size
+      assert not construct_superclient.called
+
+      client = pool.get()
+      assert 1 == pool.size
+      assert 1 == pool.in_use
+      assert 1 == pool.creations
+
+      pool.put(client)
+      assert 0 == pool.in_use
+      assert 1 == pool.idle
+
+      assert client is pool.get()
+      assert 1 == pool.creations
+
+  def test_max_size(self):
+    with patch('desktop.lib.thrift_util.construct_superclient') as construct_superclient:
+      construct_superclient.side_effect = lambda conf: Mock()
+      pool = thrift_util.ElasticPool(Mock(), max_size=1)
+
+      client = pool.get()
+      with pytest.raises(queue.Empty):
+        pool.get(timeout=0.1)
+
+      pool.put(client)
+      assert client is pool.get(timeout=0.1)
+
+  def test_construction_failure_frees_slot(self):
+    with patch('desktop.lib.thrift_util.construct_superclient') as construct_superclient:
+      construct_superclient.side_effect = Exception('Connection refused')
+      pool = thrift_util.ElasticPool(Mock(), max_size=1)
+
+      with pytest.raises(Exception):
+        pool.get(timeout=0.1)
+      assert 0 == pool.size
+      assert 0 == pool.in_use
+
+  def test_evict_idle(self):
+    with patch('desktop.lib.thrift_util.construct_superclient') as construct_superclient:
+      construct_superclient.side_effect = lambda conf: Mock()
+      pool = thrift_util.ElasticPool(Mock(), min_size=1, max_size=3, idle_timeout=60)
+
+      clients = [pool.get() for i in range(3)]
+      for client in clients:
+        pool.put(client)
+
+      assert 0 == pool.evict_idle()
+      assert 2 == pool.evict_idle(now=time.time() + 61)
+      assert 1 == pool.size
+      assert 2 == pool.evictions
+      assert clients[0].transport.close.called
+      assert clients[1].transport.close.called
+      assert not clients[2].transport.close.called
+
+  def test_adopt(self):
+    with patch('desktop.lib.thrift_util.construct_superclient') as construct_superclient:
+      construct_superclient.side_effect = lambda conf: Mock()
+      pool = thrift_util.ElasticPool(Mock(), max_size=2)
+      coordinator_pool = thrift_util.ElasticPool(Mock(), max_size=1, can_connect=False)
+
+      client = pool.get()
+      pool.release(client)
+      assert coordinator_pool.adopt(client)
+      assert not coordinator_pool.adopt(Mock())
+
+      assert 0 == pool.size
+      assert 1 == coordinator_pool.size
+      assert client is coordinator_pool.get(timeout=0.1)
+      with pytest.raises(queue.Empty):
+        coordinator_pool.get(timeout=0.1)
+
+
 @pytest.mark.django_db
 class TestThriftJWT():
   def setup_method(self):
@@ -22,6 +22,7 @@ import logging
 import logging.config
 import os
 import pkg_resources
+import shutil
 import ssl
 import sys
 import tempfile
@@ -29,6 +30,7 @@ import tempfile
 from OpenSSL import crypto
 from multiprocessing.util import _exit_function
 from desktop import conf
+from desktop.lib.metrics.shared import SHARED_DIRECTORY_ENV, SharedMetrics
 from desktop.lib.paths import get_desktop_root
 from django.core.management.base import BaseCommand
 from django.core.wsgi import get_wsgi_application
@@ -83,6 +85,13 @@ def post_worker_init(worker):
 def worker_int(worker):
   connection.close()
 
+def when_ready(server):
+  # The workers might run as another user
+  util.chown(os.environ[SHARED_DIRECTORY_ENV], server.cfg.uid, server.cfg.gid)
+
+def child_exit(server, worker):
+  SharedMetrics().retire(worker.pid)
+
 def enable_logging(args, options):
   HUE_DESKTOP_VERSION = pkg_resources.get_distribution("desktop").version or "Unknown"
   # Start basic logging as soon as possible.
@@ -216,7 +225,9 @@ def rungunicornserver(args=[], options={}):
       'workers': conf.GUNICORN_NUMBER_OF_WORKERS.get() if conf.GUNICORN_NUMBER_OF_WORKERS.get() is not None else 5,
       'post_fork': post_fork,
       'post_worker_init': post_worker_init,
-      'worker_int': worker_int
+      'worker_int': worker_int,
+      'when_ready': when_ready,
+      'child_exit': child_exit
   }
   StandaloneApplication(handler_app, gunicorn_options).run()
 
@@ -232,6 +243,12 @@ def start_server(args, options):
   activate_translation()
   enable_logging(args, options)
   atexit.unregister(_exit_function)
+
+  # The workers record their metrics in this directory, which is read by the metrics reporters
+  metrics_dir = tempfile.mkdtemp(prefix='hue_metrics_', dir=options['worker_tmp_dir'])
+  os.environ[SHARED_DIRECTORY_ENV] = metrics_dir
+  atexit.register(shutil.rmtree, metrics_dir, True)
+
   with open(PID_FILE, "a") as f:
     f.write("%s\n"%os.getpid())
   rungunicornserver(args, options)
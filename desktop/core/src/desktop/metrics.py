@@ -31,6 +31,7 @@ from useradmin.models import User
 
 from desktop.conf import ENABLE_PROMETHEUS
 from desktop.lib.metrics import global_registry
+from desktop.lib.metrics.collector import SharedMetricsCollector
 
 
 LOG = logging.getLogger()
@@ -59,6 +60,8 @@ if ENABLE_PROMETHEUS.get():
   for django_collector in django_collectors:
     REGISTRY.unregister(django_collector)
 
+  REGISTRY.register(SharedMetricsCollector(global_registry()))
+
 
 global_registry().gauge_callback(
     name='threads.total',
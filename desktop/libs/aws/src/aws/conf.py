@@ -179,7 +179,8 @@ AWS_ACCOUNTS = UnspecifiedConfigSection(
       ACCESS_KEY_ID=Config(
         key='access_key_id',
         type=str,
-        dynamic_default=get_default_access_key_id
+        dynamic_default=get_default_access_key_id,
+        memoize=False
       ),
       ACCESS_KEY_ID_SCRIPT=Config(
         key='access_key_id_script',
@@ -191,7 +192,8 @@ AWS_ACCOUNTS = UnspecifiedConfigSection(
         key='secret_access_key',
         type=str,
         private=True,
-        dynamic_default=get_default_secret_key
+        dynamic_default=get_default_secret_key,
+        memoize=False
       ),
       SECRET_ACCESS_KEY_SCRIPT=Config(
         key='secret_access_key_script',
@@ -204,7 +206,8 @@ AWS_ACCOUNTS = UnspecifiedConfigSection(
         key='security_token',
         type=str,
         private=True,
-        dynamic_default=get_default_session_token
+        dynamic_default=get_default_session_token,
+        memoize=False
       ),
       ALLOW_ENVIRONMENT_CREDENTIALS=Config(
         help=_('Allow to use environment sources of credentials (environment variables, EC2 profile).'),
@@ -48,6 +48,7 @@ else:
   from django.utils.translation import ugettext as _
 
 DEFAULT_READ_SIZE = 1024 * 1024  # 1MB
+LISTING_BATCH_SIZE = 1000  # Keys returned by one S3 listing request
 BUCKET_NAME_PATTERN = re.compile(
   "^((?:(?:[a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9_\-]*[a-zA-Z0-9])\.)*(?:[A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9_\-]*[A-Za-z0-9]))$")
 
@@ -329,18 +330,34 @@ class S3FileSystem(object):
       except Exception as e:
         raise S3FileSystemException(_('Failed to retrieve buckets: %s') % e)
 
+    return [stat for batch in self.listdir_stats_iter(path) for stat in batch]
+
+  @translate_s3_error
+  def listdir_stats_iter(self, path):
+    """
+    Same as listdir_stats() but returns an iterator of batches of stats. The keys are listed by pages
+    following the markers, the first one right away and the next ones only when needed.
+    """
+    if S3FileSystem.isroot(path):
+      return iter([self.listdir_stats(path)])
+
     bucket_name, prefix = s3.parse_uri(path)[:2]
     bucket = self._get_bucket(bucket_name)
     prefix = self._append_separator(prefix)
-    res = []
-    for item in bucket.list(prefix=prefix, delimiter='/', headers=self.header_values):
+    items = iter(bucket.list(prefix=prefix, delimiter='/', headers=self.header_values))
+    first_batch = self._next_stats_batch(items, prefix)
+
+    return itertools.chain([first_batch], iter(lambda: self._next_stats_batch(items, prefix), []))
+
+  @translate_s3_error
+  def _next_stats_batch(self, items, prefix):
+    batch = []
+    for item in itertools.islice(items, LISTING_BATCH_SIZE):
       if isinstance(item, Prefix):
-        res.append(S3Stat.from_key(Key(item.bucket, item.name), is_dir=True, fs=self.fs))
-      else:
-        if item.name == prefix:
-          continue
-        res.append(self._stats_key(item, self.fs))
-    return res
+        batch.append(S3Stat.from_key(Key(item.bucket, item.name), is_dir=True, fs=self.fs))
+      elif item.name != prefix:
+        batch.append(self._stats_key(item, self.fs))
+    return batch
 
   @translate_s3_error
   def listdir(self, path, glob=None):
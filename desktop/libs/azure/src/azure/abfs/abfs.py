@@ -21,6 +21,7 @@ Interfaces for ABFS
 from future import standard_library
 standard_library.install_aliases()
 from builtins import object
+import itertools
 import logging
 import os
 import sys
@@ -206,7 +207,16 @@ class ABFS(object):
     if ABFS.isroot(path):
       return self.listfilesystems_stats(params=None, **kwargs)
 
-    dir_stats = []
+    return [stat for batch in self.listdir_stats_iter(path, params, **kwargs) for stat in batch]
+
+  def listdir_stats_iter(self, path, params=None, **kwargs):
+    """
+    Same as listdir_stats() but returns an iterator of batches of stats, one per listing request.
+    The first batch is fetched right away and the next ones when needed by following the continuation token.
+    """
+    if ABFS.isroot(path):
+      return iter([self.listfilesystems_stats(params=None, **kwargs)])
+
     file_system, directory_name, account = Init_ABFS.parse_uri(path)
     root = Init_ABFS.ABFS_ROOT
     if path.lower().startswith(Init_ABFS.ABFS_ROOT_S):
@@ -219,13 +229,16 @@ class ABFS(object):
     if directory_name != "":
       params['directory'] = directory_name
 
+    batches = self._listdir_stats_batches(file_system, root + file_system + account + "/", params, **kwargs)
+    first_batch = next(batches)
+
+    return itertools.chain([first_batch], batches)
+
+  def _listdir_stats_batches(self, file_system, prefix, params, **kwargs):
     while True:
       res = self._root._invoke("GET", file_system, params, headers=self._getheaders(), **kwargs)
       resp = self._root._format_response(res)
-      if account:
-        file_system += account
-      for x in resp['paths']:
-        dir_stats.append(ABFSStat.for_directory(res.headers, x, root + file_system + "/" + x['name']))
+      yield [ABFSStat.for_directory(res.headers, x, prefix + x['name']) for x in resp['paths']]
       # If the number of paths returned exceeds the 5000, a continuation token is provided in the response header x-ms-continuation,
       # which must be used in subsequent invocations to continue listing the paths.
       if 'x-ms-continuation' in res.headers:
@@ -233,8 +246,6 @@ class ABFS(object):
       else:
         break
 
-    return dir_stats
-
   def listfilesystems_stats(self, root=Init_ABFS.ABFS_ROOT, params=None, **kwargs):
     """
     Lists the stats inside the File Systems, No functionality for params
@@ -104,6 +104,7 @@ AZURE_ACCOUNTS = UnspecifiedConfigSection(
         key="client_id",
         type=str,
         dynamic_default=get_default_client_id,
+        memoize=False,
         help="https://docs.microsoft.com/en-us/azure/data-lake-store/data-lake-store-service-to-service-authenticate-rest-api"),
       CLIENT_ID_SCRIPT=Config(
         key="client_id_script",
@@ -115,6 +116,7 @@ AZURE_ACCOUNTS = UnspecifiedConfigSection(
         key="client_secret",
         type=str,
         dynamic_default=get_default_secret_key,
+        memoize=False,
         private=True,
         help="https://docs.microsoft.com/en-us/azure/data-lake-store/data-lake-store-service-to-service-authenticate-rest-api"),
       CLIENT_SECRET_SCRIPT=Config(
@@ -127,6 +129,7 @@ AZURE_ACCOUNTS = UnspecifiedConfigSection(
         key="tenant_id",
         type=str,
         dynamic_default=get_default_tenant_id,
+        memoize=False,
         help="https://docs.microsoft.com/en-us/azure/data-lake-store/data-lake-store-service-to-service-authenticate-rest-api"),
       TENANT_ID_SCRIPT=Config(
         key='tenant_id_script',
@@ -17,6 +17,7 @@
 
 from builtins import filter
 import hashlib
+import itertools
 import json
 import logging
 import sys
@@ -33,12 +34,12 @@ from libsolr.api import SolrApi
 
 from notebook.connectors.base import get_api
 from notebook.dashboard_api import MockRequest
-from search.conf import SOLR_URL
+from search.conf import DOWNLOAD_LIMIT, SOLR_URL
 
 from dashboard.conf import get_engines, USE_GRIDSTER
 from dashboard.controller import can_edit_index
 from dashboard.dashboard_api import get_engine
-from dashboard.data_export import download as export_download
+from dashboard.data_export import download as export_download, download_pages as export_download_pages
 from dashboard.decorators import allow_viewer_only
 from dashboard.facet_builder import _guess_gap, _zoom_range_facet, _new_range_facet
 from dashboard.models import Collection2, augment_solr_response, pairwise2, augment_solr_exception,\
@@ -298,6 +299,11 @@ def download(request):
     file_format = 'csv' if 'csv' == request.POST.get('type') else 'xls' if 'xls' == request.POST.get('type') else 'json'
     facet = json.loads(request.POST.get('facet', '{}'))
 
+    if not facet:
+      collection = json.loads(request.POST.get('collection', '{}'))
+      if collection and collection.get('engine', 'solr') == 'solr':
+        return _download_pages(request, collection, file_format)
+
     json_response = search(request)
     response = json.loads(json_response.content)
 
@@ -320,6 +326,23 @@ def download(request):
     raise PopupException(_("Could not download search results: %s") % e)
 
 
+def _download_pages(request, collection, file_format):
+  """Streams the documents of the result grid from Solr, up to the download limit."""
+  query = json.loads(request.POST.get('query', '{}'))
+  max_rows = DOWNLOAD_LIMIT.get()
+
+  def on_progress(count, total):
+    LOG.info('Downloading %(name)s for %(user)s: %(count)s/%(total)s documents' % {
+      'name': collection['name'], 'user': request.user.username, 'count': count, 'total': total
+    })
+
+  pages = SolrApi(SOLR_URL.get(), request.user).query_cursor(collection, query, max_rows, on_progress=on_progress)
+  # Errors of the first page are reported to the user instead of cutting the stream of the file
+  pages = itertools.chain([next(pages, [])], pages)
+
+  return export_download_pages(pages, file_format, collection, user_agent=request.META.get('HTTP_USER_AGENT'))
+
+
 @allow_viewer_only
 def get_timeline(request):
   result = {'status': -1, 'message': 'Error'}
@@ -91,6 +91,21 @@ ALLOW_UNSECURE_HTML = Config(
   default=False
 )
 
+QUERY_CACHE_TTL = Config(
+  key="query_cache_ttl",
+  help=_t("Number of seconds the results of the SQL dashboard widgets are reused for the same statement. 0 to disable."),
+  type=int,
+  default=0
+)
+
+QUERY_CACHE_SHARED = Config(
+  key="query_cache_shared",
+  help=_t("Share the cached results of the SQL dashboard widgets across users. "
+          "Only enable it when the users can see the same rows of the tables."),
+  type=coerce_bool,
+  default=False
+)
+
 def get_properties():
   if ENGINES.get():
     engines = ENGINES.get()
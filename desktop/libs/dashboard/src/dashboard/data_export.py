@@ -18,8 +18,10 @@
 # Handling of data export
 
 from past.builtins import basestring, long
+import json
 import logging
 
+from django.http import StreamingHttpResponse
 from django.utils.encoding import smart_str
 
 from desktop.lib import export_csvxls
@@ -44,33 +46,76 @@ def download(results, format, collection, user_agent=None):
   return export_csvxls.make_response(generator, format, 'query_result', user_agent=user_agent)
 
 
+def download_pages(pages, format, collection, user_agent=None):
+  """
+  download_pages(pages, format) -> StreamingHttpResponse
+
+  Same as download() for an iterator of pages of documents, which are sent as they are read.
+  """
+  if format == 'json':
+    resp = StreamingHttpResponse(JsonPagesGenerator(pages), content_type='application/json')
+    resp['Content-Disposition'] = 'attachment; filename="query_result.json"'
+    return resp
+
+  content_generator = SearchPagesAdapter(pages, collection)
+  generator = export_csvxls.create_generator(content_generator, format)
+  return export_csvxls.make_response(generator, format, 'query_result', user_agent=user_agent)
+
+
 def SearchDataAdapter(results, format, collection):
   """
   SearchDataAdapter(results, format, db) -> headers, 2D array of data.
   """
   if results and results['response'] and results['response']['docs']:
     search_data = results['response']['docs']
-
-    if collection['template']['fieldsSelected']:
-      headers = collection['template']['fieldsSelected']
-    else:
-      headers = [field['name'] for field in collection['fields']]
-
-    rows = []
-
-    for data in search_data:
-      row = []
-      for column in headers:
-        if column not in data:
-          row.append("")
-        elif isinstance(data[column], basestring) or isinstance(data[column], (int, long, float, complex)):
-          row.append(data[column])
-        elif isinstance(data[column], list): # Multivalue field
-          row.append([smart_str(val, errors='replace') for val in data[column]])
-        else:
-          row.append(smart_str(data[column]))
-      rows.append(row)
+    headers = _get_headers(collection)
+    rows = [_doc_to_row(data, headers) for data in search_data]
   else:
     rows = [[]]
 
   yield headers, rows
+
+
+def SearchPagesAdapter(pages, collection):
+  """
+  SearchPagesAdapter(pages, collection) -> headers, 2D array of data of each page.
+  """
+  headers = _get_headers(collection)
+  empty = True
+
+  for docs in pages:
+    empty = False
+    yield headers, [_doc_to_row(data, headers) for data in docs]
+
+  if empty:
+    yield headers, []
+
+
+def JsonPagesGenerator(pages):
+  separator = '['
+  for docs in pages:
+    for doc in docs:
+      yield separator + json.dumps(doc)
+      separator = ','
+  yield '[]' if separator == '[' else ']'
+
+
+def _get_headers(collection):
+  if collection['template']['fieldsSelected']:
+    return collection['template']['fieldsSelected']
+  else:
+    return [field['name'] for field in collection['fields']]
+
+
+def _doc_to_row(data, headers):
+  row = []
+  for column in headers:
+    if column not in data:
+      row.append("")
+    elif isinstance(data[column], basestring) or isinstance(data[column], (int, long, float, complex)):
+      row.append(data[column])
+    elif isinstance(data[column], list): # Multivalue field
+      row.append([smart_str(val, errors='replace') for val in data[column]])
+    else:
+      row.append(smart_str(data[column]))
+  return row
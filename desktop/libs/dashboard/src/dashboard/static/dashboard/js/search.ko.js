@@ -2495,6 +2495,17 @@ var SearchViewModel = function (collection_json, query_json, initial_json, has_g
             query: ko.mapping.toJSON(self.query),
             facet: ko.mapping.toJSON(facet)
           }, function (data) {
+            if (data.cached) { // Result already computed by a previous search
+              facet.queryResult(new QueryResult(self, {
+                type: self.collection.engine(),
+                status: 'available',
+                progress: 100,
+              }));
+              self._loadResults(facet, data.result);
+              self.asyncSearchesCounter.remove(facet);
+              return;
+            }
+
             facet.queryResult(new QueryResult(self, {
               type: self.collection.engine(),
               result: data,
@@ -2531,6 +2542,17 @@ var SearchViewModel = function (collection_json, query_json, initial_json, has_g
             try {
               if (self.collection.engine() === 'solr') {
                 self._make_grid_result(data, callback);
+              } else if (data.cached) {
+                self.collection.queryResult(new QueryResult(self, {
+                  type: self.collection.engine(),
+                  status: 'available',
+                  progress: 100,
+                }));
+                self._loadResults(self.collection, data.result);
+                self.asyncSearchesCounter.remove(self.collection);
+                if (callback) {
+                  callback();
+                }
               } else {
                 self.collection.queryResult(new QueryResult(self, {
                   type: self.collection.engine(),
@@ -19,6 +19,10 @@
 from builtins import object
 import json
 import pytest
+import threading
+import time
+
+from unittest.mock import Mock, patch
 
 from django.urls import reverse
 
@@ -28,6 +32,11 @@ from desktop.lib.rest import resource
 from desktop.models import Document2
 from useradmin.models import User
 
+from notebook import dashboard_api
+from notebook.connectors.base import QueryError
+from notebook.dashboard_api import SQLDashboardApi
+
+from dashboard.conf import QUERY_CACHE_SHARED, QUERY_CACHE_TTL
 from dashboard.facet_builder import _round_number_range
 from dashboard.models import Collection2, augment_response
 from dashboard.controller import DashboardController
@@ -483,7 +492,7 @@ class TestWithMockedSolr(TestSearchBase):
         'query': json.dumps(QUERY)
     })
 
-    json_response_content = json.loads(json_response.content)
+    json_response_content = json.loads(b''.join(json_response.streaming_content))
     assert 'application/json' == json_response['Content-Type']
     assert 'attachment; filename="query_result.json"' == json_response['Content-Disposition']
     assert 4 == len(json_response_content), len(json_response_content)
@@ -542,6 +551,112 @@ class TestWithMockedSolr(TestSearchBase):
     augment_response(collection, query, response)
 
 
+class TestSQLDashboardApi(object):
+
+  def setup_method(self):
+    self.dashboard = {'name': 'default.web_logs', 'engine': 'hive', 'template': {'rows': 10}}
+    self.result = {'meta': [{'name': 'code'}], 'data': iter([[200], [404]]), 'has_more': False, 'type': 'table'}
+    self.reset = [QUERY_CACHE_TTL.set_for_testing(60), QUERY_CACHE_SHARED.set_for_testing(False)]
+
+  def teardown_method(self):
+    for reset in self.reset:
+      reset()
+
+  def _query(self, user, sql):
+    api = SQLDashboardApi(user, 'hive')
+    api._get_sql = Mock(return_value=(sql, 'default', {}))
+    api._convert_result = Mock(side_effect=lambda result, dashboard, facet, query: result)
+    return api
+
+  def test_result_cache(self):
+    user, other = Mock(username='test_cache'), Mock(username='test_cache_other')
+    hits = dashboard_api.query_cache_hits.get_count()
+
+    with patch('notebook.dashboard_api.make_notebook') as make_notebook:
+      with patch('notebook.dashboard_api.get_api') as get_api:
+        make_notebook.return_value.execute.return_value = {'handle': {'sync': False}}
+        get_api.return_value.fetch_result.return_value = self.result
+
+        api = self._query(user, 'SELECT code FROM web_logs -- Widget 1')
+        response = api.query(self.dashboard, QUERY, {})
+        assert 'handle' in response
+        assert [[200], [404]] == api.fetch_result(self.dashboard, QUERY, {'queryResult': {}})['data']
+
+        # Same statement, formatted differently
+        response = self._query(user, 'select code\n  from web_logs').query(self.dashboard, QUERY, {})
+        assert response['cached']
+        assert [[200], [404]] == response['result']['data']
+        assert 1 == make_notebook.return_value.execute.call_count
+        assert hits + 1 == dashboard_api.query_cache_hits.get_count()
+
+        # Not shared across users by default
+        assert 'handle' in self._query(other, 'SELECT code FROM web_logs').query(self.dashboard, QUERY, {})
+        assert 2 == make_notebook.return_value.execute.call_count
+
+        self.reset.append(QUERY_CACHE_SHARED.set_for_testing(True))
+        api = self._query(user, 'SELECT code FROM web_logs')
+        api.fetch_result(self.dashboard, QUERY, {'queryResult': {}})
+        assert self._query(other, 'SELECT code FROM web_logs').query(self.dashboard, QUERY, {})['cached']
+
+        # Disabled
+        self.reset.append(QUERY_CACHE_TTL.set_for_testing(0))
+        assert 'handle' in self._query(user, 'SELECT code FROM web_logs').query(self.dashboard, QUERY, {})
+
+  def test_single_flight(self):
+    api = self._query(Mock(username='test_single_flight'), 'SELECT code FROM web_logs')
+    cache_key = api._get_cache_key('SELECT code FROM web_logs', 'default', 10)
+
+    assert api._get_cached_result(cache_key) is None  # First request runs the statement
+
+    # The concurrent requests of the same statement wait for its result
+    timer = threading.Timer(0.2, api._set_cached_result, [cache_key, self.result])
+    timer.start()
+    try:
+      result = api._get_cached_result(cache_key)
+    finally:
+      timer.join()
+
+    assert [[200], [404]] == result['data']
+
+  def test_single_flight_released_on_failure(self):
+    user = Mock(username='test_single_flight_failure')
+
+    with patch('notebook.dashboard_api.make_notebook') as make_notebook:
+      make_notebook.return_value.execute.side_effect = QueryError('Table not found')
+
+      api = self._query(user, 'SELECT code FROM web_logs')
+      with pytest.raises(QueryError):
+        api.query(self.dashboard, QUERY, {})
+
+      # The next request runs the statement right away instead of waiting for the failed one
+      start = time.time()
+      with pytest.raises(QueryError):
+        self._query(user, 'SELECT code FROM web_logs').query(self.dashboard, QUERY, {})
+      assert time.time() - start < dashboard_api.SINGLE_FLIGHT_TIMEOUT / 2
+
+
+  def test_single_flight_async(self):
+    user = Mock(username='test_single_flight_async')
+
+    with patch('notebook.dashboard_api.make_notebook') as make_notebook:
+      make_notebook.return_value.execute.return_value = {'handle': {'sync': False}}
+
+      response = self._query(user, 'SELECT code FROM web_logs').query(self.dashboard, QUERY, {})
+      cache_key = response['handle']['single_flight_key']
+
+      # While the query runs, the other viewers wait for it instead of running it again, until e.g. it fails
+      timer = threading.Timer(0.2, dashboard_api.release_single_flight, [cache_key])
+      timer.start()
+      try:
+        start = time.time()
+        self._query(user, 'SELECT code FROM web_logs').query(self.dashboard, QUERY, {})
+      finally:
+        timer.join()
+
+      assert time.time() - start >= 0.2
+      assert 2 == make_notebook.return_value.execute.call_count
+
+
 SOLR_LUKE_SCHEMA = """{"responseHeader":{"status":0,"QTime":2},"index":{"numDocs":8,"maxDoc":8,"deletedDocs":0,"version":15,"segmentCount":5,"current":true,"hasDeletions":false,"directory":"org.apache.lucene.store.NRTCachingDirectory:NRTCachingDirectory(org.apache.solr.store.hdfs.HdfsDirectory@5efe087b lockFactory=org.apache.solr.store.hdfs.HdfsLockFactory@5106def2; maxCacheMB=192.0 maxMergeSizeMB=16.0)","userData":{"commitTimeMSec":"1389233070579"},"lastModified":"2014-01-09T02:04:30.579Z"},"schema":{"fields":{"_version_":{"type":"long","flags":"ITS-----OF------","copyDests":[],"copySources":[]},"author":{"type":"text_general","flags":"ITS-------------","positionIncrementGap":100,"copyDests":["author_s","text"],"copySources":[]},"<script>alert(1234)</script>":{"type":"string","flags":"I-S-M---OF-----l","copyDests":["text"],"copySources":[]},"category":{"type":"text_general","flags":"ITS-------------","positionIncrementGap":100,"copyDests":[],"copySources":[]},"comments":{"type":"text_general","flags":"ITS-------------","positionIncrementGap":100,"copyDests":[],"copySources":[]},"content":{"type":"text_general","flags":"-TS-M-----------","positionIncrementGap":100,"copyDests":["text"],"copySources":[]},"content_type":{"type":"string","flags":"I-S-M---OF-----l","copyDests":["text"],"copySources":[]},"description":{"type":"text_general","flags":"ITS-------------","positionIncrementGap":100,"copyDests":["text"],"copySources":[]},"features":{"type":"text_general","flags":"ITS-M-----------","positionIncrementGap":100,"copyDests":["text"],"copySources":[]},"id":{"type":"string","flags":"I-S-----OF-----l","required":true,"uniqueKey":true,"copyDests":[],"copySources":[]},"inStock":{"type":"boolean","flags":"I-S-----OF-----l","copyDests":[],"copySources":[]},"includes":{"type":"text_general","flags":"ITS--Vop--------","positionIncrementGap":100,"copyDests":["text"],"copySources":[]},"keywords":{"type":"text_general","flags":"ITS-------------","positionIncrementGap":100,"copyDests":["text"],"copySources":[]},"last_modified":{"type":"date","flags":"ITS------F------","copyDests":[],"copySources":[]},"links":{"type":"string","flags":"I-S-M---OF-----l","copyDests":[],"copySources":[]},"manu":{"type":"text_general","flags":"ITS-----O-------","positionIncrementGap":100,"copyDests":["text","manu_exact"],"copySources":[]},"manu_exact":{"type":"string","flags":"I-------OF-----l","copyDests":[],"copySources":["manu"]},"name":{"type":"text_general","flags":"ITS-------------","positionIncrementGap":100,"copyDests":["text"],"copySources":[]},"payloads":{"type":"payloads","flags":"ITS-------------","copyDests":[],"copySources":[]},"popularity":{"type":"int","flags":"ITS-----OF------","copyDests":[],"copySources":[]},"price":{"type":"float","flags":"ITS-----OF------","copyDests":["price_c"],"copySources":[]},"resourcename":{"type":"text_general","flags":"ITS-------------","positionIncrementGap":100,"copyDests":["text"],"copySources":[]},"sku":{"type":"text_en_splitting_tight","flags":"ITS-----O-------","positionIncrementGap":100,"copyDests":[],"copySources":[]},"store":{"type":"location","flags":"I-S------F------","copyDests":[],"copySources":[]},"subject":{"type":"text_general","flags":"ITS-------------","positionIncrementGap":100,"copyDests":[],"copySources":[]},"text":{"type":"text_general","flags":"IT--M-----------","positionIncrementGap":100,"copyDests":[],"copySources":["cat","keywords","resourcename","includes","url","content","author","title","manu","description","name","features","content_type"]},"text_rev":{"type":"text_general_rev","flags":"IT--M-----------","positionIncrementGap":100,"copyDests":[],"copySources":[]},"title":{"type":"text_general","flags":"ITS-M-----------","positionIncrementGap":100,"copyDests":["text"],"copySources":[]},"url":{"type":"text_general","flags":"ITS-------------","positionIncrementGap":100,"copyDests":["text"],"copySources":[]},"weight":{"type":"float","flags":"ITS-----OF------","copyDests":[],"copySources":[]}},"dynamicFields":{"*____amount_raw":{"type":"amount_raw_type_tlong","flags":"IT------O-------","copyDests":[],"copySources":[]},"*____currency":{"type":"currency_type_string","flags":"I-------O-------","copyDests":[],"copySources":[]},"*_b":{"type":"boolean","flags":"I-S-----OF-----l","copyDests":[],"copySources":[]},"*_bs":{"type":"boolean","flags":"I-S-M---OF-----l","copyDests":[],"copySources":[]},"*_c":{"type":"currency","flags":"I-S------F------","copyDests":[],"copySources":[]},"*_coordinate":{"type":"tdouble","flags":"IT------OF------","copyDests":[],"copySources":[]},"*_d":{"type":"double","flags":"ITS-----OF------","copyDests":[],"copySources":[]},"*_ds":{"type":"double","flags":"ITS-M---OF------","copyDests":[],"copySources":[]},"*_dt":{"type":"date","flags":"ITS------F------","copyDests":[],"copySources":[]},"*_dts":{"type":"date","flags":"ITS-M----F------","copyDests":[],"copySources":[]},"*_en":{"type":"text_en","flags":"ITS-M-----------","positionIncrementGap":100,"copyDests":[],"copySources":[]},"*_f":{"type":"float","flags":"ITS-----OF------","copyDests":[],"copySources":[]},"*_fs":{"type":"float","flags":"ITS-M---OF------","copyDests":[],"copySources":[]},"*_i":{"type":"int","flags":"ITS-----OF------","copyDests":[],"copySources":[]},"*_is":{"type":"int","flags":"ITS-M---OF------","copyDests":[],"copySources":[]},"*_l":{"type":"long","flags":"ITS-----OF------","copyDests":[],"copySources":[]},"*_ls":{"type":"long","flags":"ITS-M---OF------","copyDests":[],"copySources":[]},"*_p":{"type":"location","flags":"I-S------F------","copyDests":[],"copySources":[]},"*_pi":{"type":"pint","flags":"I-S-----OF------","copyDests":[],"copySources":[]},"*_s":{"type":"string","flags":"I-S-----OF-----l","copyDests":[],"copySources":[]},"*_ss":{"type":"string","flags":"I-S-M---OF-----l","copyDests":[],"copySources":[]},"*_t":{"type":"text_general","flags":"ITS-------------","positionIncrementGap":100,"copyDests":[],"copySources":[]},"*_td":{"type":"tdouble","flags":"ITS-----OF------","copyDests":[],"copySources":[]},"*_tdt":{"type":"tdate","flags":"ITS------F------","copyDests":[],"copySources":[]},"*_tf":{"type":"tfloat","flags":"ITS-----OF------","copyDests":[],"copySources":[]},"*_ti":{"type":"tint","flags":"ITS-----OF------","copyDests":[],"copySources":[]},"*_tl":{"type":"tlong","flags":"ITS-----OF------","copyDests":[],"copySources":[]},"*_txt":{"type":"text_general","flags":"ITS-M-----------","positionIncrementGap":100,"copyDests":[],"copySources":[]},"attr_*":{"type":"text_general","flags":"ITS-M-----------","positionIncrementGap":100,"copyDests":[],"copySources":[]},"ignored_*":{"type":"ignored","flags":"----M---OF------","copyDests":[],"copySources":[]},"random_*":{"type":"random","flags":"I-S------F------","copyDests":[],"copySources":[]}},"uniqueKeyField":"id","defaultSearchField":null,"types":{"alphaOnlySort":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.KeywordTokenizerFactory","args":{"class":"solr.KeywordTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"TrimFilterFactory":{"args":{"class":"solr.TrimFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.TrimFilterFactory"},"PatternReplaceFilterFactory":{"args":{"replace":"all","replacement":"","pattern":"([^a-z])","class":"solr.PatternReplaceFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.pattern.PatternReplaceFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.KeywordTokenizerFactory","args":{"class":"solr.KeywordTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"TrimFilterFactory":{"args":{"class":"solr.TrimFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.TrimFilterFactory"},"PatternReplaceFilterFactory":{"args":{"replace":"all","replacement":"","pattern":"([^a-z])","class":"solr.PatternReplaceFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.pattern.PatternReplaceFilterFactory"}}},"similarity":{}},"ancestor_path":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.KeywordTokenizerFactory","args":{"class":"solr.KeywordTokenizerFactory","luceneMatchVersion":"LUCENE_44"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.path.PathHierarchyTokenizerFactory","args":{"delimiter":"/","class":"solr.PathHierarchyTokenizerFactory","luceneMatchVersion":"LUCENE_44"}}},"similarity":{}},"binary":{"fields":null,"tokenized":false,"className":"org.apache.solr.schema.BinaryField","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"boolean":{"fields":["inStock","*_bs","*_b"],"tokenized":false,"className":"org.apache.solr.schema.BoolField","indexAnalyzer":{"className":"org.apache.solr.schema.BoolField$1"},"queryAnalyzer":{"className":"org.apache.solr.schema.BoolField$1"},"similarity":{}},"currency":{"fields":["*_c"],"tokenized":false,"className":"org.apache.solr.schema.CurrencyField","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"date":{"fields":["last_modified","*_dts","*_dt"],"tokenized":true,"className":"org.apache.solr.schema.TrieDateField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"similarity":{}},"descendent_path":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.path.PathHierarchyTokenizerFactory","args":{"delimiter":"/","class":"solr.PathHierarchyTokenizerFactory","luceneMatchVersion":"LUCENE_44"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.KeywordTokenizerFactory","args":{"class":"solr.KeywordTokenizerFactory","luceneMatchVersion":"LUCENE_44"}}},"similarity":{}},"double":{"fields":["*_ds","*_d"],"tokenized":true,"className":"org.apache.solr.schema.TrieDoubleField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"similarity":{}},"float":{"fields":["weight","price","*_fs","*_f"],"tokenized":true,"className":"org.apache.solr.schema.TrieFloatField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"similarity":{}},"ignored":{"fields":["ignored_*"],"tokenized":false,"className":"org.apache.solr.schema.StrField","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"int":{"fields":["popularity","*_is","*_i"],"tokenized":true,"className":"org.apache.solr.schema.TrieIntField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"similarity":{}},"location":{"fields":["store","*_p"],"tokenized":false,"className":"org.apache.solr.schema.LatLonType","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"location_rpt":{"fields":null,"tokenized":false,"className":"org.apache.solr.schema.SpatialRecursivePrefixTreeFieldType","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"long":{"fields":["_version_","*_ls","*_l"],"tokenized":true,"className":"org.apache.solr.schema.TrieLongField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"similarity":{}},"lowercase":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.KeywordTokenizerFactory","args":{"class":"solr.KeywordTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.KeywordTokenizerFactory","args":{"class":"solr.KeywordTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"}}},"similarity":{}},"payloads":{"fields":["payloads"],"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.WhitespaceTokenizerFactory","args":{"class":"solr.WhitespaceTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"DelimitedPayloadTokenFilterFactory":{"args":{"class":"solr.DelimitedPayloadTokenFilterFactory","luceneMatchVersion":"LUCENE_44","encoder":"float"},"className":"org.apache.lucene.analysis.payloads.DelimitedPayloadTokenFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.WhitespaceTokenizerFactory","args":{"class":"solr.WhitespaceTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"DelimitedPayloadTokenFilterFactory":{"args":{"class":"solr.DelimitedPayloadTokenFilterFactory","luceneMatchVersion":"LUCENE_44","encoder":"float"},"className":"org.apache.lucene.analysis.payloads.DelimitedPayloadTokenFilterFactory"}}},"similarity":{}},"pdate":{"fields":null,"tokenized":false,"className":"org.apache.solr.schema.DateField","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"pdouble":{"fields":null,"tokenized":false,"className":"org.apache.solr.schema.DoubleField","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"pfloat":{"fields":null,"tokenized":false,"className":"org.apache.solr.schema.FloatField","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"phonetic":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"DoubleMetaphoneFilterFactory":{"args":{"inject":"false","class":"solr.DoubleMetaphoneFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.phonetic.DoubleMetaphoneFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"DoubleMetaphoneFilterFactory":{"args":{"inject":"false","class":"solr.DoubleMetaphoneFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.phonetic.DoubleMetaphoneFilterFactory"}}},"similarity":{}},"pint":{"fields":["*_pi"],"tokenized":false,"className":"org.apache.solr.schema.IntField","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"plong":{"fields":null,"tokenized":false,"className":"org.apache.solr.schema.LongField","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"point":{"fields":null,"tokenized":false,"className":"org.apache.solr.schema.PointType","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"random":{"fields":["random_*"],"tokenized":false,"className":"org.apache.solr.schema.RandomSortField","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"string":{"fields":["cat","id","manu_exact","content_type","links","*_ss","*_s"],"tokenized":false,"className":"org.apache.solr.schema.StrField","indexAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"queryAnalyzer":{"className":"org.apache.solr.schema.FieldType$DefaultAnalyzer"},"similarity":{}},"tdate":{"fields":["*_tdt"],"tokenized":true,"className":"org.apache.solr.schema.TrieDateField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"similarity":{}},"tdouble":{"fields":["*_coordinate","*_td"],"tokenized":true,"className":"org.apache.solr.schema.TrieDoubleField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"similarity":{}},"text_ar":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ar.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"ArabicNormalizationFilterFactory":{"args":{"class":"solr.ArabicNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ar.ArabicNormalizationFilterFactory"},"ArabicStemFilterFactory":{"args":{"class":"solr.ArabicStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ar.ArabicStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ar.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"ArabicNormalizationFilterFactory":{"args":{"class":"solr.ArabicNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ar.ArabicNormalizationFilterFactory"},"ArabicStemFilterFactory":{"args":{"class":"solr.ArabicStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ar.ArabicStemFilterFactory"}}},"similarity":{}},"text_bg":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_bg.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"BulgarianStemFilterFactory":{"args":{"class":"solr.BulgarianStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.bg.BulgarianStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_bg.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"BulgarianStemFilterFactory":{"args":{"class":"solr.BulgarianStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.bg.BulgarianStemFilterFactory"}}},"similarity":{}},"text_ca":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"ElisionFilterFactory":{"args":{"articles":"lang/contractions_ca.txt","class":"solr.ElisionFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.util.ElisionFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ca.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Catalan","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"ElisionFilterFactory":{"args":{"articles":"lang/contractions_ca.txt","class":"solr.ElisionFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.util.ElisionFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ca.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Catalan","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_cjk":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"CJKWidthFilterFactory":{"args":{"class":"solr.CJKWidthFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.cjk.CJKWidthFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"CJKBigramFilterFactory":{"args":{"class":"solr.CJKBigramFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.cjk.CJKBigramFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"CJKWidthFilterFactory":{"args":{"class":"solr.CJKWidthFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.cjk.CJKWidthFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"CJKBigramFilterFactory":{"args":{"class":"solr.CJKBigramFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.cjk.CJKBigramFilterFactory"}}},"similarity":{}},"text_cz":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_cz.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"CzechStemFilterFactory":{"args":{"class":"solr.CzechStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.cz.CzechStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_cz.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"CzechStemFilterFactory":{"args":{"class":"solr.CzechStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.cz.CzechStemFilterFactory"}}},"similarity":{}},"text_da":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_da.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Danish","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_da.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Danish","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_de":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_de.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"GermanNormalizationFilterFactory":{"args":{"class":"solr.GermanNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.de.GermanNormalizationFilterFactory"},"GermanLightStemFilterFactory":{"args":{"class":"solr.GermanLightStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.de.GermanLightStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_de.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"GermanNormalizationFilterFactory":{"args":{"class":"solr.GermanNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.de.GermanNormalizationFilterFactory"},"GermanLightStemFilterFactory":{"args":{"class":"solr.GermanLightStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.de.GermanLightStemFilterFactory"}}},"similarity":{}},"text_el":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"GreekLowerCaseFilterFactory":{"args":{"class":"solr.GreekLowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.el.GreekLowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_el.txt","class":"solr.StopFilterFactory","ignoreCase":"false","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"GreekStemFilterFactory":{"args":{"class":"solr.GreekStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.el.GreekStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"GreekLowerCaseFilterFactory":{"args":{"class":"solr.GreekLowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.el.GreekLowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_el.txt","class":"solr.StopFilterFactory","ignoreCase":"false","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"GreekStemFilterFactory":{"args":{"class":"solr.GreekStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.el.GreekStemFilterFactory"}}},"similarity":{}},"text_en":{"fields":["*_en"],"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"StopFilterFactory":{"args":{"words":"lang/stopwords_en.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"EnglishPossessiveFilterFactory":{"args":{"class":"solr.EnglishPossessiveFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.en.EnglishPossessiveFilterFactory"},"KeywordMarkerFilterFactory":{"args":{"protected":"protwords.txt","class":"solr.KeywordMarkerFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.KeywordMarkerFilterFactory"},"PorterStemFilterFactory":{"args":{"class":"solr.PorterStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.en.PorterStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"SynonymFilterFactory":{"args":{"class":"solr.SynonymFilterFactory","expand":"true","synonyms":"synonyms.txt","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.synonym.SynonymFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_en.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"EnglishPossessiveFilterFactory":{"args":{"class":"solr.EnglishPossessiveFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.en.EnglishPossessiveFilterFactory"},"KeywordMarkerFilterFactory":{"args":{"protected":"protwords.txt","class":"solr.KeywordMarkerFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.KeywordMarkerFilterFactory"},"PorterStemFilterFactory":{"args":{"class":"solr.PorterStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.en.PorterStemFilterFactory"}}},"similarity":{}},"text_en_splitting":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.WhitespaceTokenizerFactory","args":{"class":"solr.WhitespaceTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"StopFilterFactory":{"args":{"words":"lang/stopwords_en.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"WordDelimiterFilterFactory":{"args":{"generateNumberParts":"1","splitOnCaseChange":"1","catenateWords":"1","class":"solr.WordDelimiterFilterFactory","generateWordParts":"1","luceneMatchVersion":"LUCENE_44","catenateAll":"0","catenateNumbers":"1"},"className":"org.apache.lucene.analysis.miscellaneous.WordDelimiterFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"KeywordMarkerFilterFactory":{"args":{"protected":"protwords.txt","class":"solr.KeywordMarkerFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.KeywordMarkerFilterFactory"},"PorterStemFilterFactory":{"args":{"class":"solr.PorterStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.en.PorterStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.WhitespaceTokenizerFactory","args":{"class":"solr.WhitespaceTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"SynonymFilterFactory":{"args":{"class":"solr.SynonymFilterFactory","expand":"true","synonyms":"synonyms.txt","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.synonym.SynonymFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_en.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"WordDelimiterFilterFactory":{"args":{"generateNumberParts":"1","splitOnCaseChange":"1","catenateWords":"0","class":"solr.WordDelimiterFilterFactory","generateWordParts":"1","luceneMatchVersion":"LUCENE_44","catenateAll":"0","catenateNumbers":"0"},"className":"org.apache.lucene.analysis.miscellaneous.WordDelimiterFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"KeywordMarkerFilterFactory":{"args":{"protected":"protwords.txt","class":"solr.KeywordMarkerFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.KeywordMarkerFilterFactory"},"PorterStemFilterFactory":{"args":{"class":"solr.PorterStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.en.PorterStemFilterFactory"}}},"similarity":{}},"text_en_splitting_tight":{"fields":["sku"],"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.WhitespaceTokenizerFactory","args":{"class":"solr.WhitespaceTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"SynonymFilterFactory":{"args":{"class":"solr.SynonymFilterFactory","expand":"false","synonyms":"synonyms.txt","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.synonym.SynonymFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_en.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"WordDelimiterFilterFactory":{"args":{"generateNumberParts":"0","catenateWords":"1","class":"solr.WordDelimiterFilterFactory","generateWordParts":"0","luceneMatchVersion":"LUCENE_44","catenateAll":"0","catenateNumbers":"1"},"className":"org.apache.lucene.analysis.miscellaneous.WordDelimiterFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"KeywordMarkerFilterFactory":{"args":{"protected":"protwords.txt","class":"solr.KeywordMarkerFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.KeywordMarkerFilterFactory"},"EnglishMinimalStemFilterFactory":{"args":{"class":"solr.EnglishMinimalStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.en.EnglishMinimalStemFilterFactory"},"RemoveDuplicatesTokenFilterFactory":{"args":{"class":"solr.RemoveDuplicatesTokenFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.RemoveDuplicatesTokenFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.WhitespaceTokenizerFactory","args":{"class":"solr.WhitespaceTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"SynonymFilterFactory":{"args":{"class":"solr.SynonymFilterFactory","expand":"false","synonyms":"synonyms.txt","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.synonym.SynonymFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_en.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"WordDelimiterFilterFactory":{"args":{"generateNumberParts":"0","catenateWords":"1","class":"solr.WordDelimiterFilterFactory","generateWordParts":"0","luceneMatchVersion":"LUCENE_44","catenateAll":"0","catenateNumbers":"1"},"className":"org.apache.lucene.analysis.miscellaneous.WordDelimiterFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"KeywordMarkerFilterFactory":{"args":{"protected":"protwords.txt","class":"solr.KeywordMarkerFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.KeywordMarkerFilterFactory"},"EnglishMinimalStemFilterFactory":{"args":{"class":"solr.EnglishMinimalStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.en.EnglishMinimalStemFilterFactory"},"RemoveDuplicatesTokenFilterFactory":{"args":{"class":"solr.RemoveDuplicatesTokenFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.RemoveDuplicatesTokenFilterFactory"}}},"similarity":{}},"text_es":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_es.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SpanishLightStemFilterFactory":{"args":{"class":"solr.SpanishLightStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.es.SpanishLightStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_es.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SpanishLightStemFilterFactory":{"args":{"class":"solr.SpanishLightStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.es.SpanishLightStemFilterFactory"}}},"similarity":{}},"text_eu":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_eu.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Basque","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_eu.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Basque","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_fa":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","charFilters":{"PersianCharFilterFactory":{"args":{"class":"solr.PersianCharFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.fa.PersianCharFilterFactory"}},"tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"ArabicNormalizationFilterFactory":{"args":{"class":"solr.ArabicNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ar.ArabicNormalizationFilterFactory"},"PersianNormalizationFilterFactory":{"args":{"class":"solr.PersianNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.fa.PersianNormalizationFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_fa.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","charFilters":{"PersianCharFilterFactory":{"args":{"class":"solr.PersianCharFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.fa.PersianCharFilterFactory"}},"tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"ArabicNormalizationFilterFactory":{"args":{"class":"solr.ArabicNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ar.ArabicNormalizationFilterFactory"},"PersianNormalizationFilterFactory":{"args":{"class":"solr.PersianNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.fa.PersianNormalizationFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_fa.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"}}},"similarity":{}},"text_fi":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_fi.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Finnish","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_fi.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Finnish","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_fr":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"ElisionFilterFactory":{"args":{"articles":"lang/contractions_fr.txt","class":"solr.ElisionFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.util.ElisionFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_fr.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"FrenchLightStemFilterFactory":{"args":{"class":"solr.FrenchLightStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.fr.FrenchLightStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"ElisionFilterFactory":{"args":{"articles":"lang/contractions_fr.txt","class":"solr.ElisionFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.util.ElisionFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_fr.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"FrenchLightStemFilterFactory":{"args":{"class":"solr.FrenchLightStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.fr.FrenchLightStemFilterFactory"}}},"similarity":{}},"text_ga":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"ElisionFilterFactory":{"args":{"articles":"lang/contractions_ga.txt","class":"solr.ElisionFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.util.ElisionFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/hyphenations_ga.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"IrishLowerCaseFilterFactory":{"args":{"class":"solr.IrishLowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ga.IrishLowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ga.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Irish","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"ElisionFilterFactory":{"args":{"articles":"lang/contractions_ga.txt","class":"solr.ElisionFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.util.ElisionFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/hyphenations_ga.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"IrishLowerCaseFilterFactory":{"args":{"class":"solr.IrishLowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ga.IrishLowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ga.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Irish","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_general":{"fields":["subject","includes","author","title","description","name","features","text","keywords","resourcename","url","content","category","manu","comments","attr_*","*_txt","*_t"],"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"StopFilterFactory":{"args":{"words":"stopwords.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"StopFilterFactory":{"args":{"words":"stopwords.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SynonymFilterFactory":{"args":{"class":"solr.SynonymFilterFactory","expand":"true","synonyms":"synonyms.txt","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.synonym.SynonymFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"}}},"similarity":{}},"text_general_rev":{"fields":["text_rev"],"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"StopFilterFactory":{"args":{"words":"stopwords.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"ReversedWildcardFilterFactory":{"args":{"maxFractionAsterisk":"0.33","withOriginal":"true","maxPosQuestion":"2","class":"solr.ReversedWildcardFilterFactory","maxPosAsterisk":"3","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.solr.analysis.ReversedWildcardFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"SynonymFilterFactory":{"args":{"class":"solr.SynonymFilterFactory","expand":"true","synonyms":"synonyms.txt","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.synonym.SynonymFilterFactory"},"StopFilterFactory":{"args":{"words":"stopwords.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"}}},"similarity":{}},"text_gl":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_gl.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"GalicianStemFilterFactory":{"args":{"class":"solr.GalicianStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.gl.GalicianStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_gl.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"GalicianStemFilterFactory":{"args":{"class":"solr.GalicianStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.gl.GalicianStemFilterFactory"}}},"similarity":{}},"text_hi":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"IndicNormalizationFilterFactory":{"args":{"class":"solr.IndicNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.in.IndicNormalizationFilterFactory"},"HindiNormalizationFilterFactory":{"args":{"class":"solr.HindiNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.hi.HindiNormalizationFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_hi.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"HindiStemFilterFactory":{"args":{"class":"solr.HindiStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.hi.HindiStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"IndicNormalizationFilterFactory":{"args":{"class":"solr.IndicNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.in.IndicNormalizationFilterFactory"},"HindiNormalizationFilterFactory":{"args":{"class":"solr.HindiNormalizationFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.hi.HindiNormalizationFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_hi.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"HindiStemFilterFactory":{"args":{"class":"solr.HindiStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.hi.HindiStemFilterFactory"}}},"similarity":{}},"text_hu":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_hu.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Hungarian","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_hu.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Hungarian","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_hy":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_hy.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Armenian","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_hy.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Armenian","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_id":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_id.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"IndonesianStemFilterFactory":{"args":{"class":"solr.IndonesianStemFilterFactory","stemDerivational":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.id.IndonesianStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_id.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"IndonesianStemFilterFactory":{"args":{"class":"solr.IndonesianStemFilterFactory","stemDerivational":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.id.IndonesianStemFilterFactory"}}},"similarity":{}},"text_it":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"ElisionFilterFactory":{"args":{"articles":"lang/contractions_it.txt","class":"solr.ElisionFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.util.ElisionFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_it.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"ItalianLightStemFilterFactory":{"args":{"class":"solr.ItalianLightStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.it.ItalianLightStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"ElisionFilterFactory":{"args":{"articles":"lang/contractions_it.txt","class":"solr.ElisionFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.util.ElisionFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_it.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"ItalianLightStemFilterFactory":{"args":{"class":"solr.ItalianLightStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.it.ItalianLightStemFilterFactory"}}},"similarity":{}},"text_ja":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.ja.JapaneseTokenizerFactory","args":{"class":"solr.JapaneseTokenizerFactory","luceneMatchVersion":"LUCENE_44","mode":"search"}},"filters":{"JapaneseBaseFormFilterFactory":{"args":{"class":"solr.JapaneseBaseFormFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ja.JapaneseBaseFormFilterFactory"},"JapanesePartOfSpeechStopFilterFactory":{"args":{"tags":"lang/stoptags_ja.txt","class":"solr.JapanesePartOfSpeechStopFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ja.JapanesePartOfSpeechStopFilterFactory"},"CJKWidthFilterFactory":{"args":{"class":"solr.CJKWidthFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.cjk.CJKWidthFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ja.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"JapaneseKatakanaStemFilterFactory":{"args":{"class":"solr.JapaneseKatakanaStemFilterFactory","minimumLength":"4","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ja.JapaneseKatakanaStemFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.ja.JapaneseTokenizerFactory","args":{"class":"solr.JapaneseTokenizerFactory","luceneMatchVersion":"LUCENE_44","mode":"search"}},"filters":{"JapaneseBaseFormFilterFactory":{"args":{"class":"solr.JapaneseBaseFormFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ja.JapaneseBaseFormFilterFactory"},"JapanesePartOfSpeechStopFilterFactory":{"args":{"tags":"lang/stoptags_ja.txt","class":"solr.JapanesePartOfSpeechStopFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ja.JapanesePartOfSpeechStopFilterFactory"},"CJKWidthFilterFactory":{"args":{"class":"solr.CJKWidthFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.cjk.CJKWidthFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ja.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"JapaneseKatakanaStemFilterFactory":{"args":{"class":"solr.JapaneseKatakanaStemFilterFactory","minimumLength":"4","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.ja.JapaneseKatakanaStemFilterFactory"},"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"}}},"similarity":{}},"text_lv":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_lv.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"LatvianStemFilterFactory":{"args":{"class":"solr.LatvianStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.lv.LatvianStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_lv.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"LatvianStemFilterFactory":{"args":{"class":"solr.LatvianStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.lv.LatvianStemFilterFactory"}}},"similarity":{}},"text_nl":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_nl.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"StemmerOverrideFilterFactory":{"args":{"class":"solr.StemmerOverrideFilterFactory","dictionary":"lang/stemdict_nl.txt","ignoreCase":"false","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.StemmerOverrideFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Dutch","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_nl.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"StemmerOverrideFilterFactory":{"args":{"class":"solr.StemmerOverrideFilterFactory","dictionary":"lang/stemdict_nl.txt","ignoreCase":"false","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.miscellaneous.StemmerOverrideFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Dutch","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_no":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_no.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Norwegian","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_no.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Norwegian","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_pt":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_pt.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"PortugueseLightStemFilterFactory":{"args":{"class":"solr.PortugueseLightStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.pt.PortugueseLightStemFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_pt.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"PortugueseLightStemFilterFactory":{"args":{"class":"solr.PortugueseLightStemFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.pt.PortugueseLightStemFilterFactory"}}},"similarity":{}},"text_ro":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ro.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Romanian","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ro.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Romanian","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_ru":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ru.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Russian","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_ru.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Russian","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_sv":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_sv.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Swedish","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_sv.txt","class":"solr.StopFilterFactory","format":"snowball","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Swedish","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_th":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"ThaiWordFilterFactory":{"args":{"class":"solr.ThaiWordFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.th.ThaiWordFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_th.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"LowerCaseFilterFactory":{"args":{"class":"solr.LowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.LowerCaseFilterFactory"},"ThaiWordFilterFactory":{"args":{"class":"solr.ThaiWordFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.th.ThaiWordFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_th.txt","class":"solr.StopFilterFactory","ignoreCase":"true","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"}}},"similarity":{}},"text_tr":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"TurkishLowerCaseFilterFactory":{"args":{"class":"solr.TurkishLowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.tr.TurkishLowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_tr.txt","class":"solr.StopFilterFactory","ignoreCase":"false","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Turkish","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.standard.StandardTokenizerFactory","args":{"class":"solr.StandardTokenizerFactory","luceneMatchVersion":"LUCENE_44"}},"filters":{"TurkishLowerCaseFilterFactory":{"args":{"class":"solr.TurkishLowerCaseFilterFactory","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.tr.TurkishLowerCaseFilterFactory"},"StopFilterFactory":{"args":{"words":"lang/stopwords_tr.txt","class":"solr.StopFilterFactory","ignoreCase":"false","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.core.StopFilterFactory"},"SnowballPorterFilterFactory":{"args":{"class":"solr.SnowballPorterFilterFactory","language":"Turkish","luceneMatchVersion":"LUCENE_44"},"className":"org.apache.lucene.analysis.snowball.SnowballPorterFilterFactory"}}},"similarity":{}},"text_ws":{"fields":null,"tokenized":true,"className":"org.apache.solr.schema.TextField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.WhitespaceTokenizerFactory","args":{"class":"solr.WhitespaceTokenizerFactory","luceneMatchVersion":"LUCENE_44"}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.lucene.analysis.core.WhitespaceTokenizerFactory","args":{"class":"solr.WhitespaceTokenizerFactory","luceneMatchVersion":"LUCENE_44"}}},"similarity":{}},"tfloat":{"fields":["*_tf"],"tokenized":true,"className":"org.apache.solr.schema.TrieFloatField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"similarity":{}},"tint":{"fields":["*_ti"],"tokenized":true,"className":"org.apache.solr.schema.TrieIntField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"similarity":{}},"tlong":{"fields":["*_tl"],"tokenized":true,"className":"org.apache.solr.schema.TrieLongField","indexAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"queryAnalyzer":{"className":"org.apache.solr.analysis.TokenizerChain","tokenizer":{"className":"org.apache.solr.analysis.TrieTokenizerFactory","args":{}}},"similarity":{}}}},"info":{"key":{"I":"Indexed","T":"Tokenized","S":"Stored","D":"DocValues","M":"Multivalued","V":"TermVector Stored","o":"Store Offset With TermVector","p":"Store Position With TermVector","O":"Omit Norms","F":"Omit Term Frequencies & Positions","P":"Omit Positions","H":"Store Offsets with Positions","L":"Lazy","B":"Binary","f":"Sort Missing First","l":"Sort Missing Last"},"NOTE":"Document Frequency (df) is not updated when a document is marked for deletion.  df values include deleted documents."}}"""
 
 SOLR_LUKE_ = """{"responseHeader":{"status":0,"QTime":5},"index":{"numDocs":8,"maxDoc":8,"deletedDocs":0,"version":15,"segmentCount":5,"current":true,"hasDeletions":false,"directory":"org.apache.lucene.store.NRTCachingDirectory:NRTCachingDirectory(org.apache.solr.store.hdfs.HdfsDirectory@5efe087b lockFactory=org.apache.solr.store.hdfs.HdfsLockFactory@5106def2; maxCacheMB=192.0 maxMergeSizeMB=16.0)","userData":{"commitTimeMSec":"1389233070579"},"lastModified":"2014-01-09T02:04:30.579Z"},"fields":{"_version_":{"type":"long","schema":"ITS-----OF------","index":"-TS-------------","docs":8,"distinct":8,"topTerms":["1456716393276768256",1,"1456716398067712000",1,"1456716401465098240",1,"1460689159964327936",1,"1460689159981105152",1,"1460689159988445184",1,"1460689159993688064",1,"1456716273606983680",1],"histogram":["1",8]},"cat":{"type":"string","schema":"I-S-M---OF-----l","index":"ITS-----OF------","docs":4,"distinct":1,"topTerms":["currency",4],"histogram":["1",0,"2",0,"4",1]},"features":{"type":"text_general","schema":"ITS-M-----------","index":"ITS-------------","docs":4,"distinct":3,"topTerms":["coins",4,"notes",4,"and",4],"histogram":["1",0,"2",0,"4",3]},"id":{"type":"string","schema":"I-S-----OF-----l","index":"ITS-----OF------","docs":8,"distinct":8,"topTerms":["GBP",1,"NOK",1,"USD",1,"change.me",1,"change.me1",1,"change.me112",1,"change.me12",1,"EUR",1],"histogram":["1",8]},"inStock":{"type":"boolean","schema":"I-S-----OF-----l","index":"ITS-----OF------","docs":4,"distinct":1,"topTerms":["true",4],"histogram":["1",0,"2",0,"4",1]},"manu":{"type":"text_general","schema":"ITS-----O-------","index":"ITS-----O-------","docs":4,"distinct":7,"topTerms":["of",2,"bank",2,"european",1,"norway",1,"u.k",1,"union",1,"america",1],"histogram":["1",5,"2",2]},"manu_exact":{"type":"string","schema":"I-------OF-----l","index":"(unstored field)","docs":4,"distinct":4,"topTerms":["Bank of Norway",1,"European Union",1,"U.K.",1,"Bank of America",1],"histogram":["1",4]},"manu_id_s":{"type":"string","schema":"I-S-----OF-----l","dynamicBase":"*_s","index":"ITS-----OF------","docs":4,"distinct":4,"topTerms":["eu",1,"nor",1,"uk",1,"boa",1],"histogram":["1",4]},"name":{"type":"text_general","schema":"ITS-------------","index":"ITS-------------","docs":4,"distinct":6,"topTerms":["one",4,"euro",1,"krone",1,"dollar",1,"pound",1,"british",1],"histogram":["1",5,"2",0,"4",1]},"price_c":{"type":"currency","schema":"I-S------F------","dynamicBase":"*_c"},"price_c____amount_raw":{"type":"amount_raw_type_tlong","schema":"IT------O-------","dynamicBase":"*____amount_raw","index":"(unstored field)","docs":4,"distinct":8,"topTerms":["0",4,"0",4,"0",4,"0",4,"0",4,"0",4,"0",4,"100",4],"histogram":["1",0,"2",0,"4",8]},"price_c____currency":{"type":"currency_type_string","schema":"I-------O-------","dynamicBase":"*____currency","index":"(unstored field)","docs":4,"distinct":4,"topTerms":["GBP",1,"NOK",1,"USD",1,"EUR",1],"histogram":["1",4]},"romain_t":{"type":"text_general","schema":"ITS-------------","dynamicBase":"*_t","index":"ITS-------------","docs":1,"distinct":1,"topTerms":["true",1],"histogram":["1",1]},"text":{"type":"text_general","schema":"IT--M-----------","index":"(unstored field)","docs":8,"distinct":21,"topTerms":["and",4,"currency",4,"notes",4,"one",4,"coins",4,"bank",2,"of",2,"change.me112",1,"change.me1",1,"change.me",1],"histogram":["1",14,"2",2,"4",5]},"title":{"type":"text_general","schema":"ITS-M-----------","index":"ITS-------------","docs":4,"distinct":4,"topTerms":["change.me1",1,"change.me112",1,"change.me12",1,"change.me",1],"histogram":["1",4]}},"info":{"key":{"I":"Indexed","T":"Tokenized","S":"Stored","D":"DocValues","M":"Multivalued","V":"TermVector Stored","o":"Store Offset With TermVector","p":"Store Position With TermVector","O":"Omit Norms","F":"Omit Term Frequencies & Positions","P":"Omit Positions","H":"Store Offsets with Positions","L":"Lazy","B":"Binary","f":"Sort Missing First","l":"Sort Missing Last"},"NOTE":"Document Frequency (df) is not updated when a document is marked for deletion.  df values include deleted documents."}}"""
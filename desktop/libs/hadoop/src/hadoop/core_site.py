@@ -24,6 +24,7 @@ import sys
 from hadoop import conf
 from hadoop import confparse
 
+from desktop.lib.conf import invalidate_cache
 from desktop.lib.paths import get_config_root_hadoop
 
 if sys.version_info[0] > 2:
@@ -67,6 +68,7 @@ def reset():
   """Reset the cached conf"""
   global _CORE_SITE_DICT
   _CORE_SITE_DICT = None
+  invalidate_cache()  # The dynamic defaults of the configs read it
 
 
 def get_conf():
@@ -276,6 +276,39 @@ class WebHdfs(Hdfs):
     filestatus_list = json['FileStatuses']['FileStatus']
     return [WebHdfsStat(st, path) for st in filestatus_list]
 
+  def listdir_stats_iter(self, path):
+    """
+    listdir_stats_iter(path) -> iterator of [ WebHdfsStat ]
+
+    Get directory listing with stats, one batch of dfs.ls.limit entries at a time via LISTSTATUS_BATCH.
+    The first batch is fetched right away so that errors are raised here. Falls back to a single LISTSTATUS
+    batch when the server does not support it.
+    """
+    path = self.strip_normpath(path)
+    params = self._getparams()  # Captured now as the batches might be fetched later by another request
+    params['op'] = 'LISTSTATUS_BATCH'
+    headers = self._getheaders()
+
+    try:
+      json = self._root.get(path, params, headers)
+    except WebHdfsException as e:
+      if e.server_exc not in ('IllegalArgumentException', 'UnsupportedOperationException'):
+        raise
+      LOG.debug('LISTSTATUS_BATCH is not supported, listing %s at once: %s' % (path, e))
+      return iter([self.listdir_stats(path)])
+
+    return self._listdir_stats_batches(path, params, headers, json)
+
+  def _listdir_stats_batches(self, path, params, headers, json):
+    while True:
+      filestatus_list = json['DirectoryListing']['partialListing']['FileStatuses']['FileStatus']
+      yield [WebHdfsStat(st, path) for st in filestatus_list]
+
+      if not filestatus_list or not json['DirectoryListing'].get('remainingEntries'):
+        break
+      params['startAfter'] = filestatus_list[-1]['pathSuffix']
+      json = self._root.get(path, params, headers)
+
   def listdir(self, path, glob=None):
     """
     listdir(path, glob=None) -> [ entry names ]
@@ -296,6 +329,19 @@ class WebHdfs(Hdfs):
     json = self._root.get(path, params, headers)
     return WebHdfsContentSummary(json['ContentSummary'])
 
+  def get_file_checksum(self, path):
+    """
+    get_file_checksum(path) -> {'algorithm': ..., 'bytes': ..., 'length': ...}
+
+    The checksum is computed by the DataNodes and only compares files written with the same block and chunk sizes.
+    """
+    path = self.strip_normpath(path)
+    params = self._getparams()
+    params['op'] = 'GETFILECHECKSUM'
+    headers = self._getheaders()
+    json = self._root.get(path, params, headers)
+    return json['FileChecksum']
+
 
   def _stats(self, path):
     """This version of stats returns None if the entry is not found"""
@@ -20,7 +20,9 @@ standard_library.install_aliases()
 
 from builtins import zip
 from past.builtins import basestring
+import codecs
 import csv
+import itertools
 import json
 import logging
 import urllib.error
@@ -52,6 +54,7 @@ from notebook.connectors.base import get_api, Notebook
 from notebook.decorators import api_error_handler
 from notebook.models import MockedDjangoRequest, escape_rows
 
+from indexer.conf import DIRECT_UPLOAD_MAX_ROWS
 from indexer.controller import CollectionManagerController
 from indexer.file_format import HiveFormat
 from indexer.fields import Field, guess_field_type_from_samples
@@ -63,7 +66,7 @@ from indexer.indexers.phoenix_sql import PhoenixIndexer
 from indexer.indexers.rdbms import run_sqoop, _get_api
 from indexer.indexers.sql import _create_database, _create_table, _create_table_from_local
 from indexer.models import _save_pipeline
-from indexer.solr_client import SolrClient, MAX_UPLOAD_SIZE
+from indexer.solr_client import SolrClient, rows_to_csv
 from indexer.indexers.flume import FlumeIndexer
 
 
@@ -93,6 +96,9 @@ try:
 except ImportError as e:
   LOG.warning('Solr Search interface is not enabled')
 
+FILE_CHUNK_SIZE = 1024 * 1024
+FILE_BATCH_ROWS = 1000
+
 
 def _escape_white_space_characters(s, inverse=False):
   MAPPINGS = {
@@ -611,12 +617,7 @@ def index(request):
 def _small_indexing(user, fs, client, source, destination, index_name):
   kwargs = {}
   errors = []
-
-  if source['inputFormat'] not in ('manual', 'table', 'query_handle'):
-    path = source["path"]
-    stats = fs.stats(path)
-    if stats.size > MAX_UPLOAD_SIZE:
-      raise PopupException(_('File size is too large to handle!'))
+  rows = 0
 
   indexer = MorphlineIndexer(user, fs)
 
@@ -625,8 +626,6 @@ def _small_indexing(user, fs, client, source, destination, index_name):
 
   if source['inputFormat'] == 'file':
     kwargs['separator'] = source['format']['fieldSeparator']
-    path = source["path"]
-    data = fs.read(path, 0, MAX_UPLOAD_SIZE)
 
   if client.is_solr_six_or_more():
     kwargs['processor'] = 'tolerant'
@@ -651,18 +650,22 @@ def _small_indexing(user, fs, client, source, destination, index_name):
           rows=rows,
           start_over=start_over
       )
-      rows = searcher.update_data_from_hive(
+      rows, errors = searcher.update_data_from_hive(
           index_name,
           columns,
           fetch_handle=fetch_handle,
           indexing_options=kwargs
       )
-      # TODO if rows == MAX_ROWS truncation warning
     elif source['inputFormat'] == 'manual':
       pass # No need to do anything
     else:
-      response = client.index(name=index_name, data=data, **kwargs)
-      errors = [error.get('message', '') for error in response['responseHeader'].get('errors', [])]
+      stats = {'rows': 0}
+      batches = _file_batches(fs, source['path'], source['format'], stats, has_header=destination['hasHeader'])
+      errors = client.index_batches(index_name, batches, **kwargs)
+      rows = stats['rows']
+
+    if rows >= DIRECT_UPLOAD_MAX_ROWS.get():
+      errors.append(_('Only the first %s rows were indexed.') % DIRECT_UPLOAD_MAX_ROWS.get())
   except Exception as e:
     try:
       client.delete_index(index_name, keep_config=False)
@@ -679,6 +682,48 @@ def _small_indexing(user, fs, client, source, destination, index_name):
   }
 
 
+def _file_batches(fs, path, file_format, stats, has_header=True):
+  """
+  Reads a CSV file of any filesystem chunk by chunk and yields it as (CSV batch, number of rows) of FILE_BATCH_ROWS rows,
+  each starting with the header of the file if it has one, up to DIRECT_UPLOAD_MAX_ROWS. The records are parsed so that a
+  quoted value is never split.
+  """
+  decoder = codecs.getincrementaldecoder('utf-8')('replace')
+  separator = file_format['fieldSeparator']
+
+  def lines():
+    pending = ''
+    offset = 0
+    while True:
+      chunk = fs.read(path, offset, FILE_CHUNK_SIZE)
+      if not chunk:
+        break
+      offset += len(chunk)
+      pending += decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+      pending_lines = pending.split('\n')
+      pending = pending_lines.pop()
+      for line in pending_lines:
+        yield line + '\n'
+    pending += decoder.decode(b'', final=True)
+    if pending:
+      yield pending
+
+  reader = csv.reader(lines(), delimiter=separator, quotechar=file_format.get('quoteChar') or '"')
+  header = next(reader, None) if has_header else None
+  batch = []
+
+  for row in itertools.islice(reader, DIRECT_UPLOAD_MAX_ROWS.get()):
+    batch.append(row)
+    if len(batch) == FILE_BATCH_ROWS:
+      stats['rows'] += len(batch)
+      yield rows_to_csv(header, batch, separator), len(batch)
+      batch = []
+
+  if batch:
+    stats['rows'] += len(batch)
+    yield rows_to_csv(header, batch, separator), len(batch)
+
+
 def _large_indexing(request, file_format, collection_name, query=None, start_time=None, lib_path=None, destination=None):
   indexer = MorphlineIndexer(request.user, request.fs)
 
@@ -21,7 +21,8 @@ from django.utils.datastructures import MultiValueDict
 from django.core.files.uploadhandler import InMemoryUploadedFile
 
 from desktop.settings import BASE_DIR
-from indexer.api3 import upload_local_file, guess_field_types, guess_format
+from indexer.api3 import upload_local_file, guess_field_types, guess_format, _file_batches
+from indexer.conf import DIRECT_UPLOAD_MAX_ROWS
 
 if sys.version_info[0] > 2:
   from urllib.parse import unquote as urllib_unquote
@@ -31,6 +32,41 @@ else:
   from mock import patch, Mock, MagicMock
 
 
+def test_file_batches():
+  content = b'id,message\n1,hello\n2,"multi\nline, quoted"\n3,caf\xc3\xa9\n4,last'
+  fs = Mock(read=Mock(side_effect=lambda path, offset, length: content[offset:offset + length]))
+  stats = {'rows': 0}
+
+  with patch('indexer.api3.FILE_CHUNK_SIZE', 7):
+    with patch('indexer.api3.FILE_BATCH_ROWS', 3):
+      batches = list(_file_batches(fs, '/user/test/logs.csv', {'fieldSeparator': ',', 'quoteChar': '"'}, stats))
+
+  assert [
+    ('id,message\n1,hello\n2,"multi\nline, quoted"\n3,caf\xe9\n', 3),
+    ('id,message\n4,last\n', 1)
+  ] == batches
+  assert 4 == stats['rows']
+
+  # Limited number of rows
+  reset = DIRECT_UPLOAD_MAX_ROWS.set_for_testing(2)
+  try:
+    stats = {'rows': 0}
+    batches = list(_file_batches(fs, '/user/test/logs.csv', {'fieldSeparator': ','}, stats))
+  finally:
+    reset()
+
+  assert [('id,message\n1,hello\n2,"multi\nline, quoted"\n', 2)] == batches
+  assert 2 == stats['rows']
+
+  # Without header, the first row is data
+  stats = {'rows': 0}
+  with patch('indexer.api3.FILE_BATCH_ROWS', 3):
+    batches = list(_file_batches(fs, '/user/test/logs.csv', {'fieldSeparator': ','}, stats, has_header=False))
+
+  assert [('id,message\n1,hello\n2,"multi\nline, quoted"\n', 3), ('3,caf\xe9\n4,last\n', 2)] == batches
+  assert 5 == stats['rows']
+
+
 def test_xlsx_local_file_upload():
 
   csv_file = '''test 1,test.2,test_3,test_4
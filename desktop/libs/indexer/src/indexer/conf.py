@@ -151,6 +151,35 @@ ENABLE_DIRECT_UPLOAD = Config(
   default=False
 )
 
+DIRECT_UPLOAD_MAX_ROWS = Config(
+  key="direct_upload_max_rows",
+  help=_t("Maximum number of rows of a file or a query result indexed directly into Solr."),
+  type=int,
+  default=100000
+)
+
+DIRECT_UPLOAD_CONCURRENCY = Config(
+  key="direct_upload_concurrency",
+  help=_t("Number of batches of rows sent to Solr at the same time by a direct upload."),
+  type=int,
+  default=4
+)
+
+LOCAL_FILE_BULK_LOAD_SIZE = Config(
+  key="local_file_bulk_load_size",
+  help=_t("Local files bigger than this size in bytes are staged on the cluster filesystem and loaded into the new table through "
+          "an external table instead of INSERT statements. -1 to disable."),
+  type=int,
+  default=10 * 1024 * 1024
+)
+
+LOCAL_FILE_INSERT_BATCH_ROWS = Config(
+  key="local_file_insert_batch_rows",
+  help=_t("Maximum number of rows of a local file inserted by one INSERT statement."),
+  type=int,
+  default=1000
+)
+
 # Unused
 BATCH_INDEXER_PATH = Config(
   key="batch_indexer_path",
@@ -24,17 +24,15 @@ import os
 import shutil
 import sys
 
-import tablib
-
 from desktop.lib.exceptions_renderable import PopupException
 from dashboard.models import Collection2
 from libsolr.api import SolrApi
 from libzookeeper.models import ZookeeperClient
 from search.conf import SOLR_URL, SECURITY_ENABLED
 
-from indexer.conf import CORE_INSTANCE_DIR
+from indexer.conf import CORE_INSTANCE_DIR, DIRECT_UPLOAD_MAX_ROWS
 from indexer.utils import copy_configs, field_values_from_log, field_values_from_separated_file
-from indexer.solr_client import SolrClient
+from indexer.solr_client import SolrClient, rows_to_csv
 
 if sys.version_info[0] > 2:
   from django.utils.translation import gettext as _
@@ -275,32 +273,35 @@ class CollectionManagerController(object):
       raise PopupException(_('Could not update index. Indexing strategy %s not supported.') % indexing_strategy)
 
   def update_data_from_hive(self, collection_or_core_name, columns, fetch_handle, indexing_options=None):
-    MAX_ROWS = 10000
+    """
+    Indexes the rows of a query handle, up to DIRECT_UPLOAD_MAX_ROWS. The rows are fetched by batches of FETCH_BATCH while
+    the previous batches are being indexed.
+
+    Returns the number of rows read and the list of the errors of the batches.
+    """
     FETCH_BATCH = 1000
 
-    row_count = 0
-    has_more = True
+    max_rows = DIRECT_UPLOAD_MAX_ROWS.get()
+    stats = {'rows': 0}
     if indexing_options is None:
       indexing_options = {}
 
-    client = SolrClient(self.user)
-
-    try:
-      while row_count < MAX_ROWS and has_more:
-        result = fetch_handle(FETCH_BATCH, row_count == 0)
+    def batches():
+      has_more = True
+      while stats['rows'] < max_rows and has_more:
+        result = fetch_handle(min(FETCH_BATCH, max_rows - stats['rows']), stats['rows'] == 0)
         has_more = result['has_more']
+        rows = [[cell if cell else (0 if isinstance(cell, numbers.Number) else '') for cell in row] for row in result['data']]
+        if not rows:
+          break
+        stats['rows'] += len(rows)
+        yield rows_to_csv(columns, rows), len(rows)
 
-        if result['data']:
-          dataset = tablib.Dataset()
-          dataset.append(columns)
-          for i, row in enumerate(result['data']):
-            dataset.append([cell if cell else (0 if isinstance(cell, numbers.Number) else '') for cell in row])
-
-          if not client.index(name=collection_or_core_name, data=dataset.csv, **indexing_options):
-            raise PopupException(_('Could not index the data. Check error logs for more info.'))
+    client = SolrClient(self.user)
 
-        row_count += len(dataset)
+    try:
+      errors = client.index_batches(collection_or_core_name, batches(), **indexing_options)
     except Exception as e:
       raise PopupException(_('Could not update index: %s') % e)
 
-    return row_count
+    return stats['rows'], errors
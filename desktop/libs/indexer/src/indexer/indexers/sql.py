@@ -18,7 +18,9 @@ from future import standard_library
 standard_library.install_aliases()
 from builtins import object
 import csv
+import itertools
 import logging
+import os
 import sys
 import urllib.request, urllib.error
 import uuid
@@ -35,7 +37,9 @@ from useradmin.models import User
 
 from desktop.lib import django_mako
 from desktop.lib.exceptions_renderable import PopupException
+from desktop.lib.fs.transfer import open_writer
 from desktop.settings import BASE_DIR
+from indexer.conf import LOCAL_FILE_BULK_LOAD_SIZE, LOCAL_FILE_INSERT_BATCH_ROWS
 
 if sys.version_info[0] > 2:
   from urllib.parse import urlparse, unquote as urllib_unquote
@@ -48,6 +52,8 @@ else:
 
 LOG = logging.getLogger()
 
+STAGING_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 try:
   from beeswax.server import dbms
@@ -339,6 +345,17 @@ class SQLIndexer(object):
 
     dialect = get_interpreter(source_type, self.user)['dialect']
 
+    path = urllib_unquote(source['path'])
+    staging_dir = None
+
+    if path:
+      # for the boolean col updating csv_val to (1,0)
+      rows = self._read_local_file(path, source['format']['hasHeader'], cols_to_remove, columns if dialect == 'impala' else None)
+
+      bulk_load_size = LOCAL_FILE_BULK_LOAD_SIZE.get()
+      if dialect in ('hive', 'impala') and 0 <= bulk_load_size < os.path.getsize(path):
+        staging_dir, rows = self._stage_local_rows(rows, dialect)
+
     if dialect in ('hive', 'mysql'):
 
       if dialect == 'mysql':
@@ -353,59 +370,55 @@ class SQLIndexer(object):
         'columns': ',\n'.join(['  `%(name)s` %(type)s' % col for col in columns]),
       }
 
+      if staging_dir:
+        sql += '\n' + self._create_staging_table(database, table_name + '_tmp', columns, staging_dir)
+        sql += '''\nINSERT INTO %(database)s.%(table_name)s SELECT * FROM %(database)s.%(table_name)s_tmp;
+
+DROP TABLE IF EXISTS %(database)s.%(table_name)s_tmp;\n''' % {
+          'database': database,
+          'table_name': table_name
+        }
+      insert_table_name = table_name
+
     elif dialect == 'impala':
-      sql = '''CREATE TABLE IF NOT EXISTS %(database)s.%(table_name)s_tmp (
+      if staging_dir:
+        sql = self._create_staging_table(database, table_name + '_tmp', [dict(col, type='string') for col in columns], staging_dir)
+      else:
+        sql = '''CREATE TABLE IF NOT EXISTS %(database)s.%(table_name)s_tmp (
 %(columns)s);\n''' % {
+            'database': database,
+            'table_name': table_name,
+            'columns': ',\n'.join(['  `%(name)s` string' % col for col in columns]),
+        }                                               # Impala does not implicitly cast between string and numeric or Boolean types.
+      insert_table_name = table_name + '_tmp'
+
+    if path:                                                  # data insertion
+      # Bounded multi-row statements, the rows of a big file would not fit in a single one
+      batch_size = LOCAL_FILE_INSERT_BATCH_ROWS.get()
+      rows = iter(rows)
+      batch = list(itertools.islice(rows, batch_size))
+
+      while batch:
+        sql += '''\nINSERT INTO %(database)s.%(table_name)s VALUES %(csv_rows)s;\n''' % {
           'database': database,
-          'table_name': table_name,
-          'columns': ',\n'.join(['  `%(name)s` string' % col for col in columns]),
-      }                                                 # Impala does not implicitly cast between string and numeric or Boolean types.
+          'table_name': insert_table_name,
+          'csv_rows': str(batch)[1:-1]
+        }
+        batch = list(itertools.islice(rows, batch_size))
 
-    path = urllib_unquote(source['path'])
+      if dialect == 'impala':
+        # casting from string to boolean is not allowed in impala so string -> int -> bool
+        sql_ = ',\n'.join([
+          '  CAST ( `%(name)s` AS %(type)s ) `%(name)s`' % col if col['type'] != 'boolean' \
+          else '  CAST ( CAST ( `%(name)s` AS TINYINT ) AS boolean ) `%(name)s`' % col for col in columns
+        ])
 
-    if path:                                                  # data insertion
-      with open(path, 'r') as local_file:
-        reader = csv.reader(local_file)
-        _csv_rows = []
-
-        for count, row in enumerate(reader):
-          if (source['format']['hasHeader'] and count == 0) or not row:
-            continue
-          for col_index in cols_to_remove:
-            del row[col_index]
-          if dialect == 'impala':                         # for the boolean col updating csv_val to (1,0)
-            row = self.nomalize_booleans(row, columns)
-          _csv_rows.append(tuple(row))
-
-        if _csv_rows:  #sql for data insertion
-          csv_rows = str(_csv_rows)[1:-1]
-
-          if dialect in ('hive', 'mysql'):
-            sql += '''\nINSERT INTO %(database)s.%(table_name)s VALUES %(csv_rows)s;\n'''% {
-              'database': database,
-              'table_name': table_name,
-              'csv_rows': csv_rows
-            }
-          elif dialect == 'impala':
-            sql += '''\nINSERT INTO %(database)s.%(table_name)s_tmp VALUES %(csv_rows)s;\n'''% {
-              'database': database,
-              'table_name': table_name,
-              'csv_rows': csv_rows,
-            }
-
-        if dialect == 'impala':
-          # casting from string to boolean is not allowed in impala so string -> int -> bool
-          sql_ = ',\n'.join([
-            '  CAST ( `%(name)s` AS %(type)s ) `%(name)s`' % col if col['type'] != 'boolean' \
-            else '  CAST ( CAST ( `%(name)s` AS TINYINT ) AS boolean ) `%(name)s`' % col for col in columns
-          ])
-
-          sql += '''\nCREATE TABLE IF NOT EXISTS %(database)s.%(table_name)s
+        sql += '''\nCREATE TABLE IF NOT EXISTS %(database)s.%(table_name)s
 AS SELECT\n%(sql_)s\nFROM  %(database)s.%(table_name)s_tmp;\n\nDROP TABLE IF EXISTS %(database)s.%(table_name)s_tmp;'''% {
-              'database': database,
-              'table_name': table_name,
-              'sql_': sql_
-            }
+            'database': database,
+            'table_name': table_name,
+            'sql_': sql_
+          }
 
     on_success_url = reverse('metastore:describe_table', kwargs={'database': database, 'table': final_table_name}) + \
         '?source_type=' + source_type
@@ -421,6 +434,75 @@ AS SELECT\n%(sql_)s\nFROM  %(database)s.%(table_name)s_tmp;\n\nDROP TABLE IF EXI
         is_task=True
     )
 
+  def _read_local_file(self, path, has_header, cols_to_remove, boolean_columns=None):
+    '''Yields the rows of the local CSV file without the removed columns, with the booleans normalized if boolean_columns.'''
+    with open(path, 'r') as local_file:
+      for count, row in enumerate(csv.reader(local_file)):
+        if (has_header and count == 0) or not row:
+          continue
+        for col_index in cols_to_remove:
+          del row[col_index]
+        if boolean_columns:
+          row = self.nomalize_booleans(row, boolean_columns)
+        yield tuple(row)
+
+  def _stage_local_rows(self, rows, dialect):
+    '''
+    Streams the rows into a text file of a new scratch directory of the cluster filesystem, in the format read by
+    _create_staging_table(). A text file can not contain line breaks in a value: the rows with some are returned so that
+    they get inserted instead.
+    '''
+    staging_dir = self.fs.get_home_dir() + '/.scratchdir/%s' % str(uuid.uuid4()) # Make sure it's unique.
+    self.fs.mkdir(staging_dir)
+    writer = open_writer(self.fs, staging_dir + '/data.txt')
+
+    remaining_rows = []
+    chunk = []
+    chunk_size = 0
+
+    try:
+      for row in rows:
+        if any('\n' in value or '\r' in value for value in row):
+          remaining_rows.append(row)
+          continue
+        line = ('\x01'.join([value.replace('\\', '\\\\').replace('\x01', '\\\x01') for value in row]) + '\n').encode('utf-8')
+        chunk.append(line)
+        chunk_size += len(line)
+        if chunk_size >= STAGING_CHUNK_SIZE:
+          writer.write(b''.join(chunk))
+          chunk = []
+          chunk_size = 0
+      if chunk:
+        writer.write(b''.join(chunk))
+      writer.close()
+    except Exception:
+      LOG.exception('Failed to stage the local file into %s' % staging_dir)
+      writer.abort()
+      self.fs.rmtree(staging_dir)
+      raise
+
+    if dialect == 'impala' and impala_conf and impala_conf.USER_SCRATCH_DIR_PERMISSION.get():
+      self.fs.chmod(staging_dir, 0o0777, True)
+
+    return staging_dir, remaining_rows
+
+  def _create_staging_table(self, database, table_name, columns, staging_dir):
+    '''External text table reading the files written by _stage_local_rows(), its data is deleted with the table.'''
+    if staging_dir.lower().startswith('abfs'):
+      staging_dir = abfspath(staging_dir)
+
+    return '''CREATE EXTERNAL TABLE IF NOT EXISTS %(database)s.%(table_name)s (
+%(columns)s)
+ROW FORMAT DELIMITED FIELDS TERMINATED BY '\\001' ESCAPED BY '\\\\'
+STORED AS TEXTFILE
+LOCATION '%(location)s'
+TBLPROPERTIES ('external.table.purge'='true');\n''' % {
+      'database': database,
+      'table_name': table_name,
+      'columns': ',\n'.join(['  `%(name)s` %(type)s' % col for col in columns]),
+      'location': staging_dir
+    }
+
 def _create_database(request, source, destination, start_time):
   database = destination['name']
   comment = destination['description']
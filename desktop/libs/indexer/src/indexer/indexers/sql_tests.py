@@ -27,6 +27,7 @@ from useradmin.models import User
 
 from azure.conf import ABFS_CLUSTERS
 from beeswax.server import dbms
+from indexer.conf import LOCAL_FILE_BULK_LOAD_SIZE, LOCAL_FILE_INSERT_BATCH_ROWS
 from indexer.indexers.sql import SQLIndexer
 
 
@@ -1090,6 +1091,99 @@ INSERT INTO default.test1 VALUES ('NY', 'New York', '8143197'), ('CA', 'Los Ange
     assert statement == sql
 
 
+def test_create_table_from_local_in_batches():
+  with patch('indexer.indexers.sql.get_interpreter') as get_interpreter:
+    get_interpreter.return_value = {'Name': 'MySQL', 'dialect': 'mysql'}
+    source = {
+      'path': BASE_DIR + '/apps/beeswax/data/tables/us_population.csv',
+      'sourceType': 'mysql',
+      'format': {'hasHeader': False}
+    }
+    destination = {
+      'name': 'default.test1',
+      'columns': [
+        {'name': 'field_1', 'type': 'string', 'keep': True},
+        {'name': 'field_2', 'type': 'string', 'keep': False},
+        {'name': 'field_3', 'type': 'bigint', 'keep': True},
+      ],
+      'sourceType': 'mysql'
+    }
+    reset = LOCAL_FILE_INSERT_BATCH_ROWS.set_for_testing(4)
+    try:
+      sql = SQLIndexer(user=Mock(), fs=Mock()).create_table_from_local_file(source, destination).get_str()
+    finally:
+      reset()
+
+    statement = """USE default;
+
+CREATE TABLE IF NOT EXISTS default.test1 (
+  `field_1` VARCHAR(255),
+  `field_3` bigint);
+
+INSERT INTO default.test1 VALUES ('NY', '8143197'), ('CA', '3844829'), ('IL', '2842518'), ('TX', '2016582');
+
+INSERT INTO default.test1 VALUES ('PA', '1463281'), ('AZ', '1461575'), ('TX', '1256509'), ('CA', '1255540');
+
+INSERT INTO default.test1 VALUES ('TX', '1213825'), ('CA', '912332');"""
+
+    assert statement == sql
+
+
+def test_create_table_from_local_bulk_load():
+  with patch('indexer.indexers.sql.get_interpreter') as get_interpreter:
+    with patch('uuid.uuid4', mock_uuid):
+      get_interpreter.return_value = {'Name': 'Hive', 'dialect': 'hive'}
+      source = {
+        'path': BASE_DIR + '/apps/beeswax/data/tables/us_population.csv',
+        'sourceType': 'hive',
+        'format': {'hasHeader': True}
+      }
+      destination = {
+        'name': 'default.test1',
+        'columns': [
+          {'name': 'field_1', 'type': 'string', 'keep': True},
+          {'name': 'field_2', 'type': 'string', 'keep': True},
+          {'name': 'field_3', 'type': 'bigint', 'keep': True},
+        ],
+        'sourceType': 'hive'
+      }
+      fs = Mock(get_home_dir=Mock(return_value='/user/test'))
+      reset = LOCAL_FILE_BULK_LOAD_SIZE.set_for_testing(0)
+      try:
+        sql = SQLIndexer(user=Mock(), fs=fs).create_table_from_local_file(source, destination).get_str()
+      finally:
+        reset()
+
+      staging_dir = '/user/test/.scratchdir/52f840a8-3dde-434d-934a-2d6e06f3687e'
+      fs.mkdir.assert_called_with(staging_dir)
+      fs.create.assert_called_once()
+      assert staging_dir + '/data.txt' == fs.create.call_args[0][0]
+      data = fs.create.call_args[1]['data']
+      assert data.startswith(b'CA\x01Los Angeles\x013844829\nIL\x01Chicago\x012842518\n')
+      assert 9 == data.count(b'\n')
+
+      statement = """USE default;
+
+CREATE TABLE IF NOT EXISTS default.test1 (
+  `field_1` string,
+  `field_2` string,
+  `field_3` bigint);
+
+CREATE EXTERNAL TABLE IF NOT EXISTS default.test1_tmp (
+  `field_1` string,
+  `field_2` string,
+  `field_3` bigint)
+ROW FORMAT DELIMITED FIELDS TERMINATED BY '\\001' ESCAPED BY '\\\\'
+STORED AS TEXTFILE
+LOCATION '/user/test/.scratchdir/52f840a8-3dde-434d-934a-2d6e06f3687e'
+TBLPROPERTIES ('external.table.purge'='true');
+
+INSERT INTO default.test1 SELECT * FROM default.test1_tmp;
+
+DROP TABLE IF EXISTS default.test1_tmp;"""
+
+      assert statement == sql
+
 @pytest.mark.django_db
 def test_create_table_from_local_impala():
   with patch('indexer.indexers.sql.get_interpreter') as get_interpreter:
@@ -17,18 +17,23 @@
 # limitations under the License.
 
 from builtins import object
+import csv
 import logging
 import json
 import os
 import shutil
 import sys
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 
 from desktop.lib.exceptions_renderable import PopupException
 from desktop.lib.i18n import smart_str
 from libsolr.api import SolrApi
 from libzookeeper.models import ZookeeperClient
 
-from indexer.conf import CORE_INSTANCE_DIR, get_solr_ensemble
+from indexer.conf import CORE_INSTANCE_DIR, DIRECT_UPLOAD_CONCURRENCY, get_solr_ensemble
 from indexer.utils import copy_configs
 
 if sys.version_info[0] > 2:
@@ -56,6 +61,15 @@ class SolrClientException(Exception):
   pass
 
 
+def rows_to_csv(header, rows, separator=','):
+  output = StringIO()
+  writer = csv.writer(output, delimiter=separator, lineterminator='\n')
+  if header is not None:
+    writer.writerow(header)
+  writer.writerows(rows)
+  return output.getvalue()
+
+
 class SolrClient(object):
 
   def __init__(self, user, api=None):
@@ -163,6 +177,46 @@ class SolrClient(object):
     return self.api.update(name, data, content_type=content_type, version=version, **kwargs)
 
 
+  def index_batches(self, name, batches, **kwargs):
+    """
+    Indexes an iterator of (CSV batch, number of rows), DIRECT_UPLOAD_CONCURRENCY at a time, and commits once at the end.
+    The next batch is only read when a slot is free, so that the memory is bounded whatever the size of the source. A
+    failing batch does not stop the others.
+
+    Solr numbers the rowid of each request from the start, the batches are offset by the rows of the previous ones.
+
+    Returns the list of the error messages of the batches.
+    """
+    concurrency = max(DIRECT_UPLOAD_CONCURRENCY.get(), 1)
+    slots = threading.BoundedSemaphore(concurrency)
+    errors = []
+
+    def index_batch(number, data, options):
+      try:
+        response = self.index(name=name, data=data, commit=False, **options)
+        return ['Batch %d: %s' % (number, error.get('message', '')) for error in response['responseHeader'].get('errors', [])]
+      except Exception as e:
+        LOG.warning('Batch %d of %s could not be indexed: %s' % (number, name, e))
+        return ['Batch %d: %s' % (number, smart_str(e))]
+      finally:
+        slots.release()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+      futures = []
+      offset = 0
+      for number, (data, rows) in enumerate(batches, 1):
+        options = dict(kwargs, rowidOffset=offset) if 'rowid' in kwargs else kwargs
+        offset += rows
+        slots.acquire()
+        futures.append(executor.submit(index_batch, number, data, options))
+      for future in futures:
+        errors.extend(future.result())
+
+    self.api.commit(name)
+
+    return errors
+
+
   def exists(self, name):
     try:
       self.api.get_schema(name)
@@ -20,7 +20,9 @@ import pytest
 
 from django.test import TestCase
 from django.urls import reverse
+from unittest.mock import Mock
 
+from indexer.conf import DIRECT_UPLOAD_CONCURRENCY
 from indexer.solr_client import SolrClient
 from useradmin.models import User
 
@@ -69,6 +71,43 @@ class TestSolrClient(TestCase):
       SolrClient._reset_properties()
 
 
+def test_index_batches():
+  def update(name, data, **kwargs):
+    if data == 'b2':
+      return {'responseHeader': {'errors': [{'message': 'Bad date'}]}}
+    elif data == 'b3':
+      raise Exception('Connection reset')
+    return {'responseHeader': {}}
+
+  api = Mock()
+  api.update.side_effect = update
+  read = []
+
+  def batches():
+    for data in ['b1', 'b2', 'b3', 'b4']:
+      read.append(data)
+      yield data, 10
+
+  reset = DIRECT_UPLOAD_CONCURRENCY.set_for_testing(2)
+  try:
+    errors = SolrClient(user=Mock(), api=api).index_batches('logs', batches(), separator=',')
+  finally:
+    reset()
+
+  assert ['b1', 'b2', 'b3', 'b4'] == read
+  assert ['Batch 2: Bad date', 'Batch 3: Connection reset'] == errors
+  assert 4 == api.update.call_count
+  assert not api.update.call_args[1]['commit']
+  assert ',' == api.update.call_args[1]['separator']
+  assert 'rowidOffset' not in api.update.call_args[1]
+  api.commit.assert_called_once_with('logs')
+
+  # The generated ids of the batches do not overlap
+  api.reset_mock()
+  SolrClient(user=Mock(), api=api).index_batches('logs', batches(), rowid='hue_id')
+  assert [0, 10, 20, 30] == sorted(call[1]['rowidOffset'] for call in api.update.call_args_list)
+
+
 class MockSolrCdhCloudHdfsApi(object):
   def info_system(self):
     return {"responseHeader":{"status":0,"QTime":5},"mode":"solrcloud","lucene":{"solr-spec-version":"4.10.3","solr-impl-version":"4.10.3-cdh5.13.0-SNAPSHOT Unversioned directory - jenkins - 2017-06-23 06:37:12","lucene-spec-version":"4.10.3","lucene-impl-version":"4.10.3-cdh5.13.0-SNAPSHOT Unversioned directory - jenkins - 2017-06-23 06:29:40"},"jvm":{"version":"1.7.0_67 24.65-b04","name":"Oracle Corporation Java HotSpot(TM) 64-Bit Server VM","spec":{"vendor":"Oracle Corporation","name":"Java Platform API Specification","version":"1.7"},"jre":{"vendor":"Oracle Corporation","version":"1.7.0_67"},"vm":{"vendor":"Oracle Corporation","name":"Java HotSpot(TM) 64-Bit Server VM","version":"24.65-b04"},"processors":4,"memory":{"free":"454.3 MB","total":"574.2 MB","max":"574.2 MB","used":"119.9 MB (%20.9)","raw":{"free":476406496,"total":602144768,"max":602144768,"used":125738272,"used%":20.88173453995701}},"jmx":{"bootclasspath":"/usr/java/jdk1.7.0_67-cloudera/jre/lib/resources.jar:/usr/java/jdk1.7.0_67-cloudera/jre/lib/rt.jar:/usr/java/jdk1.7.0_67-cloudera/jre/lib/sunrsasign.jar:/usr/java/jdk1.7.0_67-cloudera/jre/lib/jsse.jar:/usr/java/jdk1.7.0_67-cloudera/jre/lib/jce.jar:/usr/java/jdk1.7.0_67-cloudera/jre/lib/charsets.jar:/usr/java/jdk1.7.0_67-cloudera/jre/lib/jfr.jar:/usr/java/jdk1.7.0_67-cloudera/jre/classes","classpath":"/opt/cloudera/parcels/CDH-5.13.0-1.cdh5.13.0.p0.24/lib/bigtop-tomcat/bin/bootstrap.jar","commandLineArgs":["-Djava.util.logging.config.file=/var/lib/solr/tomcat-deployment/conf/logging.properties","-Djava.util.logging.manager=org.apache.juli.ClassLoaderLogManager","-Djdk.tls.ephemeralDHKeySize=2048","-Djava.net.preferIPv4Stack=true","-Dsolr.hdfs.blockcache.enabled=true","-Dsolr.hdfs.blockcache.direct.memory.allocation=true","-Dsolr.hdfs.blockcache.blocksperbank=16384","-Dsolr.hdfs.blockcache.slab.count=1","-DzkClientTimeout=15000","-Xms622854144","-Xmx622854144","-XX:MaxDirectMemorySize=810549248","-XX:+UseParNewGC","-XX:+UseConcMarkSweepGC","-XX:CMSInitiatingOccupancyFraction=70","-XX:+CMSParallelRemarkEnabled","-Dsolr.ulog.tlogDfsReplication=2","-XX:+HeapDumpOnOutOfMemoryError","-XX:HeapDumpPath=/tmp/SOLR-1_SOLR-1-SOLR_SERVER-9a1415864f5a8fab60dc81b173a83bfb_pid12692.hprof","-XX:OnOutOfMemoryError=/usr/lib64/cmf/service/common/killparent.sh","-DzkHost=hue.com:2181/solr","-Dsolr.solrxml.location=zookeeper","-Dsolr.hdfs.home=hdfs://hue.com:8020/solr","-Dsolr.hdfs.confdir=/run/cloudera-scm-agent/process/35-solr-SOLR_SERVER/hadoop-conf","-Dsolr.authentication.simple.anonymous.allowed=true","-Dsolr.security.proxyuser.hue.hosts=*","-Dsolr.security.proxyuser.hue.groups=*","-Dhost=hue.com","-Djetty.port=8983","-Dsolr.host=hue.com","-Dsolr.port=8983","-DuseCachedStatsBetweenGetMBeanInfoCalls=true","-DdisableSolrFieldCacheMBeanEntryListJmx=true","-Dlog4j.configuration=file:///run/cloudera-scm-agent/process/35-solr-SOLR_SERVER/log4j.properties","-Dsolr.log=/var/log/solr","-Dsolr.admin.port=8984","-Dsolr.tomcat.backlog=4096","-Dsolr.tomcat.connectionTimeout=180000","-Dsolr.tomcat.keepAliveTimeout=600000","-Dsolr.tomcat.maxKeepAliveRequests=-1","-Dsolr.max.connector.thread=10000","-Dsolr.tomcat.connectionLinger=300","-Dsolr.tomcat.bufferSize=131072","-Dsolr.solr.home=/var/lib/solr","-Djava.endorsed.dirs=/opt/cloudera/parcels/CDH-5.13.0-1.cdh5.13.0.p0.24/lib/bigtop-tomcat/endorsed","-Dcatalina.base=/var/lib/solr/tomcat-deployment","-Dcatalina.home=/opt/cloudera/parcels/CDH-5.13.0-1.cdh5.13.0.p0.24/lib/bigtop-tomcat","-Djava.io.tmpdir=/var/lib/solr/"],"startTime":"2017-06-26T12:38:28.188Z","upTimeMS":19292106}},"system":{"name":"Linux","version":"3.10.0-514.21.1.el7.x86_64","arch":"amd64","systemLoadAverage":0.6,"committedVirtualMemorySize":3105255424,"freePhysicalMemorySize":1010851840,"freeSwapSpaceSize":0,"processCpuTime":41140000000,"totalPhysicalMemorySize":27396968448,"totalSwapSpaceSize":0,"openFileDescriptorCount":56,"maxFileDescriptorCount":32768,"uname":"Linux hue.com 3.10.0-514.21.1.el7.x86_64 #1 SMP Thu May 25 17:04:51 UTC 2017 x86_64 x86_64 x86_64 GNU/Linux\n","uptime":" 11:00:00 up  6:03,  0 users,  load average: 0.60, 1.33, 1.43\n"}}
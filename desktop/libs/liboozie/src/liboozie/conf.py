@@ -72,6 +72,23 @@ USE_LIBPATH_FOR_JARS = Config(
   type=coerce_bool
 )
 
+MAX_CONCURRENT_REQUESTS = Config(
+  key="max_concurrent_requests",
+  help=_t("Maximum number of requests sent in parallel to Oozie when refreshing or acting on several jobs of the dashboard."),
+  default=10,
+  type=int
+)
+
+JOB_CACHE_TTL = Config(
+  key="job_cache_ttl",
+  help=_t(
+    "Number of seconds the jobs fetched for the progress of the dashboard are cached, so that the close refreshes and"
+    " bulk actions reuse them. Set to 0 to disable."
+  ),
+  default=5,
+  type=int
+)
+
 
 def get_oozie_status(user):
   from liboozie.oozie_api import get_oozie
@@ -18,13 +18,17 @@ from builtins import object
 import logging
 import posixpath
 import sys
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from desktop.conf import TIME_ZONE
 from desktop.conf import DEFAULT_USER
 from desktop.lib.rest.http_client import HttpClient
 from desktop.lib.rest.resource import Resource
 
-from liboozie.conf import SECURITY_ENABLED, OOZIE_URL, SSL_CERT_CA_VERIFY
+from liboozie.conf import SECURITY_ENABLED, OOZIE_URL, SSL_CERT_CA_VERIFY, MAX_CONCURRENT_REQUESTS, JOB_CACHE_TTL
 from liboozie.types import WorkflowList, CoordinatorList, Coordinator, Workflow,\
   CoordinatorAction, WorkflowAction, BundleList, Bundle, BundleAction
 from liboozie.utils import config_gen
@@ -37,6 +41,9 @@ API_VERSION = 'v1' # Overridden to v2 for SLA
 
 _XML_CONTENT_TYPE = 'application/xml;charset=UTF-8'
 
+_job_cache = {} # (user, job id) -> (fetch time, job)
+_job_cache_lock = threading.Lock()
+
 
 def get_oozie(user, api_version=API_VERSION):
   oozie_url = OOZIE_URL.get()
@@ -171,6 +178,77 @@ class OozieApi(object):
     resp = self._root.get('job/%s' % (jobid,), params)
     return Bundle(self, resp)
 
+  def get_any_job(self, jobid):
+    """
+    get_any_job(jobid) -> Workflow, Coordinator or Bundle depending on the suffix of the id
+    """
+    if jobid.endswith('W'):
+      return self.get_job(jobid)
+    elif jobid.endswith('C'):
+      return self.get_coordinator(jobid)
+    else:
+      return self.get_bundle(jobid)
+
+  def get_jobs_by_id(self, jobids, get_job=None):
+    """
+    get_jobs_by_id(jobids) -> ({jobid: job}, {jobid: exception})
+
+    Fetches the jobs in parallel with get_job, get_any_job by default. The jobs are cached by id for JOB_CACHE_TTL seconds
+    per user, whatever the get_job used as they all read job/<id>, so that the close refreshes of the dashboard and the
+    bulk actions following them reuse them.
+    """
+    if get_job is None:
+      get_job = self.get_any_job
+    ttl = JOB_CACHE_TTL.get()
+    now = time.time()
+    jobs = {}
+
+    if ttl:
+      with _job_cache_lock:
+        for jobid in jobids:
+          entry = _job_cache.get((self.user, jobid))
+          if entry is not None and now - entry[0] < ttl:
+            jobs[jobid] = entry[1]
+
+    fetched, errors = self._fan_out(get_job, [jobid for jobid in jobids if jobid not in jobs])
+
+    if ttl:
+      with _job_cache_lock:
+        for key in [key for key, entry in _job_cache.items() if now - entry[0] >= ttl]:
+          del _job_cache[key]
+        for jobid, job in fetched.items():
+          _job_cache[(self.user, jobid)] = (now, job)
+
+    jobs.update(fetched)
+    return jobs, errors
+
+  def jobs_control(self, jobids, action, **kwargs):
+    """
+    jobs_control(jobids, action) -> ({jobid: response}, {jobid: exception})
+
+    Sends the action to the jobs in parallel, see job_control().
+    """
+    return self._fan_out(lambda jobid: self.job_control(jobid, action, **kwargs), jobids)
+
+  def _fan_out(self, func, jobids):
+    """Calls func(jobid) with at most MAX_CONCURRENT_REQUESTS calls in parallel and collects the errors per job."""
+    results = {}
+    errors = {}
+    if not jobids:
+      return results, errors
+
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENT_REQUESTS.get(), len(jobids)))) as executor:
+      futures = dict((executor.submit(func, jobid), jobid) for jobid in jobids)
+      for future in as_completed(futures):
+        jobid = futures[future]
+        try:
+          results[jobid] = future.result()
+        except Exception as e:
+          LOG.warning('Oozie request failed for job %s: %s' % (jobid, e))
+          errors[jobid] = e
+
+    return results, errors
+
   def get_job_definition(self, jobid):
     """
     get_job_definition(jobid) -> Definition (xml string)
@@ -250,6 +328,10 @@ class OozieApi(object):
     if sys.version_info[0] > 2:
       resp = resp.decode()
 
+    with _job_cache_lock:
+      for key in [key for key in _job_cache if key[1] == jobid]:
+        del _job_cache[key]
+
     return resp
 
   def submit_workflow(self, application_path, properties=None):
@@ -22,6 +22,8 @@ import os
 import sys
 import time
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from string import Template
 
 from django.utils.functional import wraps
@@ -39,7 +41,7 @@ from oozie.utils import convert_to_server_timezone
 from hadoop import cluster
 from hadoop.fs.hadoopfs import Hdfs
 
-from liboozie.conf import REMOTE_DEPLOYMENT_DIR, USE_LIBPATH_FOR_JARS
+from liboozie.conf import MAX_CONCURRENT_REQUESTS, REMOTE_DEPLOYMENT_DIR, USE_LIBPATH_FOR_JARS
 from liboozie.credentials import Credentials
 from liboozie.oozie_api import get_oozie
 
@@ -70,6 +72,19 @@ def submit_dryrun(run_func):
   return wraps(run_func)(decorate)
 
 
+def timed(step):
+  """Adds the duration of the method to the deployment timings of the submission."""
+  def decorator(func):
+    def decorate(self, *args, **kwargs):
+      start = time.time()
+      try:
+        return func(self, *args, **kwargs)
+      finally:
+        self.timings[step] = self.timings.get(step, 0) + time.time() - start
+    return wraps(func)(decorate)
+  return decorator
+
+
 class Submission(object):
   """
   Represents one unique Oozie submission.
@@ -86,6 +101,7 @@ class Submission(object):
     self.jt = jt  # Deprecated with YARN, we now use logical names only for RM
     self.oozie_id = oozie_id
     self.api = get_oozie(self.user)
+    self.timings = OrderedDict()  # Step of the deployment -> seconds
 
     if properties is not None:
       self.properties = properties
@@ -192,6 +208,7 @@ class Submission(object):
     return self.oozie_id
 
   def deploy(self, deployment_dir=None):
+    start = time.time()
     try:
       if not deployment_dir:
         deployment_dir = self._create_deployment_dir()
@@ -392,6 +409,11 @@ STORED AS TEXTFILE %s""" % (self.properties.get('send_result_path'),
     oozie_xml = self.job.to_xml(self.properties)
     self._do_as(self.user.username, self._copy_files, deployment_dir, oozie_xml, self.properties)
 
+    self.timings['total'] = time.time() - start
+    LOG.info('Deployed %s in %s: %s' % (
+      self.job.name, deployment_dir, ', '.join(['%s %.2fs' % (step, duration) for step, duration in self.timings.items()]))
+    )
+
     return deployment_dir
 
   def _check_sqoop_statement(self, action):
@@ -487,6 +509,7 @@ STORED AS TEXTFILE %s""" % (self.properties.get('send_result_path'),
             LOG.error(msg)
             raise PopupException(message=_(msg), detail=str(ex))
 
+  @timed('create_deployment_dir')
   def _create_deployment_dir(self):
     """
     Return the job deployment directory in HDFS, creating it if necessary.
@@ -540,14 +563,18 @@ STORED AS TEXTFILE %s""" % (self.properties.get('send_result_path'),
 
     return path
 
+  @timed('copy_files')
   def _copy_files(self, deployment_dir, oozie_xml, oozie_properties):
     """
     Copy XML and the jar_path files from Java or MR actions to the deployment directory.
     This should run as the workflow user.
-    """
 
-    self._create_file(deployment_dir, self.job.XML_FILE_NAME, oozie_xml)
-    self._create_file(deployment_dir, 'job.properties', data='\n'.join(['%s=%s' % (key, val) for key, val in oozie_properties.items()]))
+    The files are uploaded in parallel and the jars already deployed with the same content are skipped.
+    """
+    uploads = [
+      (self._create_file, deployment_dir, self.job.XML_FILE_NAME, oozie_xml),
+      (self._create_file, deployment_dir, 'job.properties', '\n'.join(['%s=%s' % (key, val) for key, val in oozie_properties.items()])),
+    ]
 
     # List jar files
     files = []
@@ -574,20 +601,50 @@ STORED AS TEXTFILE %s""" % (self.properties.get('send_result_path'),
         self.properties['oozie.libpath'] = ','.join(files)
     else:
       # Copy the jar files to the workspace lib
-      if files:
-        for jar_file in files:
-          LOG.debug("Updating %s" % jar_file)
-          if jar_file.startswith('s3a://') or jar_file.startswith('abfs://'):
-            jar_lib_path = jar_file
-          else:
-            jar_lib_path = self.fs.join(lib_path, self.fs.basename(jar_file))
-          # Refresh if needed
-          if self.fs.exists(jar_lib_path) and self.fs.exists(jar_file):
-            stat_src = self.fs.stats(jar_file)
-            stat_dest = self.fs.stats(jar_lib_path)
-            if hasattr(stat_src, 'fileId') and hasattr(stat_dest, 'fileId') and stat_src.fileId != stat_dest.fileId:
-              self.fs.remove(jar_lib_path, skip_trash=True)
-          self.fs.copyfile(jar_file, jar_lib_path)
+      for jar_file in files:
+        if jar_file.startswith('s3a://') or jar_file.startswith('abfs://'):
+          jar_lib_path = jar_file
+        else:
+          jar_lib_path = self.fs.join(lib_path, self.fs.basename(jar_file))
+        uploads.append((self._copy_jar, jar_file, jar_lib_path))
+
+    self._run_in_parallel(uploads)
+
+  def _copy_jar(self, jar_file, jar_lib_path):
+    if jar_file == jar_lib_path:
+      return
+
+    # Refresh if needed
+    if self.fs.exists(jar_lib_path) and self.fs.exists(jar_file):
+      checksum = self._get_checksum(jar_file)
+      if checksum is not None and checksum == self._get_checksum(jar_lib_path):
+        LOG.debug("Skipping %s, already deployed with the same content" % jar_file)
+        return
+      stat_src = self.fs.stats(jar_file)
+      stat_dest = self.fs.stats(jar_lib_path)
+      if hasattr(stat_src, 'fileId') and hasattr(stat_dest, 'fileId') and stat_src.fileId != stat_dest.fileId:
+        self.fs.remove(jar_lib_path, skip_trash=True)
+
+    LOG.debug("Updating %s" % jar_file)
+    self.fs.copyfile(jar_file, jar_lib_path)
+
+  def _get_checksum(self, path):
+    try:
+      return self.fs.get_file_checksum(path)
+    except Exception as e:
+      LOG.debug('No checksum for %s: %s' % (path, e))  # E.g. not supported by the filesystem
+      return None
+
+  def _run_in_parallel(self, calls):
+    """Runs the (function, *args) calls with up to MAX_CONCURRENT_REQUESTS in parallel and raises the first error."""
+    username = self.fs.user
+
+    def run(call):
+      self.fs.setuser(username)  # The user of the filesystem is per thread
+      return call[0](*call[1:])
+
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENT_REQUESTS.get(), len(calls)))) as executor:
+      list(executor.map(run, calls))
 
   def _do_as(self, username, fn, *args, **kwargs):
     prev_user = self.fs.user
@@ -20,6 +20,8 @@ from builtins import object
 import logging
 import pytest
 
+from unittest.mock import Mock
+
 import beeswax
 
 from hadoop import cluster, pseudo_hdfs4
@@ -145,14 +147,18 @@ def test_copy_files():
       stats_udf5 = cluster.fs.stats(deployment_dir + '/udf5.jar')
       stats_udf6 = cluster.fs.stats(deployment_dir + '/udf6.jar')
 
+      # Unchanged jars are not copied again
+      cluster.fs.create(jar_1, overwrite=True, data='new content')
       submission._copy_files('%s/workspace' % prefix, "<xml>My XML</xml>", {'prop1': 'val1'})
 
       assert stats_udf1['fileId'] != cluster.fs.stats(deployment_dir + '/udf1.jar')['fileId']
-      assert stats_udf2['fileId'] != cluster.fs.stats(deployment_dir + '/udf2.jar')['fileId']
-      assert stats_udf3['fileId'] != cluster.fs.stats(deployment_dir + '/udf3.jar')['fileId']
+      assert stats_udf2['fileId'] == cluster.fs.stats(deployment_dir + '/udf2.jar')['fileId']
+      assert stats_udf3['fileId'] == cluster.fs.stats(deployment_dir + '/udf3.jar')['fileId']
       assert stats_udf4['fileId'] == cluster.fs.stats(deployment_dir + '/udf4.jar')['fileId']
-      assert stats_udf5['fileId'] != cluster.fs.stats(deployment_dir + '/udf5.jar')['fileId']
+      assert stats_udf5['fileId'] == cluster.fs.stats(deployment_dir + '/udf5.jar')['fileId']
       assert stats_udf6['fileId'] == cluster.fs.stats(deployment_dir + '/udf6.jar')['fileId']
+      assert b'new content' == cluster.fs.read(deployment_dir + '/udf1.jar', 0, 100)
+      assert submission.timings['copy_files'] > 0
 
     # Test _create_file()
     submission._create_file(deployment_dir, 'test.txt', data='Test data')
@@ -194,6 +200,26 @@ class TestSubmission(OozieMockBase):
       } == submission.properties
 
 
+  def test_copy_jar(self):
+    fs = Mock(
+      exists=Mock(return_value=True),
+      get_file_checksum=Mock(return_value={'algorithm': 'MD5-of-0MD5-of-512CRC32C', 'bytes': '0000', 'length': 28})
+    )
+    submission = Submission(self.user, fs=fs)
+
+    submission._copy_jar('/user/test/udf.jar', '/user/test/workspace/lib/udf.jar')
+    assert not fs.copyfile.called
+
+    fs.get_file_checksum.side_effect = lambda path: {'bytes': path}
+    submission._copy_jar('/user/test/udf.jar', '/user/test/workspace/lib/udf.jar')
+    fs.copyfile.assert_called_once_with('/user/test/udf.jar', '/user/test/workspace/lib/udf.jar')
+
+    # Not supported by the filesystem
+    fs.copyfile.reset_mock()
+    fs.get_file_checksum.side_effect = AttributeError()
+    submission._copy_jar('/user/test/udf.jar', '/user/test/workspace/lib/udf.jar')
+    assert fs.copyfile.called
+
   def test_get_logical_properties(self):
     submission = Submission(self.user, fs=MockFs(logical_name='fsname'), jt=MockJt(logical_name='jtname'))
 
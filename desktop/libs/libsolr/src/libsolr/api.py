@@ -53,6 +53,8 @@ else:
 
 LOG = logging.getLogger()
 
+CURSOR_PAGE_SIZE = 1000
+
 
 try:
   from search.conf import EMPTY_QUERY, SECURITY_ENABLED, SOLR_URL, DOWNLOAD_LIMIT
@@ -273,17 +275,11 @@ class SolrApi(object):
     #if query.get('timezone'):
     #  params += (('TZ', query.get('timezone')),)
 
-    if collection['template']['fieldsSelected']:
-      fields = []
-      for field in collection['template']['fieldsSelected']:
-        attribute_field = [attribute for attribute in collection['template']['fieldsAttributes'] if field == attribute['name']]
-        if attribute_field:
-          if attribute_field[0]['sort']['direction']:
-            fields.append('%s %s' % (field, attribute_field[0]['sort']['direction']))
-      if fields:
-        params += (
-          ('sort', ','.join(fields)),
-        )
+    sort = self._get_sort(collection)
+    if sort:
+      params += (
+        ('sort', ','.join(sort)),
+      )
 
     if json_facets:
       response = self._root.post(
@@ -297,6 +293,55 @@ class SolrApi(object):
     return self._get_json(response)
 
 
+  def query_cursor(self, collection, query, max_rows, page_size=CURSOR_PAGE_SIZE, on_progress=None):
+    """
+    Iterates over the pages of documents matching the query of the dashboard, up to max_rows, with a Solr cursorMark.
+    Contrary to start/rows, a deep page costs the same as the first one and only one page is held in memory.
+
+    on_progress(count, total) is called after each page.
+    """
+    sort = self._get_sort(collection)
+    id_field = collection.get('idField') or 'id'
+    if id_field not in [field.split(' ')[0] for field in sort]:
+      sort.append('%s asc' % id_field)  # A cursor requires the unique key as tie breaker
+
+    params = self._get_params() + (
+        ('q', self._get_q(query)),
+        ('wt', 'json'),
+        ('fl', urllib_unquote(utf_quoter(','.join(Collection2.get_field_list(collection))))),
+        ('sort', ','.join(sort)),
+    ) + self._get_fq(collection, query)
+
+    cursor_mark = '*'
+    count = 0
+
+    while count < max_rows:
+      rows = min(page_size, max_rows - count)
+      response = self._get_json(self._root.get('%(name)s/select' % collection, params + (
+          ('rows', rows),
+          ('cursorMark', cursor_mark),
+      )))
+      docs = response['response']['docs']
+      count += len(docs)
+
+      if docs:
+        yield docs
+      if on_progress is not None:
+        on_progress(count, min(response['response']['numFound'], max_rows))
+      if len(docs) < rows or response['nextCursorMark'] == cursor_mark:  # Last page
+        break
+      cursor_mark = response['nextCursorMark']
+
+
+  def _get_sort(self, collection):
+    sort = []
+    for field in collection['template']['fieldsSelected']:
+      attribute_field = [attribute for attribute in collection['template']['fieldsAttributes'] if field == attribute['name']]
+      if attribute_field and attribute_field[0]['sort']['direction']:
+        sort.append('%s %s' % (field, attribute_field[0]['sort']['direction']))
+    return sort
+
+
   def _n_facet_dimension(self, widget, _f, facets, dim, timeFilter, collection, can_range=None):
     facet = facets[0]
     f_name = 'dim_%02d:%s' % (dim, facet['field'])
@@ -834,7 +879,7 @@ class SolrApi(object):
       raise PopupException(e, title=_('Error while accessing Solr'))
 
 
-  def update(self, collection_or_core_name, data, content_type='csv', version=None, **kwargs):
+  def update(self, collection_or_core_name, data, content_type='csv', version=None, commit=True, **kwargs):
     if content_type == 'csv':
       content_type = 'application/csv'
     elif content_type == 'json':
@@ -846,7 +891,7 @@ class SolrApi(object):
     params = self._get_params() + (
         ('wt', 'json'),
         ('overwrite', 'true'),
-        ('commit', 'true'),
+        ('commit', 'true' if commit else 'false'),
     )
     if version is not None:
       params += (
@@ -860,6 +905,15 @@ class SolrApi(object):
     return self._get_json(response)
 
 
+  def commit(self, collection_or_core_name):
+    params = self._get_params() + (
+        ('wt', 'json'),
+    )
+    response = self._root.post('%s/update' % collection_or_core_name, contenttype='application/json', params=params,
+                               data=json.dumps({'commit': {}}))
+    return self._get_json(response)
+
+
   # Deprecated
   def aliases(self):
     try:
@@ -20,6 +20,8 @@ import logging
 import json
 import pytest
 
+from unittest.mock import Mock, patch
+
 from django.urls import reverse
 
 from dashboard.models import Collection2
@@ -85,3 +87,52 @@ class TestLibSolrWithSolr(object):
     query = {'qs': [{'q': ''}], 'fqs': [], 'start': 0}
 
     SolrApi(SOLR_URL.get(), self.user).query(collection['collection'], query)
+
+
+class TestSolrApiCursor(object):
+
+  def test_query_cursor(self):
+    collection = {
+      'name': 'log_analytics_demo',
+      'idField': 'id',
+      'template': {
+        'fieldsSelected': ['code'],
+        'fieldsAttributes': [{'name': 'code', 'sort': {'direction': 'desc'}}],
+        'isGridLayout': False,
+      },
+    }
+    query = {'qs': [{'q': ''}], 'fqs': [], 'start': 0}
+    pages = [
+      {'response': {'numFound': 5, 'docs': [{'id': 1}, {'id': 2}]}, 'nextCursorMark': 'AoE1'},
+      {'response': {'numFound': 5, 'docs': [{'id': 3}, {'id': 4}]}, 'nextCursorMark': 'AoE2'},
+      {'response': {'numFound': 5, 'docs': [{'id': 5}]}, 'nextCursorMark': 'AoE3'},
+    ]
+    progress = []
+
+    with patch('libsolr.api.EMPTY_QUERY', Mock(get=Mock(return_value='*:*')), create=True):
+      api = SolrApi('http://localhost:8983/solr/', 'test', security_enabled=False)
+      api._get_fq = Mock(return_value=())
+      api._root = Mock(get=Mock(side_effect=pages))
+
+      docs = list(api.query_cursor(collection, query, max_rows=10, page_size=2, on_progress=lambda *args: progress.append(args)))
+
+    assert [[{'id': 1}, {'id': 2}], [{'id': 3}, {'id': 4}], [{'id': 5}]] == docs
+    assert [(2, 5), (4, 5), (5, 5)] == progress
+
+    params = [dict(call[0][1]) for call in api._root.get.call_args_list]
+    assert ['*', 'AoE1', 'AoE2'] == [param['cursorMark'] for param in params]
+    assert 'code desc,id asc' == params[0]['sort']
+
+  def test_query_cursor_max_rows(self):
+    collection = {'name': 'log_analytics_demo', 'template': {'fieldsSelected': [], 'isGridLayout': False}}
+    query = {'qs': [{'q': ''}], 'fqs': [], 'start': 0}
+
+    with patch('libsolr.api.EMPTY_QUERY', Mock(get=Mock(return_value='*:*')), create=True):
+      api = SolrApi('http://localhost:8983/solr/', 'test', security_enabled=False)
+      api._get_fq = Mock(return_value=())
+      api._root = Mock(get=Mock(return_value={'response': {'numFound': 100, 'docs': [{'id': 1}, {'id': 2}]}, 'nextCursorMark': 'AoE1'}))
+
+      docs = list(api.query_cursor(collection, query, max_rows=3, page_size=2))
+
+    assert 2 == len(docs)
+    assert [2, 1] == [dict(call[0][1])['rows'] for call in api._root.get.call_args_list]
@@ -19,6 +19,8 @@ import errno
 import logging
 import os.path
 
+from desktop.lib.conf import invalidate_cache
+
 LOG = logging.getLogger()
 
 _FLAGS = None
@@ -30,6 +32,7 @@ _KERBEROS = 'atlas.authentication.method.kerberos'
 def reset():
   global _FLAGS
   _FLAGS = None
+  invalidate_cache()  # The dynamic defaults of the configs read it
 
 
 def get_conf():
@@ -132,7 +132,8 @@ OPTIMIZER = ConfigSection(
       key="auth_key_secret",
       help=_t("The private part of the key associated with the auth_key."),
       private=True,
-      dynamic_default=get_optimizer_password_script
+      dynamic_default=get_optimizer_password_script,
+      memoize=False
     ),
     AUTH_KEY_SECRET_SCRIPT=Config(
       key="auth_key_secret_script",
@@ -184,6 +185,19 @@ OPTIMIZER = ConfigSection(
       default=False,
       type=coerce_bool
     ),
+    UPLOAD_STATS_CONCURRENCY=Config(
+      key="upload_stats_concurrency",
+      help=_t("Number of tables whose DDL and stats are collected in parallel when uploading them, each worker using its own session."),
+      default=5,
+      type=int
+    ),
+    UPLOAD_STATS_FROM_METASTORE=Config(
+      key="upload_stats_from_metastore",
+      help=_t("Read the column stats of the Hive tables with one call per table to the Hive Metastore instead of one "
+              "DESCRIBE FORMATTED per column. The Metastore does not apply the authorization rules of HiveServer2."),
+      default=False,
+      type=coerce_bool
+    ),
     ENABLE_PREDICT=Config(
       key="enable_predict",
       help=_t("Enables the predict API for editor typeahead."),
@@ -314,7 +328,8 @@ CATALOG = ConfigSection(
       key="server_password",
       help=_t("Password of the user used for authentication."),
       private=True,
-      dynamic_default=get_catalog_server_password_script
+      dynamic_default=get_catalog_server_password_script,
+      memoize=False
     ),
     SERVER_PASSWORD_SCRIPT=Config(
       key="server_password_script",
@@ -433,7 +448,8 @@ NAVIGATOR = ConfigSection(
       key="navmetadataserver_cmdb_password",
       help=_t("CM password of the user used for authentication."),
       private=True,
-      dynamic_default=get_navigator_cm_password
+      dynamic_default=get_navigator_cm_password,
+      memoize=False
     ),
     AUTH_CM_PASSWORD_SCRIPT=Config(
       key="navmetadataserver_cmdb_password_script",
@@ -451,7 +467,8 @@ NAVIGATOR = ConfigSection(
       key="navmetadataserver_ldap_password",
       help=_t("LDAP password of the user used for authentication."),
       private=True,
-      dynamic_default=get_navigator_ldap_password
+      dynamic_default=get_navigator_ldap_password,
+      memoize=False
     ),
     AUTH_LDAP_PASSWORD_SCRIPT=Config(
       key="navmetadataserver_ldap_password_script",
@@ -469,7 +486,8 @@ NAVIGATOR = ConfigSection(
       key="navmetadataserver_saml_password",
       help=_t("SAML password of the user used for authentication."),
       private=True,
-      dynamic_default=get_navigator_saml_password
+      dynamic_default=get_navigator_saml_password,
+      memoize=False
     ),
     AUTH_SAML_PASSWORD_SCRIPT=Config(
       key="navmetadataserver_saml_password_script",
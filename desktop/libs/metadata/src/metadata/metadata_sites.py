@@ -19,6 +19,8 @@ import errno
 import logging
 import os
 
+from desktop.lib.conf import invalidate_cache
+
 
 LOG = logging.getLogger()
 
@@ -34,6 +36,7 @@ _CONF_NAVIGATOR_HUE_SERVER_NAME = 'navigator.client.clusterName'
 def reset():
   global _SITE_DICT
   _SITE_DICT = None
+  invalidate_cache()  # The dynamic defaults of the configs read it
 
 
 def get_conf(name='navigator'):
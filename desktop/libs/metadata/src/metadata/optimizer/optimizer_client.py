@@ -17,6 +17,7 @@
 # limitations under the License.
 
 from builtins import object
+import itertools
 import json
 import logging
 import os
@@ -172,9 +173,17 @@ class OptimizerClient(object):
             f_queries.write(row)
             LOG.debug(row[:1000])
         else:
-          # Table, column stats
-          f_queries.write(json.dumps(data))
-          LOG.debug(json.dumps(data[:10]))
+          # Table, column stats, written one by one as they can be streamed
+          count = 0
+          f_queries.write('[')
+          for item in data:
+            if count:
+              f_queries.write(', ')
+            f_queries.write(json.dumps(item))
+            if count < 10:
+              LOG.debug(json.dumps(item))
+            count += 1
+          f_queries.write(']')
 
       finally:
         f_queries.close()
@@ -401,10 +410,15 @@ class OptimizerClient(object):
 def OptimizerQueryDataAdapter(data):
   headers = ['SQL_ID', 'ELAPSED_TIME', 'SQL_FULLTEXT', 'DATABASE']
 
-  if data and len(data[0]) == 4:
-    rows = data
+  data = iter(data)
+  first = next(data, None)
+
+  if first is None:
+    rows = []
+  elif len(first) == 4:
+    rows = itertools.chain([first], data)
   else:
-    rows = ([str(uuid.uuid4()), 0.0, q, 'default'] for q in data)
+    rows = ([str(uuid.uuid4()), 0.0, q, 'default'] for q in itertools.chain([first], data))
 
   yield headers, rows
 
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+Collection of the DDL, table stats and column stats of tables in order to upload them to the Optimizer.
+'''
+
+from builtins import object
+import datetime
+import decimal
+import json
+import logging
+import sys
+import threading
+
+from tempfile import TemporaryFile
+
+from django.db import connection
+
+from metadata.optimizer.optimizer_client import _get_table_name
+
+if sys.version_info[0] > 2:
+  import queue
+else:
+  import Queue as queue
+
+
+LOG = logging.getLogger()
+
+MAX_COLUMNS = 25  # Columns per table whose stats are collected, when they need one statement each
+STATEMENT_TIMEOUT = 5.0
+POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+class TableStatsCollector(object):
+  '''
+  Collects the DDL, table stats and column stats of tables with a bounded pool of workers. Each worker opens its own
+  session, reused by all the statements of its tables.
+
+  The column stats of the Hive tables are read from the Metastore in one call per table when `metastore` is given,
+  and with one DESCRIBE FORMATTED per column otherwise. Impala returns them all with one SHOW COLUMN STATS.
+
+  collect() yields the stats of each table as soon as they are ready, so that they never all need to be in memory.
+  '''
+
+  def __init__(self, db, user, source_platform, with_ddl=False, with_table_stats=False, with_columns_stats=False, workers=5,
+      metastore=None):
+    self.db = db
+    self.user = user
+    self.source_platform = source_platform
+    self.with_ddl = with_ddl
+    self.with_table_stats = with_table_stats
+    self.with_columns_stats = with_columns_stats
+    self.workers = max(1, workers)
+    self.metastore = metastore
+
+    self._stopped = threading.Event()
+
+  def collect(self, db_tables):
+    '''
+    Yields (ddl, table_stats, column_stats) for each table, in their order of completion. The tables failing are
+    logged and skipped.
+    '''
+    tables = queue.Queue()
+    for db_table in db_tables:
+      tables.put(db_table)
+
+    results = queue.Queue(maxsize=self.workers * 2)  # Back pressure on the workers if the results are consumed slowly
+    workers = [
+      threading.Thread(target=self._work, args=(tables, results), name='TableStatsCollector-%d' % i)
+      for i in range(min(self.workers, tables.qsize()))
+    ]
+
+    for worker in workers:
+      worker.daemon = True
+      worker.start()
+
+    try:
+      finished = 0
+      while finished < len(workers):
+        result = results.get()
+        if result is _DONE:
+          finished += 1
+        else:
+          yield result
+    finally:
+      self._stopped.set()  # The results are not consumed anymore when the caller stops early
+
+  def _work(self, tables, results):
+    session = None
+    try:
+      session = self.db.open_session(self.user)
+
+      while not self._stopped.is_set():
+        try:
+          db_table = tables.get_nowait()
+        except queue.Empty:
+          break
+
+        try:
+          result = self._collect_table(session, db_table)
+        except Exception as e:
+          LOG.exception('Skipping upload of %s: %s' % (db_table, e))
+        else:
+          self._put(results, result)
+    except Exception as e:
+      LOG.exception('Failed to collect the stats of the tables: %s' % e)
+    finally:
+      if session is not None:
+        try:
+          self.db.close_session(session)
+        except Exception as e:
+          LOG.warning('Failed to close the session of the stats collection: %s' % e)
+      connection.close()  # Each thread has its own database connection
+      self._put(results, _DONE)
+
+  def _put(self, results, item):
+    while not self._stopped.is_set():
+      try:
+        results.put(item, timeout=POLL_INTERVAL)
+        return
+      except queue.Full:
+        pass
+
+  def _collect_table(self, session, db_table):
+    path = _get_table_name(db_table)
+    ddl = None
+    table_stats = None
+    column_stats = []
+
+    if self.with_ddl:
+      handle = self._execute(session, 'SHOW CREATE TABLE `%(database)s`.`%(table)s`' % path)
+      if handle:
+        result = self.db.fetch(handle, rows=5000)
+        self.db.close(handle)
+        ddl = (0, 0, ' '.join([row[0] for row in result.rows()]), path['database'])
+
+    if self.with_table_stats or self.with_columns_stats:
+      table = self.db.get_table(path['database'], path['table'], session=session)
+
+      if self.with_table_stats:
+        stats = dict((stat['data_type'], stat['comment']) for stat in table.stats)
+        table_stats = _to_table_stats(path, stats)
+
+      if self.with_columns_stats:
+        columns = [column.name for column in table.cols]
+        column_stats = [_to_column_stats(path, stats) for stats in self._get_column_stats(session, path, columns)]
+
+    return ddl, table_stats, column_stats
+
+  def _get_column_stats(self, session, path, columns):
+    '''Returns the raw stats of the columns, as dictionaries with the keys of the DESCRIBE FORMATTED of a column.'''
+    if self.source_platform == 'impala':
+      stats = self.db.get_table_columns_stats(path['database'], path['table'], column=-1, session=session)
+    else:
+      stats = None
+      if self.metastore is not None:
+        stats = self._get_metastore_column_stats(path, columns[:MAX_COLUMNS])
+      if stats is None:
+        stats = [
+          self.db.get_table_columns_stats(path['database'], path['table'], column=column, session=session)
+          for column in columns[:MAX_COLUMNS]
+        ]
+
+    return [
+      dict((key, val if val is not None else '') for col_stat in col for key, val in col_stat.items())
+      for col in stats
+    ]
+
+  def _get_metastore_column_stats(self, path, columns):
+    from hive_metastore.ttypes import TableStatsRequest  # Only with Hive
+
+    try:
+      response = self.metastore.client.meta_client.get_table_statistics_req(
+          TableStatsRequest(dbName=path['database'].lower(), tblName=path['table'].lower(), colNames=[c.lower() for c in columns])
+      )
+    except Exception as e:
+      LOG.warning('Falling back to DESCRIBE FORMATTED, could not read the column stats of %(database)s.%(table)s from the Metastore: '
+          % path + str(e))
+      return None
+
+    return [_from_metastore_column_stats(stats) for stats in response.tableStats]
+
+  def _execute(self, session, statement):
+    from beeswax.design import hql_query  # Only with Hive or Impala
+
+    return self.db.execute_and_wait(hql_query(statement), timeout_sec=STATEMENT_TIMEOUT, sleep_interval=POLL_INTERVAL, session=session)
+
+
+class SpooledItems(object):
+  '''
+  Items serialized into a temporary file as they are appended then read back one by one, to upload the collected stats
+  without keeping them all in memory.
+  '''
+
+  def __init__(self):
+    self._file = TemporaryFile(mode='w+')
+    self._count = 0
+
+  def append(self, item):
+    self._file.write(json.dumps(item) + '\n')
+    self._count += 1
+
+  def __len__(self):
+    return self._count
+
+  def __iter__(self):
+    self._file.seek(0)
+    for line in self._file:
+      yield json.loads(line)
+
+  def close(self):
+    self._file.close()
+
+
+def _to_table_stats(path, stats):
+  return {
+    'table_name': '%(database)s.%(table)s' % path,  # DB Prefix
+    'num_rows': stats.get('numRows', -1),
+    'last_modified_time': stats.get('transient_lastDdlTime', -1),
+    'total_size': stats.get('totalSize', -1),
+    'raw_data_size': stats.get('rawDataSize', -1),
+    'num_files': stats.get('numFiles', -1),
+    'num_partitions': stats.get('numPartitions', -1),
+    # bytes_cached
+    # cache_replication
+    # format
+  }
+
+
+def _to_column_stats(path, col_stats):
+  return {
+    'table_name': '%(database)s.%(table)s' % path,  # DB Prefix
+    'column_name': col_stats['col_name'],
+    'data_type': col_stats['data_type'],
+    "num_distinct": int(col_stats.get('distinct_count')) if col_stats.get('distinct_count') != '' else -1,
+    "num_nulls": int(col_stats['num_nulls']) if col_stats['num_nulls'] != '' else -1,
+    "avg_col_len": int(float(col_stats['avg_col_len'])) if col_stats['avg_col_len'] != '' else -1,
+    "max_size": int(float(col_stats['max_col_len'])) if col_stats['max_col_len'] != '' else -1,
+    "min": col_stats['min'] if col_stats.get('min', '') != '' else -1,
+    "max": col_stats['max'] if col_stats.get('max', '') != '' else -1,
+    "num_trues": col_stats['num_trues'] if col_stats.get('num_trues', '') != '' else -1,
+    "num_falses": col_stats['num_falses'] if col_stats.get('num_falses', '') != '' else -1,
+  }
+
+
+def _from_metastore_column_stats(stats_obj):
+  '''Converts a Metastore ColumnStatisticsObj into the list of single key dictionaries of get_table_columns_stats().'''
+  data = stats_obj.statsData
+  typed = [
+    getattr(data, field) for field in ('booleanStats', 'longStats', 'doubleStats', 'stringStats', 'binaryStats', 'decimalStats',
+    'dateStats') if getattr(data, field, None) is not None
+  ]
+  typed = typed[0] if typed else None
+
+  return [
+    {'col_name': stats_obj.colName},
+    {'data_type': stats_obj.colType},
+    {'min': _from_metastore_value(getattr(typed, 'lowValue', None))},
+    {'max': _from_metastore_value(getattr(typed, 'highValue', None))},
+    {'num_nulls': getattr(typed, 'numNulls', None)},
+    {'distinct_count': getattr(typed, 'numDVs', None)},
+    {'avg_col_len': getattr(typed, 'avgColLen', None)},
+    {'max_col_len': getattr(typed, 'maxColLen', None)},
+    {'num_trues': getattr(typed, 'numTrues', None)},
+    {'num_falses': getattr(typed, 'numFalses', None)},
+  ]
+
+
+def _from_metastore_value(value):
+  if value is None or isinstance(value, (int, float)):
+    return value
+  elif hasattr(value, 'unscaled'):  # Decimal: big-endian two's complement unscaled value
+    unscaled = int.from_bytes(value.unscaled, 'big', signed=True) if value.unscaled else 0
+    return str(decimal.Decimal(unscaled).scaleb(-value.scale))
+  elif hasattr(value, 'daysSinceEpoch'):
+    return str(datetime.date(1970, 1, 1) + datetime.timedelta(days=value.daysSinceEpoch))
+  return value
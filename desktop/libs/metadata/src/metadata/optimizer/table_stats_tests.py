@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from builtins import object
+import sys
+import threading
+
+from metadata.optimizer.table_stats import SpooledItems, TableStatsCollector, _from_metastore_column_stats
+
+if sys.version_info[0] > 2:
+  from unittest.mock import patch, Mock
+else:
+  from mock import patch, Mock
+
+
+def _column_stats(name, num_nulls='0', distinct_count='10'):
+  return [
+    {'col_name': name}, {'data_type': 'int'}, {'min': '1'}, {'max': '100'}, {'num_nulls': num_nulls},
+    {'distinct_count': distinct_count}, {'avg_col_len': None}, {'max_col_len': None}, {'num_trues': None}, {'num_falses': None}
+  ]
+
+
+def _column(name):
+  column = Mock()
+  column.name = name
+  return column
+
+
+class MockDb(object):
+
+  def __init__(self, failing_tables=()):
+    self.failing_tables = failing_tables
+    self.sessions = []
+    self.closed_sessions = []
+    self.lock = threading.Lock()
+
+  def open_session(self, user):
+    with self.lock:
+      session = Mock(id=len(self.sessions))
+      self.sessions.append(session)
+    return session
+
+  def close_session(self, session):
+    with self.lock:
+      self.closed_sessions.append(session)
+
+  def get_table(self, database, table_name, session=None):
+    assert session is not None
+    if table_name in self.failing_tables:
+      raise Exception('Table not found')
+    return Mock(
+      stats=[{'data_type': 'numRows', 'comment': '10'}, {'data_type': 'totalSize', 'comment': '100'}],
+      cols=[_column('id'), _column('name')]
+    )
+
+  def get_table_columns_stats(self, database, table, column, session=None):
+    assert session is not None
+    if column == -1:
+      return [_column_stats('id'), _column_stats('name', num_nulls='', distinct_count='')]
+    return _column_stats(column)
+
+
+class TestTableStatsCollector(object):
+
+  def setup_method(self):
+    self.connection = patch('metadata.optimizer.table_stats.connection')
+    self.connection.start()
+
+  def teardown_method(self):
+    self.connection.stop()
+
+  def test_collect(self):
+    db = MockDb(failing_tables=('broken',))
+    collector = TableStatsCollector(db, user=None, source_platform='hive', with_table_stats=True, with_columns_stats=True, workers=3)
+
+    results = list(collector.collect(['default.customers', 'sales.orders', 'broken', 'web_logs']))
+
+    assert 3 == len(results)  # The failing table is skipped
+    assert 3 == len(db.sessions)
+    assert sorted(db.sessions, key=id) == sorted(db.closed_sessions, key=id)
+
+    table_stats = sorted([stats for ddl, stats, columns in results], key=lambda stats: stats['table_name'])
+    assert ['default.customers', 'default.web_logs', 'sales.orders'] == [stats['table_name'] for stats in table_stats]
+    assert '10' == table_stats[0]['num_rows']
+    assert -1 == table_stats[0]['num_files']
+
+    columns = [column for ddl, stats, columns in results for column in columns]
+    assert 6 == len(columns)
+    column = [column for column in columns if column['table_name'] == 'sales.orders' and column['column_name'] == 'id'][0]
+    assert 10 == column['num_distinct']
+    assert 0 == column['num_nulls']
+    assert -1 == column['avg_col_len']
+    assert '1' == column['min']
+
+  def test_collect_impala(self):
+    db = MockDb()
+    db.get_table_columns_stats = Mock(side_effect=db.get_table_columns_stats)
+    collector = TableStatsCollector(db, user=None, source_platform='impala', with_columns_stats=True)
+
+    results = list(collector.collect(['default.customers']))
+
+    db.get_table_columns_stats.assert_called_once_with('default', 'customers', column=-1, session=db.sessions[0])
+    ddl, table_stats, columns = results[0]
+    assert ddl is None
+    assert table_stats is None
+    assert [-1, -1] == [columns[1]['num_nulls'], columns[1]['num_distinct']]
+
+  def test_collect_from_metastore(self):
+    db = MockDb()
+    db.get_table_columns_stats = Mock(side_effect=db.get_table_columns_stats)
+    metastore = Mock()
+    metastore.client.meta_client.get_table_statistics_req.return_value = Mock(tableStats=[
+      Mock(colName='id', colType='int', statsData=Mock(
+        booleanStats=None,
+        longStats=Mock(lowValue=1, highValue=100, numNulls=0, numDVs=10, spec=['lowValue', 'highValue', 'numNulls', 'numDVs'])
+      ))
+    ])
+
+    with patch.dict('sys.modules', {'hive_metastore': Mock(), 'hive_metastore.ttypes': Mock()}):
+      collector = TableStatsCollector(db, user=None, source_platform='hive', with_columns_stats=True, metastore=metastore)
+      ddl, table_stats, columns = list(collector.collect(['default.customers']))[0]
+
+      assert not db.get_table_columns_stats.called
+      assert [{
+        'table_name': 'default.customers', 'column_name': 'id', 'data_type': 'int', 'num_distinct': 10, 'num_nulls': 0,
+        'avg_col_len': -1, 'max_size': -1, 'min': 1, 'max': 100, 'num_trues': -1, 'num_falses': -1
+      }] == columns
+
+      # Fallback to the DESCRIBE FORMATTED of each column
+      metastore.client.meta_client.get_table_statistics_req.side_effect = Exception('Unknown method')
+      collector = TableStatsCollector(db, user=None, source_platform='hive', with_columns_stats=True, metastore=metastore)
+      ddl, table_stats, columns = list(collector.collect(['default.customers']))[0]
+
+      assert 2 == db.get_table_columns_stats.call_count
+      assert ['id', 'name'] == [column['column_name'] for column in columns]
+
+  def test_metastore_values(self):
+    decimal_stats = Mock(
+      lowValue=Mock(unscaled=b'\xff\x85', scale=2, spec=['unscaled', 'scale']),
+      highValue=Mock(unscaled=b'\x30\x39', scale=2, spec=['unscaled', 'scale']),
+      numNulls=3, numDVs=5, spec=['lowValue', 'highValue', 'numNulls', 'numDVs']
+    )
+    stats = _from_metastore_column_stats(Mock(colName='price', colType='decimal(6,2)', statsData=Mock(
+      booleanStats=None, longStats=None, doubleStats=None, stringStats=None, binaryStats=None, decimalStats=decimal_stats
+    )))
+
+    assert {'min': '-1.23'} in stats
+    assert {'max': '123.45'} in stats
+
+    date_stats = Mock(lowValue=Mock(daysSinceEpoch=0, spec=['daysSinceEpoch']), highValue=None, spec=['lowValue', 'highValue'])
+    stats = _from_metastore_column_stats(Mock(colName='day', colType='date', statsData=Mock(
+      booleanStats=None, longStats=None, doubleStats=None, stringStats=None, binaryStats=None, decimalStats=None, dateStats=date_stats
+    )))
+
+    assert {'min': '1970-01-01'} in stats
+    assert {'max': None} in stats
+    assert {'avg_col_len': None} in stats
+
+
+def test_spooled_items():
+  items = SpooledItems()
+  try:
+    assert not items
+    items.append({'table_name': 'default.customers'})
+    items.append((0, 0, 'CREATE TABLE customers (id INT)', 'default'))
+
+    assert 2 == len(items)
+    assert [{'table_name': 'default.customers'}, [0, 0, 'CREATE TABLE customers (id INT)', 'default']] == list(items)
+    assert 2 == len(list(items))  # Can be read again
+  finally:
+    items.close()
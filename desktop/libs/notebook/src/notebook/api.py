@@ -29,7 +29,7 @@ from django.views.decorators.http import require_GET, require_POST
 import opentracing.tracer
 
 from azure.abfs.__init__ import abfspath
-from desktop.conf import TASK_SERVER, ENABLE_CONNECTORS
+from desktop.conf import TASK_SERVER, ENABLE_CONNECTORS, WEBSOCKETS, has_channels
 from desktop.lib.i18n import smart_str
 from desktop.lib.django_util import JsonResponse
 from desktop.lib.exceptions_renderable import PopupException
@@ -43,6 +43,7 @@ from notebook.connectors.base import Notebook, QueryExpired, SessionExpired, Que
 from notebook.connectors.hiveserver2 import HS2Api
 from notebook.decorators import api_error_handler, check_document_access_permission, check_document_modify_permission
 from notebook.models import escape_rows, make_notebook, upgrade_session_properties, get_api, _get_dialect_example
+from notebook.operation_state import OperationState
 
 if sys.version_info[0] > 2:
   from urllib.parse import unquote as urllib_unquote
@@ -139,6 +140,7 @@ def _execute_notebook(request, notebook, snippet):
   active_executable = None
 
   historify = (notebook['type'] != 'notebook' or snippet.get('wasBatchExecuted')) and not notebook.get('skipHistorify')
+  channel_name = notebook.get('editorWsChannel')
 
   try:
     try:
@@ -214,12 +216,33 @@ def _execute_notebook(request, notebook, snippet):
   if result is not None:
     response['result'] = result
     response['result']['data'] = escape_rows(result['data'])
+  elif response.get('handle'):
+    if history:  # The status checks start from this state instead of the history document
+      OperationState.from_notebook(history.uuid, request.user, notebook, dict(snippet, result={'handle': response['handle']})).save()
+    if channel_name:
+      _watch_status(request, notebook, snippet, response, channel_name)
 
   response['status'] = 0
 
   return response
 
 
+def _watch_status(request, notebook, snippet, response, channel_name):
+  """Pushes the status and first results of the query to the editor connected to the websocket, see QueryStatusWatcher."""
+  if not has_channels() or not WEBSOCKETS.PUSH_QUERY_STATUS.get() or 'result' in response['handle']:  # e.g. results streamed by ksql
+    return
+
+  from notebook.watcher import get_watcher
+
+  snippet = dict(snippet, status='running', result=dict(snippet.get('result') or {}, handle=response['handle']))
+  try:
+    # The results are fetched by the editor, the connectors can't always fetch them again from the start
+    get_watcher().watch(request.user, notebook, snippet, channel_name, key=response.get('history_uuid'), fetch_result=False)
+    response['status_pushed'] = True
+  except Exception as e:
+    LOG.warning('The status of the query will be polled, could not watch it: %s' % e)
+
+
 @require_POST
 @check_document_access_permission
 @api_error_handler
@@ -265,7 +288,16 @@ def check_status(request):
 def _check_status(request, notebook=None, snippet=None, operation_id=None):
   response = {'status': -1}
 
-  if operation_id or not snippet:  # To unify with _get_snippet
+  state_id = operation_id or (notebook or {}).get('uuid')
+  state = OperationState.get(state_id, request.user) if state_id else None
+
+  if state is not None and _get_guid(snippet) and _get_guid(snippet) != _get_guid(state.snippet):  # Executed again
+    state = None
+
+  if state is not None:  # No need to load the document
+    notebook = state.notebook
+    snippet = state.snippet
+  elif operation_id or not snippet:  # To unify with _get_snippet
     nb_doc = Document2.objects.get_by_uuid(user=request.user, uuid=operation_id or notebook['uuid'])
     notebook = Notebook(document=nb_doc).get_data()  # Used below
     snippet = notebook['snippets'][0]
@@ -287,26 +319,57 @@ def _check_status(request, notebook=None, snippet=None, operation_id=None):
     else:
       status = 'failed'
 
+    if status in ('failed', 'expired', 'canceled'):
+      _release_dashboard_query(snippet)
+
     if response.get('query_status'):
       has_result_set = response['query_status'].get('has_result_set')
     else:
       has_result_set = None
 
-    if notebook.get('dialect') or notebook['type'].startswith('query') or notebook.get('isManaged'):
-      nb_doc = Document2.objects.get_by_uuid(user=request.user, uuid=operation_id or notebook['uuid'])
-      if nb_doc.can_write(request.user):
-        nb = Notebook(document=nb_doc).get_data()
-        if status != nb['snippets'][0]['status'] or has_result_set != nb['snippets'][0].get('has_result_set'):
-          nb['snippets'][0]['status'] = status
-          if has_result_set is not None:
-            nb['snippets'][0]['has_result_set'] = has_result_set
-            nb['snippets'][0]['result']['handle']['has_result_set'] = has_result_set
-          nb_doc.update_data(nb)
-          nb_doc.save()
+    if state_id and (notebook.get('dialect') or notebook['type'].startswith('query') or notebook.get('isManaged')):
+      if state is None:
+        state = OperationState.from_notebook(state_id, request.user, notebook, snippet)
+
+      if status != state.status or (has_result_set is not None and has_result_set != state.has_result_set):
+        state.status = status
+        if has_result_set is not None:
+          state.has_result_set = has_result_set
+
+        if state.is_running:
+          state.save()
+        else:  # The document is only updated with the final status, which makes the state useless
+          _update_history_status(request.user, state_id, status, has_result_set)
+          state.delete()
 
   return response
 
 
+def _release_dashboard_query(snippet):
+  '''The viewers of a dashboard widget wait for the result of its running query, which never comes when it fails.'''
+  single_flight_key = (((snippet or {}).get('result') or {}).get('handle') or {}).get('single_flight_key')
+  if single_flight_key:
+    from notebook.dashboard_api import release_single_flight
+    release_single_flight(single_flight_key)
+
+
+def _get_guid(snippet):
+  return (((snippet or {}).get('result') or {}).get('handle') or {}).get('guid')
+
+
+def _update_history_status(user, uuid, status, has_result_set):
+  nb_doc = Document2.objects.get_by_uuid(user=user, uuid=uuid)
+  if nb_doc.can_write(user):
+    nb = Notebook(document=nb_doc).get_data()
+    if status != nb['snippets'][0]['status'] or has_result_set != nb['snippets'][0].get('has_result_set'):
+      nb['snippets'][0]['status'] = status
+      if has_result_set is not None:
+        nb['snippets'][0]['has_result_set'] = has_result_set
+        nb['snippets'][0]['result']['handle']['has_result_set'] = has_result_set
+      nb_doc.update_data(nb)
+      nb_doc.save()
+
+
 @require_POST
 @check_document_access_permission
 @api_error_handler
@@ -413,6 +476,7 @@ def cancel_statement(request):
 
   with opentracing.tracer.start_span('notebook-cancel_statement') as span:
     response['result'] = get_api(request, snippet).cancel(notebook, snippet)
+    _release_dashboard_query(snippet)
 
     span.set_tag('user-id', request.user.username)
     span.set_tag(
@@ -757,6 +821,8 @@ def autocomplete(request, server=None, database=None, table=None, column=None, n
   else:
     snippet = json.loads(request.POST.get('snippet', '{}'))
   action = request.POST.get('operation', 'schema')
+  if json.loads(request.POST.get('refreshCache', 'false')):  # Refreshed from the assist, skips the metadata cached by the connectors
+    snippet['refreshCache'] = True
 
   try:
     autocomplete_data = get_api(request, snippet).autocomplete(snippet, database, table, column, nested, action)
@@ -39,9 +39,11 @@ from useradmin.models import User
 import notebook.conf
 import notebook.connectors.hiveserver2
 
-from notebook.api import _historify
+from notebook.api import _historify, _check_status
 from notebook.connectors.base import Notebook, QueryError, Api, QueryExpired
 from notebook.decorators import api_error_handler
+from notebook.models import MockedDjangoRequest
+from notebook.operation_state import OperationState
 from notebook.conf import get_ordered_interpreters, INTERPRETERS_SHOWN_ON_WHEEL, INTERPRETERS
 
 
@@ -266,6 +268,47 @@ class TestApi(object):
     assert 3 == Document.objects.filter(name__contains=self.notebook['name']).count()
 
 
+  def test_check_status_from_operation_state(self):
+    history_doc = _historify(self.notebook, self.user)
+    notebook = Notebook(document=history_doc).get_data()
+    OperationState.from_notebook(history_doc.uuid, self.user, notebook, notebook['snippets'][0]).save()  # Saved by execute
+    request = MockedDjangoRequest(user=self.user)
+
+    with patch('notebook.api.get_api') as get_api:
+      with patch.object(Document2.objects, 'get_by_uuid', side_effect=Document2.objects.get_by_uuid) as get_by_uuid:
+        get_api.return_value.check_status.return_value = {'status': 'running', 'has_result_set': True}
+        response = _check_status(request, operation_id=history_doc.uuid)
+
+        assert 'running' == response['query_status']['status']
+        assert not get_by_uuid.called  # The document is not read nor written while running
+        assert 'running' == OperationState.get(history_doc.uuid, self.user).status
+        assert OperationState.get(history_doc.uuid, self.user_not_me) is None
+
+        get_api.return_value.check_status.return_value = {'status': 'available', 'has_result_set': True}
+        _check_status(request, operation_id=history_doc.uuid)
+
+        assert 1 == get_by_uuid.call_count  # Only synced at the end
+
+    history = Notebook(document=Document2.objects.get(uuid=history_doc.uuid)).get_data()
+    assert 'available' == history['snippets'][0]['status']
+    assert OperationState.get(history_doc.uuid, self.user) is None  # Not needed once the document is synced
+
+
+  def test_check_status_releases_failed_dashboard_query(self):
+    snippet = {'type': 'hive', 'status': 'running', 'result': {'handle': {'guid': 'abc', 'single_flight_key': 'dashboard:query:abc'}}}
+    request = MockedDjangoRequest(user=self.user)
+
+    with patch('notebook.api.get_api') as get_api:
+      with patch('notebook.dashboard_api.release_single_flight') as release_single_flight:
+        get_api.return_value.check_status.return_value = {'status': 'running'}
+        _check_status(request, notebook={'type': 'hive'}, snippet=snippet)
+        assert not release_single_flight.called
+
+        get_api.return_value.check_status.return_value = {'status': 'failed'}
+        _check_status(request, notebook={'type': 'hive'}, snippet=snippet)
+        release_single_flight.assert_called_once_with('dashboard:query:abc')
+
+
   def test_get_history(self):
     assert 0 == Document2.objects.filter(name__contains=self.notebook['name'], is_history=True).count()
     _historify(self.notebook, self.user)
@@ -285,6 +285,37 @@ ENABLE_QUERY_ANALYSIS = Config(
   default=False
 )
 
+SQLALCHEMY_MAX_ENGINES = Config(
+  key="sqlalchemy_max_engines",
+  help=_t("Maximum number of SqlAlchemy engines (i.e. connection pools) kept open per Hue process. "
+          "The least recently used ones are disposed above it."),
+  type=int,
+  default=100
+)
+
+SQLALCHEMY_ENGINE_IDLE_TIMEOUT = Config(
+  key="sqlalchemy_engine_idle_timeout",
+  help=_t("Number of seconds after which an unused SqlAlchemy engine and its connections are disposed. Set to 0 to disable."),
+  type=int,
+  default=1800
+)
+
+SQLALCHEMY_MAX_CONNECTIONS = Config(
+  key="sqlalchemy_max_connections",
+  help=_t("Maximum number of database connections opened per SqlAlchemy connector and Hue process, all users included. "
+          "Set to 0 for no limit."),
+  type=int,
+  default=0
+)
+
+SQLALCHEMY_METADATA_CACHE_TTL = Config(
+  key="sqlalchemy_metadata_cache_ttl",
+  help=_t("Number of seconds the databases, tables and columns listed by the assist of the SqlAlchemy connectors are cached. "
+          "Only used with the task server, which provides a cache shared by the Hue processes. Set to 0 to disable."),
+  type=int,
+  default=600
+)
+
 
 EXAMPLES = ConfigSection(
   key='examples',
@@ -103,7 +103,7 @@ def query_error_handler(func):
       if 'timed out' in message:
         raise OperationTimeout(e)
       elif 'Connection refused' in message or 'Name or service not known' in message or 'Could not connect to any' in message:
-        reset_ha()
+        reset_ha(getattr(args[0], '_server_name', None) if args else None)
       else:
         raise QueryError(message)
     except QueryServerException as e:
@@ -202,17 +202,18 @@ class HS2Api(Api):
       if 'Connection refused' in str(e) or 'Name or service not known' in str(e):
         LOG.exception('Connection being refused or service is not available in either session or in multiple sessions'
                       '- HA failover')
-        reset_ha()
+        reset_ha(get_query_server_config(name=lang, connector=self.interpreter)['server_name'])
 
     reuse_session = session is not None
     if not reuse_session:
-      db = dbms.get(self.user, query_server=get_query_server_config(name=lang, connector=self.interpreter))
+      query_server = get_query_server_config(name=lang, connector=self.interpreter)
+      db = dbms.get(self.user, query_server=query_server)
       try:
         session = db.open_session(self.user)
       except Exception as e:
         if 'Connection refused' in str(e) or 'Name or service not known' in str(e):
           LOG.exception('Connection being refused or service is not available in reuse session - HA failover')
-          reset_ha()
+          reset_ha(query_server['server_name'])
 
     response = {
       'type': lang,
@@ -826,7 +827,10 @@ DROP TABLE IF EXISTS `%(table)s`;
       name = 'sparksql'
 
     # Note: name is not used if interpreter is present
-    return dbms.get(self.user, query_server=get_query_server_config(name=name, connector=interpreter))
+    query_server = get_query_server_config(name=name, connector=interpreter)
+    self._server_name = query_server['server_name']  # For resetting only its clients on a HA failover
+
+    return dbms.get(self.user, query_server=query_server)
 
 
   def _parse_job_counters(self, job_id):
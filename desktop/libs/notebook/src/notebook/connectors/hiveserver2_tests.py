@@ -31,6 +31,7 @@ from desktop.auth.backend import rewrite_user
 from desktop.conf import has_connectors
 from desktop.lib.i18n import smart_str
 from desktop.lib.django_test_util import make_logged_in_client
+from desktop.lib.exceptions import StructuredException
 from desktop.lib.test_utils import add_to_group, grant_access
 from beeswax.server import dbms
 from beeswax.server.dbms import QueryServerException
@@ -446,6 +447,21 @@ class TestApi():
           [{'name': 'f1'}, {'name': 'f2'}, {'name': 'f3'}])
 
 
+  def test_ha_failover_only_resets_the_failed_server(self):
+    snippet = {'type': 'hive', 'properties': {}}
+
+    with patch('notebook.connectors.hiveserver2.get_query_server_config') as get_query_server_config:
+      with patch('beeswax.server.dbms.get') as get:
+        with patch('notebook.connectors.hiveserver2.HS2Api._get_handle'):
+          with patch('notebook.connectors.hiveserver2.reset_ha') as reset_ha:
+            get_query_server_config.return_value = {'server_name': 'hplsql'}
+            get.return_value = Mock(cancel_operation=Mock(side_effect=StructuredException(code=None, message='Connection refused')))
+
+            HS2Api(self.user).cancel(None, snippet)
+
+            reset_ha.assert_called_once_with('hplsql')
+
+
 @pytest.mark.django_db
 class TestHiveserver2ApiNonMock(object):
 
@@ -16,24 +16,29 @@
 # limitations under the License.
 
 from builtins import range, object
+import hashlib
 import logging
 import re
 import sys
 import time
 import textwrap
 import json
+import uuid
 
 from beeswax.server.dbms import Table
 
-from desktop.conf import USE_DEFAULT_CONFIGURATION
+from desktop.conf import TASK_SERVER, USE_DEFAULT_CONFIGURATION
+from desktop.lib.cache_util import get_shared_cache, has_shared_cache, poll
 from desktop.lib.exceptions_renderable import PopupException
 from desktop.lib.i18n import force_unicode
+from desktop.lib.metrics import global_registry
 from desktop.lib.rest.http_client import RestException
 from desktop.models import DefaultConfiguration
 from desktop.auth.backend import rewrite_user
+from useradmin.models import User
 
 from notebook.data_export import download as spark_download
-from notebook.connectors.base import Api, QueryError, SessionExpired, _get_snippet_session
+from notebook.connectors.base import Api, QueryError, QueryExpired, SessionExpired, _get_snippet_session
 
 if sys.version_info[0] > 2:
   from django.utils.translation import gettext as _
@@ -45,13 +50,145 @@ LOG = logging.getLogger()
 
 
 try:
-  from spark.conf import LIVY_SERVER_SESSION_KIND
+  from spark.conf import LIVY_METADATA_CACHE_TTL, LIVY_SERVER_SESSION_KIND, LIVY_SESSION_POOL_SIZE, LIVY_SESSION_POOL_TTL
   from spark.livy_client import get_api as get_spark_api
 except ImportError as e:
   LOG.exception('Spark is not enabled')
 
 SESSION_KEY = '%(username)s-%(interpreter_name)s'
 
+STARTING_STATES = ('not_started', 'starting')
+UNHEALTHY_STATES = ('dead', 'shutting_down', 'error', 'killed')
+SESSION_STARTUP_TIMEOUT = 120
+PENDING_STATEMENT_KEY = 'livy:pending-statement:%s'
+POOL_KEY = 'livy:pool:%s'
+POOL_PROFILES_KEY = 'livy:pool:profiles'
+POOL_CLAIM_KEY = 'livy:pool:claim:%s'
+POOL_CLAIM_TTL = 60 * 60
+METADATA_CACHE_KEY = 'livy:metadata:%(session_key)s:%(session)s:%(version)s:%(statement)s'
+METADATA_VERSION_KEY = 'livy:metadata:version:%s'
+STATEMENT_TIMEOUT = 120
+DDL_RE = re.compile(r'\b(CREATE|DROP|ALTER|RENAME|TRUNCATE|MSCK|saveAsTable|insertInto)\b', re.IGNORECASE)
+
+
+session_startup_time = global_registry().histogram(
+    name='livy.session.startup-time',
+    label='Livy Session Startup Time',
+    description='Time from the creation of a Livy session on demand to its first idle state',
+    numerator='seconds',
+    counter_numerator='sessions',
+)
+session_pool_hits = global_registry().counter(
+    name='livy.session-pool.hits',
+    label='Livy Session Pool Hits',
+    description='Number of Livy sessions handed to users from the warm pool',
+    numerator='sessions',
+)
+session_pool_misses = global_registry().counter(
+    name='livy.session-pool.misses',
+    label='Livy Session Pool Misses',
+    description='Number of Livy sessions created on demand as the warm pool was empty',
+    numerator='sessions',
+)
+
+
+class LivySessionPool(object):
+  '''
+  Idle Livy sessions started by the task server ahead of their use, so that the first snippet does not wait for Spark.
+
+  Livy runs a session as its proxy user, so a pooled session can only be handed to the user it was started for. The pool
+  is then kept warm per (user, interpreter, session properties) profile, for the profiles used in the last
+  LIVY_SESSION_POOL_TTL seconds. The sessions are claimed atomically in the cache shared by the Hue processes.
+  '''
+
+  def is_enabled(self):
+    return TASK_SERVER.ENABLED.get() and LIVY_SESSION_POOL_SIZE.get() > 0
+
+  @staticmethod
+  def get_profile_key(username, interpreter, props):
+    profile = json.dumps([username, interpreter.get('name'), props], sort_keys=True)
+    return hashlib.md5(profile.encode('utf-8')).hexdigest()
+
+  def acquire(self, user, interpreter, props):
+    '''Returns the status of a healthy pooled session of the user with these properties, or None.'''
+    cache = get_shared_cache()
+    key = self.get_profile_key(user.username, interpreter, props)
+    if self._register(cache, key, user.username, interpreter, props):
+      self._top_up_async()  # Otherwise warmed up by the periodic top up
+    api = get_spark_api(user, interpreter)
+
+    while True:
+      session_ids = cache.get(POOL_KEY % key) or []
+      if not session_ids:
+        session_pool_misses.inc()
+        return None
+
+      session_id = session_ids[0]
+      claimed = cache.add(POOL_CLAIM_KEY % session_id, True, timeout=POOL_CLAIM_TTL)
+      cache.set(POOL_KEY % key, [_id for _id in cache.get(POOL_KEY % key) or [] if _id != session_id], timeout=None)
+      status = claimed and _get_healthy_session(api, session_id)
+      if status:
+        session_pool_hits.inc()
+        self._top_up_async()
+        return status
+
+  def top_up(self):
+    '''Starts the missing sessions of the profiles recently used and closes the ones of the profiles not used anymore.'''
+    cache = get_shared_cache()
+    profiles = cache.get(POOL_PROFILES_KEY) or {}
+    now = time.time()
+
+    for key, profile in list(profiles.items()):
+      try:
+        user = rewrite_user(User.objects.get(username=profile['username']))
+        api = get_spark_api(user, profile['interpreter'])
+        session_ids = [
+          session_id for session_id in cache.get(POOL_KEY % key) or []
+          if not cache.get(POOL_CLAIM_KEY % session_id) and _get_healthy_session(api, session_id)
+        ]
+
+        if now - profile['last_used'] > LIVY_SESSION_POOL_TTL.get():
+          for session_id in session_ids:
+            if cache.add(POOL_CLAIM_KEY % session_id, True, timeout=POOL_CLAIM_TTL):
+              api.close(session_id)
+          cache.delete(POOL_KEY % key)
+          del profiles[key]
+          continue
+
+        for i in range(LIVY_SESSION_POOL_SIZE.get() - len(session_ids)):
+          session_ids.append(api.create_session(**profile['props'])['id'])
+        cache.set(POOL_KEY % key, session_ids, timeout=None)
+      except Exception:
+        LOG.exception('Failed to top up the Livy session pool of %s' % profile['username'])
+
+    cache.set(POOL_PROFILES_KEY, profiles, timeout=None)
+
+  def _register(self, cache, key, username, interpreter, props):
+    '''Marks the profile as used, returns True if it was not in the pool yet.'''
+    profiles = cache.get(POOL_PROFILES_KEY) or {}
+    is_new = key not in profiles
+    profiles[key] = {'username': username, 'interpreter': interpreter, 'props': props, 'last_used': time.time()}
+    cache.set(POOL_PROFILES_KEY, profiles, timeout=None)
+    return is_new
+
+  def _top_up_async(self):
+    from notebook.tasks import top_up_livy_session_pool  # Avoid cyclic import
+    top_up_livy_session_pool.apply_async()
+
+
+SESSION_POOL = LivySessionPool()
+
+
+def _get_healthy_session(api, session_id):
+  try:
+    session = api.get_session(session_id)
+  except Exception as e:
+    LOG.debug('Livy session %s is not available: %s' % (session_id, e))
+    return None
+
+  if session and session['state'] not in UNHEALTHY_STATES:
+    return session
+
 class SparkApi(Api):
 
   SPARK_UI_RE = re.compile("Started SparkUI at (http[s]?://([0-9a-zA-Z-_\.]+):(\d+))")
@@ -126,17 +263,14 @@ class SparkApi(Api):
     '''
     Check if the session is actually present and its state is healthy.
     '''
-    api = self.get_api()
-    try:
-      session_present = api.get_session(session['id'])
-    except Exception as e:
-      session_present = None
-
-    if session_present and session_present['state'] not in ('dead', 'shutting_down', 'error', 'killed'):
-      return session_present
+    return _get_healthy_session(self.get_api(), session['id'])
 
 
   def create_session(self, lang='scala', properties=None):
+    '''
+    Hands a session of the warm pool or asks Livy for a new one, without waiting for it to start: the statements
+    executed in the meantime are submitted once it is idle, or wait for it when the Hue processes share no cache.
+    '''
     api = self.get_api()
     stored_session_info = self._get_session_info_from_user()
 
@@ -152,45 +286,98 @@ class SparkApi(Api):
 
     props = self.get_livy_props(lang, properties)
 
-    response = api.create_session(**props)
-
-    status = api.get_session(response['id'])
-    count = 0
-
-    while status['state'] == 'starting' and count < 120:
-      status = api.get_session(response['id'])
-      count += 1
-      time.sleep(1)
-
-    if status['state'] != 'idle':
-      info = '\n'.join(status['log']) if status['log'] else 'timeout'
-      raise QueryError(_('The Spark session is %s and could not be created in the cluster: %s') % (status['state'], info))
+    status = SESSION_POOL.acquire(self.user, self.interpreter, props) if SESSION_POOL.is_enabled() else None
+    created = None
+    if status is None:
+      status = api.create_session(**props)
+      created = time.time()
 
     new_session_info = {
         'type': lang,
-        'id': response['id'],
-        'properties': self.to_properties(props)
+        'id': status['id'],
+        'properties': self.to_properties(props),
+        'state': status.get('state', 'starting'),
     }
+    if new_session_info['state'] in STARTING_STATES and created:
+      new_session_info['created'] = created
     self._set_session_info_to_user(new_session_info)
 
     return new_session_info
-    
+
+
+  def _get_ready_session(self, snippet_type):
+    '''Returns the session of the user for the synchronous calls, waiting for it to start if needed.'''
+    stored_session_info = self._get_session_info_from_user()
+    if stored_session_info and self._check_session(stored_session_info):
+      session = stored_session_info
+    else:
+      session = self.create_session(snippet_type)
+
+    if session.get('state') in STARTING_STATES:
+      self._wait_for_session(self.get_api(), session)
+
+    return session
+
+
+  def _wait_for_session(self, api, session):
+    for _ in poll(SESSION_STARTUP_TIMEOUT):
+      status = api.get_session(session['id'])
+      if status['state'] not in STARTING_STATES:
+        break
+
+    self._on_session_started(session, status)
+
+
+  def _on_session_started(self, session, status):
+    if status['state'] not in ('idle', 'busy'):
+      info = '\n'.join(status['log']) if status.get('log') else 'timeout'
+      raise QueryError(_('The Spark session is %s and could not be created in the cluster: %s') % (status['state'], info))
+
+    if session.get('created'):
+      session_startup_time.add(time.time() - session['created'])
+
+    session['state'] = status['state']
+    session.pop('created', None)
+    stored_session_info = self._get_session_info_from_user()
+    if stored_session_info and stored_session_info['id'] == session['id']:
+      self._set_session_info_to_user(session)
+
 
   def execute(self, notebook, snippet):
     api = self.get_api()
     session = _get_snippet_session(notebook, snippet)
 
+    if DDL_RE.search(snippet['statement']):
+      self._invalidate_metadata()
+
     response = self._execute(api, session, snippet.get('type'), snippet['statement'])
     return response
 
 
   def _execute(self, api, session, snippet_type, statement):
-    if not session or not self._check_session(session):
+    status = self._check_session(session) if session else None
+    if not status:
       stored_session_info = self._get_session_info_from_user()
-      if stored_session_info and self._check_session(stored_session_info):
+      status = self._check_session(stored_session_info) if stored_session_info else None
+      if status:
         session = stored_session_info
       else:
         session = self.create_session(snippet_type)
+        status = session
+
+    if status.get('state') in STARTING_STATES:
+      if has_shared_cache():
+        # Submitted by check_status() once the session is started, so that the request does not wait for Spark.
+        # The next status check can be served by any Hue process.
+        pending_id = str(uuid.uuid4())
+        get_shared_cache().set(PENDING_STATEMENT_KEY % pending_id, {'session': session, 'statement': statement}, timeout=3600)
+        return {
+            'id': None,
+            'pending_id': pending_id,
+            'has_result_set': True,
+            'sync': False
+        }
+      self._wait_for_session(api, session)
 
     try:
       response = api.submit_statement(session['id'], statement)
@@ -210,10 +397,15 @@ class SparkApi(Api):
   def check_status(self, notebook, snippet):
     api = self.get_api()
     session = _get_snippet_session(notebook, snippet)
-    cell = snippet['result']['handle']['id']
 
     session = self._handle_session_health_check(session)
 
+    cell = self._get_cell(api, snippet['result']['handle'])
+    if cell is None:
+      return {
+          'status': 'starting',
+      }
+
     try:
       response = api.fetch_data(session['id'], cell)
       return {
@@ -230,9 +422,9 @@ class SparkApi(Api):
   def fetch_result(self, notebook, snippet, rows, start_over=False):
     api = self.get_api()
     session = _get_snippet_session(notebook, snippet)
-    cell = snippet['result']['handle']['id']
 
     session = self._handle_session_health_check(session)
+    cell = self._get_cell(api, snippet['result']['handle'])
 
     response = self._fetch_result(api, session, cell)
 
@@ -244,6 +436,32 @@ class SparkApi(Api):
     return response
 
 
+  def _get_cell(self, api, handle):
+    '''
+    Returns the id of the statement of the snippet, or None while its session is starting.
+    A statement deferred by execute() is submitted once, when its session becomes idle.
+    '''
+    if handle.get('id') is not None or not handle.get('pending_id'):
+      return handle['id']
+
+    cache = get_shared_cache()
+    key = PENDING_STATEMENT_KEY % handle['pending_id']
+    pending = cache.get(key)
+    if pending is None:
+      raise QueryExpired()
+    if pending.get('cell') is not None:
+      return pending['cell']
+
+    status = api.get_session(pending['session']['id'])
+    if status['state'] in STARTING_STATES or not cache.add(key + ':submit', True, timeout=60):
+      return None
+
+    self._on_session_started(pending['session'], status)
+    pending['cell'] = self._execute(api, pending['session'], pending['session']['type'], pending['statement'])['id']
+    cache.set(key, pending, timeout=3600)
+    return pending['cell']
+
+
   def _fetch_result(self, api, session, cell):
     try:
       response = api.fetch_data(session['id'], cell)
@@ -367,6 +585,10 @@ class SparkApi(Api):
 
     session = self._handle_session_health_check(session)
 
+    handle = snippet.get('result', {}).get('handle', {})
+    if handle.get('pending_id'):
+      get_shared_cache().delete(PENDING_STATEMENT_KEY % handle['pending_id'])
+
     try:
       response = api.cancel(session['id'])
     except Exception as e:
@@ -447,11 +669,10 @@ class SparkApi(Api):
     if self._get_session_info_from_user():
       self._close_unused_sessions(snippet.get('type'))
     
-    stored_session_info = self._get_session_info_from_user()
-    if stored_session_info and self._check_session(stored_session_info):
-      session = stored_session_info
-    else:
-      session = self.create_session(snippet.get('type'))
+    session = self._get_ready_session(snippet.get('type'))
+
+    if snippet.get('refreshCache'):
+      self._invalidate_metadata()
 
     if database is None:
       response['databases'] = self._show_databases(api, session, snippet.get('type'))
@@ -495,43 +716,69 @@ class SparkApi(Api):
 
 
   def _check_status_and_fetch_result(self, api, session, execute_resp):
-    check_status = api.fetch_data(session['id'], execute_resp['id'])
-
-    count = 0
-    while check_status['state'] in ['running', 'waiting'] and count < 120:
+    for _ in poll(STATEMENT_TIMEOUT):
       check_status = api.fetch_data(session['id'], execute_resp['id'])
-      count += 1
-      time.sleep(1)
+      if check_status['state'] not in ('running', 'waiting'):
+        break
 
     if check_status['state'] == 'available':
       return self._fetch_result(api, session, execute_resp['id'])
 
 
+  def _get_metadata(self, api, session, snippet_type, statement):
+    '''
+    Returns the result of a metadata statement. The results are cached per user, session and statement for
+    LIVY_METADATA_CACHE_TTL seconds and dropped when the user runs a DDL statement or refreshes the assist. They are only
+    cached in the cache shared by the Hue processes, as a DDL statement executed through another one would not drop them.
+    '''
+    ttl = LIVY_METADATA_CACHE_TTL.get() if has_shared_cache() else 0
+    if not ttl:
+      return self._check_status_and_fetch_result(api, session, self._execute(api, session, snippet_type, statement))
+
+    cache = get_shared_cache()
+    session_key = self._get_session_key()
+    key = METADATA_CACHE_KEY % {
+      'session_key': session_key,
+      'session': session['id'],
+      'version': cache.get(METADATA_VERSION_KEY % session_key, 0),
+      'statement': hashlib.md5(statement.encode('utf-8')).hexdigest()
+    }
+
+    result = cache.get(key)
+    if result is None:
+      result = self._check_status_and_fetch_result(api, session, self._execute(api, session, snippet_type, statement))
+      if result is not None:
+        cache.set(key, result, timeout=ttl)
+
+    return result
+
+
+  def _invalidate_metadata(self):
+    version_key = METADATA_VERSION_KEY % self._get_session_key()
+    cache = get_shared_cache()
+    if not cache.add(version_key, 1, None):
+      cache.incr(version_key)
+
+
   def _show_databases(self, api, session, snippet_type):
-    show_db_execute = self._execute(api, session, snippet_type, 'SHOW DATABASES')
-    db_list = self._check_status_and_fetch_result(api, session, show_db_execute)
+    db_list = self._get_metadata(api, session, snippet_type, 'SHOW DATABASES')
 
     if db_list:
       return [db[0] for db in db_list['data']]
 
 
   def _show_tables(self, api, session, snippet_type, database):
-    use_db_execute = self._execute(api, session, snippet_type, 'USE %(database)s' % {'database': database})
-    use_db_resp = self._check_status_and_fetch_result(api, session, use_db_execute)
-
-    show_tables_execute = self._execute(api, session, snippet_type, 'SHOW TABLES')
-    tables_list = self._check_status_and_fetch_result(api, session, show_tables_execute)
+    # Qualified statements instead of a USE, which would also change the current database of the snippets of the user
+    tables_list = self._get_metadata(api, session, snippet_type, 'SHOW TABLES IN %(database)s' % {'database': database})
 
     if tables_list:
       return [table[1] for table in tables_list['data']]
 
 
   def _get_columns(self, api, session, snippet_type, database, table):
-    use_db_execute = self._execute(api, session, snippet_type, 'USE %(database)s' % {'database': database})
-    use_db_resp = self._check_status_and_fetch_result(api, session, use_db_execute)
-
-    describe_tables_execute = self._execute(api, session, snippet_type, 'DESCRIBE %(table)s' % {'table': table})
-    columns_list = self._check_status_and_fetch_result(api, session, describe_tables_execute)
+    columns_list = self._get_metadata(
+        api, session, snippet_type, 'DESCRIBE %(database)s.%(table)s' % {'database': database, 'table': table}
+    )
 
     if columns_list:
       cols = []
@@ -564,11 +811,7 @@ class SparkApi(Api):
     if self._get_session_info_from_user():
       self._close_unused_sessions(snippet.get('type'))
 
-    stored_session_info = self._get_session_info_from_user()
-    if stored_session_info and self._check_session(stored_session_info):
-      session = stored_session_info
-    else:
-      session = self.create_session(snippet.get('type'))
+    session = self._get_ready_session(snippet.get('type'))
 
     # Skip sample data for transactional tables
     notebook = {}
@@ -616,15 +859,10 @@ class SparkApi(Api):
   def describe_table(self, notebook, snippet, database=None, table=None):
     api = self.get_api()
 
-    stored_session_info = self._get_session_info_from_user()
-    if stored_session_info and self._check_session(stored_session_info):
-      session = stored_session_info
-    else:
-      session = self.create_session(snippet.get('type'))
+    session = self._get_ready_session(snippet.get('type'))
 
     describe_query = 'DESCRIBE FORMATTED %(db)s.%(tb)s' % {'db': database, 'tb': table}
-    table_execute = self._execute(api, session, snippet.get('type'), describe_query)
-    table_result = self._check_status_and_fetch_result(api, session, table_execute)
+    table_result = self._get_metadata(api, session, snippet.get('type'), describe_query)
 
     tb = SparkDescribeTable(table_result)
     tb.handle_describe_format()
@@ -649,15 +887,10 @@ class SparkApi(Api):
     response = {'status': 0}
     api = self.get_api()
 
-    stored_session_info = self._get_session_info_from_user()
-    if stored_session_info and self._check_session(stored_session_info):
-      session = stored_session_info
-    else:
-      session = self.create_session(snippet.get('type'))
+    session = self._get_ready_session(snippet.get('type'))
 
     describe_query = 'DESCRIBE DATABASE EXTENDED %(db)s' % {'db': database}
-    db_execute = self._execute(api, session, snippet.get('type'), describe_query)
-    db_result = self._check_status_and_fetch_result(api, session, db_execute)
+    db_result = self._get_metadata(api, session, snippet.get('type'), describe_query)
 
     for d in db_result.get('data', []):
       if d[0] in ('Database Name', 'Namespace Name'):
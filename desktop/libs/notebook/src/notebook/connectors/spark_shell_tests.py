@@ -20,10 +20,11 @@ import sys
 
 from builtins import object
 
+from desktop.lib.cache_util import get_shared_cache
 from desktop.lib.django_test_util import make_logged_in_client
 from useradmin.models import User
 
-from notebook.connectors.spark_shell import SparkApi
+from notebook.connectors.spark_shell import SparkApi, SESSION_POOL, POOL_CLAIM_KEY, POOL_KEY
 
 if sys.version_info[0] > 2:
   from unittest.mock import patch, Mock
@@ -502,6 +503,187 @@ class TestSparkApi(object):
       'status': 0}
 
 
+  def test_create_session_does_not_wait(self):
+    with patch('notebook.connectors.spark_shell.get_spark_api') as get_spark_api:
+      get_spark_api.return_value = Mock(
+        create_session=Mock(
+          return_value={'id': '2', 'state': 'starting'}
+        ),
+      )
+
+      session = self.api.create_session(lang='pyspark')
+
+      assert session['id'] == '2'
+      assert session['state'] == 'starting'
+      assert not get_spark_api.return_value.get_session.called
+
+
+  @patch('notebook.connectors.spark_shell.has_shared_cache', Mock(return_value=True))
+  def test_execute_while_session_starting(self):
+    with patch('notebook.connectors.spark_shell._get_snippet_session') as _get_snippet_session:
+      with patch('notebook.connectors.spark_shell.get_spark_api') as get_spark_api:
+        session = {'id': '1', 'type': 'pyspark', 'state': 'starting'}
+        _get_snippet_session.return_value = session
+        get_spark_api.return_value = Mock(
+          get_session=Mock(
+            return_value={'id': '1', 'state': 'starting'}
+          ),
+          submit_statement=Mock(
+            return_value={'id': 'statement_id'}
+          ),
+          fetch_data=Mock(
+            return_value={'state': 'running'}
+          )
+        )
+
+        handle = self.api.execute(Mock(), {'statement': 'sc.parallelize(range(10)).count()', 'type': 'pyspark'})
+
+        assert handle['id'] is None
+        assert not get_spark_api.return_value.submit_statement.called
+
+        snippet = {'result': {'handle': handle}}
+        self.api._handle_session_health_check = Mock(return_value=session)
+        assert self.api.check_status(Mock(), snippet) == {'status': 'starting'}
+        assert not get_spark_api.return_value.submit_statement.called
+
+        # The statement is submitted once the session is idle
+        get_spark_api.return_value.get_session.return_value = {'id': '1', 'state': 'idle'}
+        assert self.api.check_status(Mock(), snippet) == {'status': 'running'}
+        assert self.api.check_status(Mock(), snippet) == {'status': 'running'}
+        get_spark_api.return_value.submit_statement.assert_called_once_with('1', 'sc.parallelize(range(10)).count()')
+        get_spark_api.return_value.fetch_data.assert_called_with('1', 'statement_id')
+
+
+  @patch('notebook.connectors.spark_shell.has_shared_cache', Mock(return_value=False))
+  def test_execute_while_session_starting_without_shared_cache(self):
+    with patch('notebook.connectors.spark_shell._get_snippet_session') as _get_snippet_session:
+      with patch('notebook.connectors.spark_shell.get_spark_api') as get_spark_api:
+        with patch('notebook.connectors.spark_shell.time.sleep'):
+          _get_snippet_session.return_value = {'id': '1', 'type': 'pyspark', 'state': 'starting'}
+          get_spark_api.return_value = Mock(
+            get_session=Mock(
+              side_effect=[{'id': '1', 'state': 'starting'}, {'id': '1', 'state': 'starting'}, {'id': '1', 'state': 'idle'}]
+            ),
+            submit_statement=Mock(
+              return_value={'id': 'statement_id'}
+            )
+          )
+
+          # The pending statement could not be found by the status checks served by the other Hue processes
+          handle = self.api.execute(Mock(), {'statement': 'sc.parallelize(range(10)).count()', 'type': 'pyspark'})
+
+          assert handle['id'] == 'statement_id'
+          assert 'pending_id' not in handle
+          get_spark_api.return_value.submit_statement.assert_called_once_with('1', 'sc.parallelize(range(10)).count()')
+
+
+  def test_create_session_from_pool(self):
+    with patch('notebook.connectors.spark_shell.get_spark_api') as get_spark_api:
+      with patch('notebook.connectors.spark_shell.SESSION_POOL.is_enabled') as is_enabled:
+        with patch('notebook.tasks.top_up_livy_session_pool') as top_up_livy_session_pool:
+          is_enabled.return_value = True
+          get_spark_api.return_value = Mock(
+            create_session=Mock(
+              return_value={'id': '3', 'state': 'starting'}
+            ),
+            get_session=Mock(
+              return_value={'id': '2', 'state': 'idle'}
+            )
+          )
+          props = SparkApi.get_livy_props('pyspark')
+          key = SESSION_POOL.get_profile_key(self.user.username, self.interpreter, props)
+          get_shared_cache().set(POOL_KEY % key, ['2'])
+          self.api._remove_session_info_from_user()
+
+          session = self.api.create_session(lang='pyspark')
+
+          assert session['id'] == '2'
+          assert session['state'] == 'idle'
+          assert not get_spark_api.return_value.create_session.called
+          assert top_up_livy_session_pool.apply_async.called
+          top_ups = top_up_livy_session_pool.apply_async.call_count
+
+          # Pool is empty
+          self.api._remove_session_info_from_user()
+          session = self.api.create_session(lang='pyspark')
+
+          assert session['id'] == '3'
+          assert top_ups == top_up_livy_session_pool.apply_async.call_count  # Left to the periodic top up
+          get_shared_cache().delete(POOL_CLAIM_KEY % '2')
+
+
+  def test_check_status_and_fetch_result_backoff(self):
+    with patch('notebook.connectors.spark_shell.time.sleep') as sleep:
+      api = Mock(
+        fetch_data=Mock(
+          side_effect=[{'state': 'running'}] * 8 + [{'state': 'available'}]
+        )
+      )
+      self.api._fetch_result = Mock(return_value={'data': [['default']]})
+
+      result = self.api._check_status_and_fetch_result(api, {'id': '1'}, {'id': '2'})
+
+      assert result == {'data': [['default']]}
+      assert api.fetch_data.call_count == 9
+      intervals = [call[0][0] for call in sleep.call_args_list]
+      assert len(intervals) == 8
+      assert intervals[0] <= 0.05
+      assert all(0 < interval <= 1.0 for interval in intervals)
+      assert intervals[-1] > intervals[0]
+
+
+  @patch('notebook.connectors.spark_shell.has_shared_cache', Mock(return_value=True))
+  def test_autocomplete_metadata_cache(self):
+    snippet = {'type': 'sparksql', 'statement': 'DROP TABLE db.t'}
+    with patch('notebook.connectors.spark_shell.get_spark_api'), patch('notebook.connectors.spark_shell._get_snippet_session'):
+      self.api._get_ready_session = Mock(return_value={'id': '1'})
+      self.api._close_unused_sessions = Mock()
+      self.api._execute = Mock(return_value={'id': '2'})
+      self.api._check_status_and_fetch_result = Mock(
+        return_value={'data': [['db', 't', False]]}
+      )
+      self.api._invalidate_metadata()
+
+      assert self.api.autocomplete(snippet, database='db') == {'tables_meta': ['t']}
+      assert self.api.autocomplete(snippet, database='db') == {'tables_meta': ['t']}
+      self.api._execute.assert_called_once_with(self.api.get_api(), {'id': '1'}, 'sparksql', 'SHOW TABLES IN db')
+
+      # Cached per statement
+      self.api.autocomplete(snippet, database='db2')
+      self.api.autocomplete(snippet, database='db')
+      assert self.api._execute.call_count == 2
+
+      # Not shared across sessions
+      self.api._get_ready_session = Mock(return_value={'id': '3'})
+      self.api.autocomplete(snippet, database='db')
+      assert self.api._execute.call_count == 3
+
+      # Dropped by a DDL statement
+      self.api.execute(Mock(), snippet)
+      self.api.autocomplete(snippet, database='db')
+      assert self.api._execute.call_count == 5
+
+      # Dropped by a refresh of the assist
+      self.api.autocomplete(dict(snippet, refreshCache=True), database='db')
+      assert self.api._execute.call_count == 6
+
+
+  @patch('notebook.connectors.spark_shell.has_shared_cache', Mock(return_value=False))
+  def test_autocomplete_metadata_not_cached_without_shared_cache(self):
+    snippet = {'type': 'sparksql', 'statement': 'SHOW TABLES'}
+    with patch('notebook.connectors.spark_shell.get_spark_api'):
+      self.api._get_ready_session = Mock(return_value={'id': '1'})
+      self.api._close_unused_sessions = Mock()
+      self.api._execute = Mock(return_value={'id': '2'})
+      self.api._check_status_and_fetch_result = Mock(
+        return_value={'data': [['db', 't', False]]}
+      )
+
+      self.api.autocomplete(snippet, database='db')
+      self.api.autocomplete(snippet, database='db')
+      assert self.api._execute.call_count == 2
+
+
   def test_get_jobs(self):
     local_jobs = [
       {'url': u'http://172.21.1.246:4040/jobs/job/?id=0', 'name': u'0'}
@@ -37,9 +37,6 @@ Parameters are not saved at any time in the Hue database. The are currently not
 The clients serves these parameters each time a query is sent in case the previously created engine is not there.
 
 Note: create_session() could create the engine object (without its credentials) like in the other interpreters.
-Note: its currently has one engine per user. This should be changed to one engine per URL but then it makes it complicated to close
-all the queries of a user. It could also have an engine per Editor session and an engine for the managed queries (where Hue guarantees
-to properly close queries).
 
 Engines and connections
 -----------------------
@@ -48,30 +45,53 @@ SqlAlchemy documentation is pretty good: https://docs.sqlalchemy.org/en/13/core/
 Each URL is mapped to one engine and should be created once per process.
 Each query statement grabs a connection from the engine and will return it after its close().
 Disposing the engine closes all its connections.
+
+Engines are shared by all the users of a connector, unless its URL contains user parameters or it has impersonation,
+in which case there is one engine per user. The ENGINES registry bounds their number, disposes the idle ones and caps
+the number of connections opened per connector.
+
+The assist metadata (databases, tables, columns, keys) is cached for SQLALCHEMY_METADATA_CACHE_TTL seconds per engine and
+invalidated for the whole connector when a DDL statement is executed through the editor or the assist is refreshed. It is
+only cached when the Hue processes share a cache, which holds the invalidation version.
+
+Statements returning rows can be fetched from any Hue worker: their handle is also saved in a shared cache and
+a worker not owning the cursor re-executes the read-only statement and skips the rows already fetched.
 '''
 from future import standard_library
 standard_library.install_aliases()
 
 from builtins import next, object
 import datetime
+import hashlib
 import json
 import logging
+import os
 import uuid
 import re
+import socket
 import sys
 import textwrap
+import threading
+import time
+
+from collections import OrderedDict
 
 from string import Template
 
-from django.core.cache import caches
-from sqlalchemy import create_engine, inspect, Table, MetaData
-from sqlalchemy.exc import OperationalError, UnsupportedCompilationError, CompileError, ProgrammingError, NoSuchTableError
+from django.core.cache import cache
+from sqlalchemy import create_engine, inspect, text, Table, MetaData, Float, Numeric, String
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.exc import ArgumentError, OperationalError, UnsupportedCompilationError, CompileError, ProgrammingError, NoSuchTableError
 
 from desktop.lib import export_csvxls
+from desktop.lib.cache_util import get_shared_cache, has_shared_cache
 from desktop.lib.i18n import force_unicode
+from desktop.lib.metrics import global_registry
 from beeswax import data_export
 from librdbms.server import dbms
 
+from notebook.conf import SQLALCHEMY_ENGINE_IDLE_TIMEOUT, SQLALCHEMY_MAX_CONNECTIONS, SQLALCHEMY_MAX_ENGINES, \
+    SQLALCHEMY_METADATA_CACHE_TTL
 from notebook.connectors.base import Api, QueryError, QueryExpired, _get_snippet_name, AuthenticationRequired
 from notebook.models import escape_rows
 
@@ -85,14 +105,161 @@ else:
   from urllib import quote_plus as urllib_quote_plus, urlparse as urllib_urlparse, parse_qs as urllib_parse_qs
   from cStringIO import StringIO
 
-ENGINES = {}
 CONNECTIONS = {}
 ENGINE_KEY = '%(username)s-%(connector_name)s'
+SHARED_ENGINE_KEY = '%(connector_name)s'
+HANDLE_KEY = 'sqlalchemy-handle-%(guid)s'
+HANDLE_TTL = 60 * 60 * 24
 URL_PATTERN = '(?P<driver_name>.+?://)(?P<host>[^:/ ]+):(?P<port>[0-9]*).*'
+# Statements re-executed by the other workers to fetch their rows. Not WITH, as a CTE can modify data, e.g. in PostgreSQL.
+READ_ONLY_STATEMENT_RE = re.compile(r'^\s*(SELECT|SHOW|DESCRIBE|DESC|VALUES)\b', re.IGNORECASE)
+DDL_STATEMENT_RE = re.compile(r'^\s*(CREATE|DROP|ALTER|RENAME|TRUNCATE|COMMENT)\b', re.IGNORECASE)
+ASSIST_CACHE_KEY = 'sqlalchemy-assist-%(engine_key)s-%(version)s'
+ASSIST_CACHE_VERSION_KEY = 'sqlalchemy-assist-version-%(connector_name)s'
+# Dialects listing the columns of all the tables of a schema in one information_schema query, with their column comment
+INFORMATION_SCHEMA_DIALECTS = {
+  'postgresql': "pg_catalog.col_description((quote_ident(table_schema) || '.' || quote_ident(table_name))::regclass, ordinal_position)",
+  'mysql': 'column_comment',
+}
+SKIP_FETCH_SIZE = 1000
 
 LOG = logging.getLogger()
 
 
+class EngineRegistry(object):
+  """
+  Process wide cache of the SqlAlchemy engines.
+
+  Its size is bounded and the least recently used or idle engines get disposed, which closes their pooled connections.
+  Engines with open connections are never evicted. It also caps the number of connections opened per connector.
+  """
+
+  def __init__(self):
+    self._engines = OrderedDict()  # engine key -> {'engine', 'last_used', 'connections'}
+    self._connector_connections = {}
+    self._lock = threading.Lock()
+    self.evictions = 0
+
+  def __contains__(self, key):
+    return key in self._engines
+
+  def __len__(self):
+    return len(self._engines)
+
+  @property
+  def connections(self):
+    return sum(self._connector_connections.values())
+
+  def get(self, key, create):
+    with self._lock:
+      now = time.time()
+      entry = self._engines.get(key)
+      if entry is None:
+        entry = self._engines[key] = {'engine': create(), 'last_used': now, 'connections': 0}
+      else:
+        self._engines.move_to_end(key)
+        entry['last_used'] = now
+      to_dispose = self._evict(now, current_key=key)
+
+    for engine in to_dispose:
+      _dispose_engine(engine)
+
+    return entry['engine']
+
+  def pop(self, key, default=None):
+    with self._lock:
+      entry = self._engines.pop(key, None)
+
+    if entry is None:
+      return default
+
+    _dispose_engine(entry['engine'])
+    return entry['engine']
+
+  def acquire(self, key, connector_name):
+    max_connections = SQLALCHEMY_MAX_CONNECTIONS.get()
+
+    with self._lock:
+      opened = self._connector_connections.get(connector_name, 0)
+      if max_connections and opened >= max_connections:
+        raise QueryError(_('Too many open connections to %s (%s), please close some queries or retry later.') % (connector_name, opened))
+      self._connector_connections[connector_name] = opened + 1
+      if key in self._engines:
+        self._engines[key]['connections'] += 1
+
+  def release(self, key, connector_name):
+    with self._lock:
+      if self._connector_connections.get(connector_name):
+        self._connector_connections[connector_name] -= 1
+      if key in self._engines and self._engines[key]['connections']:
+        self._engines[key]['connections'] -= 1
+        self._engines[key]['last_used'] = time.time()
+
+  def _evict(self, now, current_key=None):
+    max_engines = SQLALCHEMY_MAX_ENGINES.get()
+    idle_timeout = SQLALCHEMY_ENGINE_IDLE_TIMEOUT.get()
+    evicted = []
+
+    for key, entry in list(self._engines.items()):  # From the least recently used
+      if entry['connections'] or key == current_key:
+        continue
+      if (idle_timeout and now - entry['last_used'] > idle_timeout) or len(self._engines) > max_engines:
+        evicted.append(self._engines.pop(key)['engine'])
+
+    self.evictions += len(evicted)
+    return evicted
+
+
+def _dispose_engine(engine):
+  try:
+    engine.dispose()
+  except Exception as e:
+    LOG.warning('Failed to dispose SqlAlchemy engine: %s' % e)
+
+
+ENGINES = EngineRegistry()
+
+global_registry().gauge_callback(
+    name='sqlalchemy.engines',
+    callback=lambda: len(ENGINES),
+    label='SqlAlchemy Engines',
+    description='Number of SqlAlchemy engines (connection pools) currently open',
+    numerator='engines',
+)
+global_registry().gauge_callback(
+    name='sqlalchemy.connections',
+    callback=lambda: ENGINES.connections,
+    label='SqlAlchemy Connections',
+    description='Number of database connections currently opened by the SqlAlchemy connectors',
+    numerator='connections',
+)
+global_registry().gauge_callback(
+    name='sqlalchemy.engine-evictions',
+    callback=lambda: ENGINES.evictions,
+    label='SqlAlchemy Engine Evictions',
+    description='Number of SqlAlchemy engines disposed because of their idleness or the registry size',
+    numerator='engines',
+)
+
+
+assist_cache_hits = global_registry().counter(
+    name='sqlalchemy.assist.cache-hits',
+    label='SqlAlchemy Assist Cache Hits',
+    description='Number of assist metadata requests of the SqlAlchemy connectors served from the cache',
+    numerator='requests',
+)
+assist_cache_misses = global_registry().counter(
+    name='sqlalchemy.assist.cache-misses',
+    label='SqlAlchemy Assist Cache Misses',
+    description='Number of assist metadata requests of the SqlAlchemy connectors sent to the database',
+    numerator='requests',
+)
+
+
+def _worker_id():
+  return '%s:%s' % (socket.gethostname(), os.getpid())
+
+
 def query_error_handler(func):
   def decorator(*args, **kwargs):
     try:
@@ -129,18 +296,35 @@ class SqlAlchemyApi(Api):
       self.backticks = '"' if re.match('^(postgresql://|awsathena|elasticsearch|phoenix|trino)', self.options.get('url', '')) else '`'
 
   def _get_engine_key(self):
+    if self._is_engine_shared():
+      return SHARED_ENGINE_KEY % {'connector_name': self.interpreter['name']}
+
     return ENGINE_KEY % {
       'username': self.user.username,
       'connector_name': self.interpreter['name']
     }
 
+  def _is_engine_shared(self):
+    return '${' not in self.options.get('url', '') and not self.options.get('has_impersonation')
+
   def _get_engine(self):
-    engine_key = self._get_engine_key()
+    return ENGINES.get(self._get_engine_key(), self._create_engine)
 
-    if engine_key not in ENGINES:
-      ENGINES[engine_key] = self._create_engine()
+  def _get_assist_cache_key(self):
+    # A DDL statement executed through another Hue process would not invalidate the metadata cached by this one
+    if not SQLALCHEMY_METADATA_CACHE_TTL.get() or not has_shared_cache():
+      return None
 
-    return ENGINES[engine_key]
+    return ASSIST_CACHE_KEY % {
+      'engine_key': self._get_engine_key(),
+      'version': get_shared_cache().get(ASSIST_CACHE_VERSION_KEY % {'connector_name': self.interpreter['name']}, 0)
+    }
+
+  def _invalidate_assist_cache(self):
+    version_key = ASSIST_CACHE_VERSION_KEY % {'connector_name': self.interpreter['name']}
+    shared_cache = get_shared_cache()
+    if not shared_cache.add(version_key, 1, None):
+      shared_cache.incr(version_key)
 
   def _create_engine(self):
     if '${' in self.options['url']:  # URL parameters substitution
@@ -225,18 +409,112 @@ class SqlAlchemyApi(Api):
 
 
   def _create_connection(self, engine):
+    engine_key = self._get_engine_key()
+    ENGINES.acquire(engine_key, self.interpreter['name'])
+
     connection = None
     try:
       connection = engine.connect()
     except Exception as e:
-      engine_key = self._get_engine_key()
-      ENGINES.pop(engine_key, None)
+      ENGINES.release(engine_key, self.interpreter['name'])
+      if not self._is_engine_shared():  # e.g. recreated with the new credentials of the user
+        ENGINES.pop(engine_key, None)
 
       raise AuthenticationRequired(message='Could not establish connection to datasource: %s' % e)
 
     return connection
 
 
+  def _close_connection(self, connection):
+    try:
+      connection.close()
+    finally:
+      ENGINES.release(self._get_engine_key(), self.interpreter['name'])
+
+
+  def _execute_statement(self, connection, statement, database=None):
+    if self.interpreter['dialect_properties'].get('has_use_statement') and database:
+      connection.execute(
+        'USE %(sql_identifier_quote)s%(database)s%(sql_identifier_quote)s' % {
+          'sql_identifier_quote': self.interpreter['dialect_properties']['sql_identifier_quote'],
+          'database': database,
+        }
+      )
+
+    return connection.execute(statement)
+
+
+  def _get_meta(self, result):
+    return [
+      {
+        'name': col[0] if (type(col) is tuple or type(col) is dict) else col.name if hasattr(col, 'name') else col,
+        'type': 'STRING_TYPE',
+        'comment': ''
+      }
+      for col in result.cursor.description
+    ] if result.cursor else []
+
+
+  def _save_handle(self, guid, cache, has_result_set):
+    get_shared_cache().set(HANDLE_KEY % {'guid': guid}, {
+      'worker': _worker_id(),
+      'user': self.user.username,
+      'connector_name': self.interpreter['name'],
+      'statement': cache['statement'],
+      'database': cache['database'],
+      'has_result_set': has_result_set,
+      'fetched': cache['fetched'],
+    }, HANDLE_TTL)
+
+
+  def _get_handle(self, guid):
+    handle = get_shared_cache().get(HANDLE_KEY % {'guid': guid})
+    if handle and handle['user'] == self.user.username and handle['connector_name'] == self.interpreter['name']:
+      return handle
+
+
+  def _adopt_handle(self, guid, handle=None):
+    """
+    Re-attaches a read-only statement executed by another Hue worker, by executing it again and skipping the rows
+    already fetched. Statements of the current worker not in CONNECTIONS are closed and truly expired.
+    """
+    if handle is None:
+      handle = self._get_handle(guid)
+      if not handle or handle['worker'] == _worker_id():
+        return None
+
+    LOG.info('Re-executing statement %s of worker %s after %s fetched rows' % (guid, handle['worker'], handle['fetched']))
+    engine = self._get_engine()
+    connection = self._create_connection(engine)
+    try:
+      result = self._execute_statement(connection, handle['statement'], handle['database'])
+
+      to_skip = handle['fetched']
+      while to_skip > 0:
+        rows = result.fetchmany(min(to_skip, SKIP_FETCH_SIZE))
+        if not rows:
+          break
+        to_skip -= len(rows)
+    except Exception:
+      self._close_connection(connection)
+      raise
+
+    cache = {
+      'logs': [],
+      'connection': connection,
+      'result': result,
+      'meta': self._get_meta(result),
+      'statement': handle['statement'],
+      'database': handle['database'],
+      'fetched': handle['fetched'],
+      'replayable': True,
+    }
+    CONNECTIONS[guid] = cache
+    self._save_handle(guid, cache, handle['has_result_set'])
+
+    return cache
+
+
   @query_error_handler
   def execute(self, notebook, snippet):
     guid = uuid.uuid4().hex
@@ -250,32 +528,31 @@ class SqlAlchemyApi(Api):
     current_statement = self._get_current_statement(notebook, snippet)
     statement = current_statement['statement']
 
-    if self.interpreter['dialect_properties'].get('has_use_statement') and snippet.get('database'):
-      connection.execute(
-        'USE %(sql_identifier_quote)s%(database)s%(sql_identifier_quote)s' % {
-          'sql_identifier_quote': self.interpreter['dialect_properties']['sql_identifier_quote'],
-          'database': snippet['database'],
-        }
-      )
+    try:
+      result = self._execute_statement(connection, statement, snippet.get('database'))
+    except Exception:
+      self._close_connection(connection)
+      raise
 
-    result = connection.execute(statement)
+    if DDL_STATEMENT_RE.match(statement):
+      self._invalidate_assist_cache()
 
     logs = [message for message in result.cursor.fetch_logs()] if result.cursor and hasattr(result.cursor, 'fetch_logs') else []
     cache = {
       'logs': logs,
       'connection': connection,
       'result': result,
-      'meta': [
-        {
-          'name': col[0] if (type(col) is tuple or type(col) is dict) else col.name if hasattr(col, 'name') else col,
-          'type': 'STRING_TYPE',
-          'comment': ''
-        }
-        for col in result.cursor.description
-      ] if result.cursor else []
+      'meta': self._get_meta(result),
+      'statement': statement,
+      'database': snippet.get('database'),
+      'fetched': 0,
+      'replayable': result.cursor is not None and bool(READ_ONLY_STATEMENT_RE.match(statement)),
     }
     CONNECTIONS[guid] = cache
 
+    if cache['replayable']:
+      self._save_handle(guid, cache, has_result_set=True)
+
     response = {
       'sync': False,
       'has_result_set': result.cursor != None,
@@ -305,18 +582,21 @@ class SqlAlchemyApi(Api):
 
     explanation = ''
 
-    if statement:
-      if self.options['url'].startswith('bigquery://'):
-        explanation = ''
-      else:
-        try:
-          result = connection.execute('EXPLAIN '+ statement)
-          explanation = "\n".join("{}: {},".format(k, v) for row in result for k, v in row.items())
-        except ProgrammingError:
-          pass
-        except Exception as e:
-          LOG.debug('')
-          raise e
+    try:
+      if statement:
+        if self.options['url'].startswith('bigquery://'):
+          explanation = ''
+        else:
+          try:
+            result = connection.execute('EXPLAIN '+ statement)
+            explanation = "\n".join("{}: {},".format(k, v) for row in result for k, v in row.items())
+          except ProgrammingError:
+            pass
+          except Exception as e:
+            LOG.debug('')
+            raise e
+    finally:
+      self._close_connection(connection)
     return {
       'status': 0,
       'explanation': explanation,
@@ -339,6 +619,8 @@ class SqlAlchemyApi(Api):
         response['status'] = 'available'
       else:
         response['status'] = 'success'
+    elif self._get_handle(guid):  # Executed by another worker
+      response['status'] = 'available'
     else:
       raise QueryExpired()
 
@@ -369,10 +651,24 @@ class SqlAlchemyApi(Api):
     guid = snippet['result']['handle']['guid']
     handle = CONNECTIONS.get(guid)
 
+    if handle and handle.get('replayable'):
+      shared_handle = self._get_handle(guid)
+      if shared_handle and (shared_handle['worker'] != _worker_id() or shared_handle['fetched'] != handle['fetched']):
+        # Fetched meanwhile by another worker, the cursor of this one is behind
+        del CONNECTIONS[guid]
+        self._close_connection(handle['connection'])
+        handle = self._adopt_handle(guid, shared_handle)
+    else:
+      handle = handle or self._adopt_handle(guid)
+
     if handle:
       data = handle['result'].fetchmany(rows)
       meta = handle['meta']
       self._assign_types(data, meta)
+
+      if handle.get('replayable') and data:
+        handle['fetched'] += len(data)
+        self._save_handle(guid, handle, has_result_set=True)
     else:
       raise QueryExpired()
 
@@ -427,24 +723,27 @@ class SqlAlchemyApi(Api):
       guid = snippet['result']['handle']['guid']
       connection = CONNECTIONS.get(guid)
       if connection:
-        connection['connection'].close()
         del CONNECTIONS[guid]
+        self._close_connection(connection['connection'])
+      get_shared_cache().delete(HANDLE_KEY % {'guid': guid})
       result['status'] = 0
     finally:
       return result
 
 
   def close_session(self, session):
-    engine = self._get_engine()
-    engine.dispose()  # ENGINE_KEY currently includes the current user
+    if not self._is_engine_shared():  # Shared engines are disposed by the registry when idle
+      ENGINES.pop(self._get_engine_key())
 
 
   @query_error_handler
   def autocomplete(self, snippet, database=None, table=None, column=None, nested=None, operation=None):
     engine = self._get_engine()
-    inspector = inspect(engine)
 
-    assist = Assist(inspector, engine, backticks=self.backticks)
+    if snippet.get('refreshCache'):
+      self._invalidate_assist_cache()
+
+    assist = Assist(None, engine, backticks=self.backticks, api=self, cache_key=self._get_assist_cache_key())
     response = {'status': -1}
 
     if operation == 'functions':
@@ -490,9 +789,8 @@ class SqlAlchemyApi(Api):
   @query_error_handler
   def get_sample_data(self, snippet, database=None, table=None, column=None, is_async=False, operation=None):
     engine = self._get_engine()
-    inspector = inspect(engine)
 
-    assist = Assist(inspector, engine, backticks=self.backticks, api=self)
+    assist = Assist(None, engine, backticks=self.backticks, api=self, cache_key=self._get_assist_cache_key())
     response = {'status': -1, 'result': {}}
 
     metadata, sample_data = assist.get_sample_data(database, table, column=column, operation=operation)
@@ -547,20 +845,55 @@ class SqlAlchemyApi(Api):
 
 
 class Assist(object):
+  """
+  Lists the metadata of a database via the SqlAlchemy inspector.
+
+  When a cache_key is provided the results are cached for SQLALCHEMY_METADATA_CACHE_TTL seconds, the inspector is only
+  created on a cache miss and the columns of all the tables of a database are fetched at once when the dialect supports it.
+  """
 
-  def __init__(self, db, engine, backticks, api=None):
-    self.db = db
+  def __init__(self, db, engine, backticks, api=None, cache_key=None):
+    self._db = db
     self.engine = engine
     self.backticks = backticks
     self.api = api
+    self.cache_key = cache_key
+
+  @property
+  def db(self):
+    if self._db is None:
+      self._db = inspect(self.engine)
+    return self._db
+
+  def _cached(self, key, fetch):
+    if not self.cache_key:
+      return fetch()
+
+    cache_key = '%s-%s' % (self.cache_key, hashlib.md5(json.dumps(key).encode('utf-8')).hexdigest())
+    value = cache.get(cache_key)
+
+    if value is None:
+      assist_cache_misses.inc()
+      value = fetch()
+      try:
+        cache.set(cache_key, value, SQLALCHEMY_METADATA_CACHE_TTL.get())
+      except Exception as e:  # e.g. dialect types that can't be pickled
+        LOG.debug('Could not cache the assist metadata %s: %s' % (key, e))
+    else:
+      assist_cache_hits.inc()
+
+    return value
 
   def get_databases(self):
-    return self.db.get_schema_names()
+    return self._cached(['databases'], self.db.get_schema_names)
 
   def get_table_names(self, database, table_names=[]):
-    return self.db.get_table_names(database)
+    return self._cached(['tables', database], lambda: self.db.get_table_names(database))
 
   def get_view_names(self, database, view_names=[]):
+    return self._cached(['views', database], lambda: self._get_view_names(database))
+
+  def _get_view_names(self, database):
     try:
       return self.db.get_view_names(database)
     except NotImplementedError:
@@ -570,11 +903,92 @@ class Assist(object):
     return self.get_table_names(database) + self.get_view_names(database)
 
   def get_columns(self, database, table):
+    if self.cache_key and self._can_prefetch_columns():
+      columns = self._cached(['database_columns', database], lambda: self._get_database_columns(database))
+      if table in columns:
+        return columns[table]
+
+    return self._cached(['columns', database, table], lambda: self._get_columns(database, table))
+
+  def _get_columns(self, database, table):
     try:
       return self.db.get_columns(table, database)
     except NoSuchTableError:
       return []
 
+  def _can_prefetch_columns(self):
+    if hasattr(Inspector, 'get_multi_columns'):
+      return True
+    return self.engine.dialect.name in INFORMATION_SCHEMA_DIALECTS and self.api is not None
+
+  def _get_database_columns(self, database):
+    """
+    Returns the columns of all the tables and views of the database, keyed by table name. The tables with a type unknown to
+    the dialect are left out, and listed per table by the inspector.
+    """
+    if hasattr(Inspector, 'get_multi_columns'):  # SqlAlchemy 2
+      return dict((table, columns) for (schema, table), columns in self.db.get_multi_columns(schema=database).items())
+
+    statement = text(
+      'SELECT table_name, column_name, data_type, character_maximum_length, numeric_precision, numeric_scale, is_nullable, '
+      'column_default, %(comment)s '
+      'FROM information_schema.columns '
+      'WHERE table_schema = :database '
+      'ORDER BY table_name, ordinal_position' % {'comment': INFORMATION_SCHEMA_DIALECTS[self.engine.dialect.name]}
+    )
+    columns = {}
+    unknown_tables = set()
+
+    try:
+      connection = self.api._create_connection(self.engine)  # Counted in the connections of the connector
+      try:
+        rows = connection.execute(statement, database=database).fetchall()
+      finally:
+        self.api._close_connection(connection)
+    except Exception as e:
+      LOG.warning('Could not list the columns of %s from its information schema, listing them per table: %s' % (database, e))
+      return {}
+
+    for table_name, column_name, data_type, length, precision, scale, is_nullable, column_default, comment in rows:
+      column_type = self._get_column_type(data_type, length, precision, scale)
+      if column_type is None:
+        unknown_tables.add(table_name)
+      columns.setdefault(table_name, []).append({
+        'name': column_name,
+        'type': column_type,
+        'nullable': is_nullable == 'YES',
+        'default': column_default,
+        'comment': comment or None,
+      })
+
+    for table_name in unknown_tables:
+      del columns[table_name]
+
+    return columns
+
+  def _get_column_type(self, data_type, length, precision, scale):
+    """Returns the type of the dialect of an information schema column, like the inspector does, or None if unknown."""
+    type_class = self.engine.dialect.ischema_names.get(data_type.lower())
+    if type_class is None:
+      return None
+
+    if issubclass(type_class, String) and length:
+      args = {'length': length}
+    elif issubclass(type_class, Float) and precision:
+      args = {'precision': precision}
+    elif issubclass(type_class, Numeric) and precision:
+      args = {'precision': precision, 'scale': scale}
+    else:
+      args = {}
+
+    for kwargs in (args, {}):  # e.g. the floats of MySQL need both a precision and a scale
+      try:
+        return type_class(**kwargs)
+      except (TypeError, ArgumentError) as e:
+        LOG.debug('Could not create the type %s with %s: %s' % (data_type, kwargs, e))
+
+    return None
+
   def get_sample_data(self, database, table, column=None, operation=None):
     if operation == 'hello':
       statement = "SELECT 'Hello World!'"
@@ -597,9 +1011,12 @@ class Assist(object):
       result = connection.execute(statement)
       return result.cursor.description, result.fetchall()
     finally:
-      connection.close()
+      self.api._close_connection(connection)
 
   def get_keys(self, database, table):
+    return self._cached(['keys', database, table], lambda: self._get_keys(database, table))
+
+  def _get_keys(self, database, table):
     meta = MetaData()
     try:
       metaTable = Table(table, meta, schema=database, autoload=True, autoload_with=self.engine)
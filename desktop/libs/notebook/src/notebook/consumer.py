@@ -26,6 +26,7 @@ LOG = logging.getLogger()
 
 if has_channels():
   from asgiref.sync import async_to_sync
+  from channels.db import database_sync_to_async
   from channels.generic.websocket import AsyncWebsocketConsumer
   from channels.layers import get_channel_layer
 
@@ -46,6 +47,19 @@ if has_channels():
       )
 
 
+    async def disconnect(self, code):
+      await database_sync_to_async(_unwatch)(self.channel_name)
+
+
+    async def receive(self, text_data=None, bytes_data=None):
+      message = json.loads(text_data or '{}')
+
+      if message.get('type') == 'watch':  # e.g. after a reconnection or from another editor of the same query
+        await database_sync_to_async(_watch)(self.scope['user'], message['operationId'], self.channel_name)
+      elif message.get('type') == 'unwatch':
+        await database_sync_to_async(_unwatch)(self.channel_name, message.get('operationId'))
+
+
     async def task_progress(self, event):
       await self.send(
         text_data=json.dumps({
@@ -71,3 +85,18 @@ if has_channels():
         "data": message_data,
       }
     )
+
+
+  def _watch(user, operation_id, channel_name):
+    from desktop.models import Document2
+    from notebook.connectors.base import Notebook
+    from notebook.watcher import get_watcher
+
+    notebook = Notebook(document=Document2.objects.get_by_uuid(user=user, uuid=operation_id)).get_data()
+    get_watcher().watch(user, notebook, notebook['snippets'][0], channel_name, key=operation_id)
+
+
+  def _unwatch(channel_name, operation_id=None):
+    from notebook.watcher import get_watcher
+
+    get_watcher().unwatch(channel_name, key=operation_id)
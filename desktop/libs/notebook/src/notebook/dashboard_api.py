@@ -20,6 +20,7 @@ from __future__ import print_function
 from builtins import next
 from builtins import zip
 from builtins import object
+import hashlib
 import logging
 import math
 import json
@@ -30,19 +31,53 @@ import time
 from datetime import datetime, timedelta
 from itertools import groupby
 
+import sqlparse
+
 from django.utils.html import escape
 
 from notebook.models import make_notebook
 from notebook.connectors.base import get_api, OperationTimeout, Notebook
 
+from dashboard.conf import QUERY_CACHE_SHARED, QUERY_CACHE_TTL
 from dashboard.dashboard_api import DashboardApi
 from dashboard.models import Collection2, augment_response
+from desktop.lib.cache_util import get_shared_cache, poll
+from desktop.lib.metrics import global_registry
 from desktop.models import Document2
 
 
 LOG = logging.getLogger()
 
 LIMIT = 100
+QUERY_CACHE_KEY = 'dashboard:query:%s'
+SYNC_EXECUTE_TIMEOUT = 20
+SINGLE_FLIGHT_TIMEOUT = 20
+
+
+query_cache_hits = global_registry().counter(
+    name='dashboard.query-cache.hits',
+    label='Dashboard Query Cache Hits',
+    description='Number of SQL dashboard widget queries served from the result cache',
+    numerator='queries',
+)
+query_cache_misses = global_registry().counter(
+    name='dashboard.query-cache.misses',
+    label='Dashboard Query Cache Misses',
+    description='Number of SQL dashboard widget queries sent to the database',
+    numerator='queries',
+)
+query_cache_saved_time = global_registry().counter(
+    name='dashboard.query-cache.saved-time',
+    label='Dashboard Query Cache Saved Time',
+    description='Execution time of the queries served from the result cache',
+    numerator='milliseconds',
+)
+
+
+def release_single_flight(cache_key):
+  '''Lets the other viewers execute the statement of a widget, e.g. when its async query failed or was cancelled.'''
+  if cache_key.startswith(QUERY_CACHE_KEY % ''):
+    get_shared_cache().delete_many([cache_key + ':running', cache_key + ':started'])
 
 
 class MockRequest(object):
@@ -64,6 +99,41 @@ class SQLDashboardApi(DashboardApi):
     if query['qs'] == [{'q': '_root_:*'}]:
       return {'response': {'numFound': 0}}
 
+    sql, database, result_properties = self._get_sql(dashboard, query, facet)
+
+    cache_key = self._get_cache_key(sql, database, dashboard['template']['rows'])
+    result = self._get_cached_result(cache_key)
+    if result is not None:
+      return {'cached': True, 'result': self._convert_result(result, dashboard, facet, query)}
+
+    editor = make_notebook(
+        name='Execute and watch',
+        editor_type=dashboard['engine'],
+        statement=sql,
+        database=database,
+        status='ready-execute',
+        skip_historify=True,
+        result_properties=result_properties
+    )
+
+    try:
+      response = editor.execute(MockRequest(self.user, self.cluster))
+    except Exception:
+      self._release_cached_result(cache_key)
+      raise
+
+    if 'handle' in response and response['handle'].get('sync'):
+      result = self._set_cached_result(cache_key, response['result'])
+      response['result'] = self._convert_result(result, dashboard, facet, query)
+    elif 'handle' in response and cache_key is not None:
+      # The other viewers wait until fetch_result caches the result, or check_status or the cancel release them
+      response['handle']['single_flight_key'] = cache_key
+    else:
+      self._release_cached_result(cache_key)
+
+    return response
+
+  def _get_sql(self, dashboard, query, facet=None):
     filters = [q['q'] for q in query['qs'] if q['q']]
     filters.extend(self._get_fq(dashboard, query, facet))
     result_properties = {}
@@ -200,22 +270,7 @@ class SQLDashboardApi(DashboardApi):
           'limit': 'LIMIT %s' % dashboard['template']['rows'] or LIMIT
       }
 
-    editor = make_notebook(
-        name='Execute and watch',
-        editor_type=dashboard['engine'],
-        statement=sql,
-        database=database,
-        status='ready-execute',
-        skip_historify=True,
-        result_properties=result_properties
-    )
-
-    response = editor.execute(MockRequest(self.user, self.cluster))
-
-    if 'handle' in response and response['handle'].get('sync'):
-      response['result'] = self._convert_result(response['result'], dashboard, facet, query)
-
-    return response
+    return sql, database, result_properties
 
   def _supports_count_over(self):
     return True
@@ -233,6 +288,10 @@ class SQLDashboardApi(DashboardApi):
         start_over=start_over
     )
 
+    if QUERY_CACHE_TTL.get() > 0:
+      sql, database, _ = self._get_sql(dashboard, query, facet)
+      result = self._set_cached_result(self._get_cache_key(sql, database, dashboard['template']['rows']), result)
+
     return self._convert_result(result, dashboard, facet, query)
 
 
@@ -363,6 +422,11 @@ class SQLDashboardApi(DashboardApi):
     }
 
   def _sync_execute(self, sql, database):
+    cache_key = self._get_cache_key(sql, database, 10)
+    result = self._get_cached_result(cache_key)
+    if result is not None:
+      return result
+
     editor = make_notebook(
         name='Execute and watch',
         editor_type=self.engine,
@@ -375,41 +439,109 @@ class SQLDashboardApi(DashboardApi):
     request = MockRequest(self.user, self.cluster)
     mock_notebook = {}
     snippet = {'type': self.engine}
-    response = editor.execute(request)
 
+    try:
+      response = editor.execute(request)
 
-    if 'handle' in response:
-      snippet['result'] = response
+      if 'handle' in response:
+        snippet['result'] = response
 
-      if response['handle'].get('sync'):
-        result = response['result']
-      else:
-        timeout_sec = 20 # To move to Notebook API
-        sleep_interval = 0.5
-        curr = time.time()
-        end = curr + timeout_sec
-
-        api = get_api(request, snippet)
-
-        while curr <= end:
-          status = api.check_status(mock_notebook, snippet)
-          if status['status'] == 'available':
-            result = api.fetch_result(mock_notebook, snippet, rows=10, start_over=True)
-            api.close_statement(mock_notebook, snippet)
+        if response['handle'].get('sync'):
+          result = response['result']
+        else:
+          api = get_api(request, snippet)
+
+          for _ in poll(SYNC_EXECUTE_TIMEOUT):
+            status = api.check_status(mock_notebook, snippet)
+            if status['status'] == 'available':
+              result = api.fetch_result(mock_notebook, snippet, rows=10, start_over=True)
+              api.close_statement(mock_notebook, snippet)
+              break
+          else:
+            try:
+              api.cancel_operation(snippet)
+            except Exception as e:
+              LOG.warning("Failed to cancel query: %s" % e)
+              api.close_statement(mock_notebook, snippet)
+            raise OperationTimeout('Query did not finish in %s seconds' % SYNC_EXECUTE_TIMEOUT)
+
+        result = self._set_cached_result(cache_key, result)
+    except Exception:
+      self._release_cached_result(cache_key)
+      raise
+
+    return result
+
+  def _get_cache_key(self, sql, database, rows):
+    '''
+    Statements are compared without their formatting and comments. The key changes every QUERY_CACHE_TTL seconds, so
+    that a cached result is never older than the TTL, even for statements relative to now().
+    '''
+    ttl = QUERY_CACHE_TTL.get()
+    if ttl <= 0:
+      return None
+
+    statement = ' '.join(sqlparse.format(sql, keyword_case='upper', strip_comments=True).split())
+    key = json.dumps([
+      self.engine,
+      self.cluster,
+      database,
+      rows,
+      int(time.time() // ttl),
+      None if QUERY_CACHE_SHARED.get() else self.user.username,
+      statement
+    ])
+
+    return QUERY_CACHE_KEY % hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+  def _get_cached_result(self, cache_key):
+    '''
+    Returns the cached result of the statement, or None if the caller should execute it. When the same statement is already
+    running for another widget or user, waits for its result instead of running it a second time.
+    '''
+    if cache_key is None:
+      return None
+
+    cache = get_shared_cache()
+    entry = cache.get(cache_key)
+
+    if entry is None:
+      now = time.time()
+      cache.add(cache_key + ':started', now, timeout=SINGLE_FLIGHT_TIMEOUT * 10)
+      if not cache.add(cache_key + ':running', now, timeout=SINGLE_FLIGHT_TIMEOUT):
+        for _ in poll(SINGLE_FLIGHT_TIMEOUT):
+          entry = cache.get(cache_key)
+          if entry is not None or cache.get(cache_key + ':running') is None:
             break
-          time.sleep(sleep_interval)
-          curr = time.time()
 
-        if curr > end:
-          try:
-            api.cancel_operation(snippet)
-          except Exception as e:
-            LOG.warning("Failed to cancel query: %s" % e)
-            api.close_statement(mock_notebook, snippet)
-          raise OperationTimeout(e)
+    if entry is None:
+      query_cache_misses.inc()
+      return None
+
+    query_cache_hits.inc()
+    query_cache_saved_time.inc(int(entry['duration'] * 1000))
+    return entry['result']
+
+  def _set_cached_result(self, cache_key, result):
+    if cache_key is None:
+      return result
+
+    result = dict(result, data=list(result['data']))
+
+    cache = get_shared_cache()
+    started = cache.get(cache_key + ':started')
+    cache.set(cache_key, {'result': result, 'duration': time.time() - started if started else 0}, timeout=QUERY_CACHE_TTL.get())
+    cache.delete_many([cache_key + ':running', cache_key + ':started'])
 
     return result
 
+  def _release_cached_result(self, cache_key):
+    '''Lets the other widgets waiting for the statement execute it, e.g. after it failed.'''
+    if cache_key is None:
+      return
+
+    release_single_flight(cache_key)
+
   def _convert_result(self, result, dashboard, facet, query):
     if not facet.get('type'):
       return self._convert_notebook_results(result, dashboard, query)
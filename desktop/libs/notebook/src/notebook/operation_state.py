@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+Compact state of the executed operations, read and updated by the status checks instead of the query history documents.
+'''
+
+from builtins import object
+import logging
+
+from desktop.lib.cache_util import get_shared_cache
+
+
+LOG = logging.getLogger()
+
+RUNNING_STATUSES = ('waiting', 'submitted', 'starting', 'running')
+STATE_TTL = 60 * 60 * 24
+
+SNIPPET_EXCLUDED_FIELDS = ('result', 'executor')  # Potentially large, only the handle of the result is needed
+
+
+def _state_key(operation_id):
+  return 'notebook:operation:%s' % operation_id
+
+
+class OperationState(object):
+  '''
+  The handle, status and result set flag of an operation, with the notebook and snippet fields needed by the connectors
+  to check its status. The status of the document is only synced when the operation finishes.
+  '''
+
+  def __init__(self, operation_id, user_id, notebook, snippet, status=None, has_result_set=None):
+    self.operation_id = operation_id
+    self.user_id = user_id
+    self.notebook = notebook
+    self.snippet = snippet
+    self.status = status
+    self.has_result_set = has_result_set
+
+  @classmethod
+  def from_notebook(cls, operation_id, user, notebook, snippet, status=None):
+    handle = (snippet.get('result') or {}).get('handle') or {}
+
+    return cls(
+      operation_id=operation_id,
+      user_id=user.id,
+      notebook=dict((key, value) for key, value in notebook.items() if key != 'snippets'),
+      snippet=dict(
+        [(key, value) for key, value in snippet.items() if key not in SNIPPET_EXCLUDED_FIELDS] + [('result', {'handle': handle})]
+      ),
+      status=status,
+      has_result_set=handle.get('has_result_set'),
+    )
+
+  @classmethod
+  def get(cls, operation_id, user):
+    '''Returns the state of the operation if it belongs to the user, None otherwise.'''
+    try:
+      data = get_shared_cache().get(_state_key(operation_id))
+    except Exception as e:
+      LOG.warning('Could not read the state of the operation %s: %s' % (operation_id, e))
+      return None
+
+    if not data or data['user_id'] != user.id:
+      return None
+
+    return cls(operation_id=operation_id, **data)
+
+  @property
+  def is_running(self):
+    return self.status is None or self.status in RUNNING_STATUSES
+
+  def save(self):
+    self.snippet['status'] = self.status
+    if self.has_result_set is not None:
+      self.snippet['result']['handle']['has_result_set'] = self.has_result_set
+
+    try:
+      get_shared_cache().set(_state_key(self.operation_id), {
+          'user_id': self.user_id,
+          'notebook': self.notebook,
+          'snippet': self.snippet,
+          'status': self.status,
+          'has_result_set': self.has_result_set,
+        },
+        timeout=STATE_TTL
+      )
+    except Exception as e:
+      LOG.warning('Could not save the state of the operation %s: %s' % (self.operation_id, e))
+
+  def delete(self):
+    try:
+      get_shared_cache().delete(_state_key(self.operation_id))
+    except Exception as e:
+      LOG.warning('Could not delete the state of the operation %s: %s' % (self.operation_id, e))
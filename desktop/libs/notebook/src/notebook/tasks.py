@@ -74,6 +74,7 @@ STATE_MAP = {
 }
 storage_info = json.loads(TASK_SERVER.RESULT_STORAGE.get())
 storage = get_storage_class(storage_info.get('backend'))(**storage_info.get('properties', {}))
+RESULT_PAGE_SIZE = 1000  # Number of rows between two entries of the result index, and per cached page
 
 
 class ExecutionWrapperCallback(object):
@@ -130,17 +131,11 @@ def download_to_file(notebook, snippet, file_format='csv', max_rows=-1, **kwargs
     )
     response = export_csvxls.create_generator(content_generator, file_format)
 
+    result_writer = ResultWriter(result_key, cache_rows=bool(TASK_SERVER.RESULT_CACHE.get()))
     with storage.open(result_key, 'wb') as f:
       for chunk in response:
-        f.write(chunk.encode('utf-8'))
-
-    if TASK_SERVER.RESULT_CACHE.get():
-      with storage.open(result_key, 'rb') as store:
-        with codecs.getreader('utf-8')(store) as text_file:
-          delimiter = ',' if sys.version_info[0] > 2 else ','.encode('utf-8')
-          csv_reader = csv.reader(text_file, delimiter=delimiter)
-          caches[CACHES_CELERY_QUERY_RESULT_KEY].set(result_key, [row for row in csv_reader], 60 * 5)
-          LOG.info('Caching results %s.' % result_key)
+        result_writer.write(f, chunk)
+    result_writer.close()
 
     meta['row_counter'] = content_generator.row_counter
     meta['truncated'] = content_generator.is_truncated
@@ -149,6 +144,90 @@ def download_to_file(notebook, snippet, file_format='csv', max_rows=-1, **kwargs
   return meta
 
 
+class ResultWriter(object):
+  """
+  Writes the CSV chunks of a result and keeps the byte offset of every RESULT_PAGE_SIZE-th row in a
+  sidecar index, so that fetch_result can seek directly to any page.
+
+  With cache_rows, the rows are also cached page by page instead of as one big list.
+  """
+
+  def __init__(self, result_key, cache_rows=False):
+    csv.field_size_limit(sys.maxsize)
+    self.result_key = result_key
+    self.cache_rows = cache_rows
+    self.headers = None
+    self.offsets = []
+    self.row_count = 0
+    self._position = 0
+    self._page = []
+
+  def write(self, f, chunk):
+    """
+    The chunks need to contain complete CSV records, which is the case of export_csvxls.create_generator().
+    """
+    for row, offset in _csv_rows_with_offsets(chunk):
+      if self.headers is None:
+        self.headers = row
+        continue
+
+      if self.row_count % RESULT_PAGE_SIZE == 0:
+        self.offsets.append(self._position + offset)
+        self._flush_page()
+      if self.cache_rows:
+        self._page.append(row)
+      self.row_count += 1
+
+    data = chunk.encode('utf-8')
+    f.write(data)
+    self._position += len(data)
+
+  def close(self):
+    self._flush_page()
+
+    if self.cache_rows:
+      caches[CACHES_CELERY_QUERY_RESULT_KEY].set(_result_headers_key(self.result_key), self.headers or [], 60 * 5)
+      LOG.info('Caching results %s.' % self.result_key)
+    else:
+      with storage.open(_result_index_key(self.result_key), 'wb') as f:
+        f.write(json.dumps({
+            'page_size': RESULT_PAGE_SIZE,
+            'offsets': self.offsets,
+            'row_count': self.row_count,
+            'size': self._position
+          }).encode('utf-8')
+        )
+
+  def _flush_page(self):
+    if self._page:
+      page_number = (self.row_count - 1) // RESULT_PAGE_SIZE
+      caches[CACHES_CELERY_QUERY_RESULT_KEY].set(_result_page_key(self.result_key, page_number), self._page, 60 * 5)
+      self._page = []
+
+
+def _csv_rows_with_offsets(text):
+  """
+  Yields the rows of some CSV text along with the offset in bytes of their first line.
+  Lines are only split on \\n so that quoted fields with line breaks stay in the same record.
+  """
+  consumed = [0]
+
+  def lines():
+    split = text.split('\n')
+    for i, line in enumerate(split):
+      if i < len(split) - 1:
+        line += '\n'
+      elif not line:
+        break
+      consumed[0] += len(line.encode('utf-8'))
+      yield line
+
+  offset = 0
+  for row in csv.reader(lines()):
+    yield row, offset
+    offset = consumed[0]
+
+
 @app.task(ignore_result=True)
 def cancel_async(notebook, snippet, **kwargs):
   request = _get_request(**kwargs)
@@ -165,6 +244,15 @@ def close_statement_async(notebook, snippet, **kwargs):
     pass
 
 
+@app.task(ignore_result=True)
+def top_up_livy_session_pool():
+  '''Keeps the Livy sessions of the warm pool started, triggered periodically and after each hand-out.'''
+  from notebook.connectors.spark_shell import SESSION_POOL  # Spark is optional
+
+  if SESSION_POOL.is_enabled():
+    SESSION_POOL.top_up()
+
+
 @app.task(ignore_result=True)
 def run_sync_query(doc_id, user):
   '''Independently run a query as a user.'''
@@ -374,8 +462,8 @@ def fetch_result(notebook, snippet, rows, start_over, **kwargs):
 
   if info.get('handle', {}).get('has_result_set', False):
     csv.field_size_limit(sys.maxsize)
-    count = 0
-    headers, csv_reader = _get_data(task_id)
+    count = skip
+    headers, csv_reader = _get_data(task_id, skip=skip)
 
     for col in headers:
       split = col.split('|')
@@ -383,8 +471,6 @@ def fetch_result(notebook, snippet, rows, start_over, **kwargs):
       cols.append({'name': split[0], 'type': split_type, 'comment': None})
     for row in csv_reader:
       count += 1
-      if count <= skip:  # TODO: seek(skip) or [skip:]
-        continue
       data.append(row)
       if count >= target:
         break
@@ -396,24 +482,80 @@ def fetch_result(notebook, snippet, rows, start_over, **kwargs):
   return results
 
 
-def _get_data(task_id):
+def _get_data(task_id, skip=0):
+  """
+  Returns the headers and an iterator over the rows of the result, starting at row `skip`.
+  Only the pages containing the requested rows are read.
+  """
   result_key = _result_key(task_id)
 
   if TASK_SERVER.RESULT_CACHE.get():
-    csv_reader = caches[CACHES_CELERY_QUERY_RESULT_KEY].get(result_key)  # TODO check if expired
-    if csv_reader is None:
+    headers = caches[CACHES_CELERY_QUERY_RESULT_KEY].get(_result_headers_key(result_key))  # TODO check if expired
+    if headers is None:
       raise QueryError('Cached results %s not found.' % result_key)
-    headers = csv_reader[0] if csv_reader else []  # TODO check size
-    csv_reader = csv_reader[1:] if csv_reader else []
+    csv_reader = _get_cached_rows(result_key, skip)
   else:
-    f = storage.open(result_key, 'rb')
-    delimiter = ',' if sys.version_info[0] > 2 else ','.encode('utf-8')
-    csv_reader = csv.reader(f, delimiter=delimiter)
+    csv_reader = _get_stored_rows(result_key, skip)
     headers = next(csv_reader, [])
 
   return headers, csv_reader
 
 
+def _get_cached_rows(result_key, skip):
+  page_number, first = divmod(skip, RESULT_PAGE_SIZE)
+
+  while True:
+    page = caches[CACHES_CELERY_QUERY_RESULT_KEY].get(_result_page_key(result_key, page_number))
+    if not page:
+      return
+    for row in page[first:]:
+      yield row
+    first = 0
+    page_number += 1
+
+
+def _get_stored_rows(result_key, skip):
+  """
+  Yields the headers first, then the rows starting at row `skip`.
+  """
+  with storage.open(result_key, 'rb') as f:
+    csv_reader = _read_csv(f)
+    yield next(csv_reader, [])
+
+    offset, skip = _get_row_offset(result_key, skip)
+    if offset is not None:
+      f.seek(offset)
+      csv_reader = _read_csv(f)
+
+    for row in csv_reader:
+      if skip:
+        skip -= 1
+        continue
+      yield row
+
+
+def _get_row_offset(result_key, skip):
+  """
+  Returns the byte offset of the closest indexed row before row `skip` and the number of rows left to skip from there.
+  The offset is None when there is nothing to seek, e.g. with results written before the index existed.
+  """
+  if not skip or not storage.exists(_result_index_key(result_key)):
+    return None, skip
+
+  with storage.open(_result_index_key(result_key), 'rb') as f:
+    index = json.loads(f.read())
+
+  page_number = skip // index['page_size']
+  if page_number >= len(index['offsets']):
+    return index['size'], 0  # Past the last row
+  else:
+    return index['offsets'][page_number], skip - page_number * index['page_size']
+
+
+def _read_csv(f):
+  return csv.reader(codecs.getreader('utf-8')(f), delimiter=',')
+
+
 def fetch_result_size(*args, **kwargs):
   notebook = args[0]
   result = download_to_file.AsyncResult(notebook['uuid'])
@@ -487,6 +629,7 @@ def _cleanup(notebook, snippet):
   task_id = _get_query_key(notebook, snippet)
 
   storage.delete(_result_key(task_id))  # TODO: abstract storage + caches
+  storage.delete(_result_index_key(_result_key(task_id)))
   storage.delete(_log_key(notebook, snippet))
   caches[CACHES_CELERY_KEY].delete(_fetch_progress_key(notebook, snippet))
 
@@ -512,6 +655,15 @@ def _log_key(notebook, snippet):
 def _result_key(task_id):
   return task_id + '_result'
 
+def _result_index_key(result_key):
+  return result_key + '_index'
+
+def _result_headers_key(result_key):
+  return result_key + '_headers'
+
+def _result_page_key(result_key, page_number):
+  return '%s_page_%d' % (result_key, page_number)
+
 def _fetch_progress_key(notebook, snippet):
   return _get_query_key(notebook, snippet) + '_fetch_progress'
 
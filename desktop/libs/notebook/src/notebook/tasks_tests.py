@@ -16,17 +16,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import logging
 import pytest
 import sys
 
 from celery import states
 
+from desktop.conf import TASK_SERVER
 from desktop.lib.django_test_util import make_logged_in_client
 from useradmin.models import User
 
 from notebook.connectors.sql_alchemy import SqlAlchemyApi
-from notebook.tasks import run_sync_query, download_to_file, close_statement, get_log
+from notebook.tasks import run_sync_query, download_to_file, close_statement, get_log, ResultWriter, _get_data, _result_key
 
 if sys.version_info[0] > 2:
   from unittest.mock import patch, Mock, MagicMock
@@ -149,3 +151,82 @@ class TestRunSyncQueryTask():
             task = run_sync_query(query, self.user)
 
             assert task == {'history_uuid': '1', 'uuid': '1'}
+
+
+class MockStorage(object):
+
+  def __init__(self):
+    self.files = {}
+
+  def open(self, name, mode='rb'):
+    if 'w' in mode:
+      storage = self
+
+      class WriteBuffer(io.BytesIO):
+        def close(self):
+          storage.files[name] = self.getvalue()
+          super(WriteBuffer, self).close()
+
+      return WriteBuffer()
+    else:
+      return io.BytesIO(self.files[name])
+
+  def exists(self, name):
+    return name in self.files
+
+
+class TestResultWriter():
+
+  def _write(self, storage, rows, chunk_size=3):
+    result_key = _result_key('1ca47e0d')
+    writer = ResultWriter(result_key)
+    with storage.open(result_key, 'wb') as f:
+      writer.write(f, 'col1|INT_TYPE,col2|STRING_TYPE\r\n')
+      for i in range(0, len(rows), chunk_size):
+        writer.write(f, ''.join('%s,%s\r\n' % row for row in rows[i:i + chunk_size]))
+    writer.close()
+    return writer
+
+  def test_seek_to_page(self):
+    storage = MockStorage()
+    rows = [(i, '"multi\nline ü %d"' % i if i % 4 == 0 else 'row %d' % i) for i in range(25)]
+
+    with patch('notebook.tasks.storage', storage):
+      with patch('notebook.tasks.RESULT_PAGE_SIZE', 10):
+        writer = self._write(storage, rows)
+
+        assert 25 == writer.row_count
+        assert 3 == len(writer.offsets)
+
+        for skip in (0, 1, 9, 10, 17, 24, 25, 30):
+          headers, csv_reader = _get_data('1ca47e0d', skip=skip)
+
+          assert ['col1|INT_TYPE', 'col2|STRING_TYPE'] == headers
+          expected = [[str(i), ('multi\nline ü %d' if i % 4 == 0 else 'row %d') % i] for i in range(skip, 25)]
+          assert expected == list(csv_reader), skip
+
+  def test_cache_pages(self):
+    storage = MockStorage()
+    cache = {}
+    rows = [(i, 'row %d' % i) for i in range(25)]
+
+    with patch('notebook.tasks.storage', storage):
+      with patch('notebook.tasks.RESULT_PAGE_SIZE', 10):
+        with patch('notebook.tasks.caches') as caches:
+          caches.__getitem__.return_value = Mock(set=lambda key, value, timeout: cache.update({key: value}), get=cache.get)
+          reset = TASK_SERVER.RESULT_CACHE.set_for_testing('{"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}')
+
+          try:
+            result_key = _result_key('1ca47e0d')
+            writer = ResultWriter(result_key, cache_rows=True)
+            with storage.open(result_key, 'wb') as f:
+              writer.write(f, 'col1,col2\r\n' + ''.join('%s,%s\r\n' % row for row in rows))
+            writer.close()
+
+            assert 3 == len([key for key in cache if '_page_' in key])
+
+            headers, csv_reader = _get_data('1ca47e0d', skip=12)
+            assert ['col1', 'col2'] == headers
+            assert [[str(i), 'row %d' % i] for i in range(12, 25)] == list(csv_reader)
+          finally:
+            reset()
@@ -1276,6 +1276,8 @@ There is no bridge to KO for components using this integration. Example using in
       var data = JSON.parse(e.data);
       if (data['type'] === 'channel_name') {
         window.WS_CHANNEL = data['data'];
+      } else if (data['type'] === 'query_progress') {
+        huePubSub.publish('editor.ws.query.status', data['data']);
       } else if (data['type'] === 'query_result') {
         huePubSub.publish('editor.ws.query.fetch_result', data['data']);
       }
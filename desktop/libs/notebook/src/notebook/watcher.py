@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+Server side watch of the running queries. Their status, progress and first page of results are pushed to the editors
+through the WebSocket channel layer, instead of each editor polling check_status and fetch_result_data over HTTP.
+'''
+
+from builtins import object
+import logging
+import threading
+import time
+
+from django.db import connection
+
+from desktop.conf import WEBSOCKETS
+from desktop.lib.i18n import smart_str
+
+from notebook.api import _check_status, _fetch_result_data
+from notebook.connectors.base import QueryExpired, SessionExpired, QueryError
+from notebook.models import MockedDjangoRequest, get_api
+from notebook.operation_state import RUNNING_STATUSES
+
+
+LOG = logging.getLogger()
+
+
+class OperationWatch(object):
+
+  def __init__(self, key, user, notebook, snippet, fetch_result):
+    self.key = key
+    self.user = user
+    self.notebook = notebook
+    self.snippet = snippet
+    self.fetch_result = fetch_result
+    self.channels = set()
+    self.last_message = None
+
+
+class QueryStatusWatcher(object):
+  '''
+  Polls the status of all the watched operations from one thread and sends their changes to the channels of the editors
+  watching them: a 'task.progress' message at each change of status or progress, then with `fetch_result` a 'task.result'
+  message with the first page of results when the query is available. The result is fetched from the start again, which
+  not all the connectors support, e.g. SqlAlchemy or the non scrollable HiveServer2 cursors.
+
+  Several editors watching the same operation share the same watch and poll. The thread stops when nothing is watched.
+  '''
+
+  def __init__(self, interval=None, rows=100, channel_layer=None):
+    self.interval = interval if interval is not None else WEBSOCKETS.QUERY_STATUS_INTERVAL.get()
+    self.rows = rows
+    self.channel_layer = channel_layer
+
+    self._watches = {}
+    self._lock = threading.Lock()
+    self._thread = None
+
+  def watch(self, user, notebook, snippet, channel_name, key=None, fetch_result=False, start=True):
+    '''
+    Sends the changes of the operation of the snippet to channel_name until it finishes. Returns the key of the watch:
+    `key` when given, e.g. the uuid of the query history, or the guid of the operation handle.
+    '''
+    key = key or snippet['result']['handle']['guid']
+
+    with self._lock:
+      watch = self._watches.get(key)
+      if watch is None:
+        watch = self._watches[key] = OperationWatch(key, user, notebook, snippet, fetch_result)
+      watch.channels.add(channel_name)
+      watch.fetch_result = watch.fetch_result or fetch_result
+      last_message = watch.last_message
+
+    if last_message is not None:  # Catch up with the other watchers
+      self._send(channel_name, 'task.progress', last_message)
+
+    if start:
+      self._start()
+
+    return key
+
+  def unwatch(self, channel_name, key=None):
+    with self._lock:
+      for watch_key, watch in list(self._watches.items()):
+        if key is None or key == watch_key:
+          watch.channels.discard(channel_name)
+          if not watch.channels:
+            del self._watches[watch_key]
+
+  def is_watching(self, key):
+    return key in self._watches
+
+  def poll(self):
+    '''Checks once the status of every watched operation.'''
+    with self._lock:
+      watches = list(self._watches.values())
+
+    for watch in watches:
+      try:
+        finished = self._poll_operation(watch)
+      except Exception as e:
+        LOG.exception('Failed to check the status of the operation %s' % watch.key)
+        self._notify(watch, {'status': 'failed', 'message': smart_str(e)})
+        finished = True
+
+      if finished:
+        with self._lock:
+          self._watches.pop(watch.key, None)
+
+  def _poll_operation(self, watch):
+    request = MockedDjangoRequest(user=watch.user)
+
+    try:
+      query_status = _check_status(request, notebook=watch.notebook, snippet=watch.snippet)['query_status']
+    except (QueryExpired, SessionExpired) as e:
+      self._notify(watch, {'status': 'expired', 'message': smart_str(e)})
+      return True
+    except QueryError as e:
+      self._notify(watch, {'status': 'failed', 'message': smart_str(e.message)})
+      return True
+
+    status = query_status.get('status')
+    watch.snippet['status'] = status
+    if 'has_result_set' in query_status:
+      watch.snippet['result']['handle']['has_result_set'] = query_status['has_result_set']
+
+    message = dict(query_status, query_id=watch.key)
+    if status in RUNNING_STATUSES:
+      message['progress'] = self._get_progress(request, watch)
+    elif status in ('available', 'success'):
+      message['progress'] = 100
+
+    if message != watch.last_message:
+      self._notify(watch, message)
+
+    if status in RUNNING_STATUSES:
+      return False
+
+    if status == 'available' and watch.fetch_result and query_status.get('has_result_set', True):
+      result = _fetch_result_data(request, notebook=watch.notebook, snippet=watch.snippet, rows=self.rows, start_over=True)['result']
+      self._notify(watch, dict(result, status=status), message_type='task.result')
+
+    return True
+
+  def _get_progress(self, request, watch):
+    try:
+      api = get_api(request, watch.snippet)
+      return min(api.progress(watch.notebook, watch.snippet, logs=smart_str(api.get_log(watch.notebook, watch.snippet))), 99)
+    except Exception as e:
+      LOG.debug('Could not get the progress of the operation %s: %s' % (watch.key, e))
+      return watch.last_message.get('progress') if watch.last_message else None
+
+  def _notify(self, watch, message, message_type='task.progress'):
+    message = dict(message, query_id=watch.key)
+    if message_type == 'task.progress':
+      watch.last_message = message
+
+    with self._lock:
+      channels = list(watch.channels)
+
+    for channel_name in channels:
+      self._send(channel_name, message_type, message)
+
+  def _send(self, channel_name, message_type, message_data):
+    from asgiref.sync import async_to_sync
+    from channels.layers import get_channel_layer
+
+    channel_layer = self.channel_layer or get_channel_layer()
+    try:
+      async_to_sync(channel_layer.send)(channel_name, {'type': message_type, 'data': message_data})
+    except Exception as e:
+      LOG.warning('Could not send the status of the query %s to %s: %s' % (message_data.get('query_id'), channel_name, e))
+
+  def _start(self):
+    with self._lock:
+      if self._thread is None:
+        self._thread = threading.Thread(target=self._run, name='QueryStatusWatcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+  def _run(self):
+    try:
+      while True:
+        self.poll()
+
+        with self._lock:
+          if not self._watches:
+            self._thread = None
+            return
+
+        time.sleep(self.interval)
+    finally:
+      connection.close()  # The thread has its own database connection
+      with self._lock:
+        if self._thread is threading.current_thread():  # Stopped by an error
+          self._thread = None
+
+
+_WATCHER = None
+_WATCHER_LOCK = threading.Lock()
+
+
+def get_watcher():
+  global _WATCHER
+
+  with _WATCHER_LOCK:
+    if _WATCHER is None:
+      _WATCHER = QueryStatusWatcher()
+    return _WATCHER
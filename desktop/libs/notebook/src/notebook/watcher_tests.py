@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+from asgiref.sync import async_to_sync
+from channels.layers import InMemoryChannelLayer
+
+from notebook.connectors.base import QueryError
+from notebook.watcher import QueryStatusWatcher
+
+if sys.version_info[0] > 2:
+  from unittest.mock import patch, Mock
+else:
+  from mock import patch, Mock
+
+
+class TestQueryStatusWatcher(object):
+
+  def setup_method(self):
+    self.layer = InMemoryChannelLayer()
+    self.watcher = QueryStatusWatcher(interval=0, channel_layer=self.layer)
+    self.channels = [async_to_sync(self.layer.new_channel)() for i in range(2)]
+
+    self.check_status = patch('notebook.watcher._check_status')
+    self.fetch_result_data = patch('notebook.watcher._fetch_result_data')
+    self.get_api = patch('notebook.watcher.get_api')
+    self.check_status.start()
+    self.fetch_result_data.start()
+    self.get_api.start()
+
+  def teardown_method(self):
+    self.check_status.stop()
+    self.fetch_result_data.stop()
+    self.get_api.stop()
+
+  def _watch(self, channel_name, fetch_result=False):
+    snippet = {'type': 'hive', 'status': 'running', 'result': {'handle': {'guid': 'abc'}}}
+    return self.watcher.watch(
+      Mock(), {'uuid': 'history-1'}, snippet, channel_name, key='history-1', fetch_result=fetch_result, start=False
+    )
+
+  def _receive(self, channel_name):
+    return async_to_sync(self.layer.receive)(channel_name)
+
+  def test_push_status_and_result(self):
+    from notebook.watcher import _check_status, _fetch_result_data, get_api
+    _check_status.side_effect = [
+      {'query_status': {'status': 'running'}},
+      {'query_status': {'status': 'running'}},
+      {'query_status': {'status': 'available', 'has_result_set': True}},
+    ]
+    get_api.return_value.progress.side_effect = [10, 10]
+    _fetch_result_data.return_value = {'result': {'data': [[1]], 'meta': [{'name': 'a'}], 'has_more': False, 'type': 'table'}}
+
+    # Coalesced
+    assert 'history-1' == self._watch(self.channels[0], fetch_result=True)
+    self._watch(self.channels[1])
+
+    self.watcher.poll()
+    self.watcher.poll()  # Unchanged, nothing is sent
+    self.watcher.poll()
+
+    assert 3 == _check_status.call_count
+    _fetch_result_data.assert_called_once()
+    assert True == _fetch_result_data.call_args[1]['start_over']
+    assert not self.watcher.is_watching('history-1')
+
+    for channel_name in self.channels:
+      assert {
+        'type': 'task.progress', 'data': {'status': 'running', 'progress': 10, 'query_id': 'history-1'}
+      } == self._receive(channel_name)
+      assert {
+        'type': 'task.progress', 'data': {'status': 'available', 'has_result_set': True, 'progress': 100, 'query_id': 'history-1'}
+      } == self._receive(channel_name)
+      message = self._receive(channel_name)
+      assert 'task.result' == message['type']
+      assert [[1]] == message['data']['data']
+
+  def test_result_not_fetched_by_default(self):
+    from notebook.watcher import _check_status, _fetch_result_data
+    _check_status.return_value = {'query_status': {'status': 'available', 'has_result_set': True}}
+
+    self._watch(self.channels[0])
+    self.watcher.poll()
+
+    assert 'available' == self._receive(self.channels[0])['data']['status']
+    assert not _fetch_result_data.called
+    assert not self.watcher.is_watching('history-1')
+
+  def test_late_watcher_and_unwatch(self):
+    from notebook.watcher import _check_status, get_api
+    _check_status.return_value = {'query_status': {'status': 'running'}}
+    get_api.return_value.progress.return_value = 50
+
+    self._watch(self.channels[0])
+    self.watcher.poll()
+    self._watch(self.channels[1])  # Gets the last status right away
+
+    assert 50 == self._receive(self.channels[1])['data']['progress']
+
+    self.watcher.unwatch(self.channels[0])
+    assert self.watcher.is_watching('history-1')
+    self.watcher.unwatch(self.channels[1])
+    assert not self.watcher.is_watching('history-1')
+
+  def test_failure(self):
+    from notebook.watcher import _check_status, _fetch_result_data
+    _check_status.side_effect = QueryError('Table not found')
+
+    self._watch(self.channels[0])
+    self.watcher.poll()
+
+    assert {'status': 'failed', 'message': 'Table not found', 'query_id': 'history-1'} == self._receive(self.channels[0])['data']
+    assert not _fetch_result_data.called
+    assert not self.watcher.is_watching('history-1')
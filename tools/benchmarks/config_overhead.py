@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Times the configuration reads of a request: a mix of values set in the ini file, static defaults and dynamic defaults
+reading other configs, accessed through their section like desktop.conf.AUTH.BACKEND.get(). Compares the resolution at
+each get() with the memoized values.
+"""
+
+import argparse
+import time
+
+from io import StringIO
+
+from configobj import ConfigObj
+
+from desktop.lib.conf import Config, ConfigSection, coerce_bool, coerce_csv, invalidate_cache, load_confs
+
+
+CONF = """
+[desktop]
+  http_host=0.0.0.0
+  http_port=8888
+  [[auth]]
+    backend=desktop.auth.backend.AllowFirstUserDjangoBackend
+    idle_session_timeout=3600
+  [[database]]
+    engine=sqlite3
+"""
+
+
+def make_section():
+  def is_https_enabled():
+    """True when a certificate is set"""
+    return bool(desktop.SSL_CERTIFICATE.get())
+
+  def get_redirect_port():
+    """The HTTP port"""
+    return desktop.HTTP_PORT.get() + (1 if desktop.IS_HTTPS.get() else 0)
+
+  section = ConfigSection(
+    key='desktop',
+    members=dict(
+      HTTP_HOST=Config(key='http_host', default='127.0.0.1'),
+      HTTP_PORT=Config(key='http_port', default=8888, type=int),
+      SSL_CERTIFICATE=Config(key='ssl_certificate'),
+      IS_HTTPS=Config(key='is_https', dynamic_default=is_https_enabled, type=coerce_bool),
+      REDIRECT_PORT=Config(key='redirect_port', dynamic_default=get_redirect_port, type=int),
+      ENABLE_CONNECTORS=Config(key='enable_connectors', default=False, type=coerce_bool),
+      ALLOWED_HOSTS=Config(key='allowed_hosts', default='*', type=coerce_csv),
+      AUTH=ConfigSection(
+        key='auth',
+        members=dict(
+          BACKEND=Config(key='backend', default='desktop.auth.backend.AllowFirstUserDjangoBackend', type=coerce_csv),
+          IDLE_SESSION_TIMEOUT=Config(key='idle_session_timeout', default=-1, type=int),
+          EXPIRES_AFTER=Config(key='expires_after', default=-1, type=int),
+          USER_AUGMENTOR=Config(key='user_augmentor', default='desktop.auth.backend.DefaultUserAugmentor'),
+        )
+      ),
+    )
+  )
+  desktop = section.bind(load_confs([ConfigObj(infile=StringIO(CONF))]), prefix='')
+  return desktop
+
+
+def request(desktop):
+  desktop.HTTP_HOST.get()
+  desktop.HTTP_PORT.get()
+  desktop.IS_HTTPS.get()
+  desktop.REDIRECT_PORT.get()
+  desktop.ENABLE_CONNECTORS.get()
+  desktop.ALLOWED_HOSTS.get()
+  desktop.AUTH.BACKEND.get()
+  desktop.AUTH.IDLE_SESSION_TIMEOUT.get()
+  desktop.AUTH.EXPIRES_AFTER.get()
+  desktop.AUTH.USER_AUGMENTOR.get()
+
+
+def set_memoize(config, memoize):
+  config.memoize = memoize
+  for member in getattr(config, 'members', {}).values():
+    set_memoize(member, memoize)
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--requests', type=int, default=50000)
+  args = parser.parse_args()
+
+  desktop = make_section()
+
+  for memoize in (False, True):
+    set_memoize(desktop.config, memoize)
+    invalidate_cache()
+    start = time.time()
+    for _ in range(args.requests):
+      request(desktop)
+    per_request = (time.time() - start) / args.requests
+    print('%-9s %8.2f us per request of 10 reads' % ('memoized' if memoize else 'resolved', per_request * 1000000))
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the CSV encoding throughput in rows/s of a tablib Dataset per batch vs the
+export_csvxls.CSVEncoder, on a narrow and a wide schema.
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'desktop.settings')
+
+import django
+
+django.setup()
+
+from desktop.lib.export_csvxls import CSVEncoder, dataset
+
+
+def make_batches(rows, columns, batch_size=1000):
+  headers = ['col_%d|%s' % (i, 'BIGINT_TYPE' if i % 3 == 0 else 'DOUBLE_TYPE' if i % 3 == 1 else 'STRING_TYPE') for i in range(columns)]
+  batches = []
+  for start in range(0, rows, batch_size):
+    batches.append([
+      [row if i % 3 == 0 else row / 3.0 if i % 3 == 1 else (None if row % 50 == 0 else 'value %d' % row) for i in range(columns)]
+      for row in range(start, min(start + batch_size, rows))
+    ])
+  return headers, batches
+
+
+def encode_dataset(headers, batches):
+  for i, batch in enumerate(batches):
+    yield dataset(headers if i == 0 else None, batch).csv
+
+
+def encode_encoder(headers, batches):
+  encoder = CSVEncoder()
+  for i, batch in enumerate(batches):
+    yield encoder.encode(headers if i == 0 else None, batch)
+
+
+def bench(name, fn, headers, batches, rows):
+  start = time.time()
+  size = sum(len(chunk) for chunk in fn(headers, batches))
+  duration = time.time() - start
+  print('  %-8s %7.3fs %10.0f rows/s (%.1f MB)' % (name, duration, rows / max(duration, 1e-9), size / 1024.0 / 1024.0))
+  return duration
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--rows', type=int, default=100000)
+  parser.add_argument('--narrow', type=int, default=5, help='Number of columns of the narrow schema')
+  parser.add_argument('--wide', type=int, default=200, help='Number of columns of the wide schema')
+  args = parser.parse_args()
+
+  for label, columns, rows in (('narrow', args.narrow, args.rows), ('wide', args.wide, max(args.rows // 20, 1))):
+    headers, batches = make_batches(rows, columns)
+    print('%s: %d rows x %d columns' % (label, rows, columns))
+    legacy = bench('dataset', encode_dataset, headers, batches, rows)
+    encoder = bench('encoder', encode_encoder, headers, batches, rows)
+    print('  Speedup: %.1fx' % (legacy / max(encoder, 1e-9)))
+
+
+if __name__ == '__main__':
+  main()
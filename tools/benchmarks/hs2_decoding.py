@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the decoding of a HiveServer2 columnar TRowSet into rows: the row by row path
+popping the head of every column vs the columnar HiveServerTRowSet2.iter_rows().
+"""
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'desktop.settings')
+
+import django
+
+django.setup()
+
+from TCLIService.ttypes import TColumn, TI64Column, TRowSet, TStringColumn
+
+from beeswax.server.hive_server2_lib import HiveServerTColumnValue2, HiveServerTRowSet2
+
+
+def make_row_set(rows, columns, null_ratio):
+  tcolumns = []
+  for i in range(columns):
+    nulls = bytearray((rows + 7) // 8)
+    for row in range(rows):
+      if random.random() < null_ratio:
+        nulls[row // 8] |= 1 << (row % 8)
+    if i % 2:
+      tcolumns.append(TColumn(stringVal=TStringColumn(values=['value %d' % row for row in range(rows)], nulls=bytes(nulls))))
+    else:
+      tcolumns.append(TColumn(i64Val=TI64Column(values=list(range(rows)), nulls=bytes(nulls))))
+  return TRowSet(startRowOffset=0, rows=[], columns=tcolumns)
+
+
+def legacy_set_nulls(values, nulls):
+  if not nulls.strip(b'\x00'):
+    return values
+  _values = [None if is_null else value for value, is_null in zip(values, HiveServerTColumnValue2.mark_nulls(values, nulls))]
+  if len(values) != len(_values):
+    _values.extend(values[len(_values):])
+  return _values
+
+
+def legacy_rows(row_set):
+  columns = []
+  for tcolumn in row_set.columns:
+    column = tcolumn.stringVal if tcolumn.stringVal is not None else tcolumn.i64Val
+    columns.append(legacy_set_nulls(column.values, column.nulls))
+  while True:
+    try:
+      yield [column.pop(0) for column in columns]
+    except IndexError:
+      return
+
+
+def columnar_rows(row_set):
+  return HiveServerTRowSet2(row_set, schema=None).iter_rows()
+
+
+def bench(name, fn, args):
+  row_set = make_row_set(args.rows, args.columns, args.null_ratio)
+  start = time.time()
+  count = sum(1 for row in fn(row_set))
+  duration = time.time() - start
+  print('%-10s %8d rows x %3d columns in %7.3fs (%10.0f rows/s)' % (name, count, args.columns, duration, count / max(duration, 1e-9)))
+  return duration
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--rows', type=int, default=100000)
+  parser.add_argument('--columns', type=int, default=20)
+  parser.add_argument('--null-ratio', type=float, default=0.05)
+  args = parser.parse_args()
+
+  random.seed(0)
+  legacy = bench('legacy', legacy_rows, args)
+  columnar = bench('columnar', columnar_rows, args)
+  print('Speedup: %.1fx' % (legacy / max(columnar, 1e-9)))
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the metrics overhead per request of the MetricsMiddleware in a Gunicorn worker: the previous full
+dump_metrics() copied twice into a multiprocessing Manager dictionary vs the writes into the shared memory segment.
+Also times the merge of the segments of the workers done by the reporter.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from multiprocessing import Manager
+
+import pyformance
+
+from desktop.lib.metrics.registry import MetricsRegistry
+from desktop.lib.metrics.shared import SharedMetrics
+
+
+def make_registry(directory):
+  registry = MetricsRegistry(registry=pyformance.MetricsRegistry(), shared=SharedMetrics(directory))
+  active_requests = registry.counter(
+      name='requests.active', label='Active Requests', description='Active requests', numerator='requests', treat_counter_as_gauge=True
+  )
+  response_time = registry.timer(
+      name='requests.response-time', label='Response Time', description='Response time', numerator='seconds',
+      counter_numerator='requests', rate_denominator='seconds'
+  )
+  for name in ('oauth', 'saml2', 'ldap', 'pam', 'spnego'):
+    registry.timer(
+        name='auth.%s.auth-time' % name, label=name, description=name, numerator='seconds', counter_numerator='authentications',
+        rate_denominator='seconds'
+    )
+  return registry, active_requests, response_time
+
+
+def run(mode, registry, active_requests, response_time, requests, metrics_dict):
+  start = time.time()
+  for _ in range(requests):
+    timer = response_time.time()
+    active_requests.inc()
+    if mode == 'manager':
+      metrics_dict[os.getpid()] = registry.dump_metrics()
+    timer.stop()
+    active_requests.dec()
+    if mode == 'manager':
+      metrics_dict[os.getpid()] = registry.dump_metrics()
+  return (time.time() - start) / requests
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--requests', type=int, default=20000)
+  parser.add_argument('--workers', type=int, default=8, help='Number of worker segments merged by the reporter')
+  args = parser.parse_args()
+
+  directory = tempfile.mkdtemp()
+  try:
+    registry, active_requests, response_time = make_registry(directory)
+    metrics_dict = Manager().dict()
+
+    for mode in ('manager', 'shared'):
+      per_request = run(mode, registry, active_requests, response_time, args.requests, metrics_dict)
+      print('%-8s %8.1f us per request' % (mode, per_request * 1000000))
+
+    for worker in range(args.workers - 1):  # Segments of the other workers
+      shutil.copy(os.path.join(directory, '%d.metrics' % os.getpid()), os.path.join(directory, 'worker_%d.metrics' % worker))
+
+    start = time.time()
+    registry.get_metrics_shared_data()
+    print('report   %8.1f ms for %d workers' % ((time.time() - start) * 1000, args.workers))
+  finally:
+    shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# Licensed to Cloudera, Inc. under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  Cloudera, Inc. licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the peak RSS and time to first byte of an XLSX download: the openpyxl workbook
+saved in memory vs the streaming export_csvxls.xlsx_generator(). Each mode runs in its own
+process so that the peak RSS are not mixed up.
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import time
+
+from io import BytesIO
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'desktop.settings')
+
+import django
+
+django.setup()
+
+import openpyxl
+
+from desktop.lib.export_csvxls import encode_row, xlsx_generator
+
+
+def content_generator(rows, columns, batch_size=1000):
+  headers = ['col_%d' % i for i in range(columns)]
+  for start in range(0, rows, batch_size):
+    yield headers, [[row if i % 2 else 'value %d' % row for i in range(columns)] for row in range(start, min(start + batch_size, rows))]
+
+
+def workbook_generator(content_generator):
+  workbook = openpyxl.Workbook(write_only=True)
+  worksheet = workbook.create_sheet()
+  row_ctr = 0
+
+  for _headers, _data in content_generator:
+    if _headers and row_ctr == 0:
+      worksheet.append(encode_row(_headers))
+      row_ctr += 1
+    for row in _data:
+      worksheet.append(encode_row(row, make_excel_links=True))
+      row_ctr += 1
+
+  output = BytesIO()
+  workbook.save(output)
+  yield output.getvalue()
+
+
+def run(mode, rows, columns, results):
+  generator = xlsx_generator if mode == 'streaming' else workbook_generator
+
+  start = time.time()
+  first_byte = None
+  size = 0
+  for chunk in generator(content_generator(rows, columns)):
+    if first_byte is None and chunk:
+      first_byte = time.time() - start
+    size += len(chunk)
+
+  results[mode] = {
+    'first_byte': first_byte,
+    'total': time.time() - start,
+    'size': size,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+  }
+
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--rows', type=int, default=200000)
+  parser.add_argument('--columns', type=int, default=10)
+  args = parser.parse_args()
+
+  results = multiprocessing.Manager().dict()
+  for mode in ('workbook', 'streaming'):
+    process = multiprocessing.Process(target=run, args=(mode, args.rows, args.columns, results))
+    process.start()
+    process.join()
+
+    result = results[mode]
+    print('%-10s first byte %7.3fs, total %7.3fs, %6.1f MB, peak RSS %7.1f MB' % (
+        mode, result['first_byte'], result['total'], result['size'] / 1024.0 / 1024.0, result['max_rss_mb']))
+
+
+if __name__ == '__main__':
+  main()